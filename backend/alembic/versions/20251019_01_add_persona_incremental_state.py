@@ -0,0 +1,60 @@
+"""add incremental state columns to user_persona_vectors
+
+Revision ID: 20251019_01
+Revises: 20250120_01
+Create Date: 2025-10-19 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision = "20251019_01"
+down_revision = "20250120_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add running weighted-sum state used by the incremental persona engine.
+    user_persona_vectors was created outside Alembic, so create it if missing.
+    """
+    inspector = sa.inspect(op.get_bind())
+    if "user_persona_vectors" not in inspector.get_table_names():
+        op.create_table(
+            "user_persona_vectors",
+            sa.Column("user_id", sa.Integer(), primary_key=True, nullable=False, comment='사용자 ID'),
+            sa.Column("embedding_json", mysql.JSON(), nullable=False, comment='사용자 프로필 임베딩 벡터 (JSON 배열)'),
+            sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), onupdate=sa.func.now(), nullable=False, comment='수정일시'),
+        )
+        op.create_index("idx_user_updated", "user_persona_vectors", ["user_id", "updated_at"])
+
+    op.add_column(
+        "user_persona_vectors",
+        sa.Column("weighted_sum_json", mysql.JSON(), nullable=True, comment='이벤트 가중 임베딩 합 (시간 감쇠 적용, JSON 배열)'),
+    )
+    op.add_column(
+        "user_persona_vectors",
+        sa.Column("weight_sum", sa.Float(), nullable=False, server_default='0', comment='이벤트 가중치 합 (시간 감쇠 적용)'),
+    )
+    op.add_column(
+        "user_persona_vectors",
+        sa.Column("event_count", sa.Integer(), nullable=False, server_default='0', comment='반영된 이벤트 수'),
+    )
+    op.add_column(
+        "user_persona_vectors",
+        sa.Column("last_event_at", sa.DateTime(), nullable=True, comment='마지막으로 반영된 이벤트 시각 (감쇠 기준)'),
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop incremental persona state columns.
+    """
+    op.drop_column("user_persona_vectors", "last_event_at")
+    op.drop_column("user_persona_vectors", "event_count")
+    op.drop_column("user_persona_vectors", "weight_sum")
+    op.drop_column("user_persona_vectors", "weighted_sum_json")
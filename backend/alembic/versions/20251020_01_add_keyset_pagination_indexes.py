@@ -0,0 +1,61 @@
+"""add composite indexes for keyset (cursor) pagination
+
+Revision ID: 20251020_01
+Revises: 20251019_01
+Create Date: 2025-10-20 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20251020_01"
+down_revision = "20251019_01"
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns) - 컬럼 순서는 목록 정렬 키와 동일 (모두 DESC → 역방향 인덱스 스캔)
+KEYSET_INDEXES = [
+    # /api/videos, /api/videos/trends
+    ("idx_videos_published_id", "travel_videos", ["published_at", "id"]),
+    # /api/videos?channel_id=
+    ("idx_videos_channel_published_id", "travel_videos", ["channel_id", "published_at", "id"]),
+    # /api/videos/recommended
+    ("idx_videos_views_published_id", "travel_videos", ["view_count", "published_at", "id"]),
+    # /api/videos/most-liked
+    ("idx_videos_likes_views_published_id", "travel_videos", ["like_count", "view_count", "published_at", "id"]),
+    # /api/comments
+    ("idx_comments_published_id", "travel_comments", ["published_at", "id"]),
+    # /api/comments?video_id=
+    ("idx_comments_video_published_id", "travel_comments", ["video_id", "published_at", "id"]),
+]
+
+
+def _existing_indexes(inspector, table: str) -> set:
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    """
+    Create composite (sort key, id) indexes so cursor pages seek instead of scanning skipped rows.
+    travel_videos / travel_comments are created by the collector, so skip missing tables or indexes.
+    """
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    for name, table, columns in KEYSET_INDEXES:
+        if table not in tables or name in _existing_indexes(inspector, table):
+            continue
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """
+    Drop keyset pagination indexes.
+    """
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    for name, table, _ in reversed(KEYSET_INDEXES):
+        if table in tables and name in _existing_indexes(inspector, table):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,51 @@
+"""create video_comment_stats table
+
+Revision ID: 20251021_01
+Revises: 20251020_01
+Create Date: 2025-10-21 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20251021_01"
+down_revision = "20251020_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Create per-video comment count summary table and backfill it from travel_comments.
+    Afterwards the collector (MySQLWriter.insert_comments) refreshes rows for the videos it loads.
+    """
+    op.create_table(
+        "video_comment_stats",
+        sa.Column("video_id", sa.String(length=64), primary_key=True, nullable=False, comment='비디오 ID'),
+        sa.Column("total_count", sa.Integer(), nullable=False, server_default='0', comment='전체 댓글 수'),
+        sa.Column("text_count", sa.Integer(), nullable=False, server_default='0', comment='본문이 있는 댓글 수'),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), onupdate=sa.func.now(), nullable=False, comment='갱신일시'),
+    )
+
+    inspector = sa.inspect(op.get_bind())
+    if "travel_comments" in inspector.get_table_names():
+        op.execute(
+            """
+            INSERT INTO video_comment_stats (video_id, total_count, text_count, updated_at)
+            SELECT video_id,
+                   COUNT(*),
+                   SUM(CASE WHEN text IS NOT NULL AND text != '' THEN 1 ELSE 0 END),
+                   NOW()
+            FROM travel_comments
+            GROUP BY video_id
+            """
+        )
+
+
+def downgrade() -> None:
+    """
+    Drop video_comment_stats table.
+    """
+    op.drop_table("video_comment_stats")
@@ -0,0 +1,52 @@
+"""create offline_enrichments and offline_enrichment_watermarks tables
+
+Revision ID: 20251022_01
+Revises: 20251021_01
+Create Date: 2025-10-22 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision = "20251022_01"
+down_revision = "20251021_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Create offline model results (sentiment / keywords / profanity) per comment or video,
+    and the per-source resume position of the batch enrichment runner.
+    """
+    op.create_table(
+        "offline_enrichments",
+        sa.Column("source", sa.String(length=16), primary_key=True, nullable=False, comment='대상 (comment / video)'),
+        sa.Column("item_id", sa.String(length=64), primary_key=True, nullable=False, comment='댓글 ID 또는 비디오 ID'),
+        sa.Column("sentiment_label", sa.String(length=16), nullable=True, comment='감정 라벨 (positive / neutral / negative)'),
+        sa.Column("sentiment_score", sa.Float(), nullable=True, comment='감정 점수 (pos - neg, -1.0~1.0)'),
+        sa.Column("positive_prob", sa.Float(), nullable=True, comment='긍정 확률'),
+        sa.Column("keywords", mysql.JSON(), nullable=True, comment='추출 키워드 리스트'),
+        sa.Column("profanity_score", sa.Float(), nullable=True, comment='욕설/악성 확률'),
+        sa.Column("model_version", sa.String(length=32), nullable=False, comment='보강 모델 버전 (OFFLINE_ENRICHMENT_VERSION)'),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), onupdate=sa.func.now(), nullable=False, comment='갱신일시'),
+    )
+    op.create_table(
+        "offline_enrichment_watermarks",
+        sa.Column("source", sa.String(length=16), primary_key=True, nullable=False, comment='대상 (comment / video)'),
+        sa.Column("last_item_id", sa.String(length=64), nullable=True, comment='마지막으로 저장한 id (패스 완료 시 NULL)'),
+        sa.Column("model_version", sa.String(length=32), nullable=False, comment='보강 모델 버전'),
+        sa.Column("processed_count", sa.Integer(), nullable=False, server_default='0', comment='현재 패스에서 저장한 행 수'),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), onupdate=sa.func.now(), nullable=False, comment='갱신일시'),
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop offline enrichment tables.
+    """
+    op.drop_table("offline_enrichment_watermarks")
+    op.drop_table("offline_enrichments")
@@ -0,0 +1,81 @@
+"""create video_rank_features table
+
+Revision ID: 20251023_01
+Revises: 20251022_01
+Create Date: 2025-10-23 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20251023_01"
+down_revision = "20251022_01"
+branch_labels = None
+depends_on = None
+
+# 랭킹 후보 조회용 커버링 인덱스 (video_id는 PK라 보조 인덱스에 포함)
+COVERING_INDEXES = [
+    # /api/v1/videos/recommended, /personalized (토픽 없음): ORDER BY published_at DESC
+    ("idx_rank_published_cover", ["published_at", "pos_ratio", "avg_score", "topic_id", "topic_score", "log_views"]),
+    # 토픽 지정: WHERE topic_id = ? ORDER BY published_at DESC
+    ("idx_rank_topic_published_cover", ["topic_id", "published_at", "pos_ratio", "avg_score", "topic_score", "log_views"]),
+]
+SOURCE_TABLES = {"videos", "video_sentiment_agg", "video_topics"}
+
+
+def upgrade() -> None:
+    """
+    Create the materialized ranking feature table (one row per video, primary topic only)
+    with covering indexes for the recommendation candidate reads.
+    Backfill it when the pipeline tables exist; afterwards scripts/build_rank_features.py refreshes it.
+    """
+    op.create_table(
+        "video_rank_features",
+        sa.Column("video_id", sa.String(length=64), primary_key=True, nullable=False, comment='비디오 ID'),
+        sa.Column("title", sa.String(length=512), nullable=True, comment='제목'),
+        sa.Column("channel_id", sa.String(length=64), nullable=True, comment='채널 ID'),
+        sa.Column("views", sa.BigInteger(), nullable=False, server_default='0', comment='조회수'),
+        sa.Column("log_views", sa.Float(), nullable=False, server_default='0', comment='log(조회수 + 1)'),
+        sa.Column("pos_ratio", sa.Float(), nullable=True, comment='긍정 비율'),
+        sa.Column("avg_score", sa.Float(), nullable=True, comment='평균 감정 점수'),
+        sa.Column("topic_id", sa.Integer(), nullable=True, comment='대표 토픽 ID (topic_score 최대)'),
+        sa.Column("topic_score", sa.Float(), nullable=True, comment='대표 토픽 점수'),
+        sa.Column("published_at", sa.DateTime(), nullable=True, comment='게시일시'),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False, comment='배치 갱신 시각'),
+    )
+    for name, columns in COVERING_INDEXES:
+        op.create_index(name, "video_rank_features", columns)
+
+    inspector = sa.inspect(op.get_bind())
+    if SOURCE_TABLES.issubset(inspector.get_table_names()):
+        op.execute(
+            """
+            INSERT INTO video_rank_features (
+                video_id, title, channel_id, views, log_views,
+                pos_ratio, avg_score, topic_id, topic_score, published_at, refreshed_at
+            )
+            SELECT
+                v.video_id, v.title, v.channel_id,
+                COALESCE(v.views, 0), LN(COALESCE(v.views, 0) + 1),
+                s.pos_ratio, s.avg_score, t.topic_id, t.topic_score,
+                v.published_at, UTC_TIMESTAMP()
+            FROM videos v
+            JOIN video_sentiment_agg s ON v.video_id = s.video_id
+            LEFT JOIN (
+                SELECT video_id, topic_id, topic_score,
+                       ROW_NUMBER() OVER (PARTITION BY video_id ORDER BY topic_score DESC, topic_id) AS topic_rank
+                FROM video_topics
+            ) t ON t.video_id = v.video_id AND t.topic_rank = 1
+            """
+        )
+
+
+def downgrade() -> None:
+    """
+    Drop video_rank_features table.
+    """
+    for name, _ in reversed(COVERING_INDEXES):
+        op.drop_index(name, table_name="video_rank_features")
+    op.drop_table("video_rank_features")
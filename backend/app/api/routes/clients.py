@@ -0,0 +1,23 @@
+"""
+외부 서비스 HTTP 클라이언트 지표 API
+업스트림별(Bento 등) 연결 풀 설정, 서킷 브레이커 상태, 엔드포인트별 지연/오류 (app/clients/http.py)
+Redis 캐시 facade 상태 (app/core/cache.py)
+"""
+from fastapi import APIRouter
+
+from app.clients.http import clients_stats
+from app.core.cache import get_cache
+
+router = APIRouter(prefix="/api/clients", tags=["clients"])
+
+
+@router.get("/metrics")
+async def get_client_metrics():
+    """업스트림별 요청 수/오류/브레이커 차단 수, p50/p95 지연, 브레이커 상태"""
+    return clients_stats()
+
+
+@router.get("/cache")
+async def get_cache_metrics():
+    """Redis 캐시 브레이커 상태, 로컬 LRU 크기, 로컬 fallback 읽기/쓰기 수, reconcile 대기/완료 수"""
+    return get_cache().stats()
@@ -0,0 +1,42 @@
+"""
+사용자 영상 이벤트 수집 API
+이벤트는 메모리 버퍼에 적재 후 백그라운드에서 일괄 저장 (app/services/event_ingestion.py)
+"""
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from app.core.auth import get_current_user_id
+from app.schemas.event import VideoEventBatch, VideoEventBatchResponse
+from app.services.event_ingestion import EVENT_FLUSH_INTERVAL_SEC, get_event_buffer
+
+router = APIRouter(prefix="/api/events", tags=["events"])
+
+
+@router.post("", status_code=202, response_model=VideoEventBatchResponse)
+def post_events(
+    batch: VideoEventBatch,
+    user_id: str = Depends(get_current_user_id),
+):
+    """
+    시청/좋아요 이벤트 배치 수집
+
+    - DB에 바로 쓰지 않고 버퍼에 넣은 뒤 202 반환
+    - 버퍼가 가득 차서 하나도 받지 못하면 429 + Retry-After
+    """
+    accepted, rejected = get_event_buffer().add(
+        int(user_id),
+        [event.model_dump() for event in batch.events],
+    )
+    if accepted == 0 and rejected:
+        return JSONResponse(
+            status_code=429,
+            content={"success": False, "accepted": 0, "rejected": rejected},
+            headers={"Retry-After": str(max(1, int(EVENT_FLUSH_INTERVAL_SEC)))},
+        )
+    return VideoEventBatchResponse(accepted=accepted, rejected=rejected)
+
+
+@router.get("/metrics")
+def get_event_metrics():
+    """이벤트 버퍼/flush 지표"""
+    return get_event_buffer().stats()
@@ -0,0 +1,35 @@
+"""
+백그라운드 작업 조회 API
+느린 엔드포인트가 202로 넘긴 작업의 상태/결과를 폴링 또는 롱폴링 (app/services/job_runner.py)
+"""
+from fastapi import APIRouter, HTTPException, Query
+
+from app.schemas.job import JobResponse
+from app.services.job_runner import JOB_MAX_WAIT_SEC, get_job_runner, job_view
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+
+@router.get("/metrics")
+async def get_job_metrics():
+    """작업 제출/중복 합류/실패/대기열 지표"""
+    return await get_job_runner().stats()
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=JOB_MAX_WAIT_SEC, description="작업이 끝날 때까지 최대 대기 시간(초, 롱폴링)"),
+):
+    """
+    작업 상태 조회
+
+    - status가 succeeded면 result에 원래 엔드포인트의 응답 본문
+    - failed면 error / status_code
+    - 결과는 JOB_RESULT_TTL_SEC 동안 보관
+    """
+    runner = get_job_runner()
+    job = await runner.wait(job_id, wait) if wait > 0 else await runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job_view(job)
@@ -13,8 +13,7 @@ from app.core.auth import get_current_user_id
 from app.core.config import JWT_SECRET, JWT_ALGO
 from app.crud import persona as crud_persona
 from app.crud import video as crud_video
-from app.models.video import Video
-from app.models.channel import Channel
+from app.services import video_serialization
 
 logger = logging.getLogger(__name__)
 
@@ -90,18 +89,16 @@ def get_personalized_recommendations(
             logger.info(f"[Personalized] Cold-start for user {user_id}, returning popular videos")
             # 기본 인기 영상으로 fallback
             popular_videos = crud_video.get_most_liked_videos(db, skip=0, limit=limit)
+            # 채널명 일괄 조회 (LRU 캐시 우선)
+            channel_name_map = video_serialization.get_channel_name_map(db, popular_videos)
             
             items = []
             for video in popular_videos:
-                # 채널 정보 조회
-                channel = db.query(Channel).filter(Channel.id == video.channel_id).first()
-                channel_title = channel.title if channel else "알 수 없음"
-                
                 items.append({
                     "video_id": video.id,
                     "title": video.title,
                     "thumbnail_url": video.thumbnail_url,
-                    "channel_title": channel_title,
+                    "channel_title": channel_name_map.get(video.channel_id) or "알 수 없음",
                     "similarity_score": None,
                     "reason": "아직 시청 기록이 적어서, 우선 인기 여행 영상을 추천해드릴게요."
                 })
@@ -127,10 +124,16 @@ def get_personalized_recommendations(
             }
         
         # 3. 각 후보 영상에 대해 유사도 계산
+        # 저장된 임베딩은 한 번의 IN 쿼리로 조회하고, 없는 영상만 개별 생성
+        stored_embeddings = crud_persona.get_stored_video_embeddings(db, [v.id for v in candidate_videos])
         scored_videos = []
         for video in candidate_videos:
             # 영상 임베딩 가져오기
-            video_embedding = crud_persona.get_video_embedding(db, video)
+            video_embedding = stored_embeddings.get(video.id)
+            if video_embedding is None:
+                video_embedding = crud_persona.get_video_embedding(db, video)
+            elif hasattr(video_embedding, "tolist"):
+                video_embedding = video_embedding.tolist()
             
             if not video_embedding:
                 continue
@@ -150,15 +153,13 @@ def get_personalized_recommendations(
         scored_videos.sort(key=lambda x: x["similarity"], reverse=True)
         top_videos = scored_videos[:limit]
         
-        # 5. 응답 형식으로 변환
+        # 5. 응답 형식으로 변환 (채널명 일괄 조회)
+        channel_name_map = video_serialization.get_channel_name_map(db, [item["video"] for item in top_videos])
         items = []
         for item in top_videos:
             video = item["video"]
             similarity = item["similarity"]
-            
-            # 채널 정보 조회
-            channel = db.query(Channel).filter(Channel.id == video.channel_id).first()
-            channel_title = channel.title if channel else "알 수 없음"
+            channel_title = channel_name_map.get(video.channel_id) or "알 수 없음"
             
             # 추천 이유 생성
             if similarity >= 0.8:
@@ -4,8 +4,8 @@ from typing import Optional
 
 from app.core.database import get_db
 from app.recommendation.models import RankedVideo, RankedVideoList
-from app.recommendation.ranking import compute_final_score
-from app.recommendation.repository import fetch_rank_candidates, fetch_top_topics
+from app.recommendation.ranking import rank_candidates
+from app.recommendation.repository import attach_rank_details, fetch_rank_candidates, fetch_top_topics
 from app.core.responses import ok
 from app.core.auth import get_current_user_id
 
@@ -21,34 +21,25 @@ def get_recommended(
     """감정 + 토픽 + 인기도를 결합한 랭킹 추천.
 
     배치 파이프라인에서 미리 집계된 테이블을 사용한다.
+    후보는 랭킹 피처 테이블(video_rank_features) 인덱스 범위에서 읽고, 제목/채널은 상위 limit개만 조회한다.
     """
     try:
         candidates = fetch_rank_candidates(db=db, limit=limit * 5, topic_id=topic_id)
         if not candidates:
             return RankedVideoList(videos=[], total=0, message="no candidates")
 
-        # 점수 계산 후 상위 limit 추출
-        ranked = []
-        for row in candidates:
-            score = compute_final_score(
-                pos_ratio=row.get("pos_ratio"),
-                avg_score=row.get("avg_score"),
-                topic_score=row.get("topic_score"),
-                video_topic_id=row.get("topic_id"),
-                target_topic_id=topic_id,
-                views=row.get("views"),
-            )
-            ranked.append({
+        # 후보 전체를 한 번에 점수화하고 상위 limit만 argpartition으로 추출
+        topn = [
+            {
                 "video_id": row["video_id"],
                 "title": row.get("title") or "",
                 "channel_id": row.get("channel_id") or "",
-                "score": score,
+                "score": row["score"],
                 "pos_ratio": row.get("pos_ratio"),
                 "topic_id": row.get("topic_id"),
-            })
-
-        ranked.sort(key=lambda x: x["score"], reverse=True)
-        topn = ranked[:limit]
+            }
+            for row in attach_rank_details(db, rank_candidates(candidates, target_topic_id=topic_id, limit=limit))
+        ]
         payload = RankedVideoList(videos=[RankedVideo(**v) for v in topn], total=len(topn)).model_dump()
         return ok(payload).model_dump()
     except Exception as e:
@@ -66,7 +57,7 @@ def get_personalized(
 
     - user_features가 아직 없으므로 최근 본 토픽(recent_topic_id)이나
       전체 인기 토픽 상위 1개를 target_topic으로 두고 동일 점수식으로 랭킹한다.
-    - 추후 user_features가 생기면 compute_final_score 호출 시 user_affinity만 가중치로 추가하면 됨.
+    - 추후 user_features가 생기면 후보 행에 user_affinity만 채워 넣으면 rank_candidates가 가중치로 반영함.
     """
     try:
         target = recent_topic_id
@@ -78,28 +69,18 @@ def get_personalized(
         if not candidates:
             return RankedVideoList(videos=[], total=0, message="no candidates")
 
-        ranked = []
-        for row in candidates:
-            score = compute_final_score(
-                pos_ratio=row.get("pos_ratio"),
-                avg_score=row.get("avg_score"),
-                topic_score=row.get("topic_score"),
-                video_topic_id=row.get("topic_id"),
-                target_topic_id=target,
-                views=row.get("views"),
-                # user_affinity 자리(향후 user_features 조인 후 값 전달)
-            )
-            ranked.append({
+        # 후보 전체를 한 번에 점수화하고 상위 limit만 argpartition으로 추출
+        topn = [
+            {
                 "video_id": row["video_id"],
                 "title": row.get("title") or "",
                 "channel_id": row.get("channel_id") or "",
-                "score": score,
+                "score": row["score"],
                 "pos_ratio": row.get("pos_ratio"),
                 "topic_id": row.get("topic_id"),
-            })
-
-        ranked.sort(key=lambda x: x["score"], reverse=True)
-        topn = ranked[:limit]
+            }
+            for row in attach_rank_details(db, rank_candidates(candidates, target_topic_id=target, limit=limit))
+        ]
         payload = RankedVideoList(videos=[RankedVideo(**v) for v in topn], total=len(topn)).model_dump()
         return ok(payload).model_dump()
     except Exception as e:
@@ -2,49 +2,75 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import Optional
 from app.core.database import get_db
-from app.core.cache import Cache
+from app.core.cache import get_cache
 from app.core.responses import ok
 from sqlalchemy import text
+from datetime import datetime
+from app.utils.pagination import decode_cursor_or_400, keyset_sql, next_cursor
 
 router = APIRouter(prefix="/api/v1/search", tags=["search"])
 
 
+# 정렬 키 (published_at DESC, id DESC) - alembic 20251020_01 인덱스와 같은 순서
+_SEARCH_CURSOR = "search-videos"
+_SEARCH_KEYSET = (("published_at", True), ("id", False))
+
+
 @router.get("/videos")
 def search_videos(
     q: str = Query(..., min_length=1, max_length=128),
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (응답의 next_cursor, 주어지면 page 무시)"),
     db: Session = Depends(get_db),
 ):
-    cache = Cache()
+    after = decode_cursor_or_400(_SEARCH_CURSOR, cursor, [None] * len(_SEARCH_KEYSET))
+    cache = get_cache()
     key = f"search:q={q}:page={page}:limit={limit}"
+    if cursor:
+        key = f"search:q={q}:cursor={cursor}:limit={limit}"
     cached = cache.get_json(key)
     if cached:
         return ok(cached).model_dump()
 
-    offset = (page - 1) * limit
+    params = {"k": f"%{q}%", "limit": limit + 1}
+    if after is not None:
+        # 키셋: 마지막 행 다음부터 seek (깊은 페이지도 건너뛴 행을 읽지 않음)
+        seek_sql, seek_params = keyset_sql(_SEARCH_KEYSET, after)
+        seek_sql = f"AND {seek_sql}"
+        page_sql = "LIMIT :limit"
+        params.update(seek_params)
+    else:
+        seek_sql = ""
+        page_sql = "LIMIT :limit OFFSET :offset"
+        params["offset"] = (page - 1) * limit
     # Shorts 제외: duration_sec >= 240 조건 (칼럼이 없으면 백업으로 LIKE '#shorts' 제거)
     sql = text(
-        """
+        f"""
         SELECT id, channel_id, title, description, published_at, thumbnail_url, view_count
         FROM travel_videos
         WHERE (title LIKE :k OR description LIKE :k)
           AND (duration_sec IS NULL OR duration_sec >= 240)
           AND (LOWER(title) NOT LIKE '%#shorts%' AND LOWER(description) NOT LIKE '%#shorts%')
-        ORDER BY published_at DESC
-        LIMIT :limit OFFSET :offset
+          {seek_sql}
+        ORDER BY published_at DESC, id DESC
+        {page_sql}
         """
     )
-    rows = db.execute(sql, {"k": f"%{q}%", "limit": limit, "offset": offset}).mappings().all()
+    rows = db.execute(sql, params).mappings().all()
+    items = [
+        {key: value.isoformat() if isinstance(value, datetime) else value for key, value in r.items()}
+        for r in rows
+    ]
+    items, next_page_cursor = next_cursor(_SEARCH_CURSOR, items, limit, [name for name, _ in _SEARCH_KEYSET])
     data = {
-        "items": [dict(r) for r in rows],
+        "items": items,
         "page": page,
         "limit": limit,
         "query": q,
+        "next_cursor": next_page_cursor,
     }
     cache.set_json(key, data, ttl_sec=60)  # 60초 캐시
     # 인기/자동완성 카운트 누적 (옵션)
     cache.zadd("search:popular", 1, q)
     return ok(data).model_dump()
-
-
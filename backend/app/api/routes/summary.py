@@ -1,17 +1,25 @@
 """
 Video Summary API 라우터
 RAG 기반 한줄 요약 엔드포인트
+저장된 요약은 바로 반환하고, 생성(RAG + LLM)만 백그라운드 작업(summary-one-line)으로 실행 (app/services/job_runner.py)
 """
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+import asyncio
 
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.rag.pipeline import generate_one_line_summary
+from app.core.database import SessionLocal, get_async_db
+from app.models.video_summary import VideoSummary
+from app.schemas.job import JobResponse
+from app.services.job_runner import JOB_INLINE_WAIT_SEC, JOB_MAX_WAIT_SEC, register_job_handler, run_or_accept
 
 router = APIRouter(prefix="/api/videos", tags=["summary"])
 
+ONE_LINE_SUMMARY_JOB = "summary-one-line"
+ONE_LINE_SUMMARY_TYPE = "one_line_rag"
+
 
 class OneLineSummaryResponse(BaseModel):
     """한줄 요약 응답 모델"""
@@ -23,24 +31,27 @@ class OneLineSummaryResponse(BaseModel):
         from_attributes = True
 
 
-@router.get("/{video_id}/summary/one-line", response_model=OneLineSummaryResponse)
-async def get_one_line_summary(
-    video_id: str,
-    db: Session = Depends(get_db),
-):
-    """
-    RAG 기반 한줄 요약 조회/생성
-    
-    - 캐시에 있으면 즉시 반환
-    - 없으면 RAG 파이프라인으로 생성 후 반환
-    """
+def _generate_one_line_summary(video_id: str) -> str:
+    """RAG 파이프라인 실행 (동기 DB 세션/LLM 호출 → 작업 스레드에서 전용 세션과 이벤트 루프로 실행)"""
+    db = SessionLocal()
+    try:
+        # LangChain/Chroma import 비용이 크므로 첫 요약 작업 시점에 로드
+        from app.rag.pipeline import generate_one_line_summary
+
+        return asyncio.run(generate_one_line_summary(db, video_id))
+    finally:
+        db.close()
+
+
+async def _one_line_summary_job(video_id: str) -> dict:
+    """summary-one-line 작업: import/생성이 이벤트 루프를 막지 않도록 스레드에서 실행"""
     try:
-        summary_text = await generate_one_line_summary(db, video_id)
+        summary_text = await asyncio.to_thread(_generate_one_line_summary, video_id)
         return OneLineSummaryResponse(
             video_id=video_id,
-            summary_type="one_line_rag",
+            summary_type=ONE_LINE_SUMMARY_TYPE,
             summary=summary_text,
-        )
+        ).model_dump()
     except ValueError as e:
         # 환경 변수 누락 등
         raise HTTPException(status_code=500, detail=f"설정 오류: {str(e)}")
@@ -51,3 +62,34 @@ async def get_one_line_summary(
         print(traceback.format_exc())
         raise HTTPException(status_code=500, detail=f"요약 생성 실패: {str(e)}")
 
+
+register_job_handler(ONE_LINE_SUMMARY_JOB, _one_line_summary_job)
+
+
+@router.get(
+    "/{video_id}/summary/one-line",
+    response_model=OneLineSummaryResponse,
+    responses={202: {"model": JobResponse, "description": "생성 중 - poll_url로 결과 조회"}},
+)
+async def get_one_line_summary(
+    video_id: str,
+    wait: float = Query(JOB_INLINE_WAIT_SEC, ge=0, le=JOB_MAX_WAIT_SEC, description="결과를 기다릴 최대 시간(초), 0이면 바로 202"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    RAG 기반 한줄 요약 조회/생성
+    
+    - 캐시(video_summaries)에 있으면 작업 큐를 거치지 않고 즉시 반환
+    - 없으면 RAG 파이프라인으로 생성 (같은 영상의 동시 요청은 작업 하나로 합쳐짐)
+    - wait초 안에 끝나지 않으면 202 + 작업 정보
+    """
+    result = await db.execute(
+        select(VideoSummary.summary_text).where(
+            VideoSummary.video_id == video_id,
+            VideoSummary.summary_type == ONE_LINE_SUMMARY_TYPE,
+        )
+    )
+    summary_text = result.scalar_one_or_none()
+    if summary_text is not None:
+        return OneLineSummaryResponse(video_id=video_id, summary_type=ONE_LINE_SUMMARY_TYPE, summary=summary_text)
+    return await run_or_accept(ONE_LINE_SUMMARY_JOB, video_id, None, wait)
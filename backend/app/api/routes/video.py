@@ -12,14 +12,15 @@ from typing import Dict, List, Optional
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.clients.bento import analyze_video_detail_for_bento
-from app.core.cache import Cache
-from app.core.database import get_db, SessionLocal
+from app.core.cache import Cache, get_cache
+from app.core.database import async_session_scope, get_async_db, get_db, SessionLocal
 from app.crud import video as crud_video
-from app.models.channel import Channel
 from app.recommendations import ContentBasedRecommender
+from app.schemas.job import JobResponse
 from app.schemas.recommendation import RecommendationResponse, UserPreferenceRequest
 from app.schemas.video import (
     VideoAnalysis,
@@ -29,9 +30,11 @@ from app.schemas.video import (
     VideoResponse,
 )
 # ML API 서버 제거됨 - 재랭킹 기능 비활성화
-from app.services.comment_summary import generate_comment_summary
+# transformers/LangChain 기반 서비스는 콜드 스타트 단축을 위해 각 핸들러에서 지연 import
+from app.services import video_serialization
+from app.services.job_runner import JOB_INLINE_WAIT_SEC, JOB_MAX_WAIT_SEC, register_job_handler, run_or_accept
+from app.utils import pagination
 from app.services.comment_summary_llm import generate_comment_three_line_summary
-from app.services.sentiment_summary import summarize_sentiment
 
 router = APIRouter(prefix="/api/videos", tags=["videos"])
 logger = logging.getLogger(__name__)
@@ -54,8 +57,12 @@ _RECOMMENDED_CACHE_NAMESPACE = "video-recommended"
 _MOST_LIKED_CACHE_NAMESPACE = "video-most-liked"
 _SIMILAR_CACHE_NAMESPACE = "video-similar"
 
+# 백그라운드 작업 타입 (app/services/job_runner.py)
+VIDEO_DETAIL_JOB = "video-detail"
+SENTIMENT_SUMMARY_JOB = "sentiment-summary"
+
 try:
-    _detail_cache: Optional[Cache] = Cache()
+    _detail_cache: Optional[Cache] = get_cache()
 except Exception as cache_error:
     logging.getLogger(__name__).warning("[VideoDetail] Cache initialization failed: %s", cache_error)
     _detail_cache = None
@@ -136,56 +143,41 @@ def _set_cached_list(namespace: str, key_suffix: str, payload: dict, ttl_sec: in
 
 
 def _build_channel_name_map(db: Session, videos: List[object]) -> Dict[str, Optional[str]]:
-    """영상 목록에서 채널명을 일괄 조회하여 매핑"""
-    channel_ids = {getattr(v, "channel_id", None) for v in videos if getattr(v, "channel_id", None)}
-    if not channel_ids:
-        return {}
-    rows = db.query(Channel.id, Channel.title).filter(Channel.id.in_(channel_ids)).all()
-    return {channel_id: title for channel_id, title in rows}
-
-
-def _serialize_videos(videos: List[object], channel_name_map: Optional[Dict[str, Optional[str]]] = None) -> List[VideoResponse]:
-    """공통 VideoResponse 변환 로직 (중복 제거 + channel_name 주입)"""
-    video_responses: List[VideoResponse] = []
-    seen_ids = set()
-    for idx, v in enumerate(videos):
-        try:
-            video_id = getattr(v, "id", None)
-            if not video_id or video_id in seen_ids:
-                continue
-            video_dict = {
-                "id": v.id,
-                "channel_id": v.channel_id,
-                "channel_name": channel_name_map.get(v.channel_id) if channel_name_map else getattr(v, "channel_name", None),
-                "title": v.title,
-                "description": v.description,
-                "published_at": v.published_at,
-                "duration": v.duration,
-                "duration_sec": v.duration_sec,
-                "view_count": v.view_count,
-                "like_count": v.like_count,
-                "comment_count": v.comment_count,
-                "category_id": v.category_id,
-                "tags": v.tags,
-                "thumbnail_url": v.thumbnail_url,
-                "keyword": v.keyword,
-                "region": v.region,
-                "is_shorts": v.is_shorts,
-                "created_at": v.created_at,
-                "updated_at": v.updated_at,
-            }
-            video_responses.append(VideoResponse.model_validate(video_dict))
-            seen_ids.add(video_id)
-        except Exception as exc:
-            logger.warning("[VideoSerialize] Failed to serialize video idx=%s id=%s: %s", idx, getattr(v, "id", None), exc)
-            continue
-    return video_responses
+    """영상 목록에서 채널명을 일괄 조회하여 매핑 (프로세스 로컬 LRU 우선)"""
+    return video_serialization.get_channel_name_map(db, videos)
 
 
-def _build_video_list_response(db: Session, videos: List[object]) -> VideoListResponse:
+def _serialize_videos(videos: List[object], channel_name_map: Optional[Dict[str, Optional[str]]] = None) -> List[dict]:
+    """공통 응답 dict 변환 로직 (중복 제거 + channel_name 주입, JSON 호환 값)"""
+    return video_serialization.serialize_videos(videos, channel_name_map)
+
+
+def _build_video_list_payload(db: Session, videos: List[object]) -> dict:
     channel_name_map = _build_channel_name_map(db, videos)
-    video_responses = _serialize_videos(videos, channel_name_map)
-    return VideoListResponse(videos=video_responses, total=len(video_responses))
+    return video_serialization.video_list_payload(_serialize_videos(videos, channel_name_map))
+
+
+def _page_cache_key(base: str, cursor: Optional[str]) -> str:
+    """목록 캐시 키 (커서는 위치가 같으면 항상 같은 문자열이므로 그대로 키에 포함)"""
+    return f"{base}:{cursor}" if cursor else base
+
+
+def _video_page_payload(db: Session, kind: str, keys, stmt, limit: int, total: Optional[int] = None) -> dict:
+    """limit + 1개로 만든 stmt를 조회해 limit개와 다음 페이지 커서를 담은 payload 생성"""
+    items = video_serialization.fetch_video_dicts(db, stmt)
+    items, cursor = pagination.next_cursor(kind, items, limit, [key.key for key in keys])
+    return video_serialization.video_list_payload(items, total, next_cursor=cursor)
+
+
+async def _video_page_payload_async(
+    db: AsyncSession, kind: str, keys, stmt, limit: int, total: Optional[int] = None
+) -> dict:
+    """_video_page_payload의 비동기 버전"""
+    items = await video_serialization.fetch_video_dicts_async(db, stmt)
+    items, cursor = pagination.next_cursor(kind, items, limit, [key.key for key in keys])
+    return video_serialization.video_list_payload(items, total, next_cursor=cursor)
+
+
 # 채널 다양화 추천 (정적 경로 - 동적보다 먼저)
 @router.get("/diversified", response_model=VideoListResponse)
 def get_diversified_videos(
@@ -200,20 +192,17 @@ def get_diversified_videos(
         cached_payload = _get_cached_list(_DIVERSIFIED_CACHE_NAMESPACE, cache_key)
         if cached_payload:
             logger.info("[Diversified] Cache hit for total=%s max_per_channel=%s", total, max_per_channel)
-            return VideoListResponse.model_validate(cached_payload)
+            return video_serialization.json_response(cached_payload)
 
         videos = crud_video.get_diversified_videos(db, total=total, max_per_channel=max_per_channel)
-        channel_name_map = _build_channel_name_map(db, videos)
-
-        video_responses = _serialize_videos(videos, channel_name_map)
-        response_payload = VideoListResponse(videos=video_responses, total=len(video_responses))
+        response_payload = _build_video_list_payload(db, videos)
         _set_cached_list(
             _DIVERSIFIED_CACHE_NAMESPACE,
             cache_key,
-            response_payload.model_dump(),
+            response_payload,
             VIDEO_DIVERSIFIED_CACHE_TTL_SEC,
         )
-        return response_payload
+        return video_serialization.json_response(response_payload)
     except Exception as e:
         error_trace = traceback.format_exc()
         print(f"[ERROR] Error in get_diversified_videos: {str(e)}")
@@ -226,20 +215,25 @@ def get_diversified_videos(
 
 
 @router.get("/", response_model=VideoListResponse)
-def get_videos(
+async def get_videos(
     skip: int = Query(0, ge=0, description="페이지네이션 오프셋"),
     limit: int = Query(10, ge=1, le=500, description="반환할 비디오 수"),
     channel_id: Optional[str] = Query(None, description="채널 ID로 필터링"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (응답의 next_cursor, 주어지면 skip 무시)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """비디오 목록 조회"""
-    videos = crud_video.get_videos(db, skip=skip, limit=limit, channel_id=channel_id)
-    total = crud_video.get_videos_count(db, channel_id=channel_id)
-    
-    return VideoListResponse(
-        videos=[VideoResponse.model_validate(v) for v in videos],
-        total=total
+    """비디오 목록 조회 (offset 또는 커서 페이지네이션)"""
+    after = pagination.decode_cursor_or_400(crud_video.LATEST_CURSOR, cursor, crud_video.LATEST_KEYS)
+    total = await crud_video.get_videos_count_async(db, channel_id=channel_id)
+    payload = await _video_page_payload_async(
+        db,
+        crud_video.LATEST_CURSOR,
+        crud_video.LATEST_KEYS,
+        crud_video.latest_videos_stmt(skip=skip, limit=limit + 1, channel_id=channel_id, after=after),
+        limit,
+        total,
     )
+    return video_serialization.json_response(payload)
 
 
 @router.post("/", response_model=VideoResponse, status_code=201)
@@ -255,50 +249,52 @@ async def get_recommended_videos(
     limit: int = Query(10, ge=1, le=100, description="반환할 비디오 수"),
     query: Optional[str] = Query(None, description="재랭킹용 검색 쿼리 (선택사항)"),
     use_rerank: bool = Query(True, description="ML 기반 재랭킹 사용 여부"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (응답의 next_cursor, 주어지면 skip 무시)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     추천 비디오 목록 조회 (조회수 기준 상위, ML 재랭킹 지원)
     
     - query가 제공되면 ML 재랭킹을 사용하여 쿼리와 가장 관련성 높은 비디오를 우선 정렬
     - use_rerank=False이면 기본 조회수 기준 정렬만 사용
+    - cursor: (view_count, published_at, id) 키셋 페이지네이션
     """
     import traceback
+    after = pagination.decode_cursor_or_400(crud_video.RECOMMENDED_CURSOR, cursor, crud_video.RECOMMENDED_KEYS)
     try:
-        cache_key = f"{skip}:{limit}:{query or '-'}:{int(use_rerank)}"
+        cache_key = _page_cache_key(f"{skip}:{limit}:{query or '-'}:{int(use_rerank)}", cursor)
         cached_payload = _get_cached_list(_RECOMMENDED_CACHE_NAMESPACE, cache_key)
         if cached_payload:
             logger.info("[Recommended] Cache hit for skip=%s limit=%s query=%s", skip, limit, query)
-            return VideoListResponse.model_validate(cached_payload)
-
-        # 1. 더 많이 가져와서 재랭킹 후 상위 limit개만 선택
-        fetch_limit = limit * 2 if use_rerank and query else limit
-        videos = crud_video.get_recommended_videos(db, skip=skip, limit=fetch_limit)
-        print(f"[DEBUG] Found {len(videos)} videos (4min+)")
-        channel_name_map = _build_channel_name_map(db, videos)
+            return video_serialization.json_response(cached_payload)
+
+        # 1. 영상 + 채널명을 한 번의 조인 쿼리로 조회 (ORM 객체 생성 없음, 다음 페이지 확인용 +1)
+        response_payload = await _video_page_payload_async(
+            db,
+            crud_video.RECOMMENDED_CURSOR,
+            crud_video.RECOMMENDED_KEYS,
+            crud_video.recommended_videos_stmt(skip=skip, limit=limit + 1, after=after),
+            limit,
+        )
+        print(f"[DEBUG] Found {response_payload['total']} videos (4min+)")
         
         # 2. 총 개수 조회 생략 (성능 최적화)
         # total = crud_video.get_videos_count(db)
         # print(f"[DEBUG] Total videos (4min+): {total}")
         
-        # 3. VideoResponse로 변환
-        video_responses = _serialize_videos(videos, channel_name_map)
-        
-        # 4. ML 재랭킹 기능 제거됨 (ML API 서버 미사용)
+        # 3. ML 재랭킹 기능 제거됨 (ML API 서버 미사용)
         # use_rerank 파라미터는 무시되고 기본 조회수 기준 정렬만 사용됨
         if use_rerank and query:
             print(f"[DEBUG] ML reranking disabled - using default view_count order")
         
         # total은 실제 반환된 비디오 개수 사용 (성능 최적화)
-        total = len(video_responses)
-        response_payload = VideoListResponse(videos=video_responses, total=total)
         _set_cached_list(
             _RECOMMENDED_CACHE_NAMESPACE,
             cache_key,
-            response_payload.model_dump(),
+            response_payload,
             VIDEO_RECOMMENDED_CACHE_TTL_SEC,
         )
-        return response_payload
+        return video_serialization.json_response(response_payload)
     except Exception as e:
         error_trace = traceback.format_exc()
         print(f"[ERROR] Error in get_recommended_videos: {str(e)}")
@@ -314,41 +310,39 @@ async def get_recommended_videos(
 def get_trend_videos(
     skip: int = Query(0, ge=0, description="페이지네이션 오프셋"),
     limit: int = Query(10, ge=1, le=500, description="반환할 비디오 수 (최대 500)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (응답의 next_cursor, 주어지면 skip 무시)"),
     db: Session = Depends(get_db)
 ):
-    """트렌드 비디오 목록 조회 (최근 게시일 기준)"""
+    """트렌드 비디오 목록 조회 (최근 게시일 기준, (published_at, id) 커서 페이지네이션 지원)"""
     import traceback
+    after = pagination.decode_cursor_or_400(crud_video.LATEST_CURSOR, cursor, crud_video.LATEST_KEYS)
     try:
-        cache_key = f"{skip}:{limit}"
+        cache_key = _page_cache_key(f"{skip}:{limit}", cursor)
         cached_payload = _get_cached_list(_TRENDS_CACHE_NAMESPACE, cache_key)
         if cached_payload:
             logger.info("[Trend] Cache hit for skip=%s limit=%s", skip, limit)
-            return VideoListResponse.model_validate(cached_payload)
-
-        # 1. 데이터베이스에서 비디오 조회 (4분 이상만)
-        videos = crud_video.get_trend_videos(db, skip=skip, limit=limit)
-        print(f"[DEBUG] Found {len(videos)} trend videos (4min+)")
-        channel_name_map = _build_channel_name_map(db, videos)
+            return video_serialization.json_response(cached_payload)
+
+        # 1. 데이터베이스에서 비디오 + 채널명 조회 (4분 이상만, 조인 쿼리 1회)
+        response_payload = _video_page_payload(
+            db,
+            crud_video.LATEST_CURSOR,
+            crud_video.LATEST_KEYS,
+            crud_video.latest_videos_stmt(skip=skip, limit=limit + 1, after=after),
+            limit,
+        )
+        print(f"[DEBUG] Found {response_payload['total']} trend videos (4min+)")
         
-        # 2. 총 개수 조회 생략 (성능 최적화)
+        # 2. 총 개수 조회 생략 (성능 최적화, total은 실제 반환된 개수)
         # total = crud_video.get_videos_count(db)
         # print(f"[DEBUG] Total videos (4min+): {total}")
-        total = len(videos)  # 실제 반환된 개수만 사용
-        
-        # 3. VideoResponse로 변환 (에러 발생 가능 지점)
-        video_responses = _serialize_videos(videos, channel_name_map)
-        
-        response_payload = VideoListResponse(
-            videos=video_responses,
-            total=total
-        )
         _set_cached_list(
             _TRENDS_CACHE_NAMESPACE,
             cache_key,
-            response_payload.model_dump(),
+            response_payload,
             VIDEO_TRENDS_CACHE_TTL_SEC,
         )
-        return response_payload
+        return video_serialization.json_response(response_payload)
     except Exception as e:
         error_trace = traceback.format_exc()
         print(f"[ERROR] Error in get_trend_videos: {str(e)}")
@@ -427,38 +421,9 @@ def get_personalized_recommendations(
         
         print(f"[DEBUG] Recommended videos count: {len(recommended_videos)}")
         
-        # VideoResponse로 변환
-        video_responses = []
-        for idx, video in enumerate(recommended_videos):
-            try:
-                video_dict = {
-                    "id": video.id,
-                    "channel_id": video.channel_id,
-                    "title": video.title,
-                    "description": video.description,
-                    "published_at": video.published_at,
-                    "duration": video.duration,
-                    "duration_sec": video.duration_sec,
-                    "view_count": video.view_count,
-                    "like_count": video.like_count,
-                    "comment_count": video.comment_count,
-                    "category_id": video.category_id,
-                    "tags": video.tags,
-                    "thumbnail_url": video.thumbnail_url,
-                    "keyword": video.keyword,
-                    "region": video.region,
-                    "is_shorts": video.is_shorts,
-                    "created_at": video.created_at,
-                    "updated_at": video.updated_at,
-                }
-                video_response = VideoResponse.model_validate(video_dict)
-                video_responses.append(video_response.model_dump())
-            except Exception as ve:
-                print(f"[DEBUG] Error validating recommended video {idx}: {str(ve)}")
-                print(f"[DEBUG] Video data: id={video.id if video else 'None'}, title={video.title if video else 'None'}")
-                import traceback
-                print(f"[DEBUG] Validation error traceback: {traceback.format_exc()}")
-                continue
+        # 응답 dict로 직접 변환 (채널명은 LRU + 일괄 조회)
+        channel_name_map = _build_channel_name_map(db, recommended_videos)
+        video_responses = _serialize_videos(recommended_videos, channel_name_map)
         
         print(f"[DEBUG] Successfully converted {len(video_responses)} videos")
         
@@ -496,7 +461,7 @@ def get_similar_videos(
         cached_payload = _get_cached_list(_SIMILAR_CACHE_NAMESPACE, cache_key)
         if cached_payload:
             logger.info("[Similar] Cache hit for video_id=%s limit=%s", video_id, limit)
-            return VideoListResponse.model_validate(cached_payload)
+            return video_serialization.json_response(cached_payload)
 
         recommender = ContentBasedRecommender()
         
@@ -507,20 +472,14 @@ def get_similar_videos(
             min_duration_sec=240
         )
         
-        channel_name_map = _build_channel_name_map(db, similar_videos)
-        video_responses = _serialize_videos(similar_videos, channel_name_map)
-        
-        response_payload = VideoListResponse(
-            videos=video_responses,
-            total=len(video_responses)
-        )
+        response_payload = _build_video_list_payload(db, similar_videos)
         _set_cached_list(
             _SIMILAR_CACHE_NAMESPACE,
             cache_key,
-            response_payload.model_dump(),
+            response_payload,
             VIDEO_SIMILAR_CACHE_TTL_SEC,
         )
-        return response_payload
+        return video_serialization.json_response(response_payload)
     except Exception as e:
         error_trace = traceback.format_exc()
         print(f"[ERROR] Error in get_similar_videos: {str(e)}")
@@ -533,40 +492,39 @@ def get_similar_videos(
 def get_most_liked_videos(
     skip: int = Query(0, ge=0, description="페이지네이션 오프셋"),
     limit: int = Query(10, ge=1, le=100, description="반환할 비디오 수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (응답의 next_cursor, 주어지면 skip 무시)"),
     db: Session = Depends(get_db)
 ):
-    """가장 많은 좋아요를 받은 비디오 목록 조회"""
+    """가장 많은 좋아요를 받은 비디오 목록 조회 (커서 페이지네이션 지원)"""
     import traceback
+    after = pagination.decode_cursor_or_400(crud_video.MOST_LIKED_CURSOR, cursor, crud_video.MOST_LIKED_KEYS)
     try:
-        cache_key = f"{skip}:{limit}"
+        cache_key = _page_cache_key(f"{skip}:{limit}", cursor)
         cached_payload = _get_cached_list(_MOST_LIKED_CACHE_NAMESPACE, cache_key)
         if cached_payload:
             logger.info("[MostLiked] Cache hit for skip=%s limit=%s", skip, limit)
-            return VideoListResponse.model_validate(cached_payload)
-
-        # 1. 데이터베이스에서 비디오 조회 (좋아요 수 기준, 4분 이상만)
-        videos = crud_video.get_most_liked_videos(db, skip=skip, limit=limit)
-        print(f"[DEBUG] Found {len(videos)} most liked videos (4min+)")
+            return video_serialization.json_response(cached_payload)
+
+        # 1. 데이터베이스에서 비디오 + 채널명 조회 (좋아요 수 기준, 4분 이상만, 조인 쿼리 1회)
+        response_payload = _video_page_payload(
+            db,
+            crud_video.MOST_LIKED_CURSOR,
+            crud_video.MOST_LIKED_KEYS,
+            crud_video.most_liked_videos_stmt(skip=skip, limit=limit + 1, after=after),
+            limit,
+        )
+        print(f"[DEBUG] Found {response_payload['total']} most liked videos (4min+)")
 
-        # 2. 총 개수 조회 생략 (성능 최적화)
+        # 2. 총 개수 조회 생략 (성능 최적화, total은 실제 반환된 개수)
         # total = crud_video.get_videos_count(db)
         # print(f"[DEBUG] Total videos (4min+): {total}")
-        total = len(videos)  # 실제 반환된 개수만 사용
-
-        channel_name_map = _build_channel_name_map(db, videos)
-        video_responses = _serialize_videos(videos, channel_name_map)
-
-        response_payload = VideoListResponse(
-            videos=video_responses,
-            total=total
-        )
         _set_cached_list(
             _MOST_LIKED_CACHE_NAMESPACE,
             cache_key,
-            response_payload.model_dump(),
+            response_payload,
             VIDEO_MOST_LIKED_CACHE_TTL_SEC,
         )
-        return response_payload
+        return video_serialization.json_response(response_payload)
     except Exception as e:
         error_trace = traceback.format_exc()
         print(f"[ERROR] Error in get_most_liked_videos: {str(e)}")
@@ -579,13 +537,55 @@ def get_most_liked_videos(
 
 
 # 동적 경로는 정적 경로 다음에 정의
-@router.get("/{video_id}", response_model=VideoDetailResponse)
+@router.get(
+    "/{video_id}",
+    response_model=VideoDetailResponse,
+    responses={202: {"model": JobResponse, "description": "분석 중 - poll_url로 결과 조회"}},
+)
 async def get_video(
     video_id: str,
     force_refresh: bool = Query(False, description="캐시된 분석 결과를 무시하고 새로 계산"),
-    db: Session = Depends(get_db),
+    wait: float = Query(JOB_INLINE_WAIT_SEC, ge=0, le=JOB_MAX_WAIT_SEC, description="분석 결과를 기다릴 최대 시간(초), 0이면 바로 202"),
 ):
-    """특정 비디오 조회 + Bento 분석 결과"""
+    """
+    특정 비디오 조회 + Bento 분석 결과
+    - 응답 캐시 hit이면 바로 반환
+    - 아니면 DB 조회/분석을 백그라운드 작업(video-detail)으로 실행, 같은 영상의 동시 요청은 하나로 합쳐짐
+    - wait초 안에 끝나지 않으면 202 + 작업 정보 (GET /api/jobs/{job_id})
+    """
+    if not force_refresh:
+        overall_start = time.perf_counter()
+        cached_response_payload = await asyncio.to_thread(_get_cached_response, video_id)
+        if cached_response_payload:
+            cached_response = VideoDetailResponse.model_validate(cached_response_payload)
+            total_elapsed = (time.perf_counter() - overall_start) * 1000
+            detail_profiler.info(
+                "[VideoDetailProfile] video_id=%s response_cache=%s analysis_cache=%s db=0.00ms comments=0.00ms summary=0.00ms bento=0.00ms total=%.2fms",
+                video_id,
+                True,
+                False,
+                total_elapsed,
+            )
+            return cached_response
+    params = {"force_refresh": True} if force_refresh else None
+    return await run_or_accept(VIDEO_DETAIL_JOB, video_id, params, wait)
+
+
+async def _video_detail_job(video_id: str, force_refresh: bool = False) -> dict:
+    """video-detail 작업: 전용 비동기 세션으로 상세 + 분석 생성, 응답 본문(JSON 호환 dict) 반환"""
+    async with async_session_scope() as db:
+        response_payload = await _build_video_detail(db, video_id, force_refresh)
+    return response_payload.model_dump(mode="json")
+
+
+register_job_handler(VIDEO_DETAIL_JOB, _video_detail_job)
+
+
+async def _build_video_detail(db: AsyncSession, video_id: str, force_refresh: bool) -> VideoDetailResponse:
+    """
+    비디오 조회 + 분석 캐시 확인 + 댓글/Bento/요약 병렬 실행 후 캐시 저장
+    DB 조회는 AsyncSession, 동기 Redis 캐시 접근은 스레드로 넘겨 이벤트 루프를 막지 않음
+    """
     try:
         overall_start = time.perf_counter()
         summary_elapsed = 0.0
@@ -594,23 +594,8 @@ async def get_video(
         analysis_cache_hit = False
         response_cache_hit = False
 
-        if not force_refresh:
-            cached_response_payload = _get_cached_response(video_id)
-            if cached_response_payload:
-                response_cache_hit = True
-                cached_response = VideoDetailResponse.model_validate(cached_response_payload)
-                total_elapsed = (time.perf_counter() - overall_start) * 1000
-                detail_profiler.info(
-                    "[VideoDetailProfile] video_id=%s response_cache=%s analysis_cache=%s db=0.00ms comments=0.00ms summary=0.00ms bento=0.00ms total=%.2fms",
-                    video_id,
-                    response_cache_hit,
-                    False,
-                    total_elapsed,
-                )
-                return cached_response
-
         db_start = time.perf_counter()
-        db_video = crud_video.get_video(db, video_id=video_id)
+        db_video = await crud_video.get_video_async(db, video_id=video_id)
         if db_video is None:
             raise HTTPException(status_code=404, detail="Video not found")
         db_elapsed = (time.perf_counter() - db_start) * 1000
@@ -619,7 +604,7 @@ async def get_video(
         analysis_payload: Optional[VideoAnalysis] = None
 
         if not force_refresh:
-            cached_data = _get_cached_analysis(video_id)
+            cached_data = await asyncio.to_thread(_get_cached_analysis, video_id)
             if cached_data:
                 try:
                     analysis_payload = VideoAnalysis.model_validate(cached_data)
@@ -629,7 +614,7 @@ async def get_video(
 
         if analysis_cache_hit:
             response_payload = VideoDetailResponse(video=video_payload, analysis=analysis_payload)
-            _set_cached_response(video_id, response_payload.model_dump())
+            await asyncio.to_thread(_set_cached_response, video_id, response_payload.model_dump())
             total_elapsed = (time.perf_counter() - overall_start) * 1000
             detail_profiler.info(
                 "[VideoDetailProfile] video_id=%s response_cache=%s analysis_cache=%s db=%.2fms comments=0.00ms summary=0.00ms bento=0.00ms total=%.2fms",
@@ -642,7 +627,7 @@ async def get_video(
             return response_payload
 
         comments_start = time.perf_counter()
-        comments = crud_video.get_comment_payloads_for_video(db, video_id=video_id, limit=150)
+        comments = await crud_video.get_comment_payloads_for_video_async(db, video_id=video_id, limit=150)
         comments_elapsed = (time.perf_counter() - comments_start) * 1000
         logger.info("[VideoDetail] Retrieved %d comments for video %s", len(comments) if comments else 0, video_id)
         summary_lines: List[str] = []
@@ -737,10 +722,10 @@ async def get_video(
             logger.info("[VideoDetail] No comments found for video %s", video_id)
 
         if analysis_payload:
-            _set_cached_analysis(video_id, analysis_payload.model_dump())
+            await asyncio.to_thread(_set_cached_analysis, video_id, analysis_payload.model_dump())
 
         response_payload = VideoDetailResponse(video=video_payload, analysis=analysis_payload)
-        _set_cached_response(video_id, response_payload.model_dump())
+        await asyncio.to_thread(_set_cached_response, video_id, response_payload.model_dump())
 
         total_elapsed = (time.perf_counter() - overall_start) * 1000
         detail_profiler.info(
@@ -848,14 +833,41 @@ def get_video_keywords(
         raise HTTPException(status_code=500, detail=f"Error computing video keywords: {str(e)}")
 
 
-@router.get("/{video_id}/sentiment-summary")
+async def _sentiment_summary_job(video_id: str, max_comments: int = 200) -> dict:
+    """sentiment-summary 작업: 동기 LLM 호출이 이벤트 루프를 막지 않도록 전용 세션으로 스레드에서 실행"""
+    def _run() -> dict:
+        db = SessionLocal()
+        try:
+            return _sentiment_summary_payload(db, video_id, max_comments)
+        finally:
+            db.close()
+
+    return await asyncio.to_thread(_run)
+
+
+register_job_handler(SENTIMENT_SUMMARY_JOB, _sentiment_summary_job)
+
+
+@router.get(
+    "/{video_id}/sentiment-summary",
+    responses={202: {"model": JobResponse, "description": "분석 중 - poll_url로 결과 조회"}},
+)
 async def get_sentiment_summary(
     video_id: str,
     max_comments: int = Query(200, ge=1, le=500, description="분석할 최대 댓글 수"),
-    db: Session = Depends(get_db)
+    wait: float = Query(JOB_INLINE_WAIT_SEC, ge=0, le=JOB_MAX_WAIT_SEC, description="결과를 기다릴 최대 시간(초), 0이면 바로 202"),
 ):
     """
     비디오 댓글 기반 감정 요약 (LangChain 기반)
+    분석은 백그라운드 작업(sentiment-summary)으로 실행, 같은 영상/댓글 수의 동시 요청은 하나로 합쳐짐
+    wait초 안에 끝나지 않으면 202 + 작업 정보 (GET /api/jobs/{job_id})
+    """
+    return await run_or_accept(SENTIMENT_SUMMARY_JOB, video_id, {"max_comments": max_comments}, wait)
+
+
+def _sentiment_summary_payload(db: Session, video_id: str, max_comments: int) -> dict:
+    """
+    비디오 댓글 기반 감정 요약 (LangChain 기반)
     
     Args:
         video_id: YouTube 비디오 ID
@@ -881,6 +893,7 @@ async def get_sentiment_summary(
     import logging
     import os
     from datetime import datetime, timedelta
+    from app.services.sentiment_summary import summarize_sentiment
     logger = logging.getLogger(__name__)
     
     try:
@@ -1130,6 +1143,7 @@ async def get_comments_sentiment(
         # 7. 허깅페이스 요약 모델로 한 줄 요약 생성
         summary = []
         try:
+            from app.services.comment_summary import generate_comment_summary
             summary = generate_comment_summary(comment_texts, max_sentences=3)
         except Exception as summarize_error:
             print(f"[WARN] Failed to generate HuggingFace comment summary: {summarize_error}")
@@ -1280,28 +1294,48 @@ async def warm_video_list_caches() -> None:
                     "namespace": _RECOMMENDED_CACHE_NAMESPACE,
                     "key": "0:10:-:1",
                     "ttl": VIDEO_RECOMMENDED_CACHE_TTL_SEC,
-                    "fetch": lambda: crud_video.get_recommended_videos(db, skip=0, limit=20),
+                    "page": lambda: _video_page_payload(
+                        db,
+                        crud_video.RECOMMENDED_CURSOR,
+                        crud_video.RECOMMENDED_KEYS,
+                        crud_video.recommended_videos_stmt(skip=0, limit=11),
+                        10,
+                    ),
                 },
                 {
                     "label": "trends",
                     "namespace": _TRENDS_CACHE_NAMESPACE,
                     "key": "0:10",
                     "ttl": VIDEO_TRENDS_CACHE_TTL_SEC,
-                    "fetch": lambda: crud_video.get_trend_videos(db, skip=0, limit=10),
+                    "page": lambda: _video_page_payload(
+                        db,
+                        crud_video.LATEST_CURSOR,
+                        crud_video.LATEST_KEYS,
+                        crud_video.latest_videos_stmt(skip=0, limit=11),
+                        10,
+                    ),
                 },
                 {
                     "label": "most-liked",
                     "namespace": _MOST_LIKED_CACHE_NAMESPACE,
                     "key": "0:10",
                     "ttl": VIDEO_MOST_LIKED_CACHE_TTL_SEC,
-                    "fetch": lambda: crud_video.get_most_liked_videos(db, skip=0, limit=10),
+                    "page": lambda: _video_page_payload(
+                        db,
+                        crud_video.MOST_LIKED_CURSOR,
+                        crud_video.MOST_LIKED_KEYS,
+                        crud_video.most_liked_videos_stmt(skip=0, limit=11),
+                        10,
+                    ),
                 },
                 {
                     "label": "diversified",
                     "namespace": _DIVERSIFIED_CACHE_NAMESPACE,
                     "key": "20:1",
                     "ttl": VIDEO_DIVERSIFIED_CACHE_TTL_SEC,
-                    "fetch": lambda: crud_video.get_diversified_videos(db, total=20, max_per_channel=1),
+                    "page": lambda: _build_video_list_payload(
+                        db, crud_video.get_diversified_videos(db, total=20, max_per_channel=1)
+                    ),
                 },
             ]
 
@@ -1309,22 +1343,11 @@ async def warm_video_list_caches() -> None:
                 try:
                     if _get_cached_list(spec["namespace"], spec["key"]):
                         continue
-                    videos = spec["fetch"]()
-                    if not videos:
+                    payload = spec["page"]()
+                    if not payload["videos"]:
                         continue
-                    channel_name_map = _build_channel_name_map(db, videos)
-                    serialized = _serialize_videos(videos, channel_name_map)
-                    payload = VideoListResponse(
-                        videos=serialized,
-                        total=len(serialized),
-                    )
-                    _set_cached_list(
-                        spec["namespace"],
-                        spec["key"],
-                        payload.model_dump(),
-                        spec["ttl"],
-                    )
-                    logger.info("[CacheWarmup] Prefetched %s list (%d videos)", spec["label"], len(videos))
+                    _set_cached_list(spec["namespace"], spec["key"], payload, spec["ttl"])
+                    logger.info("[CacheWarmup] Prefetched %s list (%d videos)", spec["label"], payload["total"])
                 except Exception as warm_err:
                     logger.warning("[CacheWarmup] Failed to prefetch %s cache: %s", spec["label"], warm_err)
         finally:
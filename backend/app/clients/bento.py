@@ -3,6 +3,12 @@ BentoML service client utilities.
 
 This module centralizes outbound HTTP calls so the rest of the codebase
 doesn't need to worry about base URLs, timeouts, or payload formatting.
+All calls share one pooled, breaker-guarded client (see ``app.clients.http``).
+
+Video detail analysis uses the compact msgpack contract (``/v2/video-detail``,
+see ``app.clients.wire_format``) when msgpack is installed, and falls back to
+the JSON ``/v1/video-detail`` contract if Bento does not serve it.
+``BENTO_WIRE_FORMAT`` = auto (default) | msgpack | json.
 """
 
 from __future__ import annotations
@@ -10,10 +16,13 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import time
 from typing import Any, Dict, List
 
 import httpx
 
+from app.clients import wire_format
+from app.clients.http import CircuitOpenError, ManagedClient, get_client
 from app.core.config import BENTO_BASE_URL
 
 logger = logging.getLogger(__name__)
@@ -22,6 +31,13 @@ DEFAULT_TIMEOUT = httpx.Timeout(30.0, read=30.0)
 BENTO_MAX_RETRIES = int(os.getenv("BENTO_MAX_RETRIES", "2"))
 BENTO_RETRY_BACKOFF_SECONDS = float(os.getenv("BENTO_RETRY_BACKOFF_SECONDS", "1.5"))
 BENTO_HEALTH_ENDPOINT = os.getenv("BENTO_HEALTH_ENDPOINT", "/health")
+BENTO_VIDEO_DETAIL_TIMEOUT_SEC = float(os.getenv("BENTO_VIDEO_DETAIL_TIMEOUT_SEC", "30"))
+BENTO_HEALTH_TIMEOUT_SEC = float(os.getenv("BENTO_HEALTH_TIMEOUT_SEC", "10"))
+BENTO_WIRE_FORMAT = os.getenv("BENTO_WIRE_FORMAT", "auto").lower()
+BENTO_COMPACT_ENDPOINT = os.getenv("BENTO_COMPACT_ENDPOINT", "/v2/video-detail")
+
+# Set once Bento answers the compact endpoint with 404/405/415 (older deployment)
+_compact_unsupported = False
 
 
 def _get_base_url() -> str:
@@ -30,6 +46,35 @@ def _get_base_url() -> str:
     return BENTO_BASE_URL.rstrip("/")
 
 
+def _create_bento_client() -> ManagedClient:
+    return ManagedClient(
+        name="bento",
+        base_url=_get_base_url(),
+        env_prefix="BENTO",
+        default_timeout=DEFAULT_TIMEOUT,
+        timeouts={
+            "/v1/video-detail": httpx.Timeout(BENTO_VIDEO_DETAIL_TIMEOUT_SEC, connect=5.0),
+            BENTO_COMPACT_ENDPOINT: httpx.Timeout(BENTO_VIDEO_DETAIL_TIMEOUT_SEC, connect=5.0),
+            BENTO_HEALTH_ENDPOINT: httpx.Timeout(BENTO_HEALTH_TIMEOUT_SEC, connect=5.0),
+        },
+    )
+
+
+def get_bento_client() -> ManagedClient:
+    """Process-wide pooled Bento client (closed by ``close_clients`` on shutdown)."""
+    return get_client("bento", _create_bento_client)
+
+
+def _use_compact_wire_format() -> bool:
+    if BENTO_WIRE_FORMAT == "json" or _compact_unsupported:
+        return False
+    if not wire_format.msgpack_available():
+        if BENTO_WIRE_FORMAT == "msgpack":
+            logger.warning("[BentoClient] BENTO_WIRE_FORMAT=msgpack but msgpack is not installed; using JSON")
+        return False
+    return True
+
+
 async def analyze_video_detail_for_bento(
     video_id: str,
     title: str,
@@ -38,7 +83,10 @@ async def analyze_video_detail_for_bento(
     endpoint_path: str = "/v1/video-detail",
 ) -> Dict[str, Any]:
     """
-    Call the BentoML video-detail analysis endpoint and return the parsed JSON payload.
+    Call the BentoML video-detail analysis endpoint and return the parsed payload.
+
+    Over the compact contract, top comments come back as id references and are
+    expanded here from ``comments``, so callers always get the v1 shape.
 
     Args:
         video_id: Target video identifier.
@@ -51,16 +99,31 @@ async def analyze_video_detail_for_bento(
         Dict[str, Any]: The BentoML response payload.
     """
 
-    base_url = _get_base_url()
-    url = f"{base_url}{endpoint_path}"
-    payload = {
-        "request": {
-            "video_id": video_id,
-            "title": title or "",
-            "description": description or "",
-            "comments": comments,
+    global _compact_unsupported
+
+    client = get_bento_client()
+    compact = endpoint_path == "/v1/video-detail" and _use_compact_wire_format()
+    if compact:
+        request_path = BENTO_COMPACT_ENDPOINT
+        request_kwargs: Dict[str, Any] = {
+            "content": wire_format.encode(
+                wire_format.build_request(video_id, title, description, comments), wire_format.MEDIA_MSGPACK
+            ),
+            "headers": {"Content-Type": wire_format.MEDIA_MSGPACK, "Accept": wire_format.MEDIA_MSGPACK},
         }
-    }
+    else:
+        request_path = endpoint_path
+        request_kwargs = {
+            "json": {
+                "request": {
+                    "video_id": video_id,
+                    "title": title or "",
+                    "description": description or "",
+                    "comments": comments,
+                }
+            }
+        }
+    url = f"{client.base_url}{request_path}"
 
     logger.info("[BentoClient] POST %s with %d comments", url, len(comments))
     if comments:
@@ -78,11 +141,21 @@ async def analyze_video_detail_for_bento(
     response: httpx.Response | None = None
     for attempt in range(1, BENTO_MAX_RETRIES + 2):
         try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                response = await client.post(url, json=payload)
-                response.raise_for_status()
+            response = await client.post(request_path, **request_kwargs)
             break
+        except CircuitOpenError:
+            # Bento is known to be down; fail fast instead of queueing retries
+            logger.warning("[BentoClient] Circuit open, skipping call for %s", video_id)
+            raise
         except (httpx.TimeoutException, httpx.HTTPStatusError) as exc:
+            if compact and isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code in (404, 405, 415):
+                logger.warning(
+                    "[BentoClient] Compact endpoint unavailable (status=%s); falling back to JSON %s",
+                    exc.response.status_code,
+                    endpoint_path,
+                )
+                _compact_unsupported = True
+                return await analyze_video_detail_for_bento(video_id, title, description, comments, endpoint_path)
             logger.warning(
                 "[BentoClient] Attempt %s/%s failed for %s: %s",
                 attempt,
@@ -103,7 +176,20 @@ async def analyze_video_detail_for_bento(
     if response is None:
         raise RuntimeError("Bento response is None after retry loop")
 
-    data = response.json()
+    decode_start = time.perf_counter()
+    if compact:
+        data = wire_format.decode(response.content, response.headers.get("content-type"))
+        if isinstance(data, dict) and data.pop("comment_refs", False):
+            data["top_comments"] = wire_format.expand_top_comments(data.get("top_comments", []), comments)
+    else:
+        data = response.json()
+    logger.info(
+        "[BentoClient] wire=%s request_bytes=%d response_bytes=%d decode=%.2fms",
+        "msgpack" if compact else "json",
+        len(response.request.content),
+        len(response.content),
+        (time.perf_counter() - decode_start) * 1000,
+    )
     logger.info("[BentoClient] Response received: keys=%s, sentiment_ratio=%s, top_comments=%d, top_keywords=%d",
         list(data.keys()) if isinstance(data, dict) else "not a dict",
         data.get("sentiment_ratio") if isinstance(data, dict) else "N/A",
@@ -115,12 +201,10 @@ async def analyze_video_detail_for_bento(
 
 async def warmup_bento() -> None:
     """Call Bento health endpoint to warm up the model after deployment."""
-    base_url = _get_base_url()
-    health_url = f"{base_url}{BENTO_HEALTH_ENDPOINT}"
+    client = get_bento_client()
+    health_url = f"{client.base_url}{BENTO_HEALTH_ENDPOINT}"
     try:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0, read=10.0)) as client:
-            response = await client.get(health_url)
-            response.raise_for_status()
+        await client.get(BENTO_HEALTH_ENDPOINT)
         logger.info("[BentoClient] Warmup request succeeded (%s)", health_url)
     except Exception as exc:
         logger.warning("[BentoClient] Warmup request failed (%s): %s", health_url, exc)
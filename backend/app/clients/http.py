@@ -0,0 +1,271 @@
+"""
+Managed outbound HTTP clients.
+
+Source of truth: backend/app/clients/http.py. web-api/app/utils/http_client.py
+is a byte-identical copy; ./check-shared-copies.sh fails when they differ.
+
+One long-lived ``httpx.AsyncClient`` per upstream service instead of a new
+client (and new TCP/TLS handshake) per call:
+
+- connection pool limits and keepalive (``<NAME>_MAX_CONNECTIONS``,
+  ``<NAME>_MAX_KEEPALIVE``, ``<NAME>_KEEPALIVE_EXPIRY``)
+- HTTP/2 when the ``h2`` package is installed (``<NAME>_HTTP2``, default on)
+- per-endpoint timeouts (``timeouts={"/v1/video-detail": httpx.Timeout(...)}``)
+- a circuit breaker that fails fast with ``CircuitOpenError`` after
+  ``<NAME>_BREAKER_FAILURES`` consecutive failures and lets one probe through
+  after ``<NAME>_BREAKER_RESET_SEC``
+- per-endpoint latency / error metrics (``stats()``)
+
+Clients are created lazily inside the running event loop and closed from the
+app shutdown hook (``close_clients``). Pass ``transport=`` (e.g.
+``httpx.MockTransport``) or point the base URL at a local stub server
+(``backend/scripts/bento_stub_server.py``) to exercise them without the real service.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Union
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401  (httpx uses it for HTTP/2)
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
+
+
+def _env(prefix: str, name: str, default: str) -> str:
+    return os.getenv(f"{prefix}_{name}", default)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without calling the upstream while its circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    closed → (N consecutive failures) → open → (reset timeout) → half-open
+    half-open lets a single request through: success closes, failure re-opens.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout_sec: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_sec = reset_timeout_sec
+        self._clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self.open_count = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self._clock() - self.opened_at >= self.reset_timeout_sec:
+            return "half_open"
+        return "open"
+
+    def before_request(self) -> None:
+        state = self.state
+        if state == "open":
+            raise CircuitOpenError("circuit open")
+        if state == "half_open":
+            if self._probe_in_flight:
+                raise CircuitOpenError("circuit half-open, probe in flight")
+            self._probe_in_flight = True
+
+    def release_probe(self) -> None:
+        self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        was_half_open = self._probe_in_flight
+        self._probe_in_flight = False
+        if was_half_open or self.failures >= self.failure_threshold:
+            if self.opened_at is None or was_half_open:
+                self.open_count += 1
+            self.opened_at = self._clock()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"state": self.state, "consecutive_failures": self.failures, "times_opened": self.open_count}
+
+
+class EndpointMetrics:
+    """Request count / errors / latency percentiles over the last ``window`` calls."""
+
+    def __init__(self, window: int = 512):
+        self.requests = 0
+        self.errors = 0
+        self.rejected = 0
+        self.latencies_ms: Deque[float] = deque(maxlen=window)
+
+    def observe(self, elapsed_ms: float, ok: bool) -> None:
+        self.requests += 1
+        if not ok:
+            self.errors += 1
+        self.latencies_ms.append(elapsed_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        ordered = sorted(self.latencies_ms)
+
+        def pct(p: float) -> Optional[float]:
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))], 2)
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rejected_by_breaker": self.rejected,
+            "p50_ms": pct(0.5),
+            "p95_ms": pct(0.95),
+            "max_ms": round(ordered[-1], 2) if ordered else None,
+        }
+
+
+class ManagedClient:
+    """Pooled ``httpx.AsyncClient`` wrapper with breaker, per-endpoint timeouts and metrics."""
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        env_prefix: str,
+        default_timeout: httpx.Timeout,
+        timeouts: Optional[Dict[str, httpx.Timeout]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.default_timeout = default_timeout
+        self.timeouts = timeouts or {}
+        self.transport = transport
+        self.limits = httpx.Limits(
+            max_connections=int(_env(env_prefix, "MAX_CONNECTIONS", "50")),
+            max_keepalive_connections=int(_env(env_prefix, "MAX_KEEPALIVE", "20")),
+            keepalive_expiry=float(_env(env_prefix, "KEEPALIVE_EXPIRY", "60")),
+        )
+        self.http2 = _HAS_H2 and _env(env_prefix, "HTTP2", "true").lower() in {"1", "true", "yes"}
+        self.breaker = CircuitBreaker(
+            failure_threshold=int(_env(env_prefix, "BREAKER_FAILURES", "5")),
+            reset_timeout_sec=float(_env(env_prefix, "BREAKER_RESET_SEC", "30")),
+        )
+        self.metrics: Dict[str, EndpointMetrics] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.default_timeout,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self.transport,
+            )
+            logger.info(
+                "[HTTPClient] %s client created (base=%s, http2=%s, max_connections=%s)",
+                self.name, self.base_url, self.http2, self.limits.max_connections,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    def _endpoint_metrics(self, path: str) -> EndpointMetrics:
+        metrics = self.metrics.get(path)
+        if metrics is None:
+            metrics = self.metrics[path] = EndpointMetrics()
+        return metrics
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request and raise for 4xx/5xx.
+
+        Timeouts, connection errors and 5xx count as breaker failures; 4xx do not
+        (the upstream is healthy, the request is wrong).
+        """
+        metrics = self._endpoint_metrics(path)
+        try:
+            self.breaker.before_request()
+        except CircuitOpenError as exc:
+            metrics.rejected += 1
+            raise CircuitOpenError(f"{self.name} {exc}") from None
+        kwargs.setdefault("timeout", self.timeouts.get(path, self.default_timeout))
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = await self.client.request(method, path, **kwargs)
+            response.raise_for_status()
+            ok = True
+            self.breaker.record_success()
+            return response
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code < 500:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+            raise
+        except httpx.TransportError:
+            # timeouts are TransportError subclasses too
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            # cancellation / programming errors say nothing about upstream health
+            self.breaker.release_probe()
+            raise
+        finally:
+            metrics.observe((time.perf_counter() - start) * 1000, ok)
+
+    async def post(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", path, **kwargs)
+
+    async def get(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", path, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "http2": self.http2,
+            "breaker": self.breaker.snapshot(),
+            "endpoints": {path: m.snapshot() for path, m in self.metrics.items()},
+        }
+
+
+_clients: Dict[str, ManagedClient] = {}
+
+
+def get_client(name: str, factory: Callable[[], ManagedClient]) -> ManagedClient:
+    """Process-wide client registry (one pooled client per upstream)."""
+    client = _clients.get(name)
+    if client is None:
+        client = _clients[name] = factory()
+    return client
+
+
+async def close_clients() -> None:
+    """Close every pooled client (app shutdown)."""
+    for client in list(_clients.values()):
+        try:
+            await client.aclose()
+        except Exception as exc:
+            logger.warning("[HTTPClient] Failed to close %s client: %s", client.name, exc)
+
+
+def clients_stats() -> Dict[str, Union[Dict[str, Any], str]]:
+    return {name: client.stats() for name, client in _clients.items()}
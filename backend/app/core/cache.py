@@ -1,26 +1,352 @@
+"""
+캐시 facade (Redis + 프로세스 로컬 LRU fallback)
+- Redis 호출은 짧은 소켓/연결 타임아웃 (CACHE_REDIS_TIMEOUT_SEC, 기본 0.25초)
+- 연속 실패가 CACHE_BREAKER_FAILURES(기본 3)회면 CACHE_BREAKER_RESET_SEC(기본 30초) 동안 Redis를 호출하지 않음
+  (app/clients/http.py의 CircuitBreaker) → 장애 중에도 요청마다 타임아웃을 기다리지 않아 지연이 평평하게 유지됨
+- 로컬 LRU (CACHE_LOCAL_MAX_ENTRIES, CACHE_LOCAL_MAX_BYTES로 메모리 상한)
+  · 정상일 때: Redis에서 읽거나 쓴 값을 복사해 둠 (키의 남은 Redis TTL과 CACHE_LOCAL_TTL_SEC 중 짧은 시간만 보관
+    → 장애 중에도 원래 TTL이 지난 값은 내주지 않음)
+  · 장애일 때: 읽기/쓰기를 대신 처리
+- 장애 중 로컬에만 쓴 키(와 zadd)는 기록해 두었다가 Redis 호출이 다시 성공하면 백그라운드에서
+  남은 TTL로 Redis에 다시 써 넣음 (reconcile, 기록은 CACHE_RECONCILE_MAX_KEYS개까지)
+  · SET NX: 복구 후 다른 인스턴스/요청이 이미 새로 쓴 키는 덮어쓰지 않음
+- REDIS_URL이 없으면 로컬 LRU만 사용
+- 프로세스 단위 인스턴스는 get_cache(), 상태/지표는 stats() (GET /api/clients/cache)
+"""
 import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
 import redis
-from typing import Optional
+
+from app.clients.http import CircuitBreaker, CircuitOpenError
 from app.core.config import REDIS_URL
 
+logger = logging.getLogger(__name__)
+
+CACHE_REDIS_TIMEOUT_SEC = float(os.getenv("CACHE_REDIS_TIMEOUT_SEC", "0.25"))
+CACHE_BREAKER_FAILURES = int(os.getenv("CACHE_BREAKER_FAILURES", "3"))
+CACHE_BREAKER_RESET_SEC = float(os.getenv("CACHE_BREAKER_RESET_SEC", "30"))
+CACHE_LOCAL_MAX_ENTRIES = int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", "5000"))
+CACHE_LOCAL_MAX_BYTES = int(os.getenv("CACHE_LOCAL_MAX_BYTES", str(32 * 1024 * 1024)))
+CACHE_LOCAL_TTL_SEC = float(os.getenv("CACHE_LOCAL_TTL_SEC", "300"))
+CACHE_RECONCILE_MAX_KEYS = int(os.getenv("CACHE_RECONCILE_MAX_KEYS", "10000"))
+CACHE_RECONCILE_CHUNK = 500
+
+
+class LocalLRU:
+    """key → JSON 문자열 LRU (TTL 만료, 항목 수 + 대략적인 바이트 수 상한, 스레드 안전)"""
+
+    def __init__(self, max_entries: int = CACHE_LOCAL_MAX_ENTRIES, max_bytes: int = CACHE_LOCAL_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[str, Optional[float]]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    @staticmethod
+    def _size(key: str, value: str) -> int:
+        return len(key) + len(value)
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._bytes -= self._size(key, value)
+
+    def get(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        """(값, 남은 TTL 초 또는 None=만료 없음). 없거나 만료면 None"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= now:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value, (expires_at - now if expires_at is not None else None)
+
+    def set(self, key: str, value: str, ttl_sec: Optional[float]) -> None:
+        size = self._size(key, value)
+        expires_at = time.monotonic() + ttl_sec if ttl_sec is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, expires_at)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+            }
+
+
+def _loads(value: Optional[str]) -> Optional[dict]:
+    if not value:
+        return None
+    try:
+        return json.loads(value)
+    except Exception:
+        return None
+
 
 class Cache:
-    def __init__(self, url: str = REDIS_URL):
-        self.client = redis.Redis.from_url(url, decode_responses=True)
+    def __init__(
+        self,
+        url: str = REDIS_URL,
+        client: Optional[redis.Redis] = None,
+        local: Optional[LocalLRU] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        if client is None and url:
+            # 연결은 첫 명령에서 (생성 시 네트워크 호출 없음), 타임아웃 후 재시도 없음 → 실패는 브레이커가 처리
+            client = redis.Redis.from_url(
+                url,
+                decode_responses=True,
+                socket_timeout=CACHE_REDIS_TIMEOUT_SEC,
+                socket_connect_timeout=CACHE_REDIS_TIMEOUT_SEC,
+                retry_on_timeout=False,
+            )
+        self.client = client
+        self.local = local or LocalLRU()
+        self.breaker = breaker or CircuitBreaker(CACHE_BREAKER_FAILURES, CACHE_BREAKER_RESET_SEC)
+        self._lock = threading.Lock()
+        # 장애 중 로컬에만 쓴 키 / zadd (Redis 복구 후 reconcile)
+        self._dirty: "OrderedDict[str, None]" = OrderedDict()
+        self._pending_zadd: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._reconciling = False
+        self.metrics = {
+            "redis_errors": 0,
+            "skipped_by_breaker": 0,
+            "local_hits": 0,
+            "local_misses": 0,
+            "local_writes": 0,
+            "reconciled": 0,
+            "reconcile_dropped": 0,
+            "reconcile_skipped": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Redis 호출 (브레이커)
+    # ------------------------------------------------------------------
+    def _redis(self, command: Callable[[redis.Redis], Any]) -> Any:
+        """브레이커를 거쳐 Redis 명령 실행. 건너뛰거나 실패하면 CircuitOpenError / redis.RedisError"""
+        if self.client is None:
+            raise CircuitOpenError("redis not configured")
+        with self._lock:
+            try:
+                self.breaker.before_request()
+            except CircuitOpenError:
+                self.metrics["skipped_by_breaker"] += 1
+                raise
+        try:
+            result = command(self.client)
+        except redis.RedisError as exc:
+            with self._lock:
+                was_closed = self.breaker.state == "closed"
+                self.breaker.record_failure()
+                self.metrics["redis_errors"] += 1
+                opened = was_closed and self.breaker.state != "closed"
+            if opened:
+                logger.warning(f"[Cache] Redis unavailable, using local cache for {CACHE_BREAKER_RESET_SEC}s: {exc}")
+            raise
+        except BaseException:
+            with self._lock:
+                self.breaker.release_probe()
+            raise
+        with self._lock:
+            self.breaker.record_success()
+            pending = bool(self._dirty or self._pending_zadd)
+        if pending:
+            self._schedule_reconcile()
+        return result
 
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
     def get_json(self, key: str) -> Optional[dict]:
-        val = self.client.get(key)
-        if not val:
-            return None
+        def get_with_ttl(client):
+            pipe = client.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.pttl(key)
+            return pipe.execute()
+
         try:
-            return json.loads(val)
-        except Exception:
-            return None
+            value, pttl_ms = self._redis(get_with_ttl)
+        except (CircuitOpenError, redis.RedisError):
+            return self._local_get(key)
+        if value:
+            # pttl: -1 = 만료 없음, -2 = 그 사이 만료/삭제
+            if pttl_ms is None or pttl_ms == -1:
+                self.local.set(key, value, CACHE_LOCAL_TTL_SEC)
+            elif pttl_ms > 0:
+                self.local.set(key, value, min(pttl_ms / 1000.0, CACHE_LOCAL_TTL_SEC))
+            return _loads(value)
+        # 장애 중 쓴 값이 아직 reconcile되지 않았으면 로컬 값이 최신
+        with self._lock:
+            dirty = key in self._dirty
+        return self._local_get(key) if dirty else None
 
-    def set_json(self, key: str, value: dict, ttl_sec: int = 60):
-        self.client.set(key, json.dumps(value), ex=ttl_sec)
+    def set_json(self, key: str, value: dict, ttl_sec: Optional[int] = 60):
+        """ttl_sec=None이면 만료 없음 (로컬 사본은 LRU 정책으로만 제거)"""
+        payload = json.dumps(value)
+        try:
+            if ttl_sec is None:
+                self._redis(lambda client: client.set(key, payload))
+            else:
+                self._redis(lambda client: client.set(key, payload, ex=ttl_sec))
+        except (CircuitOpenError, redis.RedisError):
+            self.local.set(key, payload, ttl_sec)
+            with self._lock:
+                self.metrics["local_writes"] += 1
+                self._mark_dirty(key)
+            return
+        self.local.set(key, payload, min(ttl_sec, CACHE_LOCAL_TTL_SEC) if ttl_sec is not None else CACHE_LOCAL_TTL_SEC)
+        with self._lock:
+            self._dirty.pop(key, None)
 
     def zadd(self, key: str, score: float, member: str):
-        self.client.zadd(key, {member: score})
+        try:
+            self._redis(lambda client: client.zadd(key, {member: score}))
+        except (CircuitOpenError, redis.RedisError):
+            with self._lock:
+                self._pending_zadd[(key, member)] = score
+                self._pending_zadd.move_to_end((key, member))
+                while len(self._pending_zadd) > CACHE_RECONCILE_MAX_KEYS:
+                    self._pending_zadd.popitem(last=False)
+                    self.metrics["reconcile_dropped"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "redis_configured": self.client is not None,
+                "breaker": self.breaker.snapshot(),
+                "local": self.local.stats(),
+                "pending_reconcile": len(self._dirty) + len(self._pending_zadd),
+                **self.metrics,
+            }
+
+    # ------------------------------------------------------------------
+    # 로컬 fallback / reconcile
+    # ------------------------------------------------------------------
+    def _local_get(self, key: str) -> Optional[dict]:
+        entry = self.local.get(key)
+        with self._lock:
+            self.metrics["local_hits" if entry else "local_misses"] += 1
+        return _loads(entry[0]) if entry else None
+
+    def _mark_dirty(self, key: str) -> None:
+        """self._lock 안에서 호출"""
+        self._dirty[key] = None
+        self._dirty.move_to_end(key)
+        while len(self._dirty) > CACHE_RECONCILE_MAX_KEYS:
+            self._dirty.popitem(last=False)
+            self.metrics["reconcile_dropped"] += 1
+
+    def _schedule_reconcile(self) -> None:
+        with self._lock:
+            if self._reconciling:
+                return
+            self._reconciling = True
+        threading.Thread(target=self._reconcile_in_background, name="cache-reconcile", daemon=True).start()
+
+    def _reconcile_in_background(self) -> None:
+        try:
+            written = self.reconcile()
+            if written:
+                logger.info(f"[Cache] Reconciled {written} entries written during Redis outage")
+        except Exception as exc:
+            logger.warning(f"[Cache] Reconcile stopped: {exc}")
+        finally:
+            with self._lock:
+                self._reconciling = False
+
+    def reconcile(self) -> int:
+        """
+        장애 중 로컬에만 쓴 값을 남은 TTL로 Redis에 다시 씀 (pipeline, CACHE_RECONCILE_CHUNK개씩)
+        Redis에 이미 키가 있으면(복구 후 새로 쓴 값) 덮어쓰지 않음 (SET NX)
+        로컬에서 이미 만료/제거된 키는 건너뜀. 실패하면 아직 쓰지 못한 항목을 다시 기록하고 예외를 올림
+        """
+        with self._lock:
+            keys = list(self._dirty)
+            zadds = list(self._pending_zadd.items())
+            self._dirty.clear()
+            self._pending_zadd.clear()
+
+        items: List[Tuple[str, str, Any, Any]] = []
+        for key in keys:
+            entry = self.local.get(key)
+            if entry is None:
+                continue
+            value, remaining = entry
+            items.append(("set", key, value, max(1, math.ceil(remaining)) if remaining is not None else None))
+        for (key, member), score in zadds:
+            items.append(("zadd", key, member, score))
+
+        def run(client, chunk):
+            pipe = client.pipeline(transaction=False)
+            for kind, key, value, extra in chunk:
+                if kind == "set":
+                    pipe.set(key, value, ex=extra, nx=True)
+                else:
+                    pipe.zadd(key, {value: extra})
+            return pipe.execute()
+
+        written = 0
+        skipped = 0
+        try:
+            for start in range(0, len(items), CACHE_RECONCILE_CHUNK):
+                chunk = items[start:start + CACHE_RECONCILE_CHUNK]
+                results = self._redis(lambda client: run(client, chunk))
+                written += len(chunk)
+                # SET NX가 None이면 Redis에 더 새 값이 있어 건너뜀
+                skipped += sum(1 for (kind, *_), result in zip(chunk, results) if kind == "set" and not result)
+        except (CircuitOpenError, redis.RedisError):
+            # 다음 복구 때 재시도 (그 사이 새로 쓴 값이 있으면 그 값을 유지)
+            with self._lock:
+                for kind, key, value, extra in items[written:]:
+                    if kind == "set":
+                        self._dirty.setdefault(key, None)
+                    else:
+                        self._pending_zadd.setdefault((key, value), extra)
+            raise
+        finally:
+            with self._lock:
+                self.metrics["reconciled"] += written - skipped
+                self.metrics["reconcile_skipped"] += skipped
+        return written - skipped
+
+
+_cache: Optional[Cache] = None
+_cache_lock = threading.Lock()
 
 
+def get_cache() -> Cache:
+    """프로세스 단위 Cache 싱글톤 (로컬 LRU / 브레이커 상태를 공유)"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = Cache()
+    return _cache
@@ -1,7 +1,13 @@
 """
 데이터베이스 연결 설정
 .env에서 DB 연결 정보를 읽어 SQLAlchemy 엔진을 생성합니다.
+- 동기 엔진(pymysql): 기존 def 라우트 / 배치 작업
+- 비동기 엔진(aiomysql 또는 asyncmy): async 라우트의 핫 경로 읽기 (get_async_db)
 """
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -183,7 +189,6 @@ if USE_CLOUD_SQL_CONNECTOR:
         **engine_kwargs,
     )
 elif USE_UNIX_SOCKET:
-    import os
     import pymysql
 
     socket_exists = os.path.exists(DB_HOST)
@@ -258,3 +263,84 @@ def get_db():
             except:
                 pass
 
+
+# ---------------------------------------------------------------------------
+# 비동기 엔진 (SQLAlchemy asyncio)
+# async 라우트가 이벤트 루프를 막지 않고, 스레드풀 크기와 무관하게 DB 대기를 동시에 처리
+# Cloud SQL Python Connector는 MySQL 비동기 드라이버를 지원하지 않으므로 그 경우에는
+# 동기 세션을 스레드풀에서 실행하는 어댑터로 대체
+# ---------------------------------------------------------------------------
+DB_ASYNC_DRIVER = os.getenv("DB_ASYNC_DRIVER", "aiomysql")  # aiomysql | asyncmy
+DB_ASYNC_POOL_SIZE = int(os.getenv("DB_ASYNC_POOL_SIZE", "20"))
+DB_ASYNC_MAX_OVERFLOW = int(os.getenv("DB_ASYNC_MAX_OVERFLOW", "40"))
+
+async_engine = None
+AsyncSessionLocal = None
+
+
+def _init_async_engine() -> None:
+    global async_engine, AsyncSessionLocal
+    if USE_CLOUD_SQL_CONNECTOR:
+        print("[DEBUG] Async DB engine disabled (Cloud SQL Connector), using threadpool adapter")
+        return
+    try:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        async_url = DATABASE_URL.replace("mysql+pymysql://", f"mysql+{DB_ASYNC_DRIVER}://", 1)
+        connect_args = {"unix_socket": DB_HOST} if USE_UNIX_SOCKET else {}
+        async_engine = create_async_engine(
+            async_url,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+            pool_size=DB_ASYNC_POOL_SIZE,
+            max_overflow=DB_ASYNC_MAX_OVERFLOW,
+            pool_timeout=60,
+            echo=False,
+            connect_args=connect_args,
+        )
+        AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+        print(f"[DEBUG] Async DB engine initialized (driver={DB_ASYNC_DRIVER})")
+    except ImportError as e:
+        print(f"[WARNING] Async DB driver '{DB_ASYNC_DRIVER}' not installed ({e}), using threadpool adapter")
+
+
+_init_async_engine()
+
+
+class ThreadpoolAsyncSession:
+    """
+    비동기 엔진을 쓸 수 없을 때 AsyncSession 대신 쓰는 어댑터
+    동기 Session 호출을 스레드풀에서 실행 (pymysql은 결과를 모두 버퍼링하므로 결과 처리는 루프에서 해도 안전)
+    """
+
+    def __init__(self, session):
+        self._session = session
+
+    async def execute(self, *args, **kwargs):
+        return await asyncio.to_thread(self._session.execute, *args, **kwargs)
+
+    async def scalar(self, *args, **kwargs):
+        return await asyncio.to_thread(self._session.scalar, *args, **kwargs)
+
+    async def close(self):
+        await asyncio.to_thread(self._session.close)
+
+
+async def get_async_db():
+    """
+    비동기 데이터베이스 세션 의존성 (async 라우트용)
+    await db.execute(select(...)) 형태로 사용합니다.
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as session:
+            yield session
+        return
+    session = ThreadpoolAsyncSession(SessionLocal())
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+# 라우트 밖(백그라운드 작업 등)에서 쓰는 get_async_db: async with async_session_scope() as db
+async_session_scope = asynccontextmanager(get_async_db)
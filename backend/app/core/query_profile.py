@@ -0,0 +1,140 @@
+"""
+요청 단위 SQL 프로파일링 (N+1 탐지)
+- SQLAlchemy Engine 이벤트 훅으로 요청마다 실행된 SQL 개수 / DB 총 소요 시간 / 반복 문장 fingerprint 기록
+  · 동기 엔진(pymysql)과 비동기 엔진(async_engine.sync_engine) 모두 Engine 클래스 단위로 잡힘
+  · 요청 상태는 ContextVar로 전달되므로 def 라우트(스레드풀)와 async 라우트 모두 같은 요청에 집계
+- main.py의 request_profiler 미들웨어가 로그와 Server-Timing 헤더로 내보냄
+- QUERY_PROFILE_DEV=true이면 같은 문장이 QUERY_REPEAT_WARN_THRESHOLD회를 넘을 때 경고 (N+1 회귀 탐지)
+"""
+import logging
+import os
+import re
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("query_profiler")
+logger.setLevel(logging.INFO)
+
+QUERY_PROFILE_ENABLED = os.getenv("QUERY_PROFILE_ENABLED", "true").strip().lower() in ("1", "true", "yes")
+QUERY_PROFILE_DEV = os.getenv("QUERY_PROFILE_DEV", "false").strip().lower() in ("1", "true", "yes")
+QUERY_REPEAT_WARN_THRESHOLD = int(os.getenv("QUERY_REPEAT_WARN_THRESHOLD", "5"))
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:\s*(?:%s|%\(\w+\)s|\?|:\w+|'[^']*'|-?\d+(?:\.\d+)?)\s*,?)+\)", re.IGNORECASE)
+_STRING_RE = re.compile(r"'(?:[^'\\]|\\.)*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    SQL 문장 정규화 (리터럴/IN 목록 길이 차이를 제거해 같은 쿼리 형태끼리 묶음)
+    """
+    normalized = _WHITESPACE_RE.sub(" ", statement).strip()
+    normalized = _IN_LIST_RE.sub("IN (?)", normalized)
+    normalized = _STRING_RE.sub("?", normalized)
+    normalized = _NUMBER_RE.sub("?", normalized)
+    return normalized
+
+
+class QueryStats:
+    """한 요청 동안의 SQL 통계 (def 라우트 스레드와 미들웨어가 같은 객체를 공유하므로 lock 사용)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.fingerprints: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        key = fingerprint(statement)
+        with self._lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            self.fingerprints[key] = self.fingerprints.get(key, 0) + 1
+
+    def repeated(self, threshold: int = 1) -> List[tuple]:
+        """threshold회를 넘게 실행된 (fingerprint, count) 목록 (많은 순)"""
+        with self._lock:
+            items = [(key, count) for key, count in self.fingerprints.items() if count > threshold]
+        return sorted(items, key=lambda item: item[1], reverse=True)
+
+    def summary(self) -> dict:
+        repeated = self.repeated()
+        return {
+            "db_queries": self.count,
+            "db_time_ms": round(self.total_ms, 2),
+            "distinct_statements": len(self.fingerprints),
+            "max_repeat": repeated[0][1] if repeated else min(self.count, 1),
+        }
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def begin_request() -> Optional[QueryStats]:
+    """요청 시작 시 호출 (미들웨어). 비활성화 상태면 None"""
+    if not QUERY_PROFILE_ENABLED:
+        return None
+    stats = QueryStats()
+    _current_stats.set(stats)
+    return stats
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def server_timing_header(stats: QueryStats, total_ms: float) -> str:
+    """Server-Timing 헤더 값 (브라우저 DevTools Timing 탭에 표시)"""
+    return (
+        f'db;dur={stats.total_ms:.2f};desc="{stats.count} queries", '
+        f"app;dur={max(total_ms - stats.total_ms, 0.0):.2f}, "
+        f"total;dur={total_ms:.2f}"
+    )
+
+
+def warn_repeated(stats: QueryStats, method: str, path: str) -> None:
+    """개발 모드: 같은 문장이 임계치를 넘게 실행된 요청 경고"""
+    if not QUERY_PROFILE_DEV:
+        return
+    for key, count in stats.repeated(QUERY_REPEAT_WARN_THRESHOLD):
+        logger.warning(
+            "[QueryProfile] Possible N+1: %s %s ran the same statement %d times: %s",
+            method,
+            path,
+            count,
+            key[:300],
+        )
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_profile_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    starts = conn.info.get("query_profile_start")
+    if not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+    stats.record(statement, elapsed_ms)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    # 실패한 문장의 시작 시각이 스택에 남지 않도록 정리
+    conn = exception_context.connection
+    if conn is not None and _current_stats.get() is not None:
+        starts = conn.info.get("query_profile_start")
+        if starts:
+            starts.pop()
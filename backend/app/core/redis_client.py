@@ -1,8 +1,12 @@
 """
 Redis 클라이언트 유틸리티
 Cloud MemoryStore 또는 로컬 Redis 연결
+- 연결에 실패하면 REDIS_RETRY_COOLDOWN_SEC(기본 10초) 동안 재연결을 시도하지 않고 바로 실패
+  (lru_cache는 성공한 연결만 캐시하므로, 없으면 장애 중 호출마다 재시도 × 연결 타임아웃을 기다림)
+- 캐시 읽기/쓰기는 app/core/cache.py의 get_cache() 사용 (짧은 타임아웃 + 서킷 브레이커 + 로컬 fallback)
 """
 import os
+import time
 import redis
 from functools import lru_cache
 from typing import Optional
@@ -13,6 +17,9 @@ logger = logging.getLogger(__name__)
 REDIS_URL = os.getenv("REDIS_URL", "")
 REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "1.5"))
 REDIS_RETRY = int(os.getenv("REDIS_RETRY", "3"))
+REDIS_RETRY_COOLDOWN_SEC = float(os.getenv("REDIS_RETRY_COOLDOWN_SEC", "10"))
+
+_last_failure_at: Optional[float] = None
 
 
 class RedisClient:
@@ -60,7 +67,19 @@ def get_redis() -> redis.Redis:
     
     Returns:
         redis.Redis 인스턴스
+
+    Raises:
+        redis.ConnectionError: 최근 연결 실패 후 REDIS_RETRY_COOLDOWN_SEC가 지나지 않음
     """
+    global _last_failure_at
+    if _last_failure_at is not None and time.monotonic() - _last_failure_at < REDIS_RETRY_COOLDOWN_SEC:
+        raise redis.ConnectionError("Redis connection failed recently, skipping reconnect during cooldown")
     client = RedisClient()
-    return client.connect()
+    try:
+        connected = client.connect()
+    except redis.RedisError:
+        _last_failure_at = time.monotonic()
+        raise
+    _last_failure_at = None
+    return connected
 
@@ -0,0 +1,121 @@
+"""
+서버 시작(콜드 스타트) 프로파일링 유틸리티
+- 모듈 import 소요 시간 리포트
+- 무거운 ML 컴포넌트 로딩 상태 (readiness)
+- 포트 바인딩 이후 백그라운드 사전 로딩
+"""
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger("startup_profiler")
+logger.setLevel(logging.INFO)
+
+# 이 모듈이 처음 import된 시점을 프로세스 시작 시점으로 간주 (main.py 최상단에서 import)
+PROCESS_START = time.perf_counter()
+
+FAST_START_PRELOAD = os.getenv("FAST_START_PRELOAD", "false").strip().lower() in ("1", "true", "yes")
+FAST_START_PRELOAD_DELAY_SEC = float(os.getenv("FAST_START_PRELOAD_DELAY_SEC", "1.0"))
+
+_import_timings: Dict[str, float] = {}
+_component_probes: Dict[str, Callable[[], bool]] = {}
+_preload_state: Dict[str, dict] = {}
+_state_lock = threading.Lock()
+_first_response_ms: Optional[float] = None
+_startup_complete_ms: Optional[float] = None
+
+
+@contextmanager
+def profile_import(name: str):
+    """with 블록 안의 import 소요 시간을 name으로 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        _import_timings[name] = elapsed_ms
+        logger.info("[StartupProfile] import %s took %.2fms", name, elapsed_ms)
+
+
+def get_import_report() -> List[dict]:
+    """import 비용이 큰 순서로 정렬한 리포트"""
+    return [
+        {"module": name, "elapsed_ms": round(elapsed, 2)}
+        for name, elapsed in sorted(_import_timings.items(), key=lambda item: item[1], reverse=True)
+    ]
+
+
+def mark_startup_complete() -> None:
+    global _startup_complete_ms
+    if _startup_complete_ms is None:
+        _startup_complete_ms = (time.perf_counter() - PROCESS_START) * 1000
+        logger.info("[StartupProfile] startup complete in %.2fms", _startup_complete_ms)
+
+
+def mark_first_response() -> None:
+    """첫 응답 시점 기록 (콜드 스타트 → 첫 응답 시간)"""
+    global _first_response_ms
+    if _first_response_ms is not None:
+        return
+    with _state_lock:
+        if _first_response_ms is None:
+            _first_response_ms = (time.perf_counter() - PROCESS_START) * 1000
+            logger.info("[StartupProfile] cold start to first response: %.2fms", _first_response_ms)
+
+
+def register_component(name: str, probe: Callable[[], bool]) -> None:
+    """readiness 리포트에 포함할 컴포넌트 로딩 여부 확인 함수를 등록"""
+    _component_probes[name] = probe
+
+
+def get_component_status() -> Dict[str, bool]:
+    status: Dict[str, bool] = {}
+    for name, probe in _component_probes.items():
+        try:
+            status[name] = bool(probe())
+        except Exception:
+            status[name] = False
+    return status
+
+
+def _run_preload(tasks: Dict[str, Callable[[], object]]) -> None:
+    for name, task in tasks.items():
+        with _state_lock:
+            _preload_state[name] = {"status": "loading", "elapsed_ms": None, "error": None}
+        start = time.perf_counter()
+        try:
+            task()
+            status, error = "loaded", None
+        except Exception as exc:
+            status, error = "failed", str(exc)
+            logger.warning("[StartupProfile] preload %s failed: %s", name, exc)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with _state_lock:
+            _preload_state[name] = {"status": status, "elapsed_ms": round(elapsed_ms, 2), "error": error}
+        logger.info("[StartupProfile] preload %s %s in %.2fms", name, status, elapsed_ms)
+
+
+def start_background_preload(tasks: Dict[str, Callable[[], object]]) -> threading.Thread:
+    """무거운 모델 로딩을 데몬 스레드에서 순차 실행 (요청 처리를 막지 않음)"""
+    with _state_lock:
+        for name in tasks:
+            _preload_state.setdefault(name, {"status": "pending", "elapsed_ms": None, "error": None})
+    thread = threading.Thread(target=_run_preload, args=(tasks,), name="startup-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+def get_startup_report() -> dict:
+    with _state_lock:
+        preload = {name: dict(state) for name, state in _preload_state.items()}
+    return {
+        "uptime_ms": round((time.perf_counter() - PROCESS_START) * 1000, 2),
+        "startup_complete_ms": round(_startup_complete_ms, 2) if _startup_complete_ms is not None else None,
+        "first_response_ms": round(_first_response_ms, 2) if _first_response_ms is not None else None,
+        "imports": get_import_report(),
+        "components": get_component_status(),
+        "preload": preload,
+    }
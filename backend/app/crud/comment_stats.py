@@ -0,0 +1,83 @@
+"""
+Video Comment Stats CRUD
+댓글 수는 수집 적재 시 갱신되는 video_comment_stats에서 PK로 조회
+(행이 없을 때만 travel_comments를 직접 COUNT 하고, travel_videos에 있는 영상이면 결과를 저장
+ → 임의의 video_id 조회로 요약 행이 생기지 않음)
+"""
+import logging
+from typing import Optional
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from app.models.video_comment_stats import VideoCommentStats
+
+logger = logging.getLogger(__name__)
+
+# travel_videos에 없는 video_id면 GROUP BY 결과가 없어 아무 행도 쓰지 않음
+_REFRESH_SQL = text("""
+    INSERT INTO video_comment_stats (video_id, total_count, text_count, updated_at)
+    SELECT v.id,
+           COUNT(c.id),
+           COALESCE(SUM(CASE WHEN c.text IS NOT NULL AND c.text != '' THEN 1 ELSE 0 END), 0),
+           NOW()
+    FROM travel_videos v
+    LEFT JOIN travel_comments c ON c.video_id = v.id
+    WHERE v.id = :video_id
+    GROUP BY v.id
+    ON DUPLICATE KEY UPDATE
+        total_count = VALUES(total_count),
+        text_count = VALUES(text_count),
+        updated_at = VALUES(updated_at)
+""")
+
+
+def get_comment_stats(db: Session, video_id: str) -> Optional[VideoCommentStats]:
+    """영상 댓글 수 요약 조회 (테이블/행이 없으면 None)"""
+    try:
+        return db.get(VideoCommentStats, video_id)
+    except Exception as e:
+        db.rollback()
+        logger.warning("[CRUD] video_comment_stats lookup failed for %s: %s", video_id, e)
+        return None
+
+
+def refresh_comment_stats(db: Session, video_id: str) -> Optional[VideoCommentStats]:
+    """
+    travel_comments를 다시 집계해 요약 행 저장 (적재 경로 밖에서 행이 없을 때만 사용)
+    travel_videos에 없는 영상이면 아무것도 쓰지 않고 None
+    """
+    try:
+        if not db.execute(_REFRESH_SQL, {"video_id": video_id}).rowcount:
+            db.rollback()
+            return None
+        db.commit()
+        return db.get(VideoCommentStats, video_id, populate_existing=True)
+    except Exception as e:
+        db.rollback()
+        logger.warning("[CRUD] video_comment_stats refresh failed for %s: %s", video_id, e)
+        return None
+
+
+def get_comment_count(db: Session, video_id: str) -> int:
+    """영상 댓글 수 (요약 행 우선, 없으면 집계 후 저장, 저장하지 않은 영상(없는 ID 등)은 직접 COUNT만)"""
+    stats = get_comment_stats(db, video_id) or refresh_comment_stats(db, video_id)
+    if stats is not None:
+        return int(stats.total_count or 0)
+    return db.execute(
+        text("SELECT COUNT(*) FROM travel_comments WHERE video_id = :video_id"),
+        {"video_id": video_id},
+    ).scalar() or 0
+
+
+def get_total_comment_count(db: Session) -> int:
+    """전체 댓글 수 (요약 테이블 합계, 비어 있거나 없으면 직접 COUNT)"""
+    try:
+        total = db.query(func.sum(VideoCommentStats.total_count)).scalar()
+    except Exception as e:
+        db.rollback()
+        logger.warning("[CRUD] video_comment_stats sum failed: %s", e)
+        total = None
+    if total is not None:
+        return int(total)
+    return db.execute(text("SELECT COUNT(*) FROM travel_comments")).scalar() or 0
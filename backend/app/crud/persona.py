@@ -3,11 +3,11 @@
 """
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc
-from typing import Optional, List
-from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, List
+from datetime import datetime
 import numpy as np
-import json
 import logging
+import os
 
 from app.models.user_persona import UserPersonaVector
 from app.models.user_video_event import UserVideoEvent
@@ -18,9 +18,12 @@ from app.core.embeddings import get_embeddings_batch_sync
 logger = logging.getLogger(__name__)
 
 # 설정 상수
-MAX_USER_EVENTS = 50  # 사용자 프로필 생성에 사용할 최대 이벤트 수
-CACHE_EXPIRY_HOURS = 24  # 프로필 벡터 캐시 유효 시간 (시간)
+MAX_USER_EVENTS = 50  # 조회용 최근 이벤트 기본 개수
 CANDIDATE_VIDEO_LIMIT = 500  # 추천 후보 영상 수
+# 시간 감쇠 반감기 (일). 0 이하이면 감쇠 없이 누적 평균
+PERSONA_DECAY_HALF_LIFE_DAYS = float(os.getenv("PERSONA_DECAY_HALF_LIFE_DAYS", "30"))
+PERSONA_EVENT_TYPES = ('watch', 'like')
+REBUILD_EVENT_CHUNK_SIZE = 1000
 
 
 def get_user_recent_events(
@@ -43,7 +46,7 @@ def get_user_recent_events(
         events = db.query(UserVideoEvent).filter(
             and_(
                 UserVideoEvent.user_id == user_id,
-                UserVideoEvent.event_type.in_(['watch', 'like'])
+                UserVideoEvent.event_type.in_(PERSONA_EVENT_TYPES)
             )
         ).order_by(
             desc(UserVideoEvent.liked),  # 좋아요 우선
@@ -62,7 +65,8 @@ def get_user_persona_vector(
     user_id: int
 ) -> Optional[List[float]]:
     """
-    사용자 프로필 벡터 조회 (캐시된 것)
+    사용자 프로필 벡터 조회
+    이벤트 기록 시 증분 갱신되므로 만료 없이 저장된 벡터를 그대로 사용
     
     Args:
         db: 데이터베이스 세션
@@ -72,132 +76,292 @@ def get_user_persona_vector(
         임베딩 벡터 또는 None
     """
     try:
-        persona = db.query(UserPersonaVector).filter(
+        row = db.query(UserPersonaVector.embedding_json).filter(
             UserPersonaVector.user_id == user_id
         ).first()
-        
-        if persona:
-            # 캐시 유효 시간 확인
-            expiry_time = persona.updated_at + timedelta(hours=CACHE_EXPIRY_HOURS)
-            if datetime.utcnow() < expiry_time:
-                return persona.embedding_json
-            else:
-                logger.info(f"[Persona] User {user_id} persona vector cache expired")
-        
-        return None
+        return row[0] if row and row[0] else None
     except Exception as e:
         logger.error(f"[Persona] Error getting persona vector: {e}", exc_info=True)
         return None
 
 
-def create_user_persona_vector(
+def event_weight(event_type: str, watch_time: Optional[int] = 0, liked: Optional[bool] = False) -> float:
+    """
+    이벤트 가중치
+    - 기본 1.0
+    - 좋아요(like 이벤트 또는 liked=True) +1.0
+    - 시청 시간 10분당 +0.5 (최대 +1.0)
+    """
+    weight = 1.0
+    if event_type == 'like' or liked:
+        weight += 1.0
+    if watch_time:
+        weight += min(float(watch_time) / 600.0 * 0.5, 1.0)
+    return weight
+
+
+def _decay_factor(since: Optional[datetime], until: datetime) -> float:
+    """
+    since → until 동안의 감쇠 계수 (반감기 PERSONA_DECAY_HALF_LIFE_DAYS)
+    경과 시간은 0에서 clamp: until이 since보다 이르면 (순서가 뒤바뀐 이벤트) 감쇠 없이 1.0
+    """
+    if PERSONA_DECAY_HALF_LIFE_DAYS <= 0 or since is None:
+        return 1.0
+    age_sec = max(0.0, (until - since).total_seconds())
+    return 0.5 ** (age_sec / (PERSONA_DECAY_HALF_LIFE_DAYS * 86400.0))
+
+
+def get_stored_video_embeddings(
+    db: Session,
+    video_ids: Iterable[str]
+) -> Dict[str, np.ndarray]:
+    """
+    videos_static에 저장된 영상 임베딩 일괄 조회 (재임베딩/HTTP 호출 없음)
+    
+    Returns:
+        {video_id: embedding(np.ndarray)} - 임베딩이 없는 영상은 제외
+    """
+    ids = list({vid for vid in video_ids if vid})
+    if not ids:
+        return {}
+    rows = db.query(VideoStatic.video_id, VideoStatic.embedding).filter(
+        VideoStatic.video_id.in_(ids)
+    ).all()
+    return {
+        video_id: np.asarray(embedding, dtype=np.float64)
+        for video_id, embedding in rows
+        if embedding
+    }
+
+
+class PersonaState:
+    """사용자별 누적 상태 (가중합, 가중치합, 이벤트 수, 마지막 이벤트 시각)"""
+
+    __slots__ = ("weighted_sum", "weight_sum", "event_count", "last_event_at")
+
+    def __init__(
+        self,
+        weighted_sum: Optional[np.ndarray] = None,
+        weight_sum: float = 0.0,
+        event_count: int = 0,
+        last_event_at: Optional[datetime] = None,
+    ):
+        self.weighted_sum = weighted_sum
+        self.weight_sum = weight_sum
+        self.event_count = event_count
+        self.last_event_at = last_event_at
+
+    @classmethod
+    def from_row(cls, persona: Optional[UserPersonaVector]) -> "PersonaState":
+        if persona is None or not persona.weighted_sum_json:
+            return cls()
+        return cls(
+            weighted_sum=np.asarray(persona.weighted_sum_json, dtype=np.float64),
+            weight_sum=float(persona.weight_sum or 0.0),
+            event_count=int(persona.event_count or 0),
+            last_event_at=persona.last_event_at,
+        )
+
+    def add(self, embedding: np.ndarray, weight: float, event_at: datetime, count: bool = True) -> None:
+        """
+        이벤트 1건 반영 (O(d))
+        count=False: 이미 반영한 이벤트의 가중치 변화분만 더함 (이벤트 수/기준 시각 유지)
+        누적 상태의 기준 시각은 last_event_at (지금까지 본 가장 늦은 이벤트 시각)
+        - event_at >= 기준: 누적값을 (event_at - 기준)만큼 감쇠한 뒤 이벤트를 그대로 더함
+        - event_at < 기준 (늦게 도착한 이벤트): 누적값은 그대로, 이벤트 가중치를 (기준 - event_at)만큼 감쇠
+        두 경우 모두 경과 시간은 0에서 clamp → 도착 순서와 관계없이 시간순으로 반영한 것과 같은 결과
+        """
+        if self.weighted_sum is not None and self.weighted_sum.shape != embedding.shape:
+            # 임베딩 차원이 바뀌었으면 (모델 교체 등) 누적 상태 초기화
+            logger.warning("[Persona] Embedding dimension changed, resetting persona state")
+            self.weighted_sum = None
+            self.weight_sum = 0.0
+        if self.weighted_sum is None:
+            self.weighted_sum = embedding * weight
+            self.weight_sum = weight
+        else:
+            state_decay = _decay_factor(self.last_event_at, event_at)
+            decayed_weight = weight * _decay_factor(event_at, self.last_event_at)
+            self.weighted_sum = self.weighted_sum * state_decay + embedding * decayed_weight
+            self.weight_sum = self.weight_sum * state_decay + decayed_weight
+        if count:
+            self.event_count += 1
+        if self.last_event_at is None or event_at > self.last_event_at:
+            self.last_event_at = event_at
+
+    def mean_vector(self) -> Optional[List[float]]:
+        if self.weighted_sum is None or self.weight_sum <= 0:
+            return None
+        return (self.weighted_sum / self.weight_sum).tolist()
+
+
+def _save_persona_state(db: Session, user_id: int, persona: Optional[UserPersonaVector], state: PersonaState) -> Optional[List[float]]:
+    mean_vector = state.mean_vector()
+    if mean_vector is None:
+        return None
+    if persona is None:
+        persona = UserPersonaVector(user_id=user_id)
+        db.add(persona)
+    persona.embedding_json = mean_vector
+    persona.weighted_sum_json = state.weighted_sum.tolist()
+    persona.weight_sum = state.weight_sum
+    persona.event_count = state.event_count
+    persona.last_event_at = state.last_event_at
+    persona.updated_at = datetime.utcnow()
+    return mean_vector
+
+
+def apply_events_to_persona(
     db: Session,
     user_id: int,
-    events: List[UserVideoEvent]
+    events: List[dict],
+    commit: bool = True
 ) -> Optional[List[float]]:
     """
-    사용자 프로필 벡터 생성 (최근 이벤트 기반)
+    새 이벤트들을 사용자 프로필 벡터에 증분 반영 (이벤트당 O(d), 사용자당 1 row 갱신)
     
     Args:
         db: 데이터베이스 세션
         user_id: 사용자 ID
-        events: 사용자 이벤트 리스트
+        events: [{"video_id", "event_type", "watch_time", "liked", "created_at"}, ...]
+            - "prev_watch_time"이 있으면 이미 반영된 이벤트의 시청 시간이 늘어난 것
+              → 새 가중치 - 이전 가중치만 created_at 시점에 더함 (rebuild_user_persona_vector와 같은 결과)
+        commit: True이면 커밋까지 수행
         
     Returns:
-        임베딩 벡터 또는 None
+        갱신된 프로필 벡터 또는 None (반영할 임베딩이 없는 경우)
     """
+    events = [e for e in events if e.get("event_type") in PERSONA_EVENT_TYPES]
     if not events:
-        logger.warning(f"[Persona] No events for user {user_id}")
         return None
-    
     try:
-        # 이벤트에서 video_id 추출
-        video_ids = [event.video_id for event in events]
-        
-        # 영상 정보 조회
-        videos = db.query(Video).filter(Video.id.in_(video_ids)).all()
-        
-        if not videos:
-            logger.warning(f"[Persona] No videos found for user {user_id} events")
-            return None
-        
-        # 텍스트 생성: "제목: {title} 설명: {description}"
-        texts = []
-        for video in videos:
-            title = video.title or ""
-            description = video.description or ""
-            text = f"제목: {title} 설명: {description}".strip()
-            if text:
-                texts.append(text)
-        
-        if not texts:
-            logger.warning(f"[Persona] No valid texts for user {user_id}")
+        embeddings = get_stored_video_embeddings(db, (e["video_id"] for e in events))
+        if not embeddings:
+            logger.info(f"[Persona] No stored embeddings for user {user_id} events, skipping update")
             return None
+
+        persona = db.query(UserPersonaVector).filter(
+            UserPersonaVector.user_id == user_id
+        ).with_for_update().first()
+        state = PersonaState.from_row(persona)
+
+        now = datetime.utcnow()
+        for event in sorted(events, key=lambda e: e.get("created_at") or now):
+            embedding = embeddings.get(event["video_id"])
+            if embedding is None:
+                continue
+            weight = event_weight(event["event_type"], event.get("watch_time"), event.get("liked"))
+            if "prev_watch_time" in event:
+                weight -= event_weight(event["event_type"], event["prev_watch_time"], event.get("liked"))
+                if weight == 0 or state.weighted_sum is None or state.weighted_sum.shape != embedding.shape:
+                    # 가중치 상한 도달 / 처음 반영된 적 없는 상태에는 변화분만 더할 수 없음
+                    continue
+                state.add(embedding, weight, event.get("created_at") or now, count=False)
+                continue
+            state.add(embedding, weight, event.get("created_at") or now)
+
+        mean_vector = _save_persona_state(db, user_id, persona, state)
+        if commit:
+            db.commit()
+        return mean_vector
+    except Exception as e:
+        logger.error(f"[Persona] Error applying events for user {user_id}: {e}", exc_info=True)
+        db.rollback()
+        return None
+
+
+def rebuild_user_persona_vector(
+    db: Session,
+    user_id: int
+) -> Optional[List[float]]:
+    """
+    사용자 프로필 벡터 전체 재계산 (백필/복구용 배치 작업)
+    모든 시청/좋아요 이벤트를 시간순으로 다시 누적하며, 저장된 videos_static.embedding만 사용
+    
+    Args:
+        db: 데이터베이스 세션
+        user_id: 사용자 ID
         
-        # SimCSE 서버에서 임베딩 가져오기
-        logger.info(f"[Persona] Getting embeddings for {len(texts)} videos (user {user_id})")
-        embeddings = get_embeddings_batch_sync(texts)
-        
-        if not embeddings or len(embeddings) == 0:
-            logger.error(f"[Persona] Failed to get embeddings for user {user_id}")
+    Returns:
+        임베딩 벡터 또는 None
+    """
+    try:
+        events = db.query(
+            UserVideoEvent.video_id,
+            UserVideoEvent.event_type,
+            UserVideoEvent.watch_time,
+            UserVideoEvent.liked,
+            UserVideoEvent.created_at,
+        ).filter(
+            and_(
+                UserVideoEvent.user_id == user_id,
+                UserVideoEvent.event_type.in_(PERSONA_EVENT_TYPES)
+            )
+        ).order_by(UserVideoEvent.created_at).all()
+
+        if not events:
+            logger.warning(f"[Persona] No events for user {user_id}")
             return None
-        
-        # Mean pooling: 모든 임베딩의 평균
-        embeddings_array = np.array(embeddings)
-        mean_vector = np.mean(embeddings_array, axis=0).tolist()
-        
-        # DB에 저장 (upsert)
+
+        state = PersonaState()
+        for start in range(0, len(events), REBUILD_EVENT_CHUNK_SIZE):
+            chunk = events[start:start + REBUILD_EVENT_CHUNK_SIZE]
+            embeddings = get_stored_video_embeddings(db, (e.video_id for e in chunk))
+            for e in chunk:
+                embedding = embeddings.get(e.video_id)
+                if embedding is None:
+                    continue
+                state.add(embedding, event_weight(e.event_type, e.watch_time, e.liked), e.created_at)
+
         persona = db.query(UserPersonaVector).filter(
             UserPersonaVector.user_id == user_id
         ).first()
-        
-        if persona:
-            persona.embedding_json = mean_vector
-            persona.updated_at = datetime.utcnow()
-        else:
-            persona = UserPersonaVector(
-                user_id=user_id,
-                embedding_json=mean_vector
-            )
-            db.add(persona)
-        
+        mean_vector = _save_persona_state(db, user_id, persona, state)
+        if mean_vector is None:
+            logger.warning(f"[Persona] No stored embeddings for user {user_id} events")
+            db.rollback()
+            return None
         db.commit()
-        logger.info(f"[Persona] Created/updated persona vector for user {user_id}")
-        
+        logger.info(f"[Persona] Rebuilt persona vector for user {user_id} ({state.event_count} events)")
         return mean_vector
-        
     except Exception as e:
-        logger.error(f"[Persona] Error creating persona vector: {e}", exc_info=True)
+        logger.error(f"[Persona] Error rebuilding persona vector: {e}", exc_info=True)
         db.rollback()
         return None
 
 
+def rebuild_all_persona_vectors(db: Session) -> int:
+    """이벤트가 있는 모든 사용자의 프로필 벡터 재계산 (백필). 갱신된 사용자 수 반환"""
+    user_ids = [
+        row[0] for row in db.query(UserVideoEvent.user_id).filter(
+            UserVideoEvent.event_type.in_(PERSONA_EVENT_TYPES)
+        ).distinct().all()
+    ]
+    updated = 0
+    for user_id in user_ids:
+        if rebuild_user_persona_vector(db, user_id) is not None:
+            updated += 1
+    logger.info(f"[Persona] Rebuilt {updated}/{len(user_ids)} persona vectors")
+    return updated
+
+
 def get_or_create_user_persona_vector(
     db: Session,
     user_id: int
 ) -> Optional[List[float]]:
     """
-    사용자 프로필 벡터 가져오기 또는 생성
+    사용자 프로필 벡터 가져오기
+    벡터는 이벤트 기록 시 증분 갱신되고, 기존 사용자는 rebuild_all_persona_vectors 백필로 채움
+    → 요청 경로에서 재계산(이벤트 재조회/재임베딩)을 하지 않음
     
     Args:
         db: 데이터베이스 세션
         user_id: 사용자 ID
         
     Returns:
-        임베딩 벡터 또는 None
+        임베딩 벡터 또는 None (cold-start)
     """
-    # 캐시된 벡터 확인
-    cached_vector = get_user_persona_vector(db, user_id)
-    if cached_vector:
-        return cached_vector
-    
-    # 최근 이벤트 조회
-    events = get_user_recent_events(db, user_id)
-    if not events:
-        return None
-    
-    # 프로필 벡터 생성
-    return create_user_persona_vector(db, user_id, events)
+    return get_user_persona_vector(db, user_id)
 
 
 def get_candidate_videos(
@@ -2,11 +2,19 @@
 Video CRUD 작업
 데이터베이스 CRUD 연산을 정의합니다.
 """
+import os
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func, text
-from typing import List, Optional
+from sqlalchemy import desc, func, select, text
+from typing import List, Optional, Sequence
+from app.crud.comment_stats import get_comment_stats
 from app.models.video import Video
 from app.schemas.video import VideoCreate, VideoUpdate
+from app.utils.pagination import keyset_filter
+
+# true이면 get_comment_payloads_for_video가 요청마다 댓글 COUNT(*)를 로그로 남김 (디버깅용)
+COMMENT_COUNT_DIAGNOSTICS = os.getenv("COMMENT_COUNT_DIAGNOSTICS", "false").strip().lower() in ("1", "true", "yes")
 
 
 def get_video(db: Session, video_id: str) -> Optional[Video]:
@@ -23,20 +31,14 @@ def get_videos(
     db: Session,
     skip: int = 0,
     limit: int = 10,
-    channel_id: Optional[str] = None
+    channel_id: Optional[str] = None,
+    after: Optional[Sequence] = None
 ) -> List[Video]:
-    """비디오 목록 조회 (페이지네이션 지원, 4분 이상만)"""
-    query = db.query(Video)
-    
-    # 4분 = 240초 이상인 영상만 필터링
-    query = query.filter(Video.duration_sec >= 240)
-    
-    # 채널 ID 필터링
-    if channel_id:
-        query = query.filter(Video.channel_id == channel_id)
-    
-    # 최신순 정렬 및 페이지네이션
-    return query.order_by(desc(Video.published_at)).offset(skip).limit(limit).all()
+    """
+    비디오 목록 조회 (페이지네이션 지원, 4분 이상만)
+    after: 커서로 디코딩한 (published_at, id) - 주어지면 skip 대신 키셋 조회
+    """
+    return list(db.execute(latest_videos_stmt(skip, limit, channel_id, after)).scalars().all())
 
 
 def get_videos_count(db: Session, channel_id: Optional[str] = None) -> int:
@@ -109,57 +111,36 @@ def delete_video(db: Session, video_id: str) -> bool:
 def get_recommended_videos(
     db: Session,
     skip: int = 0,
-    limit: int = 10
+    limit: int = 10,
+    after: Optional[Sequence] = None
 ) -> List[Video]:
     """추천 비디오 목록 조회 (조회수 기준 상위, 4분 이상만)"""
     # 4분 = 240초 이상인 영상만 필터링
-    # MySQL 호환: NULL 값은 0으로 처리하여 마지막으로 정렬
-    return db.query(Video).filter(
-        Video.duration_sec >= 240
-    ).order_by(
-        desc(Video.view_count),
-        desc(Video.published_at)
-    ).offset(skip).limit(limit).all()
+    # MySQL 호환: NULL 값은 마지막으로 정렬
+    return list(db.execute(recommended_videos_stmt(skip, limit, after)).scalars().all())
 
 
 def get_trend_videos(
     db: Session,
     skip: int = 0,
-    limit: int = 10
+    limit: int = 10,
+    after: Optional[Sequence] = None
 ) -> List[Video]:
     """트렌드 비디오 목록 조회 (최근 게시일 기준, 4분 이상만)"""
     # 4분 = 240초 이상인 영상만 필터링
     # MySQL 호환: NULL 값은 자동으로 마지막으로 정렬됨
-    return db.query(Video).filter(
-        Video.duration_sec >= 240
-    ).order_by(
-        desc(Video.published_at)
-    ).offset(skip).limit(limit).all()
+    return list(db.execute(latest_videos_stmt(skip, limit, after=after)).scalars().all())
 
 
 def get_most_liked_videos(
     db: Session,
     skip: int = 0,
-    limit: int = 10
+    limit: int = 10,
+    after: Optional[Sequence] = None
 ) -> List[Video]:
     """가장 많은 좋아요를 받은 비디오 목록 조회 (좋아요 수 기준 상위, 4분 이상만)"""
-    # 4분 = 240초 이상인 영상만 필터링
-    # like_count가 NULL이거나 0인 경우도 포함하여 조회 (NULL은 0으로 처리)
-    from sqlalchemy import or_, case
-    
-    query = db.query(Video).filter(
-        Video.duration_sec >= 240
-    )
-    
-    # 좋아요 수가 NULL이 아닌 영상 우선, 없으면 조회수 기준
-    # MySQL에서는 NULL 값을 0으로 처리하여 정렬
-    query = query.order_by(
-        desc(case((Video.like_count.is_(None), 0), else_=Video.like_count)),
-        desc(Video.view_count),  # 좋아요가 같으면 조회수로 정렬
-        desc(Video.published_at)  # 최신순
-    ).offset(skip).limit(limit)
-    
-    results = query.all()
+    # 좋아요 수 → 조회수 → 최신순, NULL은 마지막
+    results = list(db.execute(most_liked_videos_stmt(skip, limit, after)).scalars().all())
     print(f"[DEBUG] get_most_liked_videos: Found {len(results)} videos")
     
     return results
@@ -259,6 +240,41 @@ def get_comments_for_video(db: Session, video_id: str, max_comments: int = 200)
         return []
 
 
+_COMMENT_PAYLOAD_SQL = text(
+    """
+    SELECT id, text, COALESCE(like_count, 0) AS like_count
+    FROM travel_comments
+    WHERE video_id = :video_id
+      AND text IS NOT NULL
+      AND text != ''
+    ORDER BY like_count DESC, created_at DESC
+    LIMIT :limit
+"""
+)
+
+
+def _build_comment_payloads(rows) -> List[dict]:
+    """(id, text, like_count) 행 → Bento 분석용 payload (빈 댓글/정제 후 빈 댓글 제외)"""
+    from app.utils.text_utils import sanitize_comment_text
+
+    payloads: List[dict] = []
+    for row in rows:
+        raw_text = row[1]
+        if not raw_text or not str(raw_text).strip():
+            continue  # Skip empty comments
+        cleaned_text = sanitize_comment_text(raw_text)
+        # Only add if cleaned text is not empty
+        if cleaned_text and cleaned_text.strip():
+            payloads.append(
+                {
+                    "comment_id": str(row[0]),
+                    "text": cleaned_text,
+                    "like_count": int(row[2]) if row[2] is not None else 0,
+                }
+            )
+    return payloads
+
+
 def get_comment_payloads_for_video(
     db: Session,
     video_id: str,
@@ -271,60 +287,35 @@ def get_comment_payloads_for_video(
     logger = logging.getLogger(__name__)
     
     try:
-        # 먼저 전체 댓글 개수 확인 (디버깅용)
-        count_query = text("SELECT COUNT(*) FROM travel_comments WHERE video_id = :video_id")
-        total_count = db.execute(count_query, {"video_id": video_id}).scalar()
-        logger.info("[CRUD] Total comments in DB for video %s: %d", video_id, total_count)
-        
-        # 텍스트가 있는 댓글 개수 확인
-        valid_count_query = text("""
-            SELECT COUNT(*) FROM travel_comments 
-            WHERE video_id = :video_id 
-            AND text IS NOT NULL 
-            AND text != ''
-        """)
-        valid_count = db.execute(valid_count_query, {"video_id": video_id}).scalar()
-        logger.info("[CRUD] Valid comments (with text) for video %s: %d", video_id, valid_count)
+        if COMMENT_COUNT_DIAGNOSTICS:
+            # 디버깅용: 요청마다 COUNT(*) 2회 (기본 비활성화)
+            total_count = db.execute(
+                text("SELECT COUNT(*) FROM travel_comments WHERE video_id = :video_id"),
+                {"video_id": video_id},
+            ).scalar()
+            valid_count = db.execute(text("""
+                SELECT COUNT(*) FROM travel_comments 
+                WHERE video_id = :video_id 
+                AND text IS NOT NULL 
+                AND text != ''
+            """), {"video_id": video_id}).scalar()
+            logger.info("[CRUD] Comments in DB for video %s: total=%d, with text=%d", video_id, total_count, valid_count)
         
         # 실제 댓글 조회
-        query = text(
-            """
-            SELECT id, text, COALESCE(like_count, 0) AS like_count
-            FROM travel_comments
-            WHERE video_id = :video_id
-              AND text IS NOT NULL
-              AND text != ''
-            ORDER BY like_count DESC, created_at DESC
-            LIMIT :limit
-        """
-        )
-        rows = db.execute(query, {"video_id": video_id, "limit": limit}).fetchall()
+        rows = db.execute(_COMMENT_PAYLOAD_SQL, {"video_id": video_id, "limit": limit}).fetchall()
         logger.info("[CRUD] Retrieved %d comment rows for video %s", len(rows), video_id)
-        
-        from app.utils.text_utils import sanitize_comment_text
-        
-        payloads: List[dict] = []
-        for row in rows:
-            raw_text = row[1]
-            if not raw_text or not str(raw_text).strip():
-                continue  # Skip empty comments
-            cleaned_text = sanitize_comment_text(raw_text)
-            # Only add if cleaned text is not empty
-            if cleaned_text and cleaned_text.strip():
-                payloads.append(
-                    {
-                        "comment_id": str(row[0]),
-                        "text": cleaned_text,
-                        "like_count": int(row[2]) if row[2] is not None else 0,
-                    }
-                )
+        payloads = _build_comment_payloads(rows)
         
         if payloads:
             logger.info("[CRUD] Sample payload (first): comment_id=%s, text_len=%d, like_count=%d",
                        payloads[0].get("comment_id"), len(payloads[0].get("text", "")), payloads[0].get("like_count"))
         else:
-            logger.warning("[CRUD] No valid comment payloads for video %s (total in DB: %d, valid: %d)", 
-                          video_id, total_count, valid_count)
+            # 빈 결과일 때만 요약 테이블(video_comment_stats)로 원인 확인
+            stats = get_comment_stats(db, video_id)
+            logger.warning("[CRUD] No valid comment payloads for video %s (total in DB: %s, valid: %s)", 
+                          video_id,
+                          stats.total_count if stats else "unknown",
+                          stats.text_count if stats else "unknown")
         
         return payloads
     except Exception as e:
@@ -333,3 +324,85 @@ def get_comment_payloads_for_video(
         logger.error("[CRUD] Error building comment payloads for %s: %s\n%s", video_id, e, error_trace)
         return []
 
+
+# ---------------------------------------------------------------------------
+# 비동기 조회 (AsyncSession, app.core.database.get_async_db)
+# async 라우트의 핫 경로 전용. 필터/정렬은 위 동기 함수와 동일합니다.
+# ---------------------------------------------------------------------------
+# 목록별 정렬 키 (모두 DESC, 마지막은 고유 키 id → 커서 위치가 유일)
+# alembic 20251020_01의 복합 인덱스와 같은 순서
+LATEST_CURSOR = "videos-latest"
+LATEST_KEYS = (Video.published_at, Video.id)
+RECOMMENDED_CURSOR = "videos-recommended"
+RECOMMENDED_KEYS = (Video.view_count, Video.published_at, Video.id)
+MOST_LIKED_CURSOR = "videos-most-liked"
+MOST_LIKED_KEYS = (Video.like_count, Video.view_count, Video.published_at, Video.id)
+
+
+def _video_list_stmt(channel_id: Optional[str] = None):
+    """4분 이상 영상 목록 기본 select"""
+    stmt = select(Video).where(Video.duration_sec >= 240)
+    if channel_id:
+        stmt = stmt.where(Video.channel_id == channel_id)
+    return stmt
+
+
+def _paginate(stmt, keys, skip: int, limit: int, after: Optional[Sequence]):
+    """정렬 키로 정렬 후 OFFSET(skip) 또는 키셋(after) 페이지네이션"""
+    stmt = stmt.order_by(*(desc(key) for key in keys))
+    if after is not None:
+        return stmt.where(keyset_filter(keys, after)).limit(limit)
+    return stmt.offset(skip).limit(limit)
+
+
+def latest_videos_stmt(
+    skip: int = 0,
+    limit: int = 10,
+    channel_id: Optional[str] = None,
+    after: Optional[Sequence] = None,
+):
+    """최신순 목록 (get_videos / get_trend_videos)"""
+    return _paginate(_video_list_stmt(channel_id), LATEST_KEYS, skip, limit, after)
+
+
+def recommended_videos_stmt(skip: int = 0, limit: int = 10, after: Optional[Sequence] = None):
+    """조회수순 목록 (get_recommended_videos)"""
+    return _paginate(_video_list_stmt(), RECOMMENDED_KEYS, skip, limit, after)
+
+
+def most_liked_videos_stmt(skip: int = 0, limit: int = 10, after: Optional[Sequence] = None):
+    """좋아요순 목록 (get_most_liked_videos)"""
+    return _paginate(_video_list_stmt(), MOST_LIKED_KEYS, skip, limit, after)
+
+
+async def get_video_async(db: AsyncSession, video_id: str) -> Optional[Video]:
+    """ID로 비디오 조회 (비동기)"""
+    result = await db.execute(select(Video).where(Video.id == video_id).limit(1))
+    return result.scalars().first()
+
+
+async def get_videos_count_async(db: AsyncSession, channel_id: Optional[str] = None) -> int:
+    """비디오 총 개수 조회 (비동기, 4분 이상만)"""
+    stmt = select(func.count(Video.id)).where(Video.duration_sec >= 240)
+    if channel_id:
+        stmt = stmt.where(Video.channel_id == channel_id)
+    return (await db.scalar(stmt)) or 0
+
+
+async def get_comment_payloads_for_video_async(
+    db: AsyncSession,
+    video_id: str,
+    limit: int = 100,
+) -> List[dict]:
+    """Bento 분석용 댓글 payload 조회 (비동기, 진단용 COUNT 쿼리 없이 본 조회만 실행)"""
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        result = await db.execute(_COMMENT_PAYLOAD_SQL, {"video_id": video_id, "limit": limit})
+        payloads = _build_comment_payloads(result.fetchall())
+        logger.info("[CRUD] Retrieved %d comment payloads for video %s", len(payloads), video_id)
+        return payloads
+    except Exception as e:
+        logger.error("[CRUD] Error building comment payloads for %s: %s", video_id, e, exc_info=True)
+        return []
@@ -1,6 +1,8 @@
 """
 FastAPI 메인 애플리케이션
 """
+from app.core import startup_profile  # 프로세스 시작 시각 기록을 위해 가장 먼저 import
+
 import asyncio
 import logging
 import time
@@ -11,10 +13,34 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 from typing import Optional
 
-from app.api.routes import auth, channel, personalized, personalized_recommendations
-from app.api.routes import recommend, redis_test, search, summary, video, videos_static
+with startup_profile.profile_import("app.core.database"):
+    from app.core.database import get_db
+from app.core import query_profile
+from app.crud import comment_stats as crud_comment_stats
+from app.utils import pagination
+with startup_profile.profile_import("app.api.routes.auth"):
+    from app.api.routes import auth
+with startup_profile.profile_import("app.api.routes.channel"):
+    from app.api.routes import channel
+with startup_profile.profile_import("app.api.routes.events"):
+    from app.api.routes import events
+with startup_profile.profile_import("app.api.routes.jobs"):
+    from app.api.routes import jobs
+with startup_profile.profile_import("app.api.routes.clients"):
+    from app.api.routes import clients
+with startup_profile.profile_import("app.api.routes.personalized"):
+    from app.api.routes import personalized, personalized_recommendations
+with startup_profile.profile_import("app.api.routes.recommend"):
+    from app.api.routes import recommend
+with startup_profile.profile_import("app.api.routes.redis_test"):
+    from app.api.routes import redis_test
+with startup_profile.profile_import("app.api.routes.search"):
+    from app.api.routes import search
+with startup_profile.profile_import("app.api.routes.summary"):
+    from app.api.routes import summary
+with startup_profile.profile_import("app.api.routes.video"):
+    from app.api.routes import video, videos_static
 from app.clients.bento import warmup_bento
-from app.core.database import get_db
 from app.core.errors import attach_error_handlers
 
 # FastAPI 앱 생성
@@ -47,6 +73,86 @@ async def startup_event():
         print("[Startup] Video cache warmup scheduled")
     except Exception as exc:
         print(f"[Startup] Video cache warmup scheduling failed: {exc}")
+    try:
+        from app.services.event_ingestion import get_event_buffer
+
+        get_event_buffer().start()
+    except Exception as exc:
+        print(f"[Startup] Event flusher start failed: {exc}")
+    try:
+        from app.services.job_runner import get_job_runner
+
+        get_job_runner().start()
+    except Exception as exc:
+        print(f"[Startup] Job runner start failed: {exc}")
+    _register_startup_components()
+    if startup_profile.FAST_START_PRELOAD:
+        # startup 이벤트 완료 후 uvicorn이 포트를 바인딩하므로, 약간 지연시켜 첫 요청 수신을 막지 않음
+        asyncio.get_running_loop().call_later(
+            startup_profile.FAST_START_PRELOAD_DELAY_SEC,
+            _start_model_preload,
+        )
+        print(f"[Startup] Model preload scheduled in {startup_profile.FAST_START_PRELOAD_DELAY_SEC}s")
+    startup_profile.mark_startup_complete()
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    """종료 시 버퍼에 남은 이벤트 저장"""
+    from app.services.event_ingestion import get_event_buffer
+
+    get_event_buffer().stop()
+
+
+@app.on_event("shutdown")
+async def stop_job_runner():
+    """백그라운드 작업 워커 종료 (실행 중이던 작업은 failed로 기록)"""
+    from app.services.job_runner import get_job_runner
+
+    await get_job_runner().stop()
+
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    """풀링된 외부 HTTP 클라이언트(Bento 등) 연결 종료"""
+    from app.clients.http import close_clients
+
+    await close_clients()
+
+
+def _register_startup_components() -> None:
+    """readiness 엔드포인트에서 보고할 무거운 컴포넌트 로딩 상태 등록"""
+    import sys
+
+    def _module_attr_loaded(module_name: str, attr: str) -> bool:
+        # 모듈이 아직 import되지 않았다면 모델도 로드되지 않은 상태 (확인을 위해 import하지 않음)
+        module = sys.modules.get(module_name)
+        return module is not None and getattr(module, attr, None) is not None
+
+    startup_profile.register_component(
+        "embedding_model", lambda: _module_attr_loaded("app.services.embeddings", "_model")
+    )
+    startup_profile.register_component(
+        "keyword_matrix", lambda: _module_attr_loaded("app.services.keyword_tagging", "_tagger")
+        and sys.modules["app.services.keyword_tagging"]._tagger.is_ready()
+    )
+    startup_profile.register_component(
+        "comment_summarizer", lambda: _module_attr_loaded("app.services.comment_summary", "_SUMMARY_PIPELINE")
+    )
+    startup_profile.register_component(
+        "rag_embedding_model", lambda: _module_attr_loaded("app.rag.embeddings", "_embedding_model")
+    )
+
+
+def _start_model_preload() -> None:
+    def _preload_embeddings() -> None:
+        from app.services.embeddings import get_model
+        from app.services.keyword_tagging import get_keyword_tagger
+
+        get_model()
+        get_keyword_tagger().matrix
+
+    startup_profile.start_background_preload({"embeddings": _preload_embeddings})
 
 # CORS 설정 (React 프론트엔드에서 호출 가능하도록)
 import os
@@ -88,6 +194,9 @@ app.include_router(redis_test.router)
 app.include_router(personalized.router)  # /personalized/{user_id}/{video_id}
 app.include_router(videos_static.router)  # /videos/{video_id}/static
 app.include_router(personalized_recommendations.router)  # /api/recommendations/personalized
+app.include_router(events.router)  # /api/events
+app.include_router(jobs.router)  # /api/jobs/{job_id}
+app.include_router(clients.router)  # /api/clients/metrics
 
 # 요청별 전체 소요 시간을 기록하는 미들웨어
 request_logger = logging.getLogger("request_profiler")
@@ -97,19 +206,38 @@ request_logger.setLevel(logging.INFO)
 @app.middleware("http")
 async def log_request_duration(request, call_next):
     start = time.perf_counter()
+    # 요청별 SQL 개수/DB 시간 집계 시작 (app/core/query_profile.py)
+    query_stats = query_profile.begin_request()
     response = await call_next(request)
     duration_ms = (time.perf_counter() - start) * 1000
     try:
         status_code = response.status_code
     except AttributeError:
         status_code = "unknown"
-    request_logger.info(
-        "[Request] %s %s status=%s duration=%.2fms",
-        request.method,
-        request.url.path,
-        status_code,
-        duration_ms,
-    )
+    if query_stats is None:
+        request_logger.info(
+            "[Request] %s %s status=%s duration=%.2fms",
+            request.method,
+            request.url.path,
+            status_code,
+            duration_ms,
+        )
+    else:
+        db_summary = query_stats.summary()
+        request_logger.info(
+            "[Request] %s %s status=%s duration=%.2fms db_queries=%d db_time=%.2fms distinct=%d max_repeat=%d",
+            request.method,
+            request.url.path,
+            status_code,
+            duration_ms,
+            db_summary["db_queries"],
+            db_summary["db_time_ms"],
+            db_summary["distinct_statements"],
+            db_summary["max_repeat"],
+        )
+        response.headers["Server-Timing"] = query_profile.server_timing_header(query_stats, duration_ms)
+        query_profile.warn_repeated(query_stats, request.method, request.url.path)
+    startup_profile.mark_first_response()
     return response
 
 
@@ -135,36 +263,59 @@ def api_ping():
     return {"status": "ok", "message": "pong"}
 
 
+@app.get("/ready")
+def ready():
+    """
+    Readiness 엔드포인트
+    서버는 모델 로딩 전에도 요청을 받을 수 있으며, 무거운 컴포넌트별 로딩 상태와
+    콜드 스타트 프로파일(import 비용, 첫 응답 시간, 사전 로딩 상태)을 함께 반환
+    """
+    report = startup_profile.get_startup_report()
+    preload = report["preload"]
+    preload_done = all(state["status"] in ("loaded", "failed") for state in preload.values())
+    return {
+        "status": "ready",
+        "models_ready": preload_done if preload else all(report["components"].values()),
+        **report,
+    }
+
+
+# /api/comments 정렬 키 (published_at DESC, id DESC) - alembic 20251020_01 인덱스와 같은 순서
+_COMMENTS_CURSOR = "comments"
+_COMMENT_KEYSET = (("published_at", True), ("id", False))
+
+
 @app.get("/api/comments")
 async def get_comments(
     video_id: Optional[str] = Query(None, description="비디오 ID로 필터링"),
     limit: int = Query(10, ge=1, le=100, description="반환할 댓글 수"),
     offset: int = Query(0, ge=0, description="페이지네이션 오프셋"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (응답의 next_cursor, 주어지면 offset 무시)"),
     db: Session = Depends(get_db)
 ):
-    """댓글 목록 조회"""
+    """댓글 목록 조회 (offset 또는 (published_at, id) 커서 페이지네이션)"""
+    after = pagination.decode_cursor_or_400(_COMMENTS_CURSOR, cursor, [None] * len(_COMMENT_KEYSET))
     try:
-        # SQLAlchemy를 사용하여 댓글 조회
-        query = text("""
-            SELECT * FROM travel_comments WHERE 1=1
-        """)
-        params = {}
-        
+        # SQLAlchemy를 사용하여 댓글 조회 (다음 페이지 확인용으로 limit + 1개)
+        conditions = []
+        params = {"limit": limit + 1}
         if video_id:
-            query = text("""
-                SELECT * FROM travel_comments 
-                WHERE video_id = :video_id 
-                ORDER BY published_at DESC 
-                LIMIT :limit OFFSET :offset
-            """)
-            params = {"video_id": video_id, "limit": limit, "offset": offset}
+            conditions.append("video_id = :video_id")
+            params["video_id"] = video_id
+        if after is not None:
+            seek_sql, seek_params = pagination.keyset_sql(_COMMENT_KEYSET, after)
+            conditions.append(seek_sql)
+            params.update(seek_params)
         else:
-            query = text("""
-                SELECT * FROM travel_comments 
-                ORDER BY published_at DESC 
-                LIMIT :limit OFFSET :offset
-            """)
-            params = {"limit": limit, "offset": offset}
+            params["offset"] = offset
+        where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        page_sql = "LIMIT :limit" if after is not None else "LIMIT :limit OFFSET :offset"
+        query = text(f"""
+            SELECT * FROM travel_comments
+            {where_sql}
+            ORDER BY published_at DESC, id DESC
+            {page_sql}
+        """)
         
         result = db.execute(query, params)
         comments = result.fetchall()
@@ -176,25 +327,22 @@ async def get_comments(
             for key, value in row._mapping.items():
                 comment_dict[key] = value
             comments_list.append(comment_dict)
+        comments_list, next_cursor = pagination.next_cursor(
+            _COMMENTS_CURSOR, comments_list, limit, [key for key, _ in _COMMENT_KEYSET]
+        )
         
-        # 전체 개수 조회
+        # 전체 개수: 페이지마다 COUNT(*) 하지 않고 video_comment_stats 요약에서 조회
         if video_id:
-            count_query = text("""
-                SELECT COUNT(*) as total FROM travel_comments 
-                WHERE video_id = :video_id
-            """)
-            count_result = db.execute(count_query, {"video_id": video_id})
+            total = crud_comment_stats.get_comment_count(db, video_id)
         else:
-            count_query = text("SELECT COUNT(*) as total FROM travel_comments")
-            count_result = db.execute(count_query)
-        
-        total = count_result.fetchone()[0]
+            total = crud_comment_stats.get_total_comment_count(db)
         
         return {
             "comments": comments_list,
             "total": total,
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": next_cursor,
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터베이스 조회 실패: {str(e)}")
@@ -14,6 +14,9 @@ from app.models.video_static import VideoStatic
 from app.models.comment_sentiment import CommentSentimentSummary
 from app.models.user_persona import UserPersonaVector
 from app.models.user_video_event import UserVideoEvent
+from app.models.video_comment_stats import VideoCommentStats
+from app.models.offline_enrichment import OfflineEnrichment, OfflineEnrichmentWatermark
+from app.models.video_rank_features import VideoRankFeatures
 
 __all__ = [
     "User",
@@ -31,4 +34,8 @@ __all__ = [
     "CommentSentimentSummary",
     "UserPersonaVector",
     "UserVideoEvent",
+    "VideoCommentStats",
+    "OfflineEnrichment",
+    "OfflineEnrichmentWatermark",
+    "VideoRankFeatures",
 ]
@@ -0,0 +1,45 @@
+"""
+Offline Enrichment 모델
+offline_enrichments / offline_enrichment_watermarks 테이블 스키마
+오프라인 모델(감정 / 키워드 / 욕설) 보강 결과와 배치 실행기의 재개 위치
+(scripts/run_offline_enrichment.py → app/recommendation/offline_enrichment.py)
+"""
+from sqlalchemy import Column, String, Float, Integer, JSON, DateTime
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class OfflineEnrichment(Base):
+    """
+    댓글/영상 텍스트별 오프라인 모델 결과 테이블 모델
+    """
+    __tablename__ = "offline_enrichments"
+
+    source = Column(String(16), primary_key=True, comment='대상 (comment / video)')
+    item_id = Column(String(64), primary_key=True, comment='댓글 ID 또는 비디오 ID')
+    sentiment_label = Column(String(16), nullable=True, comment='감정 라벨 (positive / neutral / negative)')
+    sentiment_score = Column(Float, nullable=True, comment='감정 점수 (pos - neg, -1.0~1.0)')
+    positive_prob = Column(Float, nullable=True, comment='긍정 확률')
+    keywords = Column(JSON, nullable=True, comment='추출 키워드 리스트')
+    profanity_score = Column(Float, nullable=True, comment='욕설/악성 확률')
+    model_version = Column(String(32), nullable=False, comment='보강 모델 버전 (OFFLINE_ENRICHMENT_VERSION)')
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now(), comment='갱신일시')
+
+    def __repr__(self):
+        return f"<OfflineEnrichment(source='{self.source}', item_id='{self.item_id}', model_version='{self.model_version}')>"
+
+
+class OfflineEnrichmentWatermark(Base):
+    """
+    대상별 보강 실행기 재개 위치 (진행 중인 패스의 마지막 처리 id, 패스 완료 시 NULL)
+    """
+    __tablename__ = "offline_enrichment_watermarks"
+
+    source = Column(String(16), primary_key=True, comment='대상 (comment / video)')
+    last_item_id = Column(String(64), nullable=True, comment='마지막으로 저장한 id (패스 완료 시 NULL)')
+    model_version = Column(String(32), nullable=False, comment='보강 모델 버전')
+    processed_count = Column(Integer, nullable=False, default=0, server_default='0', comment='현재 패스에서 저장한 행 수')
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now(), comment='갱신일시')
+
+    def __repr__(self):
+        return f"<OfflineEnrichmentWatermark(source='{self.source}', last_item_id='{self.last_item_id}')>"
@@ -1,8 +1,9 @@
 """
 User Persona Vector 모델
 사용자 프로필 임베딩 벡터 저장
+이벤트 발생 시 O(d)로 갱신할 수 있도록 가중합/가중치합/이벤트 수를 함께 저장
 """
-from sqlalchemy import Column, Integer, JSON, DateTime, Index
+from sqlalchemy import Column, Integer, Float, JSON, DateTime, Index
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -16,6 +17,10 @@ class UserPersonaVector(Base):
     
     user_id = Column(Integer, primary_key=True, index=True, comment='사용자 ID')
     embedding_json = Column(JSON, nullable=False, comment='사용자 프로필 임베딩 벡터 (JSON 배열)')
+    weighted_sum_json = Column(JSON, nullable=True, comment='이벤트 가중 임베딩 합 (시간 감쇠 적용, JSON 배열)')
+    weight_sum = Column(Float, nullable=False, default=0.0, server_default='0', comment='이벤트 가중치 합 (시간 감쇠 적용)')
+    event_count = Column(Integer, nullable=False, default=0, server_default='0', comment='반영된 이벤트 수')
+    last_event_at = Column(DateTime, nullable=True, comment='마지막으로 반영된 이벤트 시각 (감쇠 기준)')
     updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now(), index=True, comment='수정일시')
     
     __table_args__ = (
@@ -3,7 +3,7 @@ Video 모델
 SQLAlchemy ORM 모델 정의
 실제 travel_videos 테이블 스키마에 맞춰 정의
 """
-from sqlalchemy import Column, Integer, String, DateTime, Text, BigInteger, TIMESTAMP, Boolean, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Text, BigInteger, TIMESTAMP, Boolean, JSON, Index
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -34,6 +34,14 @@ class Video(Base):
     updated_at = Column(TIMESTAMP, nullable=True, server_default=func.current_timestamp(), onupdate=func.current_timestamp(), comment='수정일시')
     is_shorts = Column(Boolean, nullable=True, default=False, index=True, comment='YouTube Shorts 여부')
     
+    # 키셋(커서) 페이지네이션용 복합 인덱스 (alembic 20251020_01)
+    __table_args__ = (
+        Index('idx_videos_published_id', 'published_at', 'id'),
+        Index('idx_videos_channel_published_id', 'channel_id', 'published_at', 'id'),
+        Index('idx_videos_views_published_id', 'view_count', 'published_at', 'id'),
+        Index('idx_videos_likes_views_published_id', 'like_count', 'view_count', 'published_at', 'id'),
+    )
+    
     def __repr__(self):
         return f"<Video(id={self.id}, title='{self.title}', channel_id='{self.channel_id}')>"
 
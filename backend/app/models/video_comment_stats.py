@@ -0,0 +1,24 @@
+"""
+Video Comment Stats 모델
+video_comment_stats 테이블 스키마
+영상별 댓글 수 요약 (수집 적재 시 MySQLWriter.insert_comments가 갱신)
+"""
+from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class VideoCommentStats(Base):
+    """
+    영상별 댓글 수 요약 테이블 모델
+    travel_comments COUNT(*) 대신 PK 조회로 댓글 수를 읽기 위한 테이블
+    """
+    __tablename__ = "video_comment_stats"
+    
+    video_id = Column(String(64), primary_key=True, comment='비디오 ID')
+    total_count = Column(Integer, nullable=False, default=0, comment='전체 댓글 수')
+    text_count = Column(Integer, nullable=False, default=0, comment='본문이 있는 댓글 수')
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now(), comment='갱신일시')
+    
+    def __repr__(self):
+        return f"<VideoCommentStats(video_id='{self.video_id}', total_count={self.total_count}, text_count={self.text_count})>"
@@ -0,0 +1,36 @@
+"""
+Video Rank Features 모델
+video_rank_features 테이블 스키마
+/api/v1/videos/recommended, /personalized 랭킹 피처 (배치 작업 refresh_rank_features가 갱신)
+"""
+from sqlalchemy import Column, String, Integer, BigInteger, Float, DateTime, Index
+from app.core.database import Base
+
+
+class VideoRankFeatures(Base):
+    """
+    영상별 랭킹 피처 테이블 모델
+    videos ⨝ video_sentiment_agg ⟕ video_topics(대표 토픽) 조인 결과를 영상당 한 행으로 저장
+    """
+    __tablename__ = "video_rank_features"
+
+    video_id = Column(String(64), primary_key=True, comment='비디오 ID')
+    title = Column(String(512), nullable=True, comment='제목')
+    channel_id = Column(String(64), nullable=True, comment='채널 ID')
+    views = Column(BigInteger, nullable=False, default=0, comment='조회수')
+    log_views = Column(Float, nullable=False, default=0.0, comment='log(조회수 + 1)')
+    pos_ratio = Column(Float, nullable=True, comment='긍정 비율')
+    avg_score = Column(Float, nullable=True, comment='평균 감정 점수')
+    topic_id = Column(Integer, nullable=True, comment='대표 토픽 ID (topic_score 최대)')
+    topic_score = Column(Float, nullable=True, comment='대표 토픽 점수')
+    published_at = Column(DateTime, nullable=True, comment='게시일시')
+    refreshed_at = Column(DateTime, nullable=False, comment='배치 갱신 시각')
+
+    # 후보 조회 커버링 인덱스 (ORDER BY published_at DESC, video_id는 PK로 포함)
+    __table_args__ = (
+        Index('idx_rank_published_cover', 'published_at', 'pos_ratio', 'avg_score', 'topic_id', 'topic_score', 'log_views'),
+        Index('idx_rank_topic_published_cover', 'topic_id', 'published_at', 'pos_ratio', 'avg_score', 'topic_score', 'log_views'),
+    )
+
+    def __repr__(self):
+        return f"<VideoRankFeatures(video_id='{self.video_id}', topic_id={self.topic_id}, refreshed_at={self.refreshed_at})>"
@@ -0,0 +1,30 @@
+"""
+오프라인 모델 배치 구성 유틸리티
+- 텍스트를 길이 순으로 정렬해 비슷한 길이끼리 묶음 → 배치 안 패딩(= 낭비되는 연산) 최소화
+- 배치마다 원래 인덱스를 함께 돌려주므로 호출 측에서 입력 순서대로 결과를 되돌릴 수 있음
+"""
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+
+def length_bucketed_batches(
+    texts: Sequence[str],
+    batch_size: int,
+    max_chars: Optional[int] = None,
+) -> Iterator[Tuple[List[int], List[str]]]:
+    """
+    (원래 인덱스 목록, 텍스트 목록) 배치를 길이 오름차순으로 생성
+    max_chars: 배치의 (가장 긴 텍스트 길이 × 개수) 상한. 긴 텍스트 배치는 개수를 줄여 메모리/지연을 고르게 유지
+    """
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    indices: List[int] = []
+    for i in order:
+        # 길이 오름차순이므로 지금 텍스트가 배치에서 가장 긴 텍스트
+        if indices and (
+            len(indices) >= batch_size
+            or (max_chars is not None and len(texts[i]) * (len(indices) + 1) > max_chars)
+        ):
+            yield indices, [texts[j] for j in indices]
+            indices = []
+        indices.append(i)
+    if indices:
+        yield indices, [texts[j] for j in indices]
@@ -0,0 +1,387 @@
+"""
+오프라인 텍스트 보강(enrichment) 배치 실행기
+- travel_comments / travel_videos를 id 순서 keyset 청크(OFFLINE_ENRICHMENT_CHUNK_SIZE)로 읽어
+  감정(SentimentScorer) / 키워드(KeywordExtractor) / 욕설(ProfanityFilter) 결과를 계산
+- 모델마다 batch API + 길이 버킷 배치 (torch.inference_mode) → 텍스트 1건씩 호출하던 것보다 패딩/호출 오버헤드 감소
+- 청크 결과는 offline_enrichments에 multi-row upsert, 같은 트랜잭션에서 offline_enrichment_watermarks에 마지막 id 기록
+  → 중간에 중단되어도 다시 실행하면 워터마크 다음 id부터 이어서 처리, 끝까지 돌면 워터마크를 비움 (패스 완료)
+- 같은 OFFLINE_ENRICHMENT_VERSION으로 선택한 모델 결과가 이미 있는 행은 anti-join으로 건너뜀
+  → 야간 재실행은 새로 적재된 댓글/영상만 처리, 버전을 올리면 전체 재계산
+- workers > 1: 프로세스 풀 (프로세스마다 모델 로드, torch 스레드 = CPU 수 / workers)
+  메인 프로세스는 DB 읽기/쓰기만 하고 청크 단위로 작업을 넘김 (저장은 청크 순서대로 → 워터마크 일관성 유지)
+
+모델 경로(MODEL_DIR)가 저장소 루트 기준이므로 루트에서 실행:
+    python backend/scripts/run_offline_enrichment.py --source comment --workers 4
+"""
+import json
+import logging
+import multiprocessing
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+OFFLINE_ENRICHMENT_VERSION = os.getenv("OFFLINE_ENRICHMENT_VERSION", "v1")
+OFFLINE_ENRICHMENT_CHUNK_SIZE = int(os.getenv("OFFLINE_ENRICHMENT_CHUNK_SIZE", "2000"))
+OFFLINE_ENRICHMENT_WORKERS = int(os.getenv("OFFLINE_ENRICHMENT_WORKERS", "1"))
+OFFLINE_ENRICHMENT_BATCH_SIZE = int(os.getenv("OFFLINE_ENRICHMENT_BATCH_SIZE", "64"))
+OFFLINE_ENRICHMENT_MAX_CHARS = int(os.getenv("OFFLINE_ENRICHMENT_MAX_CHARS", "1000"))
+OFFLINE_KEYWORD_BATCH_SIZE = int(os.getenv("OFFLINE_KEYWORD_BATCH_SIZE", "16"))
+OFFLINE_KEYWORD_NUM_BEAMS = int(os.getenv("OFFLINE_KEYWORD_NUM_BEAMS", "4"))
+OFFLINE_KEYWORD_MAX_LEN = int(os.getenv("OFFLINE_KEYWORD_MAX_LEN", "64"))
+
+ENRICHMENT_MODELS = ("sentiment", "keywords", "profanity")
+
+# 대상별 (테이블, 보강할 텍스트 식, 텍스트가 있는 행 조건)
+_SOURCES = {
+    "comment": ("travel_comments", "t.text", "t.text IS NOT NULL AND t.text != ''"),
+    "video": ("travel_videos", "CONCAT_WS('\\n', t.title, t.description)", "t.title IS NOT NULL"),
+}
+# 모델 → 결과 컬럼 (NULL이면 아직 해당 모델 결과 없음)
+_MODEL_COLUMNS = {
+    "sentiment": "sentiment_label",
+    "keywords": "keywords",
+    "profanity": "profanity_score",
+}
+
+# 선택하지 않은 모델의 컬럼(VALUES(...)가 NULL)은 같은 버전이면 기존 값 유지, 버전이 바뀌면 NULL
+# → 일부 모델만 새 버전으로 돌려도 나머지 모델의 이전 버전 결과가 새 버전으로 표시되지 않음 (_pending_query가 다시 처리)
+# MySQL은 SET 항목을 왼쪽부터 적용하므로 model_version은 그 값을 비교하는 컬럼들보다 뒤에 둠
+_KEEP_IF_SAME_VERSION = "COALESCE(VALUES({column}), IF(model_version = VALUES(model_version), {column}, NULL))"
+_UPSERT_SQL = text(f"""
+    INSERT INTO offline_enrichments (
+        source, item_id, sentiment_label, sentiment_score, positive_prob,
+        keywords, profanity_score, model_version, updated_at
+    ) VALUES (
+        :source, :item_id, :sentiment_label, :sentiment_score, :positive_prob,
+        :keywords, :profanity_score, :model_version, NOW()
+    )
+    ON DUPLICATE KEY UPDATE
+        sentiment_label = {_KEEP_IF_SAME_VERSION.format(column="sentiment_label")},
+        sentiment_score = {_KEEP_IF_SAME_VERSION.format(column="sentiment_score")},
+        positive_prob = {_KEEP_IF_SAME_VERSION.format(column="positive_prob")},
+        keywords = {_KEEP_IF_SAME_VERSION.format(column="keywords")},
+        profanity_score = {_KEEP_IF_SAME_VERSION.format(column="profanity_score")},
+        model_version = VALUES(model_version),
+        updated_at = VALUES(updated_at)
+""")
+
+_WATERMARK_SQL = text("""
+    INSERT INTO offline_enrichment_watermarks (source, last_item_id, model_version, processed_count, updated_at)
+    VALUES (:source, :last_item_id, :model_version, :processed_count, NOW())
+    ON DUPLICATE KEY UPDATE
+        last_item_id = VALUES(last_item_id),
+        model_version = VALUES(model_version),
+        processed_count = VALUES(processed_count),
+        updated_at = VALUES(updated_at)
+""")
+
+_LOAD_WATERMARK_SQL = text("""
+    SELECT last_item_id, model_version, processed_count
+    FROM offline_enrichment_watermarks
+    WHERE source = :source
+""")
+
+_KEYWORD_SPLIT = re.compile(r"[,\n]")
+
+
+@dataclass(frozen=True)
+class EnrichmentSettings:
+    """배치 실행 설정 (프로세스 풀 초기화 인자로 넘기므로 picklable)"""
+    models: Tuple[str, ...] = ENRICHMENT_MODELS
+    version: str = OFFLINE_ENRICHMENT_VERSION
+    batch_size: int = OFFLINE_ENRICHMENT_BATCH_SIZE
+    max_chars: int = OFFLINE_ENRICHMENT_MAX_CHARS
+    keyword_batch_size: int = OFFLINE_KEYWORD_BATCH_SIZE
+    keyword_num_beams: int = OFFLINE_KEYWORD_NUM_BEAMS
+    keyword_max_len: int = OFFLINE_KEYWORD_MAX_LEN
+    torch_threads: Optional[int] = None  # None이면 torch 기본값
+
+    def __post_init__(self):
+        unknown = set(self.models) - set(ENRICHMENT_MODELS)
+        if unknown or not self.models:
+            raise ValueError(f"models must be a non-empty subset of {ENRICHMENT_MODELS}, got {self.models}")
+
+
+def split_keywords(generated: str) -> List[str]:
+    """KoBART 출력("키워드1, 키워드2, ...") → 중복 없는 키워드 리스트 (순서 유지)"""
+    keywords = [part.strip() for part in _KEYWORD_SPLIT.split(generated or "")]
+    return list(dict.fromkeys(keyword for keyword in keywords if keyword))
+
+
+class EnrichmentPipeline:
+    """선택한 오프라인 모델을 한 프로세스에 로드하고 텍스트 목록을 한꺼번에 보강"""
+
+    def __init__(self, settings: EnrichmentSettings):
+        import torch
+
+        self.settings = settings
+        if settings.torch_threads:
+            torch.set_num_threads(settings.torch_threads)
+
+        self.sentiment = None
+        self.keywords = None
+        self.profanity = None
+        if "sentiment" in settings.models:
+            from app.recommendation.offline_sentiment import SentimentScorer
+            self.sentiment = SentimentScorer()
+        if "keywords" in settings.models:
+            from app.recommendation.offline_keywords import KeywordExtractor
+            self.keywords = KeywordExtractor()
+        if "profanity" in settings.models:
+            from app.recommendation.offline_profanity import ProfanityFilter
+            self.profanity = ProfanityFilter()
+
+    def run(self, texts: Sequence[str]) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+        """
+        텍스트 목록 → (입력 순서대로 결과 dict 목록, 모델별 소요 ms)
+        결과 dict에는 실행한 모델의 컬럼만 값이 채워짐 (나머지는 None → upsert에서 기존 값 유지)
+        """
+        settings = self.settings
+        # 토크나이저가 어차피 256토큰에서 자르므로 긴 텍스트는 미리 잘라 토큰화 비용 절감
+        texts = [(t or "")[:settings.max_chars] for t in texts]
+        results: List[Dict[str, Any]] = [
+            {
+                "sentiment_label": None,
+                "sentiment_score": None,
+                "positive_prob": None,
+                "keywords": None,
+                "profanity_score": None,
+            }
+            for _ in texts
+        ]
+        timings: Dict[str, float] = {}
+
+        if self.sentiment is not None:
+            start = time.perf_counter()
+            for row, (label, score, pos) in zip(results, self.sentiment.score_batch(texts, batch_size=settings.batch_size)):
+                row["sentiment_label"] = label
+                row["sentiment_score"] = score
+                row["positive_prob"] = pos
+            timings["sentiment"] = (time.perf_counter() - start) * 1000
+
+        if self.profanity is not None:
+            start = time.perf_counter()
+            for row, score in zip(results, self.profanity.score_batch(texts, batch_size=settings.batch_size)):
+                row["profanity_score"] = score
+            timings["profanity"] = (time.perf_counter() - start) * 1000
+
+        if self.keywords is not None:
+            start = time.perf_counter()
+            generated = self.keywords.extract_batch(
+                texts,
+                max_len=settings.keyword_max_len,
+                num_beams=settings.keyword_num_beams,
+                batch_size=settings.keyword_batch_size,
+            )
+            for row, keywords in zip(results, generated):
+                row["keywords"] = split_keywords(keywords)
+            timings["keywords"] = (time.perf_counter() - start) * 1000
+
+        return results, timings
+
+
+# ------------------------------------------------------------------
+# 프로세스 풀 워커 (프로세스마다 파이프라인 1개)
+# ------------------------------------------------------------------
+_worker_pipeline: Optional[EnrichmentPipeline] = None
+
+
+def _init_worker(settings: EnrichmentSettings) -> None:
+    global _worker_pipeline
+    _worker_pipeline = EnrichmentPipeline(settings)
+
+
+def _run_in_worker(texts: List[str]) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+    return _worker_pipeline.run(texts)
+
+
+# ------------------------------------------------------------------
+# DB 읽기 / 쓰기
+# ------------------------------------------------------------------
+def _pending_query(source: str, models: Sequence[str]):
+    """워터마크 이후 id 중 현재 버전의 선택 모델 결과가 없는 행 (id 오름차순)"""
+    table, body, has_text = _SOURCES[source]
+    done = " AND ".join(f"e.{_MODEL_COLUMNS[model]} IS NOT NULL" for model in models)
+    return text(f"""
+        SELECT t.id, {body}
+        FROM {table} t
+        LEFT JOIN offline_enrichments e
+          ON e.source = :source AND e.item_id = t.id AND e.model_version = :version AND {done}
+        WHERE t.id > :after AND {has_text} AND e.item_id IS NULL
+        ORDER BY t.id
+        LIMIT :limit
+    """)
+
+
+def load_watermark(db, source: str, version: str) -> Tuple[str, int]:
+    """(재개할 마지막 id, 현재 패스에서 저장한 행 수). 진행 중인 패스가 없거나 버전이 다르면 ("", 0)"""
+    row = db.execute(_LOAD_WATERMARK_SQL, {"source": source}).first()
+    if row is None or not row[0] or row[1] != version:
+        return "", 0
+    return str(row[0]), int(row[2] or 0)
+
+
+def save_chunk(
+    db,
+    source: str,
+    version: str,
+    rows: Sequence[Tuple[Any, str]],
+    results: Sequence[Dict[str, Any]],
+    processed_count: int,
+) -> None:
+    """청크 결과 multi-row upsert + 워터마크 갱신을 한 트랜잭션으로 커밋"""
+    params = []
+    for (item_id, _), result in zip(rows, results):
+        keywords = result["keywords"]
+        params.append({
+            **result,
+            "source": source,
+            "item_id": str(item_id),
+            "keywords": json.dumps(keywords, ensure_ascii=False) if keywords is not None else None,
+            "model_version": version,
+        })
+    try:
+        # executemany → pymysql이 multi-row INSERT 한 문장으로 묶음
+        db.execute(_UPSERT_SQL, params)
+        db.execute(_WATERMARK_SQL, {
+            "source": source,
+            "last_item_id": str(rows[-1][0]),
+            "model_version": version,
+            "processed_count": processed_count,
+        })
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+def finish_pass(db, source: str, version: str, processed_count: int) -> None:
+    """대상 전체를 끝까지 처리함 → 워터마크를 비워 다음 실행은 처음부터 (새 행만) 확인"""
+    db.execute(_WATERMARK_SQL, {
+        "source": source,
+        "last_item_id": None,
+        "model_version": version,
+        "processed_count": processed_count,
+    })
+    db.commit()
+
+
+def run_enrichment(
+    session_factory: Callable,
+    source: str = "comment",
+    settings: Optional[EnrichmentSettings] = None,
+    workers: int = OFFLINE_ENRICHMENT_WORKERS,
+    chunk_size: int = OFFLINE_ENRICHMENT_CHUNK_SIZE,
+    limit: Optional[int] = None,
+    restart: bool = False,
+) -> Dict[str, Any]:
+    """
+    한 대상(comment / video)을 보강하고 실행 통계 반환
+    limit: 이번 실행에서 처리할 최대 행 수 (중간에 멈추면 워터마크가 남아 다음 실행이 이어서 처리)
+    restart: 워터마크를 무시하고 처음부터 (이미 보강된 행은 여전히 건너뜀)
+    """
+    if source not in _SOURCES:
+        raise ValueError(f"unknown source: {source} (expected one of {sorted(_SOURCES)})")
+    settings = settings or EnrichmentSettings()
+    query = _pending_query(source, settings.models)
+
+    db = session_factory()
+    executor: Optional[ProcessPoolExecutor] = None
+    pipeline: Optional[EnrichmentPipeline] = None
+    inflight: deque = deque()
+    stats: Dict[str, Any] = {
+        "source": source,
+        "version": settings.version,
+        "models": list(settings.models),
+        "workers": workers,
+        "processed": 0,
+        "chunks": 0,
+        "completed_pass": False,
+        "model_ms": {model: 0.0 for model in settings.models},
+    }
+    start = time.perf_counter()
+
+    try:
+        after, processed_total = ("", 0) if restart else load_watermark(db, source, settings.version)
+        stats["resumed_from"] = after or None
+
+        if workers > 1:
+            threads = settings.torch_threads or max(1, (os.cpu_count() or 1) // workers)
+            # spawn: 부모의 DB 연결 / torch 스레드 풀을 물려받지 않도록
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(replace(settings, torch_threads=threads),),
+            )
+        else:
+            pipeline = EnrichmentPipeline(settings)
+
+        def save(rows, outcome) -> None:
+            nonlocal processed_total
+            results, timings = outcome.result() if isinstance(outcome, Future) else outcome
+            processed_total += len(rows)
+            save_chunk(db, source, settings.version, rows, results, processed_total)
+            stats["processed"] += len(rows)
+            stats["chunks"] += 1
+            for model, elapsed_ms in timings.items():
+                stats["model_ms"][model] += elapsed_ms
+            elapsed = time.perf_counter() - start
+            logger.info(
+                f"[Enrichment] {source}: {stats['processed']} rows "
+                f"({stats['processed'] / elapsed:.1f}/s), last id={rows[-1][0]}"
+            )
+
+        remaining = limit
+        while True:
+            if remaining is not None and remaining <= 0:
+                break
+            fetch_size = chunk_size if remaining is None else min(chunk_size, remaining)
+            rows = [tuple(row) for row in db.execute(query, {
+                "source": source,
+                "version": settings.version,
+                "after": after,
+                "limit": fetch_size,
+            }).all()]
+            db.commit()  # 읽기 트랜잭션 종료 (긴 배치 동안 스냅샷 유지하지 않음)
+            if not rows:
+                stats["completed_pass"] = True
+                break
+            after = str(rows[-1][0])
+            if remaining is not None:
+                remaining -= len(rows)
+            texts = [row[1] or "" for row in rows]
+
+            if executor is None:
+                save(rows, pipeline.run(texts))
+                continue
+            inflight.append((rows, executor.submit(_run_in_worker, texts)))
+            # 워커마다 청크 2개까지만 대기 (메모리 제한), 저장은 제출 순서대로
+            while len(inflight) >= workers * 2:
+                save(*inflight.popleft())
+
+        while inflight:
+            save(*inflight.popleft())
+        if stats["completed_pass"]:
+            finish_pass(db, source, settings.version, processed_total)
+    finally:
+        for _, future in inflight:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        db.close()
+
+    elapsed = time.perf_counter() - start
+    stats["elapsed_sec"] = round(elapsed, 2)
+    stats["rows_per_sec"] = round(stats["processed"] / elapsed, 2) if elapsed else 0.0
+    stats["model_ms"] = {model: round(ms, 1) for model, ms in stats["model_ms"].items()}
+    logger.info(f"[Enrichment] {source} done: {stats}")
+    return stats
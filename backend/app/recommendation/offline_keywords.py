@@ -1,5 +1,10 @@
+from typing import List, Sequence
+
+import torch
 from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 
+from app.recommendation.offline_batching import length_bucketed_batches
+
 MODEL_DIR = "backend/models/keyword/kobart"
 
 
@@ -10,10 +15,25 @@ class KeywordExtractor:
         self.model.eval()
 
     def extract(self, text: str, max_len: int = 64) -> str:
-        prompt = f"키워드: {text}"
-        inputs = self.tokenizer([prompt], return_tensors="pt", truncation=True, max_length=256)
-        outputs = self.model.generate(**inputs, num_beams=4, max_length=max_len)
-        decoded = self.tokenizer.batch_decode(outputs, skip_special_tokens=True)[0]
-        return decoded.strip()
-
+        return self.extract_batch([text], max_len=max_len)[0]
 
+    @torch.inference_mode()
+    def extract_batch(
+        self,
+        texts: Sequence[str],
+        max_len: int = 64,
+        num_beams: int = 4,
+        batch_size: int = 16,
+    ) -> List[str]:
+        """Length-bucketed batched generate; results are returned in input order."""
+        results = [""] * len(texts)
+        for indices, batch in length_bucketed_batches(texts, batch_size):
+            prompts = [f"키워드: {text}" for text in batch]
+            inputs = self.tokenizer(
+                prompts, return_tensors="pt", padding=True, truncation=True, max_length=256, return_token_type_ids=False
+            )
+            outputs = self.model.generate(**inputs, num_beams=num_beams, max_length=max_len)
+            decoded = self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+            for i, keywords in zip(indices, decoded):
+                results[i] = keywords.strip()
+        return results
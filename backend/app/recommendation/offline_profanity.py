@@ -1,6 +1,10 @@
+from typing import List, Sequence
+
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 import torch
 
+from app.recommendation.offline_batching import length_bucketed_batches
+
 MODEL_DIR = "backend/models/profanity/kcelectra"
 
 
@@ -10,13 +14,19 @@ class ProfanityFilter:
         self.model = AutoModelForSequenceClassification.from_pretrained(MODEL_DIR, local_files_only=True)
         self.model.eval()
 
-    @torch.inference_mode()
     def score(self, text: str) -> float:
         """Return probability of toxic/abusive class if available; otherwise 0/1 proxy."""
-        inputs = self.tokenizer(text, return_tensors="pt", truncation=True, max_length=256)
-        logits = self.model(**inputs).logits
-        probs = torch.softmax(logits, dim=-1).squeeze(0).cpu().tolist()
-        # assume last index = toxic
-        return float(probs[-1]) if len(probs) > 1 else float(probs[0])
-
+        return self.score_batch([text])[0]
 
+    @torch.inference_mode()
+    def score_batch(self, texts: Sequence[str], batch_size: int = 64) -> List[float]:
+        """Length-bucketed batched scoring; results are returned in input order."""
+        results = [0.0] * len(texts)
+        for indices, batch in length_bucketed_batches(texts, batch_size):
+            inputs = self.tokenizer(batch, return_tensors="pt", padding=True, truncation=True, max_length=256)
+            logits = self.model(**inputs).logits
+            probs = torch.softmax(logits, dim=-1).cpu().tolist()
+            for i, p in zip(indices, probs):
+                # assume last index = toxic
+                results[i] = float(p[-1]) if len(p) > 1 else float(p[0])
+        return results
@@ -1,6 +1,8 @@
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 import torch
 
+from app.recommendation.offline_batching import length_bucketed_batches
+
 MODEL_DIR = "backend/models/sentiment/koelectra"  # daekeun-ml/koelectra-small-finetuned-sentiment
 
 
@@ -12,13 +14,13 @@ class SentimentScorer:
 
     @torch.inference_mode()
     def score_batch(self, texts, batch_size: int = 64):
-        results = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i+batch_size]
+        # 길이가 비슷한 텍스트끼리 배치 (패딩 최소화), 결과는 입력 순서대로
+        results = [None] * len(texts)
+        for indices, batch in length_bucketed_batches(texts, batch_size):
             inp = self.tokenizer(batch, return_tensors="pt", padding=True, truncation=True, max_length=256)
             logits = self.model(**inp).logits
             probs = torch.softmax(logits, dim=-1).cpu().tolist()
-            for p in probs:
+            for i, p in zip(indices, probs):
                 # assume [neg, neu, pos] or [neg, pos]
                 if len(p) == 3:
                     neg, neu, pos = p
@@ -30,7 +32,5 @@ class SentimentScorer:
                     neg, neu, pos = 0.0, 0.0, p[-1]
                 label = "positive" if pos >= max(neg, neu) else ("negative" if neg >= max(neu, pos) else "neutral")
                 score = pos - neg  # [-1,1] 근사
-                results.append((label, float(score), float(pos)))
+                results[i] = (label, float(score), float(pos))
         return results
-
-
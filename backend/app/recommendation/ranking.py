@@ -7,6 +7,10 @@
   popularity      = log(views + 1)
   final_score     = 0.5 * sentiment_score + 0.3 * topic_score + 0.2 * popularity
 
+배치 API(compute_final_scores / rank_candidates)는 같은 공식을 후보 배열 전체에 한 번에 적용하고
+상위 K개는 argpartition으로 고른다.
+랭킹 피처 테이블(video_rank_features)에서 읽은 후보는 log(views + 1)이 log_views로 미리 계산되어 있다.
+
 향후 확장:
   - user_features 테이블에 사용자 주제 친화도(user_affinity) 등이 생기면
     final_score += 0.1 * user_affinity 형태로 간단히 가산/가중치 추가 가능
@@ -14,7 +18,11 @@
 from __future__ import annotations
 
 import math
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.utils.similarity import top_k_indices
 
 
 def compute_sentiment_score(pos_ratio: Optional[float], avg_score: Optional[float]) -> float:
@@ -54,3 +62,71 @@ def compute_final_score(
     return float(base)
 
 
+def _as_float_array(values: Sequence[Optional[float]]) -> np.ndarray:
+    """None → NaN 변환 포함 float64 배열"""
+    return np.asarray(values, dtype=np.float64)
+
+
+def compute_final_scores(
+    pos_ratio: Sequence[Optional[float]],
+    avg_score: Sequence[Optional[float]],
+    topic_score: Sequence[Optional[float]],
+    video_topic_id: Sequence[Optional[int]],
+    target_topic_id: Optional[int],
+    views: Sequence[Optional[int]],
+    user_affinity: Optional[Sequence[Optional[float]]] = None,
+    log_views: Optional[Sequence[Optional[float]]] = None,
+) -> np.ndarray:
+    """
+    compute_final_score의 벡터화 버전. 입력은 후보 순서로 정렬된 길이 N 배열 (None 허용)
+    log_views가 주어지면 views 대신 미리 계산된 log(views + 1)을 인기도로 사용
+    """
+    sentiment = 0.6 * np.nan_to_num(_as_float_array(pos_ratio)) + 0.4 * np.nan_to_num(_as_float_array(avg_score))
+
+    topic = np.nan_to_num(_as_float_array(topic_score))
+    if target_topic_id is not None:
+        topic_ids = _as_float_array(video_topic_id)
+        has_topic = ~np.isnan(topic_ids)
+        topic = np.where(has_topic, np.where(topic_ids == target_topic_id, 1.0, topic * 0.7), topic)
+
+    if log_views is not None:
+        popularity = np.nan_to_num(_as_float_array(log_views))
+    else:
+        popularity = np.log1p(np.nan_to_num(_as_float_array(views)))
+    base = 0.5 * sentiment + 0.3 * topic + 0.2 * popularity
+    if user_affinity is not None:
+        base += 0.1 * np.nan_to_num(_as_float_array(user_affinity))
+    return base
+
+
+def rank_candidates(
+    rows: List[Dict[str, Any]],
+    target_topic_id: Optional[int],
+    limit: int,
+) -> List[Dict[str, Any]]:
+    """
+    fetch_rank_candidates 결과를 한 번에 점수화하고 상위 limit개를 점수 내림차순으로 반환
+    (각 행에 "score" 추가, 행에 log_views가 있으면 views 대신 사용)
+    """
+    if not rows:
+        return []
+    has_log_views = all("log_views" in row for row in rows)
+    scores = compute_final_scores(
+        pos_ratio=[row.get("pos_ratio") for row in rows],
+        avg_score=[row.get("avg_score") for row in rows],
+        topic_score=[row.get("topic_score") for row in rows],
+        video_topic_id=[row.get("topic_id") for row in rows],
+        target_topic_id=target_topic_id,
+        views=[row.get("views") for row in rows],
+        log_views=[row.get("log_views") for row in rows] if has_log_views else None,
+        user_affinity=(
+            [row.get("user_affinity") for row in rows]
+            if any("user_affinity" in row for row in rows) else None
+        ),
+    )
+    ranked = []
+    for i in top_k_indices(scores, limit):
+        row = dict(rows[i])
+        row["score"] = float(scores[i])
+        ranked.append(row)
+    return ranked
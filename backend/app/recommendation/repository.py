@@ -9,21 +9,107 @@
   - videos(video_id, title, channel_id, views, published_at, thumbnail_url ...)
 
 스키마 차이가 있어도 SELECT 별칭으로 필드를 통일해서 올려준다.
+
+랭킹 피처 테이블 (video_rank_features):
+  위 3-way 조인(videos ⨝ video_sentiment_agg ⟕ video_topics)을 배치 작업(refresh_rank_features,
+  scripts/build_rank_features.py)이 영상당 한 행으로 미리 풀어 둔 테이블.
+  - topic_id / topic_score는 영상의 대표 토픽(topic_score 최대) 하나
+  - (published_at, 점수 피처) / (topic_id, published_at, 점수 피처) 커버링 인덱스
+    → 요청마다 조인/정렬 없이 인덱스 범위 하나만 읽음 (제목/채널은 상위 K개만 PK로 조회)
+  - 갱신은 Airflow youtube_travel_pipeline의 yt_refresh_rank_features 태스크 (MySQL 적재 후, 매일)
+  - RANK_FEATURES_ENABLED=false 이거나, 테이블이 비었거나, 마지막 갱신이 RANK_FEATURES_MAX_AGE_SEC보다 오래됐거나,
+    테이블 조회가 실패하면 기존 조인 쿼리 사용 (상태 확인 결과는 RANK_FEATURES_STATUS_TTL_SEC 동안 재사용)
 """
-from typing import Optional, List, Dict, Any
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple
+
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import DateTime, bindparam, text
 
+from utils import rank_features_sql
 
-def fetch_rank_candidates(
-    db: Session,
-    limit: int = 20,
-    topic_id: Optional[int] = None,
-) -> List[Dict[str, Any]]:
-    """추천 랭킹 후보를 조회한다.
+logger = logging.getLogger(__name__)
 
-    MySQL 호환. 점수 계산은 애플리케이션 레벨에서 수행(유연성 확보).
+RANK_FEATURES_ENABLED = os.getenv("RANK_FEATURES_ENABLED", "true").strip().lower() in {"1", "true", "yes", "on"}
+RANK_FEATURES_MAX_AGE_SEC = float(os.getenv("RANK_FEATURES_MAX_AGE_SEC", str(2 * 24 * 3600)))
+RANK_FEATURES_STATUS_TTL_SEC = float(os.getenv("RANK_FEATURES_STATUS_TTL_SEC", "60"))
+TOP_TOPICS_CACHE_TTL_SEC = float(os.getenv("TOP_TOPICS_CACHE_TTL_SEC", "300"))
+
+# 커버링 인덱스 컬럼만 읽음 (video_id는 PK라 보조 인덱스에 포함됨)
+_FEATURE_CANDIDATES_SQL = text(
+    """
+    SELECT video_id, pos_ratio, avg_score, topic_id, topic_score, log_views
+    FROM video_rank_features
+    ORDER BY published_at DESC
+    LIMIT :limit
+    """
+)
+
+_FEATURE_TOPIC_CANDIDATES_SQL = text(
     """
+    SELECT video_id, pos_ratio, avg_score, topic_id, topic_score, log_views
+    FROM video_rank_features
+    WHERE topic_id = :topic_id
+    ORDER BY published_at DESC
+    LIMIT :limit
+    """
+)
+
+_FEATURE_DETAILS_SQL = text(
+    """
+    SELECT video_id, title, channel_id
+    FROM video_rank_features
+    WHERE video_id IN :video_ids
+    """
+).bindparams(bindparam("video_ids", expanding=True))
+
+# 갱신 SQL은 Airflow(utils/db_writer)와 함께 쓰는 utils/rank_features_sql에 한 번만 정의
+_REFRESH_FEATURES_SQL = text(rank_features_sql.render(rank_features_sql.REFRESH_TEMPLATE, ":refreshed_at"))
+_DELETE_STALE_FEATURES_SQL = text(rank_features_sql.render(rank_features_sql.DELETE_STALE_TEMPLATE, ":refreshed_at"))
+
+# 갱신 후 오래된 행은 지워지므로 모든 행의 refreshed_at이 같음 → 아무 행 하나로 갱신 시각 확인
+_FEATURES_REFRESHED_AT_SQL = text("SELECT refreshed_at FROM video_rank_features LIMIT 1").columns(refreshed_at=DateTime)
+
+# (상태 만료 시각, 피처 테이블 사용 가능 여부)
+_features_status: Optional[Tuple[float, bool]] = None
+_features_status_lock = threading.Lock()
+
+
+def _rank_features_usable(db: Session) -> bool:
+    """피처 테이블에 행이 있고 RANK_FEATURES_MAX_AGE_SEC 안에 갱신됐는지 (RANK_FEATURES_STATUS_TTL_SEC 동안 캐시)"""
+    global _features_status
+    now = time.monotonic()
+    with _features_status_lock:
+        status = _features_status
+    if status is not None and status[0] > now:
+        return status[1]
+
+    refreshed_at = db.execute(_FEATURES_REFRESHED_AT_SQL).scalar()
+    if refreshed_at is None:
+        usable = False
+        logger.warning("[Recommend] video_rank_features is empty, using joined query")
+    else:
+        age_sec = (datetime.utcnow() - refreshed_at).total_seconds()
+        usable = RANK_FEATURES_MAX_AGE_SEC <= 0 or age_sec <= RANK_FEATURES_MAX_AGE_SEC
+        if not usable:
+            logger.warning(
+                f"[Recommend] video_rank_features is stale (refreshed {age_sec / 3600:.1f}h ago), using joined query"
+            )
+    with _features_status_lock:
+        _features_status = (now + RANK_FEATURES_STATUS_TTL_SEC, usable)
+    return usable
+
+
+def _fetch_rank_candidates_joined(
+    db: Session,
+    limit: int,
+    topic_id: Optional[int],
+) -> List[Dict[str, Any]]:
+    """피처 테이블 없이 원본 테이블을 조인해 후보 조회 (요청마다 조인 + 정렬)"""
     params: Dict[str, Any] = {"limit": limit}
 
     # topic_id가 지정되면 해당 토픽 우선으로 필터(너무 좁다면 LEFT JOIN 전체도 가능)
@@ -34,7 +120,7 @@ def fetch_rank_candidates(
 
     sql = text(
         f"""
-        SELECT 
+        SELECT
             v.video_id        AS video_id,
             v.title           AS title,
             v.channel_id      AS channel_id,
@@ -56,8 +142,94 @@ def fetch_rank_candidates(
     return [dict(r) for r in rows]
 
 
+def fetch_rank_candidates(
+    db: Session,
+    limit: int = 20,
+    topic_id: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """추천 랭킹 후보를 조회한다.
+
+    MySQL 호환. 점수 계산은 애플리케이션 레벨에서 수행(유연성 확보).
+    피처 테이블에서 읽은 후보에는 title/channel_id가 없으므로
+    랭킹 후 attach_rank_details로 상위 행에만 채운다.
+    피처 테이블이 비었거나 오래됐으면 기존 조인 쿼리를 사용한다.
+    """
+    if not RANK_FEATURES_ENABLED:
+        return _fetch_rank_candidates_joined(db, limit, topic_id)
+    try:
+        if not _rank_features_usable(db):
+            return _fetch_rank_candidates_joined(db, limit, topic_id)
+        if topic_id is None:
+            rows = db.execute(_FEATURE_CANDIDATES_SQL, {"limit": limit}).mappings().all()
+        else:
+            rows = db.execute(
+                _FEATURE_TOPIC_CANDIDATES_SQL, {"limit": limit, "topic_id": int(topic_id)}
+            ).mappings().all()
+        return [dict(r) for r in rows]
+    except Exception as e:
+        db.rollback()
+        logger.warning("[Recommend] video_rank_features lookup failed, using joined query: %s", e)
+        return _fetch_rank_candidates_joined(db, limit, topic_id)
+
+
+def attach_rank_details(db: Session, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """title/channel_id가 없는 행(피처 테이블 후보)에 PK 조회 한 번으로 채운다 (rows를 직접 갱신)."""
+    missing = [row["video_id"] for row in rows if "title" not in row]
+    if not missing:
+        return rows
+    details = {
+        r["video_id"]: r
+        for r in db.execute(_FEATURE_DETAILS_SQL, {"video_ids": missing}).mappings().all()
+    }
+    for row in rows:
+        if "title" not in row:
+            detail = details.get(row["video_id"]) or {}
+            row["title"] = detail.get("title")
+            row["channel_id"] = detail.get("channel_id")
+    return rows
+
+
+def refresh_rank_features(db: Session) -> Dict[str, Any]:
+    """
+    video_rank_features를 원본 테이블에서 다시 계산 (배치 작업, 멱등)
+    upsert 후 이번 갱신에서 쓰지 않은 행을 지우고 한 트랜잭션으로 커밋
+    (Airflow 파이프라인은 utils/db_writer.MySQLWriter.refresh_rank_features로 같은 SQL(utils/rank_features_sql)을 실행)
+    """
+    global _features_status
+    refreshed_at = datetime.utcnow().replace(microsecond=0)
+    start = time.perf_counter()
+    try:
+        upserted = db.execute(_REFRESH_FEATURES_SQL, {"refreshed_at": refreshed_at}).rowcount
+        deleted = db.execute(_DELETE_STALE_FEATURES_SQL, {"refreshed_at": refreshed_at}).rowcount
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    with _features_status_lock:
+        _features_status = None
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info(f"[Recommend] Refreshed video_rank_features in {elapsed_ms:.1f}ms (upserted={upserted}, deleted={deleted})")
+    return {
+        "refreshed_at": refreshed_at.isoformat(),
+        "upserted": upserted,
+        "deleted": deleted,
+        "elapsed_ms": round(elapsed_ms, 1),
+    }
+
+
+# 인기 토픽: limit별 (만료 시각, 결과). 배치 집계 테이블 기반이라 TTL 동안 재사용해도 충분
+_top_topics_cache: Dict[int, Tuple[float, List[int]]] = {}
+_top_topics_lock = threading.Lock()
+
+
 def fetch_top_topics(db: Session, limit: int = 5) -> List[int]:
-    """가장 인기 있는 토픽 ID 상위 N개를 반환 (간단 합계 기반)."""
+    """가장 인기 있는 토픽 ID 상위 N개를 반환 (간단 합계 기반, TOP_TOPICS_CACHE_TTL_SEC 동안 프로세스 캐시)."""
+    now = time.monotonic()
+    with _top_topics_lock:
+        entry = _top_topics_cache.get(limit)
+    if entry is not None and entry[0] > now:
+        return list(entry[1])
+
     sql = text(
         """
         SELECT t.topic_id
@@ -68,6 +240,8 @@ def fetch_top_topics(db: Session, limit: int = 5) -> List[int]:
         """
     )
     rows = db.execute(sql, {"limit": limit}).all()
-    return [int(r[0]) for r in rows]
-
-
+    topics = [int(r[0]) for r in rows]
+    if TOP_TOPICS_CACHE_TTL_SEC > 0:
+        with _top_topics_lock:
+            _top_topics_cache[limit] = (now + TOP_TOPICS_CACHE_TTL_SEC, topics)
+    return list(topics)
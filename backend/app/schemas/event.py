@@ -0,0 +1,25 @@
+"""
+사용자 영상 이벤트 스키마
+"""
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+
+
+class VideoEventCreate(BaseModel):
+    """이벤트 1건 (watch_time은 직전 전송 이후 시청한 초)"""
+    video_id: str = Field(..., min_length=1, max_length=64, description="비디오 ID")
+    event_type: Literal["watch", "like", "bookmark"] = Field(..., description="이벤트 타입")
+    watch_time: int = Field(0, ge=0, le=86400, description="시청 시간 (초)")
+    liked: Optional[bool] = Field(None, description="좋아요 여부")
+
+
+class VideoEventBatch(BaseModel):
+    """이벤트 배치 요청"""
+    events: list[VideoEventCreate] = Field(..., min_length=1, max_length=500)
+
+
+class VideoEventBatchResponse(BaseModel):
+    """이벤트 배치 응답"""
+    success: bool = True
+    accepted: int
+    rejected: int = 0
@@ -0,0 +1,21 @@
+"""
+백그라운드 작업 스키마 (app/services/job_runner.py)
+"""
+from pydantic import BaseModel, Field
+from typing import Any, Literal, Optional
+
+
+class JobResponse(BaseModel):
+    """작업 상태 (202 응답 본문 / GET /api/jobs/{job_id})"""
+    id: str = Field(..., description="작업 ID")
+    type: str = Field(..., description="작업 타입 (video-detail, sentiment-summary, summary-one-line)")
+    video_id: str = Field(..., description="비디오 ID")
+    params: dict = Field(default_factory=dict, description="작업 파라미터")
+    status: Literal["queued", "running", "succeeded", "failed"] = Field(..., description="작업 상태")
+    result: Optional[Any] = Field(None, description="완료 시 원래 엔드포인트의 응답 본문")
+    error: Optional[str] = Field(None, description="실패 사유")
+    status_code: Optional[int] = Field(None, description="실패 시 원래 엔드포인트가 반환했을 HTTP 상태 코드")
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    poll_url: str = Field(..., description="결과 폴링 URL (?wait=초 로 롱폴링)")
@@ -54,6 +54,7 @@ class VideoListResponse(BaseModel):
     """비디오 목록 응답 스키마"""
     videos: list[VideoResponse]
     total: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
 
 
 # --- Video detail analysis schemas ---------------------------------------------------------
@@ -7,8 +7,7 @@ import os
 import re
 from typing import List
 
-from transformers import pipeline
-
+# transformers는 import 비용이 크므로 _get_summarizer()에서 지연 import
 _SUMMARY_PIPELINE = None
 
 
@@ -19,6 +18,8 @@ def _get_summarizer():
     global _SUMMARY_PIPELINE
 
     if _SUMMARY_PIPELINE is None:
+        from transformers import pipeline
+
         model_name = os.getenv("COMMENT_SUMMARY_MODEL", "sshleifer/distilbart-cnn-6-6")
         device_str = os.getenv("COMMENT_SUMMARY_DEVICE", "cpu").lower()
 
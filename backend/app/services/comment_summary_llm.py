@@ -4,12 +4,13 @@ Generate three-line comment summaries using OpenAI (via LangChain).
 from __future__ import annotations
 
 import logging
-from typing import List
-
-from langchain_openai import ChatOpenAI
+from typing import TYPE_CHECKING, List
 
 from app.core.config import OPENAI_API_KEY, LLM_MODEL, LLM_TEMPERATURE, LLM_MAX_TOKENS
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
 logger = logging.getLogger(__name__)
 
 COMMENT_SUMMARY_PROMPT = """
@@ -48,6 +49,8 @@ def _get_summary_llm() -> ChatOpenAI:
     if _summary_llm is None:
         if not OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY 환경 변수가 설정되어 있지 않습니다.")
+        from langchain_openai import ChatOpenAI
+
         _summary_llm = ChatOpenAI(
             model=LLM_MODEL,
             temperature=LLM_TEMPERATURE,
@@ -2,16 +2,27 @@
 임베딩 서비스 모듈
 sentence-transformers/all-MiniLM-L6-v2 모델을 사용한 텍스트 임베딩 생성 및 키워드 유사도 계산
 """
+from __future__ import annotations
+
 import json
 import os
-from typing import List, Dict, Optional
+import threading
+from typing import TYPE_CHECKING, List, Dict, Optional
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+# 임베딩 런타임: "torch" (sentence-transformers) 또는 "onnx" (int8 양자화 ONNX, onnxruntime)
+EMBEDDING_RUNTIME = os.getenv("EMBEDDING_RUNTIME", "torch").strip().lower()
+# 두 런타임 모두 같은 모델 (ONNX는 이 모델을 int8로 변환한 것) → 사전 계산 행렬 메타의 "model"과 비교
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
 
 
 # 전역 변수: 모델 및 키워드 풀 임베딩 캐싱
+# sentence_transformers / torch는 import 비용이 크므로 get_model() 최초 호출 시점에 import
 _model: Optional[SentenceTransformer] = None
+_model_lock = threading.Lock()
 _keyword_pool: List[str] = []
 _keyword_embeddings: Optional[np.ndarray] = None
 
@@ -19,19 +30,41 @@ _keyword_embeddings: Optional[np.ndarray] = None
 def get_model() -> SentenceTransformer:
     """
     MiniLM 모델 로딩 (싱글톤 패턴)
-    서버 시작 시 한 번만 로드하여 메모리에 캐싱
+    최초 호출 시 한 번만 로드하여 메모리에 캐싱 (백그라운드 사전 로딩과 동시 호출되어도 1회만 로드)
+    
+    EMBEDDING_RUNTIME=onnx이면 int8 ONNX 인코더(OnnxSentenceEncoder)를 반환
     
     Returns:
-        SentenceTransformer: all-MiniLM-L6-v2 모델 인스턴스
+        SentenceTransformer: all-MiniLM-L6-v2 모델 인스턴스 (또는 동일한 encode() 인터페이스의 ONNX 인코더)
     """
     global _model
-    if _model is None:
-        print("[Embeddings] Loading sentence-transformers/all-MiniLM-L6-v2 model...")
-        _model = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
-        print("[Embeddings] Model loaded successfully")
+    if _model is not None:
+        return _model
+    with _model_lock:
+        if _model is not None:
+            return _model
+        if EMBEDDING_RUNTIME == "onnx":
+            try:
+                from app.services.onnx_embeddings import OnnxSentenceEncoder
+
+                _model = OnnxSentenceEncoder()
+                return _model
+            except Exception as e:
+                print(f"[Embeddings] ONNX runtime unavailable ({e}), falling back to PyTorch model")
+        _model = load_torch_model()
     return _model
 
 
+def load_torch_model() -> SentenceTransformer:
+    """PyTorch sentence-transformers MiniLM 모델 로드 (캐싱 없음, 벤치마크 비교용으로도 사용)"""
+    from sentence_transformers import SentenceTransformer
+
+    print(f"[Embeddings] Loading {EMBEDDING_MODEL_NAME} model...")
+    model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+    print("[Embeddings] Model loaded successfully")
+    return model
+
+
 def load_keyword_pool(file_path: Optional[str] = None) -> List[str]:
     """
     keyword_pool.json 파일 로드
@@ -117,6 +150,7 @@ def compute_keyword_similarities(
 ) -> List[Dict[str, float]]:
     """
     텍스트와 키워드 풀 간의 코사인 유사도를 계산하여 상위 Top-K 키워드 반환
+    정규화된 키워드 행렬(사전 계산 .npy)과 텍스트 임베딩 캐시를 사용하는 KeywordTagger에 위임
     
     Args:
         text: 분석할 텍스트 (title + description + comments)
@@ -130,30 +164,9 @@ def compute_keyword_similarities(
     if not text or not text.strip():
         return []
     
-    # 텍스트 임베딩 생성
-    text_embedding = encode_text(text)
-    text_embedding = text_embedding.reshape(1, -1)  # (1, embedding_dim) 형태로 변환
-    
-    # 키워드 임베딩 가져오기
-    keyword_embeddings = get_keyword_embeddings()
-    
-    # 코사인 유사도 계산
-    similarities = cosine_similarity(text_embedding, keyword_embeddings)[0]  # (n_keywords,) 형태
-    
-    # 키워드 풀 가져오기
-    keywords = load_keyword_pool()
-    
-    # (키워드, 유사도) 튜플 리스트 생성
-    keyword_scores = [
-        {"keyword": keyword, "score": float(similarity)}
-        for keyword, similarity in zip(keywords, similarities)
-    ]
-    
-    # score 기준 내림차순 정렬
-    keyword_scores.sort(key=lambda x: x["score"], reverse=True)
-    
-    # 상위 top_k개만 반환
-    return keyword_scores[:top_k]
+    from app.services.keyword_tagging import get_keyword_tagger
+
+    return get_keyword_tagger().tag(text, top_k=top_k)
 
 
 def initialize_embeddings():
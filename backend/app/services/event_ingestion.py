@@ -0,0 +1,452 @@
+"""
+사용자 영상 이벤트(시청/좋아요) 수집 서비스
+- POST /api/events 요청은 메모리 버퍼에 넣기만 하고 바로 반환 (페이지 로딩 지연 없음)
+- 같은 (user_id, video_id, event_type) 이벤트는 버퍼 안에서 하나로 합침 (플레이어 heartbeat 대응)
+  · watch_time: 합산 (클라이언트는 직전 전송 이후 시청한 초를 보냄)
+  · liked: 마지막 값
+- 백그라운드 flusher가 주기적으로 또는 버퍼가 임계치를 넘으면 multi-row INSERT로 저장하고
+  사용자별 프로필 벡터를 증분 갱신 (crud/persona.apply_events_to_persona)
+- watch 이벤트는 (user_id, video_id) 시청 세션 단위로 합침
+  · 세션의 첫 flush만 INSERT, 이후 heartbeat는 같은 행의 watch_time을 UPDATE
+  · 프로필은 INSERT 때 반영하고, UPDATE 때는 늘어난 시청 시간만큼의 가중치 변화분을 더함
+  · 마지막 heartbeat 후 EVENT_WATCH_SESSION_GAP_SEC가 지나면 새 시청(새 행)으로 봄
+- 저장 전 users / travel_videos에 없는 ID의 이벤트는 버림 (FK 위반으로 배치 전체가 실패하지 않도록)
+- 배치 저장이 실패하면 행 단위로 다시 시도하고, 실패한 행은 EVENT_MAX_ATTEMPTS회까지만 버퍼로 되돌림
+- 버퍼가 가득 차면 새 키는 거절 (429) → 클라이언트가 재시도
+"""
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, bindparam, insert, select, update
+from sqlalchemy.exc import DataError, IntegrityError
+
+from app.core.database import SessionLocal
+from app.models.user import User
+from app.models.user_video_event import UserVideoEvent
+from app.models.video import Video
+
+logger = logging.getLogger(__name__)
+
+EVENT_QUEUE_MAX_KEYS = int(os.getenv("EVENT_QUEUE_MAX_KEYS", "50000"))
+EVENT_FLUSH_INTERVAL_SEC = float(os.getenv("EVENT_FLUSH_INTERVAL_SEC", "2.0"))
+EVENT_FLUSH_MAX_BATCH = int(os.getenv("EVENT_FLUSH_MAX_BATCH", "2000"))
+EVENT_INSERT_CHUNK_SIZE = int(os.getenv("EVENT_INSERT_CHUNK_SIZE", "500"))
+EVENT_UPDATE_PERSONA = os.getenv("EVENT_UPDATE_PERSONA", "true").lower() == "true"
+EVENT_MAX_ATTEMPTS = int(os.getenv("EVENT_MAX_ATTEMPTS", "3"))
+EVENT_WATCH_SESSION_GAP_SEC = float(os.getenv("EVENT_WATCH_SESSION_GAP_SEC", "1800"))
+
+EVENT_TYPES = ("watch", "like", "bookmark")
+INSERT_COLUMNS = ("user_id", "video_id", "event_type", "watch_time", "liked", "created_at")
+
+EventKey = Tuple[int, str, str]
+SessionKey = Tuple[int, str]
+
+# 진행 중인 시청 세션 행에 heartbeat 시청 시간 누적 (idx_user_video_event + created_at으로 행 특정)
+_table = UserVideoEvent.__table__
+_WATCH_UPDATE = (
+    update(_table)
+    .where(
+        and_(
+            _table.c.user_id == bindparam("b_user_id"),
+            _table.c.video_id == bindparam("b_video_id"),
+            _table.c.event_type == "watch",
+            _table.c.created_at == bindparam("b_started_at"),
+        )
+    )
+    .values(watch_time=_table.c.watch_time + bindparam("b_watch_time"))
+)
+
+
+class EventBuffer:
+    """(user_id, video_id, event_type) 단위로 이벤트를 합치는 크기 제한 버퍼 + 백그라운드 flusher"""
+
+    def __init__(
+        self,
+        max_keys: int = EVENT_QUEUE_MAX_KEYS,
+        flush_interval_sec: float = EVENT_FLUSH_INTERVAL_SEC,
+        flush_max_batch: int = EVENT_FLUSH_MAX_BATCH,
+        insert_chunk_size: int = EVENT_INSERT_CHUNK_SIZE,
+        update_persona: bool = EVENT_UPDATE_PERSONA,
+        max_attempts: int = EVENT_MAX_ATTEMPTS,
+        watch_session_gap_sec: float = EVENT_WATCH_SESSION_GAP_SEC,
+        session_factory=SessionLocal,
+    ):
+        self.max_keys = max_keys
+        self.flush_interval_sec = flush_interval_sec
+        self.flush_max_batch = flush_max_batch
+        self.insert_chunk_size = insert_chunk_size
+        self.update_persona = update_persona
+        self.max_attempts = max_attempts
+        self.watch_session_gap_sec = watch_session_gap_sec
+        self.session_factory = session_factory
+
+        self._pending: Dict[EventKey, dict] = {}
+        # 진행 중인 시청 세션: (user_id, video_id) → {"started_at", "last_seen", "watch_time", "liked"}
+        # (last_seen 오래된 순, watch_time은 행에 저장된 누적 시청 시간)
+        self._sessions: Dict[SessionKey, dict] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # metrics는 요청 스레드(add)와 flusher가 함께 갱신 → 항상 self._lock 안에서만 변경
+        self.metrics = {
+            "accepted": 0,
+            "coalesced": 0,
+            "rejected": 0,
+            "flushes": 0,
+            "flushed_rows": 0,
+            "watch_session_updates": 0,
+            "failed_flushes": 0,
+            "row_retry_failures": 0,
+            "invalid_dropped": 0,
+            "dropped": 0,
+            "persona_updates": 0,
+            "last_flush_rows": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "last_flush_at": None,
+        }
+
+    # ------------------------------------------------------------------
+    # 수집
+    # ------------------------------------------------------------------
+    def add(self, user_id: int, events: List[dict]) -> Tuple[int, int]:
+        """
+        이벤트를 버퍼에 추가 (DB 접근 없음)
+
+        Returns:
+            (accepted, rejected) - 버퍼가 가득 차서 새 키를 받지 못한 이벤트는 rejected
+        """
+        accepted = rejected = 0
+        # created_at은 DATETIME(초 단위) 컬럼과 그대로 비교하므로 초 단위로 맞춤
+        now = datetime.utcnow().replace(microsecond=0)
+        with self._lock:
+            for event in events:
+                key = (user_id, event["video_id"], event["event_type"])
+                watch_time = int(event.get("watch_time") or 0)
+                current = self._pending.get(key)
+                if current is not None:
+                    current["watch_time"] += watch_time
+                    if event.get("liked") is not None:
+                        current["liked"] = bool(event["liked"])
+                    if event["event_type"] != "watch":
+                        current["created_at"] = now
+                    current["last_seen"] = now
+                    self.metrics["coalesced"] += 1
+                    accepted += 1
+                    continue
+                if len(self._pending) >= self.max_keys:
+                    rejected += 1
+                    continue
+                self._pending[key] = {
+                    "user_id": user_id,
+                    "video_id": event["video_id"],
+                    "event_type": event["event_type"],
+                    "watch_time": watch_time,
+                    "liked": bool(event.get("liked") or event["event_type"] == "like"),
+                    "created_at": now,
+                    "last_seen": now,
+                    "attempts": 0,
+                }
+                accepted += 1
+            self.metrics["accepted"] += accepted
+            self.metrics["rejected"] += rejected
+            pending = len(self._pending)
+        if pending >= self.flush_max_batch:
+            self._wakeup.set()
+        return accepted, rejected
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    # ------------------------------------------------------------------
+    # flush
+    # ------------------------------------------------------------------
+    def _drain(self) -> List[dict]:
+        with self._lock:
+            rows = list(self._pending.values())
+            self._pending = {}
+        return rows
+
+    def _requeue(self, rows: List[dict]) -> None:
+        """저장하지 못한 이벤트를 버퍼로 되돌림 (버퍼 용량을 넘는 만큼은 버림)"""
+        dropped = 0
+        with self._lock:
+            for row in rows:
+                key = (row["user_id"], row["video_id"], row["event_type"])
+                current = self._pending.get(key)
+                if current is not None:
+                    current["watch_time"] += row["watch_time"]
+                    current["created_at"] = min(current["created_at"], row["created_at"])
+                    current["attempts"] = max(current["attempts"], row["attempts"])
+                elif len(self._pending) < self.max_keys:
+                    self._pending[key] = row
+                else:
+                    dropped += 1
+            self.metrics["dropped"] += dropped
+        if dropped:
+            logger.warning(f"[Events] Buffer full while requeueing, dropped {dropped} events")
+
+    def _filter_known_ids(self, db, rows: List[dict]) -> List[dict]:
+        """users / travel_videos에 있는 ID의 이벤트만 남김 (FK 위반 행 제거)"""
+        video_ids = {row["video_id"] for row in rows}
+        user_ids = {row["user_id"] for row in rows}
+        known_videos = set(db.execute(select(Video.id).where(Video.id.in_(video_ids))).scalars())
+        known_users = set(db.execute(select(User.id).where(User.id.in_(user_ids))).scalars())
+        valid = [row for row in rows if row["video_id"] in known_videos and row["user_id"] in known_users]
+        invalid = len(rows) - len(valid)
+        if invalid:
+            with self._lock:
+                self.metrics["invalid_dropped"] += invalid
+            logger.warning(f"[Events] Dropped {invalid} events with unknown user_id/video_id")
+        return valid
+
+    def _expire_sessions(self, now: datetime) -> None:
+        """마지막 heartbeat가 오래된 시청 세션 정리 (last_seen 순서라 앞에서부터만 확인)"""
+        while self._sessions:
+            key = next(iter(self._sessions))
+            session = self._sessions[key]
+            if (now - session["last_seen"]).total_seconds() <= self.watch_session_gap_sec and len(self._sessions) <= self.max_keys:
+                break
+            del self._sessions[key]
+
+    def _split_watch_updates(self, rows: List[dict]) -> Tuple[List[dict], List[dict]]:
+        """(INSERT할 행, 진행 중인 시청 세션 행에 UPDATE할 watch 행)"""
+        inserts: List[dict] = []
+        updates: List[dict] = []
+        for row in rows:
+            if row["event_type"] == "watch":
+                session = self._sessions.get((row["user_id"], row["video_id"]))
+                if session is not None and (row["created_at"] - session["last_seen"]).total_seconds() <= self.watch_session_gap_sec:
+                    row["session_started_at"] = session["started_at"]
+                    updates.append(row)
+                    continue
+            inserts.append(row)
+        return inserts, updates
+
+    def _touch_session(self, row: dict, started_at: datetime, watch_time: int, liked: bool) -> None:
+        key = (row["user_id"], row["video_id"])
+        self._sessions.pop(key, None)
+        self._sessions[key] = {"started_at": started_at, "last_seen": row["last_seen"], "watch_time": watch_time, "liked": liked}
+
+    def _track_sessions(self, inserts: List[dict], updates: List[dict]) -> List[dict]:
+        """
+        저장된 watch 행으로 시청 세션 갱신 후 프로필에 반영할 이벤트 반환
+        - INSERT 행: 그대로
+        - UPDATE 행: 세션 시작 시각의 이벤트로, 이전/현재 누적 시청 시간을 함께 넘김 (가중치 변화분만 반영)
+        """
+        persona_events = list(inserts)
+        for row in inserts:
+            if row["event_type"] == "watch":
+                self._touch_session(row, row["created_at"], row["watch_time"], row["liked"])
+        for row in updates:
+            session = self._sessions[(row["user_id"], row["video_id"])]
+            prev_watch_time = session["watch_time"]
+            watch_time = prev_watch_time + row["watch_time"]
+            self._touch_session(row, row["session_started_at"], watch_time, session["liked"])
+            persona_events.append({
+                "user_id": row["user_id"],
+                "video_id": row["video_id"],
+                "event_type": "watch",
+                "watch_time": watch_time,
+                "prev_watch_time": prev_watch_time,
+                "liked": session["liked"],
+                "created_at": row["session_started_at"],
+            })
+        return persona_events
+
+    def _execute(self, db, inserts: List[dict], updates: List[dict]) -> None:
+        for i in range(0, len(inserts), self.insert_chunk_size):
+            # executemany → pymysql이 하나의 multi-row INSERT 문으로 묶음
+            db.execute(
+                insert(_table),
+                [{column: row[column] for column in INSERT_COLUMNS} for row in inserts[i:i + self.insert_chunk_size]],
+            )
+        for i in range(0, len(updates), self.insert_chunk_size):
+            db.execute(
+                _WATCH_UPDATE,
+                [
+                    {
+                        "b_user_id": row["user_id"],
+                        "b_video_id": row["video_id"],
+                        "b_started_at": row["session_started_at"],
+                        "b_watch_time": row["watch_time"],
+                    }
+                    for row in updates[i:i + self.insert_chunk_size]
+                ],
+            )
+
+    def _write_rows_individually(self, db, inserts: List[dict], updates: List[dict]) -> Tuple[List[dict], List[dict], List[dict]]:
+        """
+        배치 저장 실패 시 행 단위로 저장 (문제 행 하나가 나머지를 막지 않도록)
+
+        Returns:
+            (저장된 INSERT 행, 저장된 UPDATE 행, 저장하지 못한 행)
+            - 행 자체의 오류(IntegrityError/DataError)가 아니면 (DB 장애 등) 남은 행은 시도하지 않고 되돌림
+        """
+        ops = [(row, True) for row in inserts] + [(row, False) for row in updates]
+        written_inserts: List[dict] = []
+        written_updates: List[dict] = []
+        failed: List[dict] = []
+        for index, (row, is_insert) in enumerate(ops):
+            try:
+                self._execute(db, [row] if is_insert else [], [] if is_insert else [row])
+                db.commit()
+            except (IntegrityError, DataError) as e:
+                db.rollback()
+                row["attempts"] += 1
+                failed.append(row)
+                logger.warning(f"[Events] Event {row['event_type']} ({row['user_id']}, {row['video_id']}) failed: {e}")
+                continue
+            except Exception as e:
+                db.rollback()
+                row["attempts"] += 1
+                failed.append(row)
+                failed.extend(r for r, _ in ops[index + 1:])
+                logger.error(f"[Events] Row-by-row retry aborted: {e}")
+                break
+            (written_inserts if is_insert else written_updates).append(row)
+        return written_inserts, written_updates, failed
+
+    def flush(self) -> int:
+        """버퍼의 이벤트를 multi-row INSERT(+ 시청 세션 UPDATE)로 저장. 저장된 이벤트 수 반환"""
+        with self._flush_lock:
+            rows = self._drain()
+            if not rows:
+                return 0
+            start = time.perf_counter()
+            now = datetime.utcnow()
+            self._expire_sessions(now)
+            db = self.session_factory()
+            try:
+                try:
+                    rows = self._filter_known_ids(db, rows)
+                except Exception as e:
+                    # ID 조회 실패는 행 문제가 아님 (DB 장애) → 시도 횟수 증가 없이 되돌림
+                    db.rollback()
+                    with self._lock:
+                        self.metrics["failed_flushes"] += 1
+                    logger.error(f"[Events] Flush of {len(rows)} events failed: {e}", exc_info=True)
+                    self._requeue(rows)
+                    return 0
+                inserts, updates = self._split_watch_updates(rows)
+                failed: List[dict] = []
+                try:
+                    self._execute(db, inserts, updates)
+                    db.commit()
+                except Exception as e:
+                    db.rollback()
+                    with self._lock:
+                        self.metrics["failed_flushes"] += 1
+                    logger.error(f"[Events] Batch flush of {len(rows)} events failed, retrying row by row: {e}")
+                    inserts, updates, failed = self._write_rows_individually(db, inserts, updates)
+
+                persona_events = self._track_sessions(inserts, updates)
+
+                if failed:
+                    retry = [row for row in failed if row["attempts"] < self.max_attempts]
+                    given_up = len(failed) - len(retry)
+                    with self._lock:
+                        self.metrics["row_retry_failures"] += len(failed)
+                        self.metrics["dropped"] += given_up
+                    if given_up:
+                        logger.error(f"[Events] Dropped {given_up} events after {self.max_attempts} failed attempts")
+                    self._requeue(retry)
+
+                if self.update_persona and persona_events:
+                    self._update_personas(db, persona_events)
+            finally:
+                db.close()
+
+            written = len(inserts) + len(updates)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self.metrics["flushes"] += 1
+                self.metrics["flushed_rows"] += len(inserts)
+                self.metrics["watch_session_updates"] += len(updates)
+                self.metrics["last_flush_rows"] = written
+                self.metrics["last_flush_ms"] = round(elapsed_ms, 2)
+                self.metrics["max_flush_ms"] = round(max(self.metrics["max_flush_ms"], elapsed_ms), 2)
+                self.metrics["last_flush_at"] = datetime.utcnow().isoformat()
+            logger.info(
+                f"[Events] Flushed {written} events ({len(inserts)} inserted, {len(updates)} watch updates) in {elapsed_ms:.1f}ms"
+            )
+            return written
+
+    def _update_personas(self, db, rows: List[dict]) -> None:
+        from app.crud.persona import apply_events_to_persona
+
+        by_user: Dict[int, List[dict]] = {}
+        for row in rows:
+            by_user.setdefault(row["user_id"], []).append(row)
+        updated = 0
+        for user_id, user_events in by_user.items():
+            if apply_events_to_persona(db, user_id, user_events) is not None:
+                updated += 1
+        with self._lock:
+            self.metrics["persona_updates"] += updated
+
+    # ------------------------------------------------------------------
+    # 백그라운드 flusher
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wakeup.wait(self.flush_interval_sec)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"[Events] Flusher error: {e}", exc_info=True)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="event-flusher", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"[Events] Flusher started (interval={self.flush_interval_sec}s, "
+            f"max_batch={self.flush_max_batch}, max_keys={self.max_keys})"
+        )
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """flusher 종료 후 남은 이벤트 저장"""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> dict:
+        with self._lock:
+            metrics = dict(self.metrics)
+            pending = len(self._pending)
+        return {
+            **metrics,
+            "pending": pending,
+            "watch_sessions": len(self._sessions),
+            "max_keys": self.max_keys,
+            "flusher_running": self._thread is not None and self._thread.is_alive(),
+        }
+
+
+_buffer: Optional[EventBuffer] = None
+_buffer_lock = threading.Lock()
+
+
+def get_event_buffer() -> EventBuffer:
+    """프로세스 단위 EventBuffer 싱글톤"""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = EventBuffer()
+    return _buffer
@@ -0,0 +1,526 @@
+"""
+느린 엔드포인트 작업용 백그라운드 작업 실행기
+- 한줄 요약(RAG + LLM), 감정 요약(LLM N회), 캐시 없는 영상 상세(Bento + LLM)를 요청 안에서 끝까지 실행하지 않고
+  작업으로 넘김 → Cloud Run 요청 타임아웃과 무관하게 진행
+- (job_type, video_id[, 파라미터]) 키로 중복 제거: 같은 작업이 대기/실행 중이면 새로 만들지 않고 기존 작업 반환
+  → 같은 영상에 동시에 들어온 요청은 작업 하나로 합쳐짐
+- 프로세스 안의 asyncio 워커 JOB_WORKERS개가 큐에서 꺼내 실행 (대기 작업은 JOB_QUEUE_MAX개로 제한, 초과 시 503)
+  · 워커는 작업 하나의 예외로 죽지 않고, 그래도 끝난 워커는 그 자리만 다시 시작
+  · 결과 저장(store.save)은 JOB_SAVE_ATTEMPTS회까지 재시도, 실행 시간이 JOB_TIMEOUT_SEC + 60초를 넘긴
+    대기/실행 중 작업은 중복 제거 대상에서 제외 (결과 저장 실패로 남은 작업에 새 요청이 합류하지 않도록)
+- 저장소 (JOB_BACKEND)
+  · memory (기본): dict + asyncio.Queue, 인스턴스 안에서만 중복 제거 (로컬/테스트)
+  · redis: 작업 레코드 / 중복 키 / 큐를 Redis에 저장 → 인스턴스 사이 중복 제거, 어느 인스턴스에서나 결과 조회
+- 라우트는 run_or_accept로 작업을 제출하고 wait초까지만 기다림
+  → 끝나면 기존과 같은 200 응답, 아니면 202 + 작업 정보 (GET /api/jobs/{job_id}?wait=... 로 폴링/롱폴링)
+- 핸들러: async def handler(video_id, **params) -> JSON 호환 값 (register_job_handler로 등록)
+  HTTPException을 던지면 status_code/detail이 작업 결과로 전달됨
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+JOB_BACKEND = os.getenv("JOB_BACKEND", "memory").strip().lower()
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_QUEUE_MAX = int(os.getenv("JOB_QUEUE_MAX", "200"))
+JOB_TIMEOUT_SEC = float(os.getenv("JOB_TIMEOUT_SEC", "300"))
+JOB_RESULT_TTL_SEC = int(os.getenv("JOB_RESULT_TTL_SEC", "600"))
+JOB_INLINE_WAIT_SEC = float(os.getenv("JOB_INLINE_WAIT_SEC", "20"))
+JOB_MAX_WAIT_SEC = float(os.getenv("JOB_MAX_WAIT_SEC", "55"))
+JOB_POLL_INTERVAL_SEC = float(os.getenv("JOB_POLL_INTERVAL_SEC", "0.25"))
+JOB_REDIS_PREFIX = os.getenv("JOB_REDIS_PREFIX", "jobs")
+JOB_SAVE_ATTEMPTS = int(os.getenv("JOB_SAVE_ATTEMPTS", "3"))
+JOB_SAVE_RETRY_SEC = 0.5
+JOB_STALE_GRACE_SEC = 60
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_FINISHED = (JOB_SUCCEEDED, JOB_FAILED)
+
+JobHandler = Callable[..., Awaitable[Any]]
+
+_handlers: Dict[str, JobHandler] = {}
+
+
+class JobQueueFull(Exception):
+    """대기 작업 수가 JOB_QUEUE_MAX에 도달"""
+
+
+def register_job_handler(job_type: str, handler: JobHandler) -> None:
+    """작업 타입별 핸들러 등록 (라우트 모듈 import 시점)"""
+    _handlers[job_type] = handler
+
+
+def job_key(job_type: str, video_id: str, params: Optional[dict] = None) -> str:
+    """중복 제거 키: 같은 타입/영상/파라미터면 같은 작업"""
+    key = f"{job_type}:{video_id}"
+    if params:
+        key += ":" + ",".join(f"{name}={params[name]}" for name in sorted(params))
+    return key
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _new_job(job_type: str, video_id: str, params: dict, key: str) -> dict:
+    return {
+        "id": uuid.uuid4().hex,
+        "type": job_type,
+        "video_id": video_id,
+        "params": params,
+        "key": key,
+        "status": JOB_QUEUED,
+        "result": None,
+        "error": None,
+        "status_code": None,
+        "created_at": _now(),
+        "started_at": None,
+        "finished_at": None,
+    }
+
+
+def _is_stale(job: dict) -> bool:
+    """실행 제한 시간 + 여유(JOB_STALE_GRACE_SEC)가 지났는데 끝나지 않은 작업 (워커가 결과를 저장하지 못함)"""
+    if job["status"] in JOB_FINISHED or not job.get("started_at"):
+        return False
+    started_at = datetime.fromisoformat(job["started_at"])
+    return (datetime.utcnow() - started_at).total_seconds() > JOB_TIMEOUT_SEC + JOB_STALE_GRACE_SEC
+
+
+def job_view(job: dict) -> dict:
+    """API 응답용 작업 정보 (내부 중복 키 제외 + 폴링 URL)"""
+    view = {name: value for name, value in job.items() if name != "key"}
+    view["poll_url"] = f"/api/jobs/{job['id']}"
+    return view
+
+
+class MemoryJobStore:
+    """프로세스 메모리 저장소 (이벤트 루프 안에서만 접근하므로 lock 불필요)"""
+
+    def __init__(self, max_queue: int = JOB_QUEUE_MAX, result_ttl_sec: int = JOB_RESULT_TTL_SEC):
+        self.max_queue = max_queue
+        self.result_ttl_sec = result_ttl_sec
+        self._jobs: Dict[str, dict] = {}
+        self._keys: Dict[str, str] = {}
+        self._done: Dict[str, asyncio.Event] = {}
+        self._expires: Dict[str, float] = {}
+        self._queue: Optional[asyncio.Queue] = None
+
+    def _get_queue(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+        return self._queue
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        for job_id in [job_id for job_id, expires_at in self._expires.items() if expires_at <= now]:
+            self._expires.pop(job_id, None)
+            self._jobs.pop(job_id, None)
+            self._done.pop(job_id, None)
+
+    async def submit(self, job_type: str, video_id: str, params: dict, key: str) -> Tuple[dict, bool]:
+        self._purge()
+        existing_id = self._keys.get(key)
+        existing = self._jobs.get(existing_id) if existing_id is not None else None
+        if existing is not None and existing["status"] not in JOB_FINISHED and not _is_stale(existing):
+            return existing, False
+        queue = self._get_queue()
+        if queue.full():
+            raise JobQueueFull(f"{queue.qsize()} jobs queued")
+        job = _new_job(job_type, video_id, params, key)
+        self._jobs[job["id"]] = job
+        self._keys[key] = job["id"]
+        self._done[job["id"]] = asyncio.Event()
+        queue.put_nowait(job["id"])
+        return job, True
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        return self._jobs.get(job_id)
+
+    async def next_job_id(self) -> str:
+        return await self._get_queue().get()
+
+    async def save(self, job: dict) -> None:
+        self._jobs[job["id"]] = job
+        if job["status"] in JOB_FINISHED:
+            if self._keys.get(job["key"]) == job["id"]:
+                del self._keys[job["key"]]
+            self._expires[job["id"]] = time.monotonic() + self.result_ttl_sec
+            done = self._done.get(job["id"])
+            if done is not None:
+                done.set()
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[dict]:
+        done = self._done.get(job_id)
+        if done is not None and timeout > 0:
+            try:
+                await asyncio.wait_for(done.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self._jobs.get(job_id)
+
+    async def queued_count(self) -> int:
+        return self._get_queue().qsize()
+
+
+class RedisJobStore:
+    """
+    Redis 저장소 (동기 redis 클라이언트 호출은 스레드로 넘김)
+    {prefix}:job:{id} = 작업 JSON, {prefix}:key:{job_key} = 대기/실행 중 job id, {prefix}:queue = 대기 job id 리스트
+    """
+
+    def __init__(
+        self,
+        client,
+        max_queue: int = JOB_QUEUE_MAX,
+        result_ttl_sec: int = JOB_RESULT_TTL_SEC,
+        prefix: str = JOB_REDIS_PREFIX,
+    ):
+        self.client = client
+        self.max_queue = max_queue
+        self.result_ttl_sec = result_ttl_sec
+        self.prefix = prefix
+        self._queue_key = f"{prefix}:queue"
+        # 워커가 죽어도 중복 키가 영원히 남지 않도록 작업 제한 시간 기준으로 만료
+        self._dedup_ttl_sec = int(JOB_TIMEOUT_SEC * 2)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}:job:{job_id}"
+
+    def _dedup_key(self, key: str) -> str:
+        return f"{self.prefix}:key:{key}"
+
+    def _get_sync(self, job_id) -> Optional[dict]:
+        if isinstance(job_id, bytes):
+            job_id = job_id.decode()
+        raw = self.client.get(self._job_key(job_id))
+        return json.loads(raw) if raw else None
+
+    def _save_sync(self, job: dict) -> None:
+        self.client.set(self._job_key(job["id"]), json.dumps(job, ensure_ascii=False), ex=self.result_ttl_sec)
+
+    def _submit_sync(self, job_type: str, video_id: str, params: dict, key: str) -> Tuple[dict, bool]:
+        dedup_key = self._dedup_key(key)
+        existing_id = self.client.get(dedup_key)
+        if existing_id:
+            existing = self._get_sync(existing_id)
+            if existing is not None and existing["status"] not in JOB_FINISHED and not _is_stale(existing):
+                return existing, False
+        if self.client.llen(self._queue_key) >= self.max_queue:
+            raise JobQueueFull(f"{self.max_queue} jobs queued")
+        job = _new_job(job_type, video_id, params, key)
+        if not self.client.set(dedup_key, job["id"], nx=True, ex=self._dedup_ttl_sec):
+            # 다른 인스턴스가 방금 같은 작업을 만들었으면 그 작업을 사용
+            other = self._get_sync(self.client.get(dedup_key) or b"")
+            if other is not None and other["status"] not in JOB_FINISHED and not _is_stale(other):
+                return other, False
+            self.client.set(dedup_key, job["id"], ex=self._dedup_ttl_sec)
+        pipe = self.client.pipeline()
+        pipe.set(self._job_key(job["id"]), json.dumps(job, ensure_ascii=False), ex=self.result_ttl_sec)
+        pipe.lpush(self._queue_key, job["id"])
+        pipe.execute()
+        return job, True
+
+    def _finish_sync(self, job: dict) -> None:
+        self._save_sync(job)
+        dedup_key = self._dedup_key(job["key"])
+        current = self.client.get(dedup_key)
+        if current is not None and current.decode() == job["id"]:
+            self.client.delete(dedup_key)
+
+    async def submit(self, job_type: str, video_id: str, params: dict, key: str) -> Tuple[dict, bool]:
+        return await asyncio.to_thread(self._submit_sync, job_type, video_id, params, key)
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        return await asyncio.to_thread(self._get_sync, job_id)
+
+    async def next_job_id(self) -> str:
+        while True:
+            # socket_timeout(REDIS_SOCKET_TIMEOUT)보다 짧게 블록
+            popped = await asyncio.to_thread(self.client.brpop, self._queue_key, 1)
+            if popped:
+                return popped[1].decode()
+
+    async def save(self, job: dict) -> None:
+        if job["status"] in JOB_FINISHED:
+            await asyncio.to_thread(self._finish_sync, job)
+        else:
+            await asyncio.to_thread(self._save_sync, job)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[dict]:
+        deadline = time.monotonic() + timeout
+        job = await self.get(job_id)
+        while job is not None and job["status"] not in JOB_FINISHED and time.monotonic() < deadline:
+            await asyncio.sleep(min(JOB_POLL_INTERVAL_SEC, max(deadline - time.monotonic(), 0)))
+            job = await self.get(job_id)
+        return job
+
+    async def queued_count(self) -> int:
+        return await asyncio.to_thread(self.client.llen, self._queue_key)
+
+
+class JobRunner:
+    """작업 제출/조회 + 크기 제한 asyncio 워커 풀"""
+
+    def __init__(self, store, workers: int = JOB_WORKERS, timeout_sec: float = JOB_TIMEOUT_SEC):
+        self.store = store
+        self.workers = workers
+        self.timeout_sec = timeout_sec
+        self._tasks: List[asyncio.Task] = []
+        self.metrics = {
+            "submitted": 0,
+            "deduplicated": 0,
+            "rejected": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "running": 0,
+            "save_errors": 0,
+            "worker_errors": 0,
+            "worker_restarts": 0,
+            "last_run_ms": 0.0,
+            "max_run_ms": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # 워커
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """워커 태스크 시작 (실행 중인 이벤트 루프 필요). 이미 실행 중이면 끝난 워커 자리만 다시 시작"""
+        fresh = not self._tasks
+        started = 0
+        tasks: List[asyncio.Task] = []
+        for idx in range(self.workers):
+            task = self._tasks[idx] if idx < len(self._tasks) else None
+            if task is None or task.done():
+                task = asyncio.create_task(self._worker(idx))
+                task.add_done_callback(self._on_worker_done)
+                started += 1
+            tasks.append(task)
+        self._tasks = tasks
+        if not started:
+            return
+        if fresh:
+            logger.info(
+                f"[Jobs] Started {self.workers} workers (backend={type(self.store).__name__}, "
+                f"queue_max={self.store.max_queue}, timeout={self.timeout_sec}s)"
+            )
+        else:
+            self.metrics["worker_restarts"] += started
+            logger.warning(f"[Jobs] Restarted {started} stopped workers")
+
+    def _on_worker_done(self, task: asyncio.Task) -> None:
+        """stop() 이외의 이유로 끝난 워커는 바로 다시 시작"""
+        if task.cancelled() or task not in self._tasks:
+            return
+        logger.error(f"[Jobs] Worker exited unexpectedly: {task.exception()!r}")
+        self.start()
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _worker(self, idx: int) -> None:
+        while True:
+            try:
+                job_id = await self.store.next_job_id()
+                job = await self.store.get(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[Jobs] Worker {idx} failed to fetch next job: {e}")
+                await asyncio.sleep(1.0)
+                continue
+            if job is None or job["status"] != JOB_QUEUED:
+                continue
+            try:
+                await self._execute(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.metrics["worker_errors"] += 1
+                logger.error(f"[Jobs] Worker {idx} error on job {job['id']}: {e}", exc_info=True)
+
+    async def _save(self, job: dict) -> bool:
+        """store.save를 JOB_SAVE_ATTEMPTS회까지 재시도. 끝내 실패하면 False"""
+        for attempt in range(1, JOB_SAVE_ATTEMPTS + 1):
+            try:
+                await self.store.save(job)
+                return True
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.metrics["save_errors"] += 1
+                logger.warning(f"[Jobs] Saving job {job['id']} ({job['status']}) failed ({attempt}/{JOB_SAVE_ATTEMPTS}): {e}")
+                if attempt < JOB_SAVE_ATTEMPTS:
+                    await asyncio.sleep(JOB_SAVE_RETRY_SEC * attempt)
+        return False
+
+    async def _execute(self, job: dict) -> None:
+        handler = _handlers.get(job["type"])
+        job["status"] = JOB_RUNNING
+        job["started_at"] = _now()
+        # running 상태 저장 실패는 조회 화면에만 영향 → 실행은 계속
+        await self._save(job)
+        self.metrics["running"] += 1
+        start = time.perf_counter()
+        try:
+            if handler is None:
+                raise RuntimeError(f"no handler registered for job type '{job['type']}'")
+            result = await asyncio.wait_for(handler(job["video_id"], **job["params"]), self.timeout_sec)
+            job["status"] = JOB_SUCCEEDED
+            job["result"] = result
+            self.metrics["succeeded"] += 1
+        except asyncio.CancelledError:
+            job["status"] = JOB_FAILED
+            job["error"] = "cancelled"
+            await self.store.save(job)
+            raise
+        except asyncio.TimeoutError:
+            job["status"] = JOB_FAILED
+            job["error"] = f"timed out after {self.timeout_sec:.0f}s"
+            job["status_code"] = 504
+            self.metrics["failed"] += 1
+            self.metrics["timed_out"] += 1
+        except HTTPException as e:
+            job["status"] = JOB_FAILED
+            job["error"] = str(e.detail)
+            job["status_code"] = e.status_code
+            self.metrics["failed"] += 1
+        except Exception as e:
+            job["status"] = JOB_FAILED
+            job["error"] = str(e)
+            job["status_code"] = 500
+            self.metrics["failed"] += 1
+            logger.error(f"[Jobs] {job['type']} for {job['video_id']} failed: {e}", exc_info=True)
+        finally:
+            self.metrics["running"] -= 1
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        job["finished_at"] = _now()
+        self.metrics["last_run_ms"] = round(elapsed_ms, 2)
+        self.metrics["max_run_ms"] = round(max(self.metrics["max_run_ms"], elapsed_ms), 2)
+        if not await self._save(job):
+            # 결과를 끝내 저장하지 못함: 대기 중인 요청이 중복 키로 합류하지 않도록 실패로 표시하고
+            # 중복 키 해제를 한 번 더 시도 (그래도 실패하면 _is_stale로 제한 시간 후 새 작업 생성)
+            if job["status"] == JOB_SUCCEEDED:
+                self.metrics["succeeded"] -= 1
+                self.metrics["failed"] += 1
+            job.update(status=JOB_FAILED, result=None, error="job result could not be saved", status_code=503)
+            if not await self._save(job):
+                logger.error(f"[Jobs] Giving up saving job {job['id']}; it will be treated as stale")
+            return
+        logger.info(f"[Jobs] {job['type']} for {job['video_id']} {job['status']} in {elapsed_ms:.1f}ms")
+
+    # ------------------------------------------------------------------
+    # 제출 / 조회
+    # ------------------------------------------------------------------
+    async def submit(self, job_type: str, video_id: str, params: Optional[dict] = None) -> Tuple[dict, bool]:
+        """
+        작업 제출 (같은 키의 작업이 대기/실행 중이면 그 작업 반환)
+
+        Returns:
+            (작업, 새로 만들었는지 여부)
+        Raises:
+            JobQueueFull: 대기 작업이 가득 참
+        """
+        if job_type not in _handlers:
+            raise KeyError(f"unknown job type '{job_type}'")
+        self.start()  # startup 훅 없이 쓰는 경우(테스트 등) 첫 제출 시 워커 시작
+        params = params or {}
+        try:
+            job, created = await self.store.submit(job_type, video_id, params, job_key(job_type, video_id, params))
+        except JobQueueFull:
+            self.metrics["rejected"] += 1
+            raise
+        self.metrics["submitted" if created else "deduplicated"] += 1
+        return job, created
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        return await self.store.get(job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[dict]:
+        """작업이 끝나거나 timeout초가 지날 때까지 대기 (롱폴링)"""
+        return await self.store.wait(job_id, timeout)
+
+    async def stats(self) -> dict:
+        try:
+            queued = await self.store.queued_count()
+        except Exception:
+            queued = None
+        return {
+            **self.metrics,
+            "queued": queued,
+            "workers": self.workers,
+            "workers_running": sum(1 for task in self._tasks if not task.done()),
+            "backend": type(self.store).__name__,
+            "handlers": sorted(_handlers),
+        }
+
+
+_runner: Optional[JobRunner] = None
+
+
+def _create_store():
+    if JOB_BACKEND == "redis":
+        try:
+            from app.core.redis_client import get_redis
+
+            return RedisJobStore(get_redis())
+        except Exception as e:
+            logger.warning(f"[Jobs] Redis job store unavailable ({e}), falling back to in-memory store")
+    return MemoryJobStore()
+
+
+def get_job_runner() -> JobRunner:
+    """프로세스 단위 JobRunner 싱글톤 (이벤트 루프 안에서만 호출)"""
+    global _runner
+    if _runner is None:
+        _runner = JobRunner(_create_store())
+    return _runner
+
+
+async def run_or_accept(job_type: str, video_id: str, params: Optional[dict], wait: float):
+    """
+    라우트용: 작업을 제출(중복이면 합류)하고 wait초까지 결과 대기
+
+    Returns:
+        끝났으면 핸들러 결과, 아니면 202 JSONResponse (작업 정보 + Location)
+    Raises:
+        HTTPException: 작업 실패 (핸들러의 status_code 유지) 또는 큐 가득 참(503)
+    """
+    runner = get_job_runner()
+    try:
+        job, _ = await runner.submit(job_type, video_id, params)
+    except JobQueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="작업 대기열이 가득 찼습니다. 잠시 후 다시 시도하세요.",
+            headers={"Retry-After": "5"},
+        )
+    if job["status"] not in JOB_FINISHED and wait > 0:
+        job = await runner.wait(job["id"], min(wait, JOB_MAX_WAIT_SEC)) or job
+    if job["status"] == JOB_SUCCEEDED:
+        return job["result"]
+    if job["status"] == JOB_FAILED:
+        raise HTTPException(status_code=job.get("status_code") or 500, detail=job.get("error"))
+    view = job_view(job)
+    return JSONResponse(
+        status_code=202,
+        content=view,
+        headers={"Location": view["poll_url"], "Retry-After": "1"},
+    )
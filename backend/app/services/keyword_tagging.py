@@ -0,0 +1,251 @@
+"""
+키워드 태깅 엔진
+- 키워드 풀 임베딩 행렬은 오프라인에서 정규화하여 .npy로 저장 (scripts/build_keyword_embeddings.py)
+  → 서버에서는 memory-map으로 열기만 하므로 get_keyword_embeddings() 재계산 없음
+  (메타의 키워드 목록/모델이 현재 keyword_pool.json/인코더와 다르면 무시하고 런타임 인코딩)
+- 영상 텍스트 임베딩은 content hash 기준 LRU 캐시
+- 유사도는 정규화된 행렬 × 벡터 1회, 상위 K는 argpartition
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.services.embeddings import EMBEDDING_MODEL_NAME, get_keyword_embeddings, get_model, load_keyword_pool
+from app.utils.similarity import top_k_indices
+
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+KEYWORD_MATRIX_PATH = os.getenv("KEYWORD_EMBEDDINGS_NPY", os.path.join(_DATA_DIR, "keyword_embeddings.npy"))
+KEYWORD_MATRIX_META_PATH = os.getenv(
+    "KEYWORD_EMBEDDINGS_META", os.path.join(_DATA_DIR, "keyword_embeddings.json")
+)
+KEYWORD_TEXT_CACHE_SIZE = int(os.getenv("KEYWORD_TEXT_CACHE_SIZE", "4096"))
+KEYWORD_ENCODE_BATCH_SIZE = int(os.getenv("KEYWORD_ENCODE_BATCH_SIZE", "64"))
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """행 단위 L2 정규화 (float32)"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class KeywordTagger:
+    """키워드 풀 행렬 + 텍스트 임베딩 캐시 기반 키워드 태거"""
+
+    def __init__(
+        self,
+        matrix_path: str = KEYWORD_MATRIX_PATH,
+        meta_path: str = KEYWORD_MATRIX_META_PATH,
+        cache_size: int = KEYWORD_TEXT_CACHE_SIZE,
+    ):
+        self.matrix_path = matrix_path
+        self.meta_path = meta_path
+        self.cache_size = cache_size
+        self._keywords: Optional[List[str]] = None
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_source: Optional[str] = None
+        self._load_lock = threading.Lock()
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    # ------------------------------------------------------------------
+    # 키워드 풀 행렬
+    # ------------------------------------------------------------------
+    def _load_precomputed(self) -> bool:
+        if not (os.path.exists(self.matrix_path) and os.path.exists(self.meta_path)):
+            return False
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            keywords = meta.get("keywords") or []
+            matrix = np.load(self.matrix_path, mmap_mode="r")
+            if matrix.ndim != 2 or matrix.shape[0] != len(keywords):
+                print(
+                    f"[KeywordTagger] Precomputed matrix shape {matrix.shape} does not match "
+                    f"{len(keywords)} keywords, ignoring {self.matrix_path}"
+                )
+                return False
+            if meta.get("model") != EMBEDDING_MODEL_NAME:
+                print(
+                    f"[KeywordTagger] Precomputed matrix was built with {meta.get('model')!r}, "
+                    f"current encoder is {EMBEDDING_MODEL_NAME!r}, ignoring {self.matrix_path}"
+                )
+                return False
+            if list(keywords) != list(load_keyword_pool()):
+                print(
+                    f"[KeywordTagger] Precomputed keywords differ from keyword_pool.json, ignoring {self.matrix_path} "
+                    f"(re-run scripts/build_keyword_embeddings.py)"
+                )
+                return False
+            self._keywords = list(keywords)
+            self._matrix = matrix
+            self._matrix_source = "mmap"
+            print(f"[KeywordTagger] Memory-mapped keyword matrix {matrix.shape} from {self.matrix_path}")
+            return True
+        except Exception as e:
+            print(f"[KeywordTagger] Failed to load precomputed keyword matrix: {e}")
+            return False
+
+    def _ensure_matrix(self) -> None:
+        if self._matrix is not None:
+            return
+        with self._load_lock:
+            if self._matrix is not None:
+                return
+            if self._load_precomputed():
+                return
+            # 사전 계산 파일이 없거나 현재 키워드 풀/모델과 다르면 기존 방식으로 계산 후 정규화하여 보관
+            print("[KeywordTagger] Precomputed matrix unavailable, encoding keyword pool at runtime")
+            self._keywords = list(load_keyword_pool())
+            self._matrix = normalize_rows(get_keyword_embeddings())
+            self._matrix_source = "runtime"
+
+    @property
+    def keywords(self) -> List[str]:
+        self._ensure_matrix()
+        return self._keywords or []
+
+    @property
+    def matrix(self) -> np.ndarray:
+        self._ensure_matrix()
+        return self._matrix
+
+    def is_ready(self) -> bool:
+        return self._matrix is not None
+
+    # ------------------------------------------------------------------
+    # 텍스트 임베딩 캐시
+    # ------------------------------------------------------------------
+    def _cache_get(self, key: str) -> Optional[np.ndarray]:
+        with self._cache_lock:
+            vec = self._cache.get(key)
+            if vec is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+            return vec
+
+    def _cache_put(self, key: str, vec: np.ndarray) -> None:
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = vec
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def encode_texts(self, texts: Sequence[str]) -> np.ndarray:
+        """정규화된 텍스트 임베딩 (N, d). 캐시 미스만 한 번의 배치로 인코딩"""
+        keys = [text_hash(t) for t in texts]
+        vectors: List[Optional[np.ndarray]] = [self._cache_get(k) for k in keys]
+        miss_idx = [i for i, v in enumerate(vectors) if v is None]
+        if miss_idx:
+            # 같은 배치 안의 중복 텍스트는 한 번만 인코딩
+            unique: Dict[str, int] = {}
+            for i in miss_idx:
+                unique.setdefault(keys[i], i)
+            miss_texts = [texts[i] for i in unique.values()]
+            encoded = get_model().encode(
+                miss_texts,
+                convert_to_numpy=True,
+                batch_size=KEYWORD_ENCODE_BATCH_SIZE,
+                show_progress_bar=False,
+            )
+            encoded = normalize_rows(encoded)
+            fresh = dict(zip(unique.keys(), encoded))
+            for key, vec in fresh.items():
+                self._cache_put(key, vec)
+            for i in miss_idx:
+                vectors[i] = fresh[keys[i]]
+        if not vectors:
+            return np.empty((0, self.matrix.shape[1]), dtype=np.float32)
+        return np.stack(vectors).astype(np.float32, copy=False)
+
+    # ------------------------------------------------------------------
+    # 태깅
+    # ------------------------------------------------------------------
+    def tag(self, text: str, top_k: int = 7) -> List[Dict[str, float]]:
+        if not text or not text.strip():
+            return []
+        return self.tag_batch([text], top_k=top_k)[0]
+
+    def tag_batch(self, texts: Sequence[str], top_k: int = 7) -> List[List[Dict[str, float]]]:
+        """
+        여러 텍스트를 한 번에 태깅 (파이프라인 배치용)
+
+        Returns:
+            입력 순서와 같은 [{"keyword": ..., "score": ...}, ...] 리스트의 리스트
+            (빈 텍스트는 빈 리스트)
+        """
+        results: List[List[Dict[str, float]]] = [[] for _ in texts]
+        valid_idx = [i for i, t in enumerate(texts) if t and t.strip()]
+        if not valid_idx:
+            return results
+        text_vecs = self.encode_texts([texts[i] for i in valid_idx])
+        scores = text_vecs @ np.asarray(self.matrix).T  # (N, n_keywords)
+        top_idx = top_k_indices(scores, top_k)
+        keywords = self.keywords
+        for row, i in enumerate(valid_idx):
+            results[i] = [
+                {"keyword": keywords[j], "score": float(scores[row, j])}
+                for j in top_idx[row]
+            ]
+        return results
+
+    def stats(self) -> dict:
+        return {
+            "matrix_source": self._matrix_source,
+            "keywords": len(self._keywords or []),
+            "cache_size": len(self._cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
+
+
+_tagger: Optional[KeywordTagger] = None
+_tagger_lock = threading.Lock()
+
+
+def get_keyword_tagger() -> KeywordTagger:
+    """프로세스 단위 KeywordTagger 싱글톤"""
+    global _tagger
+    if _tagger is None:
+        with _tagger_lock:
+            if _tagger is None:
+                _tagger = KeywordTagger()
+    return _tagger
+
+
+def tag_videos(videos: Sequence[dict], top_k: int = 7) -> Dict[str, List[Dict[str, float]]]:
+    """
+    파이프라인용 배치 API: [{"id"/"video_id", "title", "description"}, ...] → {video_id: keywords}
+    """
+    ids: List[str] = []
+    texts: List[str] = []
+    for video in videos:
+        video_id = video.get("video_id") or video.get("id")
+        if not video_id:
+            continue
+        ids.append(video_id)
+        texts.append(build_video_text(video.get("title"), video.get("description")))
+    tagged = get_keyword_tagger().tag_batch(texts, top_k=top_k)
+    return dict(zip(ids, tagged))
+
+
+def build_video_text(title: Optional[str], description: Optional[str]) -> str:
+    """키워드 태깅 입력 텍스트 (title + description)"""
+    return " ".join(part for part in (title, description) if part)
@@ -0,0 +1,89 @@
+"""
+ONNX Runtime 기반 MiniLM 임베딩 인코더
+scripts/export_minilm_onnx.py로 내보낸 int8 양자화 모델을 onnxruntime으로 실행
+PyTorch/sentence-transformers 없이 동작하므로 API 컨테이너 메모리와 요청당 CPU 사용량이 줄어듦
+
+SentenceTransformer.encode()와 같은 형태로 호출할 수 있도록 encode() 시그니처를 맞춤
+(all-MiniLM-L6-v2 파이프라인: Transformer → mean pooling → L2 normalize)
+"""
+from __future__ import annotations
+
+import os
+from typing import List, Sequence, Union
+
+import numpy as np
+
+_BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ONNX_MODEL_DIR = os.getenv("EMBEDDING_ONNX_DIR", os.path.join(_BACKEND_ROOT, "models", "embeddings", "minilm_onnx"))
+ONNX_MODEL_FILE = os.getenv("EMBEDDING_ONNX_FILE", "model.int8.onnx")
+ONNX_INTRA_OP_THREADS = int(os.getenv("EMBEDDING_ONNX_INTRA_OP_THREADS", "1"))
+ONNX_INTER_OP_THREADS = int(os.getenv("EMBEDDING_ONNX_INTER_OP_THREADS", "1"))
+ONNX_MAX_LENGTH = int(os.getenv("EMBEDDING_ONNX_MAX_LENGTH", "256"))
+
+
+class OnnxSentenceEncoder:
+    """int8 ONNX MiniLM 인코더 (mean pooling + L2 정규화)"""
+
+    def __init__(
+        self,
+        model_dir: str = ONNX_MODEL_DIR,
+        model_file: str = ONNX_MODEL_FILE,
+        intra_op_threads: int = ONNX_INTRA_OP_THREADS,
+        inter_op_threads: int = ONNX_INTER_OP_THREADS,
+        max_length: int = ONNX_MAX_LENGTH,
+    ):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        model_path = os.path.join(model_dir, model_file)
+        tokenizer_path = os.path.join(model_dir, "tokenizer.json")
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"ONNX model not found at {model_path}. Run scripts/export_minilm_onnx.py first."
+            )
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = inter_op_threads
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(tokenizer_path)
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+        self.model_path = model_path
+        print(
+            f"[Embeddings] ONNX encoder loaded from {model_path} "
+            f"(intra_op={intra_op_threads}, inter_op={inter_op_threads})"
+        )
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.asarray([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.asarray([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.asarray([e.type_ids for e in encodings], dtype=np.int64)
+
+        last_hidden = self.session.run(None, feeds)[0]  # [batch, seq, hidden]
+        mask = attention_mask[:, :, np.newaxis].astype(np.float32)
+        pooled = (last_hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return (pooled / np.maximum(norms, 1e-12)).astype(np.float32)
+
+    def encode(
+        self,
+        sentences: Union[str, Sequence[str]],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        show_progress_bar: bool = False,
+        **_: object,
+    ) -> np.ndarray:
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        chunks = [self._encode_batch(texts[i:i + batch_size]) for i in range(0, len(texts), batch_size)]
+        embeddings = np.concatenate(chunks, axis=0)
+        return embeddings[0] if single else embeddings
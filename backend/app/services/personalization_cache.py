@@ -1,11 +1,12 @@
 """
 개인화 점수 캐싱 서비스
 Redis를 사용한 user_pref, video_static, personalized_score 캐싱
+캐시 facade(app/core/cache.py get_cache) 사용 → Redis 장애 중에는 브레이커가 Redis 호출을 건너뛰고
+프로세스 로컬 LRU가 대신 처리하므로 호출마다 연결 타임아웃을 기다리지 않음
 """
-import json
 import logging
 from typing import Optional, Dict, Any
-from app.core.redis_client import get_redis
+from app.core.cache import get_cache
 from app.crud.user_preference import get_user_preference
 from app.crud.video_static import get_video_static
 from sqlalchemy.orm import Session
@@ -24,15 +25,10 @@ def get_user_pref_cache(db: Session, user_id: int) -> Optional[Dict[str, Any]]:
     Returns:
         사용자 취향 정보 딕셔너리 또는 None
     """
-    # Redis 캐시 확인 (실패해도 계속 진행)
-    try:
-        redis_client = get_redis()
-        cache_key = f"user_pref:{user_id}"
-        cached = redis_client.get(cache_key)
-        if cached:
-            return json.loads(cached)
-    except Exception as e:
-        logger.warning(f"[Cache] Redis get failed for user_pref:{user_id}: {e}, falling back to DB")
+    # 캐시 확인 (Redis 장애 시 로컬 캐시, 없으면 DB)
+    cached = get_cache().get_json(f"user_pref:{user_id}")
+    if cached:
+        return cached
     
     # DB에서 조회
     try:
@@ -48,13 +44,11 @@ def get_user_pref_cache(db: Session, user_id: int) -> Optional[Dict[str, Any]]:
             "sentiment_weight": pref.sentiment_weight
         }
         
-        # Redis에 캐싱 (실패해도 계속 진행)
+        # 캐싱 (실패해도 계속 진행)
         try:
-            redis_client = get_redis()
-            cache_key = f"user_pref:{user_id}"
-            redis_client.set(cache_key, json.dumps(pref_dict))
+            get_cache().set_json(f"user_pref:{user_id}", pref_dict, ttl_sec=None)
         except Exception as e:
-            logger.warning(f"[Cache] Redis set failed for user_pref:{user_id}: {e}")
+            logger.warning(f"[Cache] Cache set failed for user_pref:{user_id}: {e}")
         
         return pref_dict
     except Exception as e:
@@ -73,15 +67,10 @@ def get_video_static_cache(db: Session, video_id: str) -> Optional[Dict[str, Any
     Returns:
         비디오 정적 정보 딕셔너리 또는 None
     """
-    # Redis 캐시 확인 (실패해도 계속 진행)
-    try:
-        redis_client = get_redis()
-        cache_key = f"vid_static:{video_id}"
-        cached = redis_client.get(cache_key)
-        if cached:
-            return json.loads(cached)
-    except Exception as e:
-        logger.warning(f"[Cache] Redis get failed for vid_static:{video_id}: {e}, falling back to DB")
+    # 캐시 확인 (Redis 장애 시 로컬 캐시, 없으면 DB)
+    cached = get_cache().get_json(f"vid_static:{video_id}")
+    if cached:
+        return cached
     
     # DB에서 조회
     try:
@@ -98,13 +87,11 @@ def get_video_static_cache(db: Session, video_id: str) -> Optional[Dict[str, Any
             "embedding": static.embedding
         }
         
-        # Redis에 캐싱 (실패해도 계속 진행)
+        # 캐싱 (실패해도 계속 진행)
         try:
-            redis_client = get_redis()
-            cache_key = f"vid_static:{video_id}"
-            redis_client.set(cache_key, json.dumps(static_dict))
+            get_cache().set_json(f"vid_static:{video_id}", static_dict, ttl_sec=None)
         except Exception as e:
-            logger.warning(f"[Cache] Redis set failed for vid_static:{video_id}: {e}")
+            logger.warning(f"[Cache] Cache set failed for vid_static:{video_id}: {e}")
         
         return static_dict
     except Exception as e:
@@ -123,16 +110,7 @@ def get_personalized_cache(user_id: int, video_id: str) -> Optional[Dict[str, An
     Returns:
         개인화 점수 딕셔너리 또는 None
     """
-    try:
-        redis_client = get_redis()
-        cache_key = f"pref_score:{user_id}:{video_id}"
-        cached = redis_client.get(cache_key)
-        if cached:
-            return json.loads(cached)
-    except Exception as e:
-        logger.warning(f"[Cache] Redis get failed for pref_score:{user_id}:{video_id}: {e}")
-    
-    return None
+    return get_cache().get_json(f"pref_score:{user_id}:{video_id}")
 
 
 def set_personalized_cache(user_id: int, video_id: str, score_data: Dict[str, Any]):
@@ -145,10 +123,8 @@ def set_personalized_cache(user_id: int, video_id: str, score_data: Dict[str, An
         score_data: 점수 데이터 딕셔너리
     """
     try:
-        redis_client = get_redis()
-        cache_key = f"pref_score:{user_id}:{video_id}"
         # 1시간 TTL
-        redis_client.set(cache_key, json.dumps(score_data), ex=3600)
+        get_cache().set_json(f"pref_score:{user_id}:{video_id}", score_data, ttl_sec=3600)
     except Exception as e:
-        logger.warning(f"[Cache] Redis set failed for pref_score:{user_id}:{video_id}: {e}")
+        logger.warning(f"[Cache] Cache set failed for pref_score:{user_id}:{video_id}: {e}")
 
@@ -3,7 +3,7 @@
 user_pref와 video_static을 기반으로 개인화 점수 계산
 """
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Sequence
 
 
 def cosine_similarity(a: list, b: list) -> float:
@@ -163,3 +163,125 @@ def calculate_personalized_score(
             "final_score": 0.0
         }
 
+
+# ----------------------------------------------------------------------
+# 배치(벡터화) 점수 계산
+# 후보 N개를 (N, d) 행렬과 길이 N 배열로 받아 한 번에 계산 (위 단건 함수와 같은 공식)
+# ----------------------------------------------------------------------
+
+def cosine_similarities(user_embedding: Sequence[float], video_embeddings: np.ndarray) -> np.ndarray:
+    """
+    사용자 벡터 1개 × 후보 임베딩 행렬 (N, d) 코사인 유사도
+    
+    Returns:
+        (N,) 유사도 배열 (0.0-1.0). 차원이 다르거나 영벡터면 0.0
+    """
+    matrix = np.asarray(video_embeddings, dtype=np.float32)
+    if matrix.ndim != 2:
+        return np.zeros(0, dtype=np.float32)
+    user_vec = np.asarray(user_embedding if user_embedding is not None else [], dtype=np.float32).ravel()
+    if user_vec.size == 0 or matrix.shape[1] != user_vec.size:
+        return np.zeros(matrix.shape[0], dtype=np.float32)
+
+    user_norm = float(np.linalg.norm(user_vec))
+    if user_norm == 0:
+        return np.zeros(matrix.shape[0], dtype=np.float32)
+    # einsum으로 행 노름 계산 (N×d 임시 배열 생성 없음)
+    row_norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+    similarities = (matrix @ user_vec) / np.maximum(row_norms * user_norm, 1e-12)
+    return np.clip(similarities, 0.0, 1.0)
+
+
+def build_topic_matrix(video_topics: Sequence[Optional[Dict[str, float]]]) -> tuple:
+    """
+    후보별 토픽 딕셔너리 리스트 → (N, T) 가중치 행렬과 토픽 이름 리스트
+    """
+    topic_index: Dict[str, int] = {}
+    rows: List[int] = []
+    cols: List[int] = []
+    values: List[float] = []
+    for row, topics in enumerate(video_topics):
+        if not isinstance(topics, dict):
+            continue
+        for topic, weight in topics.items():
+            try:
+                weight_float = float(weight) if weight is not None else 0.0
+            except (ValueError, TypeError):
+                continue
+            rows.append(row)
+            cols.append(topic_index.setdefault(topic, len(topic_index)))
+            values.append(weight_float)
+
+    matrix = np.zeros((len(video_topics), len(topic_index)), dtype=np.float32)
+    if values:
+        np.add.at(matrix, (np.asarray(rows), np.asarray(cols)), np.asarray(values, dtype=np.float32))
+    return matrix, list(topic_index)
+
+
+def calculate_topic_scores(
+    user_topics: Dict[str, float],
+    topic_matrix: np.ndarray,
+    topic_names: Sequence[str]
+) -> np.ndarray:
+    """
+    토픽 점수 배치 계산 (calculate_topic_score와 같은 가중 평균)
+    
+    Args:
+        user_topics: 사용자 토픽 점수 {topic: score}
+        topic_matrix: (N, T) 비디오 토픽 가중치 (build_topic_matrix 결과)
+        topic_names: 열 순서의 토픽 이름
+    
+    Returns:
+        (N,) 토픽 점수 배열
+    """
+    n = topic_matrix.shape[0]
+    if not isinstance(user_topics, dict) or not user_topics or topic_matrix.size == 0:
+        return np.zeros(n, dtype=np.float32)
+    user_vec = np.zeros(len(topic_names), dtype=np.float32)
+    for i, topic in enumerate(topic_names):
+        try:
+            value = user_topics.get(topic)
+            user_vec[i] = float(value) if value is not None else 0.0
+        except (ValueError, TypeError):
+            continue
+    total_weight = topic_matrix.sum(axis=1)
+    weighted = topic_matrix @ user_vec
+    return np.divide(weighted, total_weight, out=np.zeros(n, dtype=np.float32), where=total_weight != 0)
+
+
+def calculate_personalized_scores(
+    user_pref: Dict[str, Any],
+    video_embeddings: np.ndarray,
+    topic_scores: np.ndarray,
+    sentiments: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    개인화 점수 배치 계산 (calculate_personalized_score의 벡터화 버전)
+    
+    Args:
+        user_pref: 사용자 취향 정보 (embedding, sentiment_weight)
+        video_embeddings: (N, d) 후보 임베딩 행렬
+        topic_scores: (N,) 토픽 점수 (calculate_topic_scores 결과)
+        sentiments: (N,) 비디오 감정 값 (없으면 NaN → 0.5)
+    
+    Returns:
+        {"similarity", "topic_score", "sentiment_adjust", "final_score"} → 각 (N,) 배열
+    """
+    similarity = cosine_similarities(user_pref.get("embedding") or [], video_embeddings)
+    topic = np.asarray(topic_scores, dtype=np.float32)
+
+    sentiment = np.asarray(sentiments, dtype=np.float32)
+    sentiment = np.where(np.isnan(sentiment), 0.5, sentiment)
+    try:
+        sentiment_weight = float(user_pref.get("sentiment_weight", 0.3))
+    except (ValueError, TypeError):
+        sentiment_weight = 0.3
+    sentiment_adjust = np.clip(1.0 + (sentiment - 0.5) * sentiment_weight, 0.8, 1.2)
+
+    final_score = np.clip((similarity * 0.6 + topic * 0.4) * sentiment_adjust, 0.0, 1.0)
+    return {
+        "similarity": similarity,
+        "topic_score": topic,
+        "sentiment_adjust": sentiment_adjust,
+        "final_score": final_score,
+    }
@@ -0,0 +1,209 @@
+"""
+영상 목록 공통 직렬화
+- 영상 + 채널명을 한 번의 쿼리(outer join)로 튜플 행으로 조회 (ORM 객체/identity map 생성 없음)
+- 채널명은 프로세스 로컬 LRU 캐시 (TTL) → ORM 객체 목록에서도 채널 쿼리 없이 채널명 주입
+- 응답 dict를 VideoResponse 필드 순서대로 직접 생성하고, datetime은 ISO 문자열로 변환해
+  Redis 캐시(json.dumps)와 응답 바이트 인코딩에 그대로 사용
+- ORM → VideoResponse.model_validate → model_dump 경로 대비 비교: scripts/benchmark_serialization.py
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from fastapi.responses import Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.channel import Channel
+from app.models.video import Video
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json 사용
+    orjson = None
+
+CHANNEL_NAME_CACHE_SIZE = int(os.getenv("CHANNEL_NAME_CACHE_SIZE", "10000"))
+CHANNEL_NAME_CACHE_TTL_SEC = float(os.getenv("CHANNEL_NAME_CACHE_TTL_SEC", "600"))
+
+# VideoResponse 필드 순서 (channel_name은 조인/캐시로 채움)
+VIDEO_FIELDS = (
+    "id",
+    "channel_id",
+    "title",
+    "description",
+    "published_at",
+    "duration",
+    "duration_sec",
+    "view_count",
+    "like_count",
+    "comment_count",
+    "category_id",
+    "tags",
+    "thumbnail_url",
+    "keyword",
+    "region",
+    "is_shorts",
+    "created_at",
+    "updated_at",
+)
+_VIDEO_COLUMNS = tuple(getattr(Video, name) for name in VIDEO_FIELDS)
+_DATETIME_FIELDS = ("published_at", "created_at", "updated_at")
+
+
+class ChannelNameCache:
+    """channel_id → 채널명 LRU (TTL 만료, 스레드 안전). 없는 채널은 None으로 캐시"""
+
+    def __init__(self, max_size: int = CHANNEL_NAME_CACHE_SIZE, ttl_sec: float = CHANNEL_NAME_CACHE_TTL_SEC):
+        self.max_size = max_size
+        self.ttl_sec = ttl_sec
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, channel_ids: Iterable[str]) -> tuple:
+        """(찾은 {id: name}, 없는 id 목록)"""
+        found: Dict[str, Optional[str]] = {}
+        missing: List[str] = []
+        now = time.monotonic()
+        with self._lock:
+            for channel_id in channel_ids:
+                entry = self._entries.get(channel_id)
+                if entry is not None and entry[1] > now:
+                    self._entries.move_to_end(channel_id)
+                    found[channel_id] = entry[0]
+                else:
+                    missing.append(channel_id)
+            self.hits += len(found)
+            self.misses += len(missing)
+        return found, missing
+
+    def put_many(self, names: Dict[str, Optional[str]]) -> None:
+        expires_at = time.monotonic() + self.ttl_sec
+        with self._lock:
+            for channel_id, name in names.items():
+                self._entries[channel_id] = (name, expires_at)
+                self._entries.move_to_end(channel_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+channel_name_cache = ChannelNameCache()
+
+
+def _channel_ids(videos: Iterable[object]) -> List[str]:
+    return list({v.channel_id for v in videos if getattr(v, "channel_id", None)})
+
+
+def get_channel_name_map(db: Session, videos: Iterable[object]) -> Dict[str, Optional[str]]:
+    """영상 목록의 채널명 매핑 (LRU 우선, 캐시에 없는 채널만 한 번의 IN 쿼리)"""
+    names, missing = channel_name_cache.get_many(_channel_ids(videos))
+    if missing:
+        rows = db.execute(select(Channel.id, Channel.title).where(Channel.id.in_(missing))).all()
+        fetched = dict.fromkeys(missing)
+        fetched.update({channel_id: title for channel_id, title in rows})
+        channel_name_cache.put_many(fetched)
+        names.update(fetched)
+    return names
+
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def video_to_dict(video: object, channel_name: Optional[str] = None) -> dict:
+    """Video ORM 객체(또는 같은 속성을 가진 행) → VideoResponse 형태 dict (JSON 호환)"""
+    item = {"id": video.id, "channel_id": video.channel_id, "channel_name": channel_name}
+    for name in VIDEO_FIELDS[2:]:
+        item[name] = _json_value(getattr(video, name))
+    return item
+
+
+def serialize_videos(
+    videos: Iterable[object],
+    channel_name_map: Optional[Dict[str, Optional[str]]] = None,
+) -> List[dict]:
+    """영상 목록 → 응답 dict 목록 (id 없는 항목/중복 제거)"""
+    items: List[dict] = []
+    seen_ids = set()
+    for video in videos:
+        video_id = getattr(video, "id", None)
+        if not video_id or video_id in seen_ids:
+            continue
+        seen_ids.add(video_id)
+        if channel_name_map is not None:
+            channel_name = channel_name_map.get(video.channel_id)
+        else:
+            channel_name = getattr(video, "channel_name", None)
+        items.append(video_to_dict(video, channel_name))
+    return items
+
+
+def video_rows_stmt(video_stmt):
+    """
+    select(Video)... 문장을 (Video 컬럼..., Channel.title) 튜플 조회로 변환
+    WHERE / ORDER BY / LIMIT / OFFSET은 그대로 유지 (crud.video의 *_stmt 빌더와 함께 사용)
+    """
+    return video_stmt.with_only_columns(*_VIDEO_COLUMNS, Channel.title).outerjoin(
+        Channel, Channel.id == Video.channel_id
+    )
+
+
+def _rows_to_dicts(rows) -> List[dict]:
+    items: List[dict] = []
+    seen_ids = set()
+    datetime_positions = [VIDEO_FIELDS.index(name) for name in _DATETIME_FIELDS]
+    names: Dict[str, Optional[str]] = {}
+    for row in rows:
+        values = list(row)
+        video_id = values[0]
+        if not video_id or video_id in seen_ids:
+            continue
+        seen_ids.add(video_id)
+        for pos in datetime_positions:
+            if values[pos] is not None:
+                values[pos] = values[pos].isoformat()
+        channel_name = values.pop()
+        if values[1]:
+            names[values[1]] = channel_name
+        item = dict(zip(VIDEO_FIELDS, values))
+        item["channel_name"] = channel_name
+        items.append(item)
+    if names:
+        channel_name_cache.put_many(names)
+    return items
+
+
+def fetch_video_dicts(db: Session, video_stmt) -> List[dict]:
+    """영상 목록 + 채널명을 한 번의 쿼리로 조회해 응답 dict로 변환"""
+    return _rows_to_dicts(db.execute(video_rows_stmt(video_stmt)).all())
+
+
+async def fetch_video_dicts_async(db, video_stmt) -> List[dict]:
+    """fetch_video_dicts의 비동기 버전"""
+    result = await db.execute(video_rows_stmt(video_stmt))
+    return _rows_to_dicts(result.all())
+
+
+def video_list_payload(items: List[dict], total: Optional[int] = None, next_cursor: Optional[str] = None) -> dict:
+    """VideoListResponse와 같은 모양의 dict (Redis 캐시에 그대로 저장 가능)"""
+    return {"videos": items, "total": len(items) if total is None else total, "next_cursor": next_cursor}
+
+
+def dumps(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_response(payload) -> Response:
+    """이미 JSON 호환인 payload를 response_model 재검증 없이 바로 응답"""
+    return Response(content=dumps(payload), media_type="application/json")
@@ -0,0 +1,138 @@
+"""
+키셋(커서) 페이지네이션 유틸리티
+- OFFSET은 건너뛴 행을 모두 읽고 버리므로 깊은 페이지일수록 느려짐
+  → 마지막 행의 정렬 키 (예: published_at, id) 다음부터 seek 하는 조건으로 대체
+- 커서는 base64url(JSON) 불투명 문자열: {"k": 목록 종류, "v": [정렬 키 값...]}
+  · 같은 위치는 항상 같은 커서 → 커서를 포함한 캐시 키로 응답 캐시 가능
+- 정렬은 모두 DESC, NULL은 가장 작은 값으로 취급 (MySQL의 DESC 정렬에서 NULL이 마지막)
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+from sqlalchemy.types import Date, DateTime
+
+
+class InvalidCursor(ValueError):
+    """디코딩할 수 없거나 다른 목록의 커서"""
+
+
+def _json_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def encode_cursor(kind: str, values: Sequence[Any]) -> str:
+    """정렬 키 값 → 불투명 커서 문자열"""
+    payload = json.dumps({"k": kind, "v": [_json_value(v) for v in values]}, separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _coerce(column, value: Any) -> Any:
+    """커서의 JSON 값을 컬럼 타입에 맞게 변환 (DATETIME은 ISO 문자열로 저장됨)"""
+    if value is None:
+        return None
+    column_type = getattr(column, "type", None)
+    if isinstance(column_type, (DateTime, Date)) and isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError as exc:
+            raise InvalidCursor(f"bad datetime in cursor: {value}") from exc
+    return value
+
+
+def decode_cursor(kind: str, cursor: str, columns: Sequence) -> List[Any]:
+    """
+    커서 문자열 → 정렬 키 값 목록 (kind/길이 검증 + 컬럼 타입 변환)
+
+    Args:
+        columns: 정렬 키 컬럼 (SQLAlchemy 컬럼이면 타입 변환, 문자열 등은 그대로)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        values = payload["v"]
+    except Exception as exc:
+        raise InvalidCursor(f"malformed cursor: {exc}") from exc
+    if payload.get("k") != kind or not isinstance(values, list) or len(values) != len(columns):
+        raise InvalidCursor(f"cursor does not belong to '{kind}'")
+    return [_coerce(column, value) for column, value in zip(columns, values)]
+
+
+def decode_cursor_or_400(kind: str, cursor: Optional[str], columns: Sequence) -> Optional[List[Any]]:
+    """라우트용: 커서가 없으면 None, 잘못된 커서는 400"""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(kind, cursor, columns)
+    except InvalidCursor as exc:
+        raise HTTPException(status_code=400, detail=f"invalid cursor: {exc}")
+
+
+def keyset_filter(columns: Sequence, values: Sequence[Any]):
+    """
+    (c1, c2, ..., id) DESC 정렬에서 커서 행 '다음' 행들을 고르는 조건
+    (c1 < v1) OR (c1 = v1 AND c2 < v2) OR ... , NULL은 가장 작은 값
+
+    마지막 컬럼은 NOT NULL 고유 키(id)여야 함
+    """
+    branches = []
+    equal_prefix = []
+    for column, value in zip(columns, values):
+        nullable = getattr(column, "nullable", True)
+        if value is None:
+            less = None  # NULL보다 작은 값 없음
+            equal = column.is_(None)
+        else:
+            less = or_(column < value, column.is_(None)) if nullable else column < value
+            equal = column == value
+        if less is not None:
+            branches.append(and_(*equal_prefix, less) if equal_prefix else less)
+        equal_prefix.append(equal)
+    return or_(*branches)
+
+
+def keyset_sql(keys: Sequence[Tuple[str, bool]], values: Sequence[Any], prefix: str = "ks") -> Tuple[str, Dict[str, Any]]:
+    """
+    keyset_filter의 raw SQL 버전 (text() 쿼리용)
+
+    Args:
+        keys: [(SQL 컬럼 표현식, nullable 여부), ...] 마지막은 고유 키
+        values: 커서 값
+    Returns:
+        (SQL 조건 문자열, bind 파라미터)
+    """
+    branches = []
+    equal_prefix: List[str] = []
+    params: Dict[str, Any] = {}
+    for idx, ((expr, nullable), value) in enumerate(zip(keys, values)):
+        name = f"{prefix}{idx}"
+        if value is None:
+            less = None
+            equal = f"{expr} IS NULL"
+        else:
+            params[name] = value
+            less = f"({expr} < :{name} OR {expr} IS NULL)" if nullable else f"{expr} < :{name}"
+            equal = f"{expr} = :{name}"
+        if less is not None:
+            branches.append(" AND ".join(equal_prefix + [less]))
+        equal_prefix.append(equal)
+    if not branches:
+        return "1 = 0", params
+    return "(" + " OR ".join(f"({branch})" for branch in branches) + ")", params
+
+
+def next_cursor(kind: str, items: List[dict], limit: int, keys: Sequence[str]) -> Tuple[List[dict], Optional[str]]:
+    """
+    limit + 1개를 조회한 결과에서 다음 페이지 커서 계산
+
+    Returns:
+        (limit개로 자른 items, 다음 커서 또는 None(마지막 페이지))
+    """
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    last = items[-1]
+    return items, encode_cursor(kind, [last.get(key) for key in keys])
@@ -48,3 +48,18 @@ def compute_similarities(
     """
     return [cosine_similarity(query_embedding, cand) for cand in candidate_embeddings]
 
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """마지막 축 기준 상위 k개 인덱스를 점수 내림차순으로 반환 (전체 정렬 없이 argpartition)"""
+    n = scores.shape[-1]
+    k = max(0, min(k, n))
+    if k == 0:
+        return np.empty(scores.shape[:-1] + (0,), dtype=np.int64)
+    if k < n:
+        part = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+    else:
+        part = np.broadcast_to(np.arange(n), scores.shape).copy()
+    part_scores = np.take_along_axis(scores, part, axis=-1)
+    order = np.argsort(-part_scores, axis=-1, kind="stable")
+    return np.take_along_axis(part, order, axis=-1)
@@ -32,12 +32,21 @@ else:
 if utils_path not in sys.path:
     sys.path.insert(0, utils_path)
 
-from youtube_collector import YouTubeCollector
+from youtube_backfill import BackfillCheckpoint, ChannelBackfill
 from db_writer import MySQLWriter
 import json
 
+BACKFILL_LOOKBACK_HOURS = 8760
+BACKFILL_MAX_VIDEOS_PER_CHANNEL = 500
+# 체크포인트 상태 파일 (Airflow 워커 재시작에도 남도록 볼륨 경로 권장)
+BACKFILL_STATE_PATH = os.environ.get('BACKFILL_STATE_PATH', os.path.join(dag_dir, 'backfill_state.json'))
+
 
 def backfill_collect_and_load(**context):
+    """
+    채널 목록을 API 키 수만큼의 워커로 병렬 수집하고 bulk 적재
+    체크포인트(BACKFILL_STATE_PATH)에 완료 채널/page token을 기록하므로 중단 후 재실행하면 이어서 진행
+    """
     from airflow.models import Variable
     channel_list_path = os.path.join(dag_dir, 'channel_list.json')
     with open(channel_list_path, 'r', encoding='utf-8') as f:
@@ -50,25 +59,31 @@ def backfill_collect_and_load(**context):
         api_key = Variable.get("YOUTUBE_API_KEY")
         api_keys = [api_key]
 
-    collector = YouTubeCollector(api_keys=api_keys)
     writer = MySQLWriter(conn_id=os.environ.get('AIRFLOW_MYSQL_CONN_ID', 'mysql_local'))
     writer.create_tables()
 
-    total = 0
+    identifiers = []
     for ch in channels:
         identifier = ch.get('channel_id') or ch.get('channel_handle') or ch.get('name')
-        if not identifier:
-            continue
-        bundle = collector.collect_channel_videos(channel_id_or_handle=identifier, lookback_hours=8760, max_results=500)
-        meta = bundle.get('channel_meta')
-        vids = bundle.get('videos', [])
-        if meta:
-            writer.insert_channels([meta])
-        if vids:
-            writer.insert_videos(vids, keyword='travel')
-            total += len(vids)
-    print(f"Backfill loaded videos: {total}")
-    return True
+        if identifier and identifier not in identifiers:
+            identifiers.append(identifier)
+
+    max_workers = Variable.get("BACKFILL_MAX_WORKERS", default_var=None)
+    backfill = ChannelBackfill(
+        api_keys=api_keys,
+        writer=writer,
+        checkpoint=BackfillCheckpoint(BACKFILL_STATE_PATH, lookback_hours=BACKFILL_LOOKBACK_HOURS),
+        lookback_hours=BACKFILL_LOOKBACK_HOURS,
+        # 채널당 수집 상한 (API 할당량 보호, 0이면 lookback 기간 전체)
+        max_videos_per_channel=int(Variable.get("BACKFILL_MAX_VIDEOS_PER_CHANNEL", default_var=BACKFILL_MAX_VIDEOS_PER_CHANNEL)),
+        max_workers=int(max_workers) if max_workers else None,
+        load_batch_size=int(Variable.get("BACKFILL_LOAD_BATCH_SIZE", default_var=1000)),
+    )
+    result = backfill.run(identifiers)
+    print(f"Backfill loaded videos: {result['loaded_this_run']} (total {result['loaded']})")
+    if result['quota_exhausted']:
+        print("Backfill stopped on API quota; re-run the DAG to resume from the checkpoint")
+    return result
 
 
 run = PythonOperator(
@@ -23,8 +23,12 @@ if utils_path not in sys.path:
 
 from youtube_collector import YouTubeCollector
 from db_writer import MySQLWriter, BigQueryWriter
+from staging import stage_run
 import json
 
+# 실행별 Parquet 스테이징 디렉터리 (BigQuery 태스크와 공유되는 볼륨 경로 권장)
+STAGING_ROOT = os.environ.get('AIRFLOW_STAGING_DIR', '/tmp/youtube_staging')
+
 
 # DAG 기본 설정
 default_args = {
@@ -562,20 +566,26 @@ def load_to_mysql(**context):
     videos = ti.xcom_pull(task_ids='yt_extract_videos', key='videos')
     comments = ti.xcom_pull(task_ids='yt_extract_comments', key='comments')
     
-    if channels:
-        mysql_writer.insert_channels(channels)
-    
-    if videos:
-        # 키워드는 기본적으로 'travel'로 설정 (여행 관련이므로)
-        mysql_writer.insert_videos(videos, keyword='travel')
-    
-    if comments:
-        mysql_writer.insert_comments(comments)
+    # 컬럼형 스테이징: 같은 Parquet 파일을 MySQL/BigQuery 적재에 재사용
+    staging_dir = os.path.join(STAGING_ROOT, context['run_id'].replace(':', '_').replace('+', '_'))
+    # 키워드는 기본적으로 'travel'로 설정 (여행 관련이므로)
+    staging_paths = stage_run(staging_dir, channels=channels, videos=videos, comments=comments, keyword='travel')
+    ti.xcom_push(key='staging_paths', value=staging_paths)
+
+    mysql_writer.load_staged(staging_paths, keyword='travel')
     
     print("Data loaded to MySQL successfully")
     return True
 
 
+def refresh_rank_features(**context):
+    """추천 랭킹 피처 테이블(video_rank_features) 갱신 - API는 갱신이 오래되면 조인 쿼리로 대체"""
+    conn_id = os.environ.get('AIRFLOW_MYSQL_CONN_ID', 'mysql_local')
+    mysql_writer = MySQLWriter(conn_id=conn_id)
+    mysql_writer.refresh_rank_features()
+    return True
+
+
 def load_to_bigquery(**context):
     """BigQuery에 데이터 적재"""
     from airflow.models import Variable
@@ -647,29 +657,33 @@ def load_to_bigquery(**context):
         raise
     
     success_count = 0
-    
-    if channels and len(channels) > 0:
-        try:
-            bq_writer.load_channels(channels, table_id='travel_channels')
-            success_count += 1
-        except Exception as e:
-            print(f"✗ Failed to load channels: {e}")
-            raise
-    
-    if videos and len(videos) > 0:
-        try:
-            bq_writer.load_videos(videos, table_id='travel_videos')
-            success_count += 1
-        except Exception as e:
-            print(f"✗ Failed to load videos: {e}")
-            raise
-    
-    if comments and len(comments) > 0:
+
+    # MySQL 적재 때 만든 스테이징 파일이 있으면 그대로 사용 (없으면 XCom 데이터를 스테이징)
+    staging_paths = ti.xcom_pull(task_ids='yt_load_mysql', key='staging_paths') or {}
+    sources = {
+        'channels': channels,
+        'videos': videos,
+        'comments': comments,
+    }
+    for name, path in staging_paths.items():
+        if path and os.path.exists(path):
+            sources[name] = path
+        else:
+            print(f"⚠️ Staging file for {name} not found ({path}), loading from XCom data")
+
+    loaders = (
+        ('channels', bq_writer.load_channels, 'travel_channels'),
+        ('videos', bq_writer.load_videos, 'travel_videos'),
+        ('comments', bq_writer.load_comments, 'travel_comments'),
+    )
+    for name, load, table_id in loaders:
+        if not sources[name]:
+            continue
         try:
-            bq_writer.load_comments(comments, table_id='travel_comments')
+            load(sources[name], table_id=table_id)
             success_count += 1
         except Exception as e:
-            print(f"✗ Failed to load comments: {e}")
+            print(f"✗ Failed to load {name}: {e}")
             raise
     
     print(f"\n{'='*60}")
@@ -700,6 +714,13 @@ load_mysql_task = PythonOperator(
     dag=dag,
 )
 
+refresh_rank_features_task = PythonOperator(
+    task_id='yt_refresh_rank_features',
+    python_callable=refresh_rank_features,
+    provide_context=True,
+    dag=dag,
+)
+
 # BigQuery 적재는 기본 비활성화(로컬 환경). 환경변수로만 켭니다.
 ENABLE_BQ = str(os.environ.get('AIRFLOW_ENABLE_BIGQUERY', 'false')).lower() in ('1', 'true', 'yes')
 
@@ -716,4 +737,5 @@ if ENABLE_BQ:
     collect_videos_task >> collect_comments_task >> load_mysql_task >> load_bigquery_task
 else:
     collect_videos_task >> collect_comments_task >> load_mysql_task
+load_mysql_task >> refresh_rank_features_task
 
@@ -0,0 +1,114 @@
+"""
+Bento video-detail 전송 포맷 벤치마크 (네트워크/모델 없음)
+- v1: JSON 요청(댓글 dict 목록) + JSON 응답(top_comments에 댓글 본문 포함) → response.json() + VideoAnalysis 검증
+- v2: msgpack 요청(댓글 컬럼 배열) + msgpack 응답(top_comments는 comment_id 참조) → 디코드 + 본문 복원 + 검증
+합성 댓글 N개(기본 150), top_comments 20개 기준으로 바이트 수와 인코딩/파싱 시간을 출력
+
+사용법:
+    cd backend && python scripts/benchmark_bento_wire_format.py [--comments 150] [--repeat 2000]
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+backend_root = Path(__file__).parent.parent
+if str(backend_root) not in sys.path:
+    sys.path.insert(0, str(backend_root))
+
+from app.clients import wire_format
+from app.schemas.video import VideoAnalysis
+
+WORDS = ["여행", "브이로그", "풍경", "숙소", "맛집", "최고", "추천", "다음에", "꼭", "가보고", "싶어요", "영상", "감사합니다", "일본", "제주도"]
+
+
+def make_comments(n, rng):
+    return [
+        {
+            "comment_id": f"Ugz{rng.getrandbits(64):016x}",
+            "text": " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 40))),
+            "like_count": rng.randrange(500),
+        }
+        for _ in range(n)
+    ]
+
+
+def make_result(comments, rng, top_n=20):
+    top = sorted(comments, key=lambda c: c["like_count"], reverse=True)[:top_n]
+    return {
+        "video_id": "vid0001",
+        "sentiment_ratio": {"pos": 0.7, "neu": 0.0, "neg": 0.3},
+        "top_comments": [
+            {**c, "label": rng.choice(["pos", "neg"]), "score": rng.random()} for c in top
+        ],
+        "top_keywords": [{"keyword": w, "weight": float(rng.randrange(1, 50))} for w in WORDS[:12]],
+        "model": {"sentiment_model": "sentiment_onnx", "version": "v1"},
+    }
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        out = fn()
+    return out, (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--comments", type=int, default=150)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+    if not wire_format.msgpack_available():
+        print("msgpack is not installed (pip install msgpack)")
+        return 1
+
+    rng = random.Random(42)
+    comments = make_comments(args.comments, rng)
+    result = make_result(comments, rng)
+    compact_result = {
+        **result,
+        "top_comments": wire_format.compact_top_comments(result["top_comments"]),
+        "comment_refs": True,
+    }
+    v1_request = {"request": {"video_id": "vid0001", "title": "제목", "description": "설명", "comments": comments}}
+
+    def v1_encode():
+        return json.dumps(v1_request).encode("utf-8")  # httpx json= 와 같은 기본 json.dumps
+
+    def v2_encode():
+        return wire_format.encode(
+            wire_format.build_request("vid0001", "제목", "설명", comments), wire_format.MEDIA_MSGPACK
+        )
+
+    v1_response = json.dumps(result).encode("utf-8")  # Bento JSON 응답 (ensure_ascii 기본값)
+    v2_response = wire_format.encode(compact_result, wire_format.MEDIA_MSGPACK)
+
+    def v1_parse():
+        return VideoAnalysis.model_validate(json.loads(v1_response))
+
+    def v2_parse():
+        data = wire_format.decode(v2_response, wire_format.MEDIA_MSGPACK)
+        data.pop("comment_refs", None)
+        data["top_comments"] = wire_format.expand_top_comments(data["top_comments"], comments)
+        return VideoAnalysis.model_validate(data)
+
+    v1_req, v1_enc_ms = timed(v1_encode, args.repeat)
+    v2_req, v2_enc_ms = timed(v2_encode, args.repeat)
+    v1_model, v1_parse_ms = timed(v1_parse, args.repeat)
+    v2_model, v2_parse_ms = timed(v2_parse, args.repeat)
+
+    same = v1_model.model_dump() == v2_model.model_dump()
+    print(f"comments={args.comments}, top_comments={len(result['top_comments'])}, repeat={args.repeat}")
+    print(f"{'':12}{'v1 json':>14}{'v2 msgpack':>14}{'ratio':>8}")
+    print(f"{'request B':12}{len(v1_req):>14}{len(v2_req):>14}{len(v2_req) / len(v1_req):>8.2f}")
+    print(f"{'response B':12}{len(v1_response):>14}{len(v2_response):>14}{len(v2_response) / len(v1_response):>8.2f}")
+    print(f"{'encode ms':12}{v1_enc_ms:>14.3f}{v2_enc_ms:>14.3f}{v2_enc_ms / v1_enc_ms:>8.2f}")
+    print(f"{'parse ms':12}{v1_parse_ms:>14.3f}{v2_parse_ms:>14.3f}{v2_parse_ms / v1_parse_ms:>8.2f}")
+    print(f"same VideoAnalysis: {same}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
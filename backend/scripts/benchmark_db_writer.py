@@ -0,0 +1,158 @@
+"""
+MySQLWriter 적재 전 변환 벤치마크 (DB 연결 없음)
+- 기존 방식: tags apply + iterrows로 행마다 파라미터 dict 생성
+- 현재 방식: db_writer.normalize_videos / normalize_comments (컬럼 단위 정규화 + itertuples)
+합성 데이터 N행(기본 100k)에 대해 변환 시간과 결과 일치 여부를 출력
+
+사용법 (Airflow 컨테이너 또는 airflow/google-cloud-bigquery가 설치된 환경):
+    cd backend && python scripts/benchmark_db_writer.py [--rows 100000]
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+backend_root = Path(__file__).parent.parent
+utils_path = str(backend_root / 'utils')
+if utils_path not in sys.path:
+    sys.path.insert(0, utils_path)
+
+import pandas as pd
+
+from db_writer import normalize_comments, normalize_videos
+
+
+def make_videos(n, rng):
+    videos = []
+    for i in range(n):
+        videos.append({
+            'id': f'vid{i % (n - n // 50)}',  # 약 2% 중복 id
+            'video_id': f'vid{i % (n - n // 50)}',
+            'channel_id': f'UC{rng.randrange(500):022d}',
+            'title': f'여행 영상 {i}',
+            'description': None if i % 7 == 0 else f'설명 {i}',
+            'published_at': f'2025-0{rng.randrange(1, 10)}-1{rng.randrange(10)}T0{rng.randrange(10)}:00:00Z',
+            'duration': 'PT10M',
+            'view_count': rng.randrange(1_000_000),
+            'like_count': rng.randrange(10_000),
+            'comment_count': rng.randrange(1_000),
+            'category_id': 19,
+            'tags': [] if i % 5 == 0 else ['여행', f'tag{i % 100}'],
+            'thumbnail_url': 'https://i.ytimg.com/vi/x/default.jpg',
+            'keyword': None,
+            'region': 'KR',
+        })
+    return videos
+
+
+def make_comments(n, rng):
+    return [{
+        'id': f'c{i}',
+        'video_id': f'vid{rng.randrange(5000)}',
+        'parent_id': None,
+        'author_name': f'user{i % 1000}',
+        'text': f'좋은 영상 감사합니다 {i}',
+        'like_count': None if i % 9 == 0 else rng.randrange(100),
+        'published_at': '2025-03-01T12:00:00Z',
+        'language': 'ko',
+    } for i in range(n)]
+
+
+def legacy_videos(videos, keyword):
+    df = pd.DataFrame(videos)
+    df['published_at'] = pd.to_datetime(df['published_at'])
+    if keyword:
+        df['keyword'] = keyword
+    if 'tags' in df.columns:
+        df['tags'] = df['tags'].apply(lambda x: None if x is None or (isinstance(x, list) and len(x) == 0) else json.dumps(x) if isinstance(x, list) else x)
+    rows = []
+    for _, row in df.iterrows():
+        rows.append({
+            'id': row['id'],
+            'channel_id': row['channel_id'],
+            'title': row['title'],
+            'description': row.get('description', ''),
+            'published_at': row['published_at'],
+            'duration': row.get('duration', ''),
+            'view_count': row.get('view_count', 0),
+            'like_count': row.get('like_count', 0),
+            'comment_count': row.get('comment_count', 0),
+            'category_id': row.get('category_id', 0),
+            'tags': row.get('tags'),
+            'thumbnail_url': row.get('thumbnail_url', ''),
+            'keyword': row.get('keyword'),
+            'region': row.get('region', 'KR'),
+        })
+    return rows
+
+
+def legacy_comments(comments):
+    df = pd.DataFrame(comments)
+    df['published_at'] = pd.to_datetime(df['published_at'])
+    rows = []
+    for _, row in df.iterrows():
+        rows.append({
+            'id': row['id'],
+            'video_id': row['video_id'],
+            'parent_id': row.get('parent_id'),
+            'author_name': row['author_name'],
+            'text': row['text'],
+            'like_count': row.get('like_count', 0),
+            'published_at': row['published_at'],
+            'language': row.get('language', 'ko'),
+        })
+    return rows
+
+
+def _time(fn):
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    videos = make_videos(args.rows, rng)
+    comments = make_comments(args.rows, rng)
+
+    print(f"{'':>10} {'legacy ms':>10} {'vectorized ms':>14} {'speedup':>8} {'rows in/out':>16}")
+    for name, records, legacy, current in (
+        ('videos', videos, lambda: legacy_videos(videos, 'travel'), lambda: normalize_videos(videos, keyword='travel')),
+        ('comments', comments, lambda: legacy_comments(comments), lambda: normalize_comments(comments)),
+    ):
+        legacy_ms, legacy_rows = _time(legacy)
+        current_ms, current_rows = _time(current)
+        print(
+            f"{name:>10} {legacy_ms:>10.0f} {current_ms:>14.0f} {legacy_ms / max(current_ms, 1e-9):>7.1f}x "
+            f"{len(legacy_rows):>7}/{len(current_rows):<7}"
+        )
+        # 마지막 값 기준 id별 비교 (기존 방식은 배치 내 중복 id를 그대로 보냄)
+        last_legacy = {row['id']: row for row in legacy_rows}
+        sample = current_rows[:: max(1, len(current_rows) // 1000)]
+        mismatched = 0
+        for row in sample:
+            expected = last_legacy[row[0]]
+            for value, key in zip(row, expected):
+                old = expected[key]
+                if pd.isna(old) if not isinstance(old, (list, str)) else False:
+                    old = None
+                if key == 'published_at' and old is not None:
+                    old = old.tz_localize(None) if old.tzinfo else old
+                if key == 'description' and old is None:
+                    old = ''  # 기존 방식은 None을 그대로 보냄 (row.get은 누락 키에만 기본값 적용)
+                if key == 'like_count' and old is None:
+                    old = 0
+                if value != old:
+                    mismatched += 1
+                    break
+        print(f"{'':>10} sampled {len(sample)} rows, mismatched: {mismatched}")
+
+
+if __name__ == '__main__':
+    main()
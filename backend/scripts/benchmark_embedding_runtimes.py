@@ -0,0 +1,98 @@
+"""
+MiniLM 임베딩 런타임 비교 벤치마크 (PyTorch vs int8 ONNX)
+고정 코퍼스에 대해 배치 크기별 지연 시간, 임베딩 코사인 일치도, 키워드 Top-K 일치율을 출력
+
+사용법:
+    cd backend && python scripts/benchmark_embedding_runtimes.py [--repeat 5] [--threads 1]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+backend_root = Path(__file__).parent.parent
+if str(backend_root) not in sys.path:
+    sys.path.insert(0, str(backend_root))
+
+try:
+    import numpy as np
+    from app.services.embeddings import load_keyword_pool, load_torch_model
+    from app.services.keyword_tagging import normalize_rows
+    from app.utils.similarity import top_k_indices
+    from app.services.onnx_embeddings import OnnxSentenceEncoder
+except ImportError as e:
+    print(f"필요한 패키지 설치: pip install -r requirements.txt onnxruntime ({e})")
+    sys.exit(1)
+
+# 고정 코퍼스 (여행 영상 제목/설명 형태)
+CORPUS = [
+    "제주도 3박 4일 여행 브이로그 | 오름, 바다, 맛집 총정리",
+    "도쿄 혼자 여행 첫날 시부야 신주쿠 야경 투어",
+    "Bangkok street food tour: 10 dishes you must try",
+    "스위스 융프라우 기차 여행, 눈 덮인 알프스의 절경",
+    "부산 해운대 광안리 1박 2일 코스 추천 (숙소 포함)",
+    "Paris in 48 hours - Eiffel tower, Louvre and hidden cafes",
+    "강릉 감성 카페 투어와 경포대 일출 산책",
+    "다낭 가족 여행 리조트 후기, 아이와 함께 가기 좋은 곳",
+    "Iceland road trip: waterfalls, glaciers and northern lights",
+    "오사카 유니버설 스튜디오 완벽 공략 꿀팁",
+    "치앙마이 한 달 살기 비용 정리와 디지털 노마드 일상",
+    "뉴욕 맨해튼 브루클린 브릿지 걷기, 가을 풍경",
+    "전주 한옥마을 한복 체험과 비빔밥 맛집",
+    "Bali surf camp and rice terrace hiking vlog",
+    "몰디브 수상 빌라 허니문 럭셔리 휴양",
+    "경주 역사 유적지 자전거 여행, 첨성대와 불국사",
+]
+
+
+def _time_encode(encoder, texts, batch_size, repeat):
+    encoder.encode(texts[:2], batch_size=batch_size)  # warmup
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        encoder.encode(texts, batch_size=batch_size, convert_to_numpy=True, show_progress_bar=False)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=1, help="ONNX intra-op threads")
+    parser.add_argument("--top-k", type=int, default=7)
+    args = parser.parse_args()
+
+    print("📦 모델 로드")
+    start = time.perf_counter()
+    torch_model = load_torch_model()
+    torch_load_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    onnx_model = OnnxSentenceEncoder(intra_op_threads=args.threads, inter_op_threads=1)
+    onnx_load_ms = (time.perf_counter() - start) * 1000
+    print(f"   - load: torch={torch_load_ms:.0f}ms onnx-int8={onnx_load_ms:.0f}ms")
+
+    print("\n⏱  지연 시간 (median, ms)")
+    print(f"{'batch':>6} {'torch':>10} {'onnx-int8':>10} {'speedup':>8}")
+    for batch_size in (1, 8, len(CORPUS)):
+        texts = CORPUS[:batch_size]
+        t_ms = _time_encode(torch_model, texts, batch_size, args.repeat)
+        o_ms = _time_encode(onnx_model, texts, batch_size, args.repeat)
+        print(f"{batch_size:>6} {t_ms:>10.2f} {o_ms:>10.2f} {t_ms / max(o_ms, 1e-9):>7.2f}x")
+
+    print("\n🎯 정확도")
+    torch_vecs = normalize_rows(torch_model.encode(CORPUS, convert_to_numpy=True, show_progress_bar=False))
+    onnx_vecs = normalize_rows(onnx_model.encode(CORPUS))
+    cosines = np.sum(torch_vecs * onnx_vecs, axis=1)
+    print(f"   - 임베딩 코사인 일치도: mean={cosines.mean():.4f} min={cosines.min():.4f}")
+
+    keywords = load_keyword_pool()
+    kw_matrix = normalize_rows(torch_model.encode(keywords, convert_to_numpy=True, show_progress_bar=False))
+    torch_top = top_k_indices(torch_vecs @ kw_matrix.T, args.top_k)
+    onnx_top = top_k_indices(onnx_vecs @ kw_matrix.T, args.top_k)
+    overlap = [len(set(a) & set(b)) / args.top_k for a, b in zip(torch_top.tolist(), onnx_top.tolist())]
+    print(f"   - 키워드 Top-{args.top_k} 일치율: {np.mean(overlap) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+점수 계산 마이크로 벤치마크: 단건(루프) vs 배치(벡터화 + argpartition)
+- services/scoring.py: calculate_personalized_score vs calculate_personalized_scores
+- recommendation/ranking.py: compute_final_score vs compute_final_scores
+후보 수 N = 1e3 ~ 1e6 에 대해 median 시간과 결과 일치 여부를 출력
+
+사용법:
+    cd backend && python scripts/benchmark_scoring.py [--dim 384] [--max-n 1000000] [--scalar-max-n 100000]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+backend_root = Path(__file__).parent.parent
+if str(backend_root) not in sys.path:
+    sys.path.insert(0, str(backend_root))
+
+import numpy as np
+
+from app.recommendation.ranking import compute_final_score, compute_final_scores
+from app.services.scoring import (
+    build_topic_matrix,
+    calculate_personalized_score,
+    calculate_personalized_scores,
+    calculate_topic_scores,
+)
+from app.utils.similarity import top_k_indices
+
+TOPICS = ["beach", "city", "food", "mountain", "culture", "nature", "shopping", "night"]
+
+
+def _median_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _make_data(n, dim, rng):
+    embeddings = rng.standard_normal((n, dim), dtype=np.float32)
+    video_topics = [
+        {TOPICS[j]: float(w) for j, w in zip(rng.choice(len(TOPICS), 2, replace=False), rng.random(2))}
+        for _ in range(n)
+    ]
+    return {
+        "embeddings": embeddings,
+        "video_topics": video_topics,
+        "sentiments": rng.random(n).astype(np.float32),
+        "pos_ratio": rng.random(n),
+        "avg_score": rng.random(n),
+        "topic_score": rng.random(n),
+        "topic_id": rng.integers(0, 10, n),
+        "views": rng.integers(0, 10_000_000, n),
+    }
+
+
+def bench_personalized(data, user_pref, k, repeat, run_scalar):
+    n = len(data["sentiments"])
+    topic_matrix, topic_names = build_topic_matrix(data["video_topics"])
+
+    def batch():
+        topic_scores = calculate_topic_scores(user_pref["topics"], topic_matrix, topic_names)
+        scores = calculate_personalized_scores(user_pref, data["embeddings"], topic_scores, data["sentiments"])
+        return top_k_indices(scores["final_score"], k), scores["final_score"]
+
+    batch_ms = _median_ms(batch, repeat)
+    scalar_ms = None
+    max_diff = None
+    if run_scalar:
+        embeddings_list = data["embeddings"].tolist()
+
+        def scalar():
+            finals = [
+                calculate_personalized_score(
+                    user_pref,
+                    {"embedding": embeddings_list[i], "topics": data["video_topics"][i], "sentiment": float(data["sentiments"][i])},
+                )["final_score"]
+                for i in range(n)
+            ]
+            return sorted(range(n), key=lambda i: finals[i], reverse=True)[:k], finals
+
+        scalar_ms = _median_ms(scalar, 1)
+        _, finals = scalar()
+        max_diff = float(np.max(np.abs(np.asarray(finals) - batch()[1])))  # 단건은 소수 4자리 반올림
+    return batch_ms, scalar_ms, max_diff
+
+
+def bench_ranking(data, k, repeat, run_scalar):
+    n = len(data["views"])
+    target = 3
+
+    def batch():
+        scores = compute_final_scores(
+            data["pos_ratio"], data["avg_score"], data["topic_score"], data["topic_id"], target, data["views"]
+        )
+        return top_k_indices(scores, k), scores
+
+    batch_ms = _median_ms(batch, repeat)
+    scalar_ms = None
+    max_diff = None
+    if run_scalar:
+        columns = [data[c].tolist() for c in ("pos_ratio", "avg_score", "topic_score", "topic_id", "views")]
+
+        def scalar():
+            scores = [
+                compute_final_score(pr, av, ts, tid, target, v)
+                for pr, av, ts, tid, v in zip(*columns)
+            ]
+            return sorted(range(n), key=lambda i: scores[i], reverse=True)[:k], scores
+
+        scalar_ms = _median_ms(scalar, 1)
+        _, scores = scalar()
+        max_diff = float(np.max(np.abs(np.asarray(scores) - batch()[1])))
+    return batch_ms, scalar_ms, max_diff
+
+
+def _fmt(value, spec):
+    return format(value, spec) if value is not None else "-"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--max-n", type=int, default=1_000_000)
+    parser.add_argument("--scalar-max-n", type=int, default=100_000, help="단건 루프는 이 N까지만 측정")
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    user_pref = {
+        "embedding": rng.standard_normal(args.dim).tolist(),
+        "topics": {t: float(s) for t, s in zip(TOPICS, rng.random(len(TOPICS)))},
+        "sentiment_weight": 0.3,
+    }
+
+    header = f"{'N':>9} {'batch ms':>10} {'scalar ms':>10} {'speedup':>8} {'max|diff|':>10}"
+    sizes = [n for n in (1_000, 10_000, 100_000, 1_000_000) if n <= args.max_n]
+    results = {"scoring.calculate_personalized_score(s)": [], "ranking.compute_final_score(s)": []}
+    for n in sizes:
+        data = _make_data(n, args.dim, rng)
+        run_scalar = n <= args.scalar_max_n
+        results["scoring.calculate_personalized_score(s)"].append(
+            (n, *bench_personalized(data, user_pref, args.top_k, args.repeat, run_scalar))
+        )
+        results["ranking.compute_final_score(s)"].append(
+            (n, *bench_ranking(data, args.top_k, args.repeat, run_scalar))
+        )
+        del data
+
+    for name, rows in results.items():
+        print(f"\n⏱  {name} (dim={args.dim}, top_k={args.top_k})")
+        print(header)
+        for n, batch_ms, scalar_ms, max_diff in rows:
+            speedup = scalar_ms / max(batch_ms, 1e-9) if scalar_ms is not None else None
+            print(
+                f"{n:>9} {batch_ms:>10.2f} {_fmt(scalar_ms, '>10.2f')} "
+                f"{_fmt(speedup, '>7.1f')}{'x' if speedup is not None else ' '} {_fmt(max_diff, '>10.2e')}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+영상 목록 직렬화 벤치마크: ORM → VideoResponse(Pydantic) vs 조인 튜플 → dict → bytes
+- 기존: db.query(Video) + 채널 IN 쿼리 + 필드별 dict + VideoResponse.model_validate + model_dump_json
+- 공통 계층: services/video_serialization.fetch_video_dicts (조인 쿼리 1회) + dumps
+- ORM 목록(유사/다양화 추천): 기존 model_validate 경로 vs serialize_videos(LRU 채널명)
+limit = 100 / 500 에 대해 median 시간과 결과 일치 여부를 출력
+
+기본은 SQLite 메모리 DB에 합성 데이터를 넣어 측정 (쿼리 시간 비중은 실제 MySQL과 다름).
+실제 DB로 측정하려면 --db-url mysql+pymysql://... (테이블/데이터는 그대로 읽기만 함)
+
+사용법:
+    cd backend && python scripts/benchmark_serialization.py [--limits 100,500] [--repeat 20] [--db-url ...]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+backend_root = Path(__file__).parent.parent
+if str(backend_root) not in sys.path:
+    sys.path.insert(0, str(backend_root))
+
+# app.core.database import 시 환경 변수 검증을 통과하기 위한 값 (벤치마크는 자체 엔진 사용)
+for _name, _value in (("DB_USER", "bench"), ("DB_PASSWORD", "bench"), ("DB_HOST", "127.0.0.1")):
+    os.environ.setdefault(_name, _value)
+
+from sqlalchemy import create_engine, desc
+from sqlalchemy.orm import sessionmaker
+
+from app.crud import video as crud_video
+from app.models.channel import Channel
+from app.models.video import Video
+from app.schemas.video import VideoListResponse, VideoResponse
+from app.services import video_serialization
+
+
+def _median_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _seed(session, n_videos, n_channels):
+    now = datetime(2025, 1, 1)
+    session.add_all(Channel(id=f"UC{i:06d}", title=f"여행 채널 {i}") for i in range(n_channels))
+    session.add_all(
+        Video(
+            id=f"v{i:08d}",
+            channel_id=f"UC{i % n_channels:06d}",
+            title=f"여행 영상 {i} 제주도 브이로그",
+            description="오늘은 제주도 여행 " * 20,
+            published_at=now - timedelta(minutes=i),
+            duration="PT10M30S",
+            duration_sec=630,
+            view_count=(i * 7919) % 1_000_000,
+            like_count=(i * 104729) % 50_000,
+            comment_count=i % 500,
+            category_id=19,
+            tags=["여행", "제주", f"tag{i % 50}"],
+            thumbnail_url=f"https://i.ytimg.com/vi/v{i:08d}/hqdefault.jpg",
+            keyword="travel",
+            region="KR",
+            is_shorts=False,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(n_videos)
+    )
+    session.commit()
+
+
+def legacy_list(db, limit):
+    """기존 경로: ORM 조회 + 채널 IN 쿼리 + Pydantic 검증/직렬화"""
+    videos = db.query(Video).filter(Video.duration_sec >= 240).order_by(
+        desc(Video.published_at)
+    ).limit(limit).all()
+    return legacy_serialize(db, videos)
+
+
+def legacy_serialize(db, videos):
+    channel_ids = {v.channel_id for v in videos if v.channel_id}
+    rows = db.query(Channel.id, Channel.title).filter(Channel.id.in_(channel_ids)).all()
+    channel_name_map = {channel_id: title for channel_id, title in rows}
+    responses = []
+    for v in videos:
+        video_dict = {
+            "id": v.id,
+            "channel_id": v.channel_id,
+            "channel_name": channel_name_map.get(v.channel_id),
+            "title": v.title,
+            "description": v.description,
+            "published_at": v.published_at,
+            "duration": v.duration,
+            "duration_sec": v.duration_sec,
+            "view_count": v.view_count,
+            "like_count": v.like_count,
+            "comment_count": v.comment_count,
+            "category_id": v.category_id,
+            "tags": v.tags,
+            "thumbnail_url": v.thumbnail_url,
+            "keyword": v.keyword,
+            "region": v.region,
+            "is_shorts": v.is_shorts,
+            "created_at": v.created_at,
+            "updated_at": v.updated_at,
+        }
+        responses.append(VideoResponse.model_validate(video_dict))
+    return VideoListResponse(videos=responses, total=len(responses)).model_dump_json().encode()
+
+
+def shared_list(db, limit):
+    """공통 계층: 조인 튜플 조회 + dict 직접 생성 + bytes"""
+    items = video_serialization.fetch_video_dicts(db, crud_video.latest_videos_stmt(skip=0, limit=limit))
+    return video_serialization.dumps(video_serialization.video_list_payload(items))
+
+
+def shared_serialize(db, videos):
+    channel_name_map = video_serialization.get_channel_name_map(db, videos)
+    items = video_serialization.serialize_videos(videos, channel_name_map)
+    return video_serialization.dumps(video_serialization.video_list_payload(items))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limits", default="100,500")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--db-url", default=None, help="기본: SQLite 메모리 DB + 합성 데이터")
+    parser.add_argument("--videos", type=int, default=5000)
+    parser.add_argument("--channels", type=int, default=300)
+    args = parser.parse_args()
+
+    engine = create_engine(args.db_url or "sqlite://")
+    Session = sessionmaker(bind=engine)
+    if not args.db_url:
+        Channel.__table__.create(engine)
+        Video.__table__.create(engine)
+        with Session() as session:
+            _seed(session, args.videos, args.channels)
+
+    print(f"{'case':<28}{'limit':>7}{'legacy ms':>12}{'shared ms':>12}{'speedup':>9}  match")
+    for limit in [int(x) for x in args.limits.split(",")]:
+        with Session() as db:
+            legacy = json.loads(legacy_list(db, limit))
+            shared = json.loads(shared_list(db, limit))
+            match = legacy == shared
+            legacy_ms = _median_ms(lambda: legacy_list(db, limit), args.repeat)
+            shared_ms = _median_ms(lambda: shared_list(db, limit), args.repeat)
+        print(f"{'query+serialize (trends)':<28}{limit:>7}{legacy_ms:>12.2f}{shared_ms:>12.2f}"
+              f"{legacy_ms / shared_ms:>8.1f}x  {match}")
+
+        with Session() as db:
+            videos = db.query(Video).order_by(desc(Video.published_at)).limit(limit).all()
+            video_serialization.channel_name_cache.clear()
+            match = json.loads(legacy_serialize(db, videos)) == json.loads(shared_serialize(db, videos))
+            legacy_ms = _median_ms(lambda: legacy_serialize(db, videos), args.repeat)
+            shared_ms = _median_ms(lambda: shared_serialize(db, videos), args.repeat)
+        print(f"{'serialize ORM (similar)':<28}{limit:>7}{legacy_ms:>12.2f}{shared_ms:>12.2f}"
+              f"{legacy_ms / shared_ms:>8.1f}x  {match}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Bento 스텁 서버 + 풀링 클라이언트 부하 확인용 스크립트
+- /health, /v1/video-detail 을 흉내내는 FastAPI 앱 (지연/실패율 조절 가능)
+- 실제 모델 없이 app/clients/http.py 의 연결 재사용, 타임아웃, 서킷 브레이커 동작 확인
+
+사용법:
+    cd backend && python scripts/bento_stub_server.py --port 3001 --latency-ms 80 --fail-rate 0.1
+    BENTO_BASE_URL=http://localhost:3001 uvicorn app.main:app   # 백엔드를 스텁으로 연결
+    python scripts/bento_stub_server.py --drive --requests 500 --concurrency 50   # 스텁 기동 + 클라이언트 부하
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+backend_root = Path(__file__).parent.parent
+if str(backend_root) not in sys.path:
+    sys.path.insert(0, str(backend_root))
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, HTTPException
+
+
+def create_app(latency_ms: float, fail_rate: float) -> FastAPI:
+    app = FastAPI(title="bento-stub")
+
+    async def _simulate() -> None:
+        if latency_ms > 0:
+            await asyncio.sleep(random.uniform(0.5, 1.5) * latency_ms / 1000)
+        if fail_rate > 0 and random.random() < fail_rate:
+            raise HTTPException(status_code=503, detail="stub failure")
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok", "stub": True}
+
+    @app.post("/v1/video-detail")
+    async def video_detail(body: dict):
+        await _simulate()
+        request = body.get("request", {})
+        comments = request.get("comments", [])
+        return {
+            "video_id": request.get("video_id"),
+            "sentiment_ratio": {"pos": 60, "neg": 10, "neu": 30},
+            "top_keywords": ["여행", "맛집"],
+            "top_comments": [
+                {"comment_id": c.get("comment_id"), "text": c.get("text", ""), "label": "pos", "score": 0.9}
+                for c in comments[:5]
+            ],
+        }
+
+    return app
+
+
+async def drive(port: int, requests: int, concurrency: int) -> None:
+    """공유 ManagedClient로 스텁에 동시 요청을 보내고 지연/브레이커 지표 출력"""
+    from app.clients.http import CircuitOpenError, ManagedClient
+
+    client = ManagedClient(
+        name="bento-stub",
+        base_url=f"http://127.0.0.1:{port}",
+        env_prefix="BENTO",
+        default_timeout=httpx.Timeout(10.0, connect=5.0),
+    )
+    payload = {
+        "request": {
+            "video_id": "stub",
+            "title": "",
+            "description": "",
+            "comments": [{"comment_id": str(i), "text": f"댓글 {i}", "like_count": i} for i in range(150)],
+        }
+    }
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    outcomes = {"ok": 0, "http_error": 0, "transport_error": 0, "circuit_open": 0}
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await client.post("/v1/video-detail", json=payload)
+                outcomes["ok"] += 1
+                latencies.append((time.perf_counter() - start) * 1000)
+            except CircuitOpenError:
+                outcomes["circuit_open"] += 1
+            except httpx.HTTPStatusError:
+                outcomes["http_error"] += 1
+            except httpx.TransportError:
+                outcomes["transport_error"] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    await client.aclose()
+
+    print(f"[Stub] {requests} requests, concurrency={concurrency}, {requests / elapsed:.1f} req/s")
+    print(f"[Stub] outcomes: {outcomes}")
+    if latencies:
+        ordered = sorted(latencies)
+        print(
+            f"[Stub] ok latency ms: p50={statistics.median(ordered):.1f} "
+            f"p95={ordered[int(len(ordered) * 0.95) - 1]:.1f} max={ordered[-1]:.1f}"
+        )
+    print(f"[Stub] client stats: {client.stats()}")
+
+
+async def serve_and_drive(args) -> None:
+    config = uvicorn.Config(create_app(args.latency_ms, args.fail_rate), host="127.0.0.1", port=args.port, log_level="warning")
+    server = uvicorn.Server(config)
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+    try:
+        await drive(args.port, args.requests, args.concurrency)
+    finally:
+        server.should_exit = True
+        await task
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--drive", action="store_true", help="스텁을 띄우고 풀링 클라이언트로 부하를 보낸 뒤 종료")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.drive:
+        asyncio.run(serve_and_drive(args))
+    else:
+        uvicorn.run(create_app(args.latency_ms, args.fail_rate), host="0.0.0.0", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+키워드 풀 임베딩 행렬을 오프라인으로 생성하는 스크립트
+- app/data/keyword_pool.json의 키워드를 MiniLM으로 인코딩
+- 행 단위 L2 정규화 후 float32 .npy로 저장 (서버에서 mmap으로 로드)
+- 키워드 순서/모델 정보는 keyword_embeddings.json에 함께 저장
+
+사용법:
+    cd backend && python scripts/build_keyword_embeddings.py
+"""
+import json
+import sys
+from pathlib import Path
+
+backend_root = Path(__file__).parent.parent
+if str(backend_root) not in sys.path:
+    sys.path.insert(0, str(backend_root))
+
+try:
+    import numpy as np
+    from app.services.embeddings import EMBEDDING_MODEL_NAME, get_model, load_keyword_pool
+    from app.services.keyword_tagging import (
+        KEYWORD_MATRIX_META_PATH,
+        KEYWORD_MATRIX_PATH,
+        normalize_rows,
+    )
+except ImportError as e:
+    print(f"필요한 패키지 설치: pip install -r requirements.txt ({e})")
+    sys.exit(1)
+
+
+def main() -> None:
+    keywords = load_keyword_pool()
+    print(f"📦 키워드 {len(keywords)}개 인코딩 중...")
+
+    model = get_model()
+    embeddings = model.encode(keywords, convert_to_numpy=True, show_progress_bar=True)
+    matrix = normalize_rows(embeddings)
+
+    matrix_path = Path(KEYWORD_MATRIX_PATH)
+    meta_path = Path(KEYWORD_MATRIX_META_PATH)
+    matrix_path.parent.mkdir(parents=True, exist_ok=True)
+
+    np.save(matrix_path, matrix)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "model": EMBEDDING_MODEL_NAME,
+                "dim": int(matrix.shape[1]),
+                "normalized": True,
+                "keywords": list(keywords),
+            },
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+
+    print(f"✅ 저장 완료: {matrix_path} (shape={matrix.shape}, dtype={matrix.dtype})")
+    print(f"   - 메타데이터: {meta_path}")
+
+
+if __name__ == "__main__":
+    main()
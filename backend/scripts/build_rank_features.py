@@ -0,0 +1,34 @@
+"""
+랭킹 피처 테이블(video_rank_features) 갱신 스크립트
+- videos ⨝ video_sentiment_agg ⟕ video_topics(대표 토픽)를 영상당 한 행으로 다시 계산해 upsert
+- 원본에서 사라진 영상 행은 삭제
+- 감정/토픽 집계 파이프라인이 끝난 뒤 (또는 주기적으로) 실행
+
+사용법:
+    cd backend && python scripts/build_rank_features.py
+"""
+import sys
+from pathlib import Path
+
+backend_root = Path(__file__).parent.parent
+if str(backend_root) not in sys.path:
+    sys.path.insert(0, str(backend_root))
+
+from app.core.database import SessionLocal
+from app.recommendation.repository import refresh_rank_features
+
+
+def main() -> None:
+    db = SessionLocal()
+    try:
+        stats = refresh_rank_features(db)
+        print(
+            f"[RankFeatures] ✓ upserted={stats['upserted']} deleted={stats['deleted']} "
+            f"in {stats['elapsed_ms']}ms (refreshed_at={stats['refreshed_at']})"
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+all-MiniLM-L6-v2 모델을 ONNX로 변환하고 int8 동적 양자화하는 스크립트
+결과물은 app/services/onnx_embeddings.py (EMBEDDING_RUNTIME=onnx)에서 사용
+
+출력 (기본: backend/models/embeddings/minilm_onnx):
+  - model.onnx        : fp32 ONNX
+  - model.int8.onnx   : int8 동적 양자화 ONNX (서버 기본값)
+  - tokenizer.json 등 : 토크나이저 파일
+"""
+import os
+import sys
+from pathlib import Path
+
+# 모델 경로 설정
+backend_root = Path(__file__).parent.parent
+model_name = "sentence-transformers/all-MiniLM-L6-v2"
+output_dir = Path(os.getenv("EMBEDDING_ONNX_DIR", str(backend_root / "models" / "embeddings" / "minilm_onnx")))
+
+try:
+    from transformers import AutoTokenizer, AutoModel
+    import torch
+    import onnxruntime as ort
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+except ImportError:
+    print("필요한 패키지 설치: pip install transformers torch onnxruntime")
+    sys.exit(1)
+
+output_dir.mkdir(parents=True, exist_ok=True)
+fp32_path = output_dir / "model.onnx"
+int8_path = output_dir / "model.int8.onnx"
+
+print(f"📦 모델 로드: {model_name}")
+tokenizer = AutoTokenizer.from_pretrained(model_name)
+model = AutoModel.from_pretrained(model_name)
+model.eval()
+
+# 토크나이저 저장 (tokenizer.json은 tokenizers 라이브러리로 바로 로드)
+tokenizer.save_pretrained(str(output_dir))
+
+dummy_input = tokenizer(["테스트 문장입니다"], return_tensors="pt", padding=True, truncation=True)
+
+print("🔄 ONNX 변환 시작...")
+torch.onnx.export(
+    model,
+    (dummy_input["input_ids"], dummy_input["attention_mask"], dummy_input["token_type_ids"]),
+    str(fp32_path),
+    input_names=["input_ids", "attention_mask", "token_type_ids"],
+    output_names=["last_hidden_state"],
+    dynamic_axes={
+        "input_ids": {0: "batch_size", 1: "sequence_length"},
+        "attention_mask": {0: "batch_size", 1: "sequence_length"},
+        "token_type_ids": {0: "batch_size", 1: "sequence_length"},
+        "last_hidden_state": {0: "batch_size", 1: "sequence_length"},
+    },
+    opset_version=14,
+    do_constant_folding=True,
+)
+print(f"✅ 변환 완료: {fp32_path}")
+
+print("🔄 int8 동적 양자화...")
+quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+print(f"✅ 양자화 완료: {int8_path}")
+print(f"   - fp32: {fp32_path.stat().st_size / 1e6:.1f}MB, int8: {int8_path.stat().st_size / 1e6:.1f}MB")
+
+# 변환된 모델 검증
+try:
+    ort_session = ort.InferenceSession(str(int8_path), providers=["CPUExecutionProvider"])
+    print("   ✓ ONNX 모델 검증 성공")
+    print(f"   - 입력: {[inp.name for inp in ort_session.get_inputs()]}")
+    print(f"   - 출력: {[out.name for out in ort_session.get_outputs()]}")
+except Exception as e:
+    print(f"   ⚠️ ONNX 검증 실패: {e}")
@@ -0,0 +1,39 @@
+"""
+사용자 프로필(페르소나) 벡터 백필/재계산 스크립트
+- 증분 상태(weighted_sum_json, weight_sum, event_count)가 없는 기존 사용자 백필
+- 감쇠 설정(PERSONA_DECAY_HALF_LIFE_DAYS) 변경이나 임베딩 모델 교체 후 전체 재계산
+- videos_static.embedding만 사용 (재임베딩 없음)
+
+사용법:
+    cd backend && python scripts/rebuild_persona_vectors.py [--user-id 123]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import SessionLocal
+from app.crud.persona import rebuild_all_persona_vectors, rebuild_user_persona_vector
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--user-id", type=int, default=None, help="특정 사용자만 재계산")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.user_id is not None:
+            vector = rebuild_user_persona_vector(db, args.user_id)
+            print(f"[Persona] user {args.user_id}: {'rebuilt' if vector else 'no embeddings/events'}")
+        else:
+            updated = rebuild_all_persona_vectors(db)
+            print(f"[Persona] ✓ Rebuilt {updated} persona vectors")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+오프라인 모델(감정 / 키워드 / 욕설) 보강 배치 실행 스크립트 (야간 배치용)
+- travel_comments / travel_videos를 청크 단위로 읽어 offline_enrichments에 저장
+- 중단 후 다시 실행하면 워터마크(offline_enrichment_watermarks)부터 이어서 처리
+- 처리량 측정: --limit 으로 일부만 돌려 rows/s 확인 후 전체 댓글 수로 소요 시간 추정
+
+모델 경로가 저장소 루트 기준이므로 루트에서 실행:
+    python backend/scripts/run_offline_enrichment.py [--source comment|video|all] [--workers 4]
+        [--models sentiment,keywords,profanity] [--keyword-beams 4] [--limit 5000] [--restart]
+"""
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+backend_root = Path(__file__).parent.parent
+if str(backend_root) not in sys.path:
+    sys.path.insert(0, str(backend_root))
+
+from app.core.database import SessionLocal
+from app.recommendation.offline_enrichment import (
+    ENRICHMENT_MODELS,
+    OFFLINE_ENRICHMENT_CHUNK_SIZE,
+    OFFLINE_ENRICHMENT_WORKERS,
+    EnrichmentSettings,
+    run_enrichment,
+)
+
+
+def main() -> None:
+    defaults = EnrichmentSettings()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--source", choices=["comment", "video", "all"], default="comment")
+    parser.add_argument("--models", default=",".join(ENRICHMENT_MODELS), help="실행할 모델 (쉼표 구분)")
+    parser.add_argument("--workers", type=int, default=OFFLINE_ENRICHMENT_WORKERS, help="프로세스 수 (1이면 현재 프로세스에서 실행)")
+    parser.add_argument("--chunk-size", type=int, default=OFFLINE_ENRICHMENT_CHUNK_SIZE, help="DB에서 한 번에 읽고 저장하는 행 수")
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size, help="감정/욕설 모델 배치 크기")
+    parser.add_argument("--keyword-batch-size", type=int, default=defaults.keyword_batch_size)
+    parser.add_argument("--keyword-beams", type=int, default=defaults.keyword_num_beams, help="키워드 생성 beam 수 (1 = greedy, 가장 빠름)")
+    parser.add_argument("--limit", type=int, default=None, help="대상별 최대 처리 행 수")
+    parser.add_argument("--restart", action="store_true", help="워터마크를 무시하고 처음부터 확인")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    settings = EnrichmentSettings(
+        models=tuple(model.strip() for model in args.models.split(",") if model.strip()),
+        batch_size=args.batch_size,
+        keyword_batch_size=args.keyword_batch_size,
+        keyword_num_beams=args.keyword_beams,
+    )
+    sources = ["comment", "video"] if args.source == "all" else [args.source]
+    for source in sources:
+        stats = run_enrichment(
+            SessionLocal,
+            source=source,
+            settings=settings,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            limit=args.limit,
+            restart=args.restart,
+        )
+        print(json.dumps(stats, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
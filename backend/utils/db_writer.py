@@ -2,14 +2,153 @@
 MySQL 및 BigQuery 데이터 적재 유틸리티
 """
 from airflow.hooks.base import BaseHook
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, inspect, text
 from google.cloud import bigquery
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
 import os
 import json
+import tempfile
+import time
+from datetime import datetime
 from urllib.parse import quote_plus
 
+import numpy as np
+
+import rank_features_sql
+import staging
+
+# travel_videos / travel_comments 적재 컬럼 순서와 기본값
+VIDEO_COLUMNS = (
+    'id', 'channel_id', 'title', 'description', 'published_at', 'duration',
+    'view_count', 'like_count', 'comment_count', 'category_id', 'tags',
+    'thumbnail_url', 'keyword', 'region',
+)
+VIDEO_DEFAULTS = {
+    'description': '', 'duration': '', 'view_count': 0, 'like_count': 0, 'comment_count': 0,
+    'category_id': 0, 'thumbnail_url': '', 'region': 'KR',
+}
+COMMENT_COLUMNS = (
+    'id', 'video_id', 'parent_id', 'author_name', 'text', 'like_count', 'published_at', 'language',
+)
+COMMENT_DEFAULTS = {'like_count': 0, 'language': 'ko'}
+
+VIDEO_UPSERT_SQL = """
+    INSERT INTO travel_videos (
+        id, channel_id, title, description, published_at, duration,
+        view_count, like_count, comment_count, category_id, tags,
+        thumbnail_url, keyword, region
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        title = VALUES(title),
+        description = VALUES(description),
+        view_count = VALUES(view_count),
+        like_count = VALUES(like_count),
+        comment_count = VALUES(comment_count)
+"""
+COMMENT_UPSERT_SQL = """
+    INSERT INTO travel_comments (
+        id, video_id, parent_id, author_name, text, like_count, published_at, language
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        text = VALUES(text),
+        like_count = VALUES(like_count)
+"""
+# 적재한 영상들의 댓글 수 요약 재계산 (video_comment_stats, 멱등)
+# {placeholders}에는 video_id 개수만큼 %s가 들어감
+COMMENT_STATS_REFRESH_SQL = """
+    INSERT INTO video_comment_stats (video_id, total_count, text_count, updated_at)
+    SELECT video_id,
+           COUNT(*),
+           SUM(CASE WHEN text IS NOT NULL AND text != '' THEN 1 ELSE 0 END),
+           NOW()
+    FROM travel_comments
+    WHERE video_id IN ({placeholders})
+    GROUP BY video_id
+    ON DUPLICATE KEY UPDATE
+        total_count = VALUES(total_count),
+        text_count = VALUES(text_count),
+        updated_at = VALUES(updated_at)
+"""
+COMMENT_STATS_CHUNK_SIZE = 500
+
+# 추천 랭킹 피처 테이블 갱신 (app/recommendation/repository.refresh_rank_features와 같은 정의를 공유)
+RANK_FEATURES_SOURCE_TABLES = rank_features_sql.SOURCE_TABLES
+RANK_FEATURES_REFRESH_SQL = rank_features_sql.render(rank_features_sql.REFRESH_TEMPLATE, "%s")
+RANK_FEATURES_DELETE_STALE_SQL = rank_features_sql.render(rank_features_sql.DELETE_STALE_TEMPLATE, "%s")
+
+
+def _encode_tags(value):
+    """tags → JSON 문자열 (빈 리스트/None은 NULL, 이미 문자열이면 그대로)"""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return json.dumps(list(value)) if len(value) else None
+    if isinstance(value, str):
+        return value
+    return None
+
+
+def normalize_rows(
+    data,
+    columns: tuple,
+    defaults: Dict,
+    int_columns: tuple = (),
+    datetime_columns: tuple = (),
+    json_columns: tuple = (),
+    overrides: Optional[Dict] = None,
+) -> List[tuple]:
+    """
+    dict 리스트/DataFrame → executemany용 튜플 리스트 (컬럼 단위 벡터화 처리)
+    - 누락 컬럼 추가 + 기본값 채우기, 정수/시간 컬럼 변환, JSON 컬럼 일괄 인코딩
+    - 같은 배치 안의 중복 id는 마지막 값만 유지 (upsert 전에 제거)
+    - NaN/NaT → None, numpy 정수 → Python int (드라이버 escape 호환)
+    """
+    df = data.copy() if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+    if df.empty:
+        return []
+    # 수집기는 id / video_id를 모두 채우지만 한쪽만 있어도 처리
+    if 'video_id' in df.columns and 'video_id' not in columns:
+        df['id'] = df['id'].fillna(df['video_id']) if 'id' in df.columns else df['video_id']
+    df = df.reindex(columns=list(columns))
+    for column, value in (overrides or {}).items():
+        df[column] = value
+    df = df.fillna(value={c: v for c, v in defaults.items() if c in df.columns})
+
+    for column in int_columns:
+        df[column] = pd.to_numeric(df[column], errors='coerce').fillna(0).astype('int64')
+    for column in datetime_columns:
+        # UTC 기준 naive datetime (기존 적재와 같은 벽시계 값)
+        df[column] = pd.to_datetime(df[column], errors='coerce', utc=True).dt.tz_localize(None)
+    for column in json_columns:
+        df[column] = [_encode_tags(v) for v in df[column].tolist()]
+
+    df = df[df['id'].notna()].drop_duplicates(subset='id', keep='last')
+    df = df.astype(object).where(df.notna(), None)
+    return list(df.itertuples(index=False, name=None))
+
+
+def normalize_videos(data, keyword: str = None) -> List[tuple]:
+    """영상 → VIDEO_COLUMNS 순서 튜플 리스트"""
+    return normalize_rows(
+        data,
+        VIDEO_COLUMNS,
+        VIDEO_DEFAULTS,
+        int_columns=('view_count', 'like_count', 'comment_count', 'category_id'),
+        datetime_columns=('published_at',),
+        json_columns=('tags',),
+        overrides={'keyword': keyword} if keyword else None,
+    )
+
+
+def normalize_comments(data) -> List[tuple]:
+    """댓글 → COMMENT_COLUMNS 순서 튜플 리스트"""
+    return normalize_rows(
+        data,
+        COMMENT_COLUMNS,
+        COMMENT_DEFAULTS,
+        int_columns=('like_count',),
+        datetime_columns=('published_at',),
+    )
+
 
 class MySQLWriter:
     def __init__(self, conn_id: str = 'cloudsql_mysql'):
@@ -189,182 +328,71 @@ class MySQLWriter:
         
         print(f"Inserted/Updated {len(channels)} channels")
     
-    def insert_videos(self, videos: List[Dict], keyword: str = None):
-        """영상 데이터 삽입 (배치 삽입으로 최적화)"""
-        if not videos:
+    def insert_videos(self, videos: Union[List[Dict], pd.DataFrame], keyword: str = None):
+        """영상 데이터 삽입 (컬럼 단위 정규화 + multi-row upsert)"""
+        if videos is None or len(videos) == 0:
             return
         
         engine = self._get_engine()
-        df = pd.DataFrame(videos)
-        
-        df['published_at'] = pd.to_datetime(df['published_at'])
-        
-        # keyword 추가
-        if keyword:
-            df['keyword'] = keyword
-        
-        # tags를 JSON 문자열로 변환 (MySQL JSON 타입 저장용)
-        if 'tags' in df.columns:
-            df['tags'] = df['tags'].apply(lambda x: None if x is None or (isinstance(x, list) and len(x) == 0) else json.dumps(x) if isinstance(x, list) else x)
-        
-        # 컬럼 순서: id, channel_id, title, description, published_at, duration, view_count, 
-        # like_count, comment_count, category_id, tags, thumbnail_url, keyword, region
+        rows = normalize_videos(videos, keyword=keyword)
         
         # 배치 크기 설정 (한 번에 100개씩 처리)
         batch_size = 100
-        total_batches = (len(df) + batch_size - 1) // batch_size
+        total_batches = (len(rows) + batch_size - 1) // batch_size
         
-        print(f"Inserting {len(videos)} videos in {total_batches} batches (batch size: {batch_size})")
+        print(f"Inserting {len(rows)} videos in {total_batches} batches (batch size: {batch_size})")
         
         for batch_num in range(total_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min((batch_num + 1) * batch_size, len(df))
-            batch_df = df.iloc[start_idx:end_idx]
-            
-            print(f"Processing batch {batch_num + 1}/{total_batches} ({len(batch_df)} videos)...")
+            batch = rows[batch_num * batch_size:(batch_num + 1) * batch_size]
             
             try:
                 with engine.begin() as conn:
-                    for _, row in batch_df.iterrows():
-                        conn.execute(text("""
-                            INSERT INTO travel_videos (
-                                id, channel_id, title, description, published_at, duration,
-                                view_count, like_count, comment_count, category_id, tags,
-                                thumbnail_url, keyword, region
-                            ) VALUES (
-                                :id, :channel_id, :title, :description, :published_at, :duration,
-                                :view_count, :like_count, :comment_count, :category_id, :tags,
-                                :thumbnail_url, :keyword, :region
-                            )
-                            ON DUPLICATE KEY UPDATE
-                                title = VALUES(title),
-                                description = VALUES(description),
-                                view_count = VALUES(view_count),
-                                like_count = VALUES(like_count),
-                                comment_count = VALUES(comment_count)
-                        """), {
-                            'id': row['id'],
-                            'channel_id': row['channel_id'],
-                            'title': row['title'],
-                            'description': row.get('description', ''),
-                            'published_at': row['published_at'],
-                            'duration': row.get('duration', ''),
-                            'view_count': row.get('view_count', 0),
-                            'like_count': row.get('like_count', 0),
-                            'comment_count': row.get('comment_count', 0),
-                            'category_id': row.get('category_id', 0),
-                            'tags': row.get('tags'),  # 이미 JSON 문자열로 변환됨
-                            'thumbnail_url': row.get('thumbnail_url', ''),
-                            'keyword': row.get('keyword'),
-                            'region': row.get('region', 'KR')
-                        })
-                print(f"✓ Batch {batch_num + 1}/{total_batches} completed ({len(batch_df)} videos)")
+                    # executemany → pymysql이 multi-row INSERT 한 문장으로 묶음
+                    conn.exec_driver_sql(VIDEO_UPSERT_SQL, batch)
             except Exception as e:
                 print(f"✗ Batch {batch_num + 1}/{total_batches} failed: {type(e).__name__}: {e}")
                 # 실패한 배치만 다시 시도 (개별 삽입으로 fallback)
                 print(f"  Retrying batch {batch_num + 1} with individual inserts...")
                 with engine.begin() as conn:
-                    for idx, row in batch_df.iterrows():
+                    for row in batch:
                         try:
-                            conn.execute(text("""
-                                INSERT INTO travel_videos (
-                                    id, channel_id, title, description, published_at, duration,
-                                    view_count, like_count, comment_count, category_id, tags,
-                                    thumbnail_url, keyword, region
-                                ) VALUES (
-                                    :id, :channel_id, :title, :description, :published_at, :duration,
-                                    :view_count, :like_count, :comment_count, :category_id, :tags,
-                                    :thumbnail_url, :keyword, :region
-                                )
-                                ON DUPLICATE KEY UPDATE
-                                    title = VALUES(title),
-                                    description = VALUES(description),
-                                    view_count = VALUES(view_count),
-                                    like_count = VALUES(like_count),
-                                    comment_count = VALUES(comment_count)
-                            """), {
-                                'id': row['id'],
-                                'channel_id': row['channel_id'],
-                                'title': row['title'],
-                                'description': row.get('description', ''),
-                                'published_at': row['published_at'],
-                                'duration': row.get('duration', ''),
-                                'view_count': row.get('view_count', 0),
-                                'like_count': row.get('like_count', 0),
-                                'comment_count': row.get('comment_count', 0),
-                                'category_id': row.get('category_id', 0),
-                                'tags': row.get('tags'),
-                                'thumbnail_url': row.get('thumbnail_url', ''),
-                                'keyword': row.get('keyword'),
-                                'region': row.get('region', 'KR')
-                            })
+                            conn.exec_driver_sql(VIDEO_UPSERT_SQL, row)
                         except Exception as e2:
-                            print(f"  ⚠️ Failed to insert video {row.get('id', 'unknown')}: {e2}")
+                            print(f"  ⚠️ Failed to insert video {row[0]}: {e2}")
                             continue
         
-        print(f"✓ Inserted {len(videos)} videos (total)")
+        print(f"✓ Inserted {len(rows)} videos (total)")
     
-    def insert_comments(self, comments: List[Dict]):
-        """댓글 데이터 삽입 (배치 삽입으로 최적화)"""
-        if not comments:
+    def insert_comments(self, comments: Union[List[Dict], pd.DataFrame]):
+        """댓글 데이터 삽입 (컬럼 단위 정규화 + multi-row upsert)"""
+        if comments is None or len(comments) == 0:
             return
         
         import time
         engine = self._get_engine()
-        df = pd.DataFrame(comments)
-        
-        df['published_at'] = pd.to_datetime(df['published_at'])
+        rows = normalize_comments(comments)
         
         # 배치 크기 설정 (연결 안정성을 위해 50개씩으로 줄임)
         batch_size = 50
-        total_batches = (len(df) + batch_size - 1) // batch_size
-        
-        print(f"Inserting {len(comments)} comments in {total_batches} batches (batch size: {batch_size})")
+        total_batches = (len(rows) + batch_size - 1) // batch_size
         
-        insert_stmt = text("""
-            INSERT INTO travel_comments (
-                id, video_id, parent_id, author_name, text, like_count, published_at, language
-            ) VALUES (
-                :id, :video_id, :parent_id, :author_name, :text, :like_count, :published_at, :language
-            )
-            ON DUPLICATE KEY UPDATE
-                text = VALUES(text),
-                like_count = VALUES(like_count)
-        """)
+        print(f"Inserting {len(rows)} comments in {total_batches} batches (batch size: {batch_size})")
         
         for batch_num in range(total_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min((batch_num + 1) * batch_size, len(df))
-            batch_df = df.iloc[start_idx:end_idx]
+            batch_data = rows[batch_num * batch_size:(batch_num + 1) * batch_size]
             
             if batch_num % 20 == 0 or batch_num == total_batches - 1:  # 20배치마다 또는 마지막 배치 로그 출력
-                print(f"Processing batch {batch_num + 1}/{total_batches} ({len(batch_df)} comments)...")
-            
-            # 배치 데이터 준비
-            batch_data = []
-            for _, row in batch_df.iterrows():
-                batch_data.append({
-                    'id': row['id'],
-                    'video_id': row['video_id'],
-                    'parent_id': row.get('parent_id'),
-                    'author_name': row['author_name'],
-                    'text': row['text'],
-                    'like_count': row.get('like_count', 0),
-                    'published_at': row['published_at'],
-                    'language': row.get('language', 'ko')
-                })
+                print(f"Processing batch {batch_num + 1}/{total_batches} ({len(batch_data)} comments)...")
             
             # 배치 삽입 시도
             max_retries = 3
             retry_delay = 2
-            success = False
             
             for retry in range(max_retries):
                 try:
                     with engine.begin() as conn:
                         # executemany로 실제 배치 삽입
-                        conn.execute(insert_stmt, batch_data)
-                    success = True
+                        conn.exec_driver_sql(COMMENT_UPSERT_SQL, batch_data)
                     break
                 except Exception as e:
                     if retry < max_retries - 1:
@@ -375,30 +403,92 @@ class MySQLWriter:
                         # 마지막 시도: 작은 배치로 분할하여 재시도
                         print(f"  Retrying batch {batch_num + 1} with smaller batches (10 comments each)...")
                         small_batch_size = 10
-                        for small_batch_num in range((len(batch_data) + small_batch_size - 1) // small_batch_size):
-                            small_start = small_batch_num * small_batch_size
-                            small_end = min((small_batch_num + 1) * small_batch_size, len(batch_data))
-                            small_batch = batch_data[small_start:small_end]
+                        for small_start in range(0, len(batch_data), small_batch_size):
+                            small_batch = batch_data[small_start:small_start + small_batch_size]
                             
                             try:
                                 with engine.begin() as conn:
-                                    conn.execute(insert_stmt, small_batch)
+                                    conn.exec_driver_sql(COMMENT_UPSERT_SQL, small_batch)
                             except Exception as e2:
                                 # 개별 삽입으로 최종 시도
-                                print(f"    ⚠️ Small batch {small_batch_num + 1} failed, trying individual inserts...")
+                                print(f"    ⚠️ Small batch {small_start // small_batch_size + 1} failed, trying individual inserts...")
                                 with engine.begin() as conn:
                                     for item in small_batch:
                                         try:
-                                            conn.execute(insert_stmt, item)
+                                            conn.exec_driver_sql(COMMENT_UPSERT_SQL, item)
                                         except Exception as e3:
-                                            print(f"      ⚠️ Failed to insert comment {item.get('id', 'unknown')}: {str(e3)[:100]}")
+                                            print(f"      ⚠️ Failed to insert comment {item[0]}: {str(e3)[:100]}")
                                             continue
             
             # 배치 간 짧은 대기로 부하 분산
             if batch_num < total_batches - 1:
                 time.sleep(0.1)
         
-        print(f"✓ Inserted {len(comments)} comments (total)")
+        print(f"✓ Inserted {len(rows)} comments (total)")
+        self.refresh_comment_stats(row[1] for row in rows)
+
+    def refresh_comment_stats(self, video_ids):
+        """
+        video_comment_stats 갱신 (API는 COUNT(*) 대신 이 테이블을 PK로 조회)
+        영상 단위로 다시 집계하므로 재실행/부분 실패 후에도 값이 맞춰짐
+        실패해도 댓글 적재 자체는 유지 (다음 적재 때 다시 갱신)
+        """
+        video_ids = sorted({vid for vid in video_ids if vid})
+        if not video_ids:
+            return
+        engine = self._get_engine()
+        try:
+            for start in range(0, len(video_ids), COMMENT_STATS_CHUNK_SIZE):
+                chunk = video_ids[start:start + COMMENT_STATS_CHUNK_SIZE]
+                sql = COMMENT_STATS_REFRESH_SQL.format(placeholders=", ".join(["%s"] * len(chunk)))
+                with engine.begin() as conn:
+                    conn.exec_driver_sql(sql, tuple(chunk))
+            print(f"✓ Refreshed comment stats for {len(video_ids)} videos")
+        except Exception as e:
+            print(f"⚠️ Failed to refresh comment stats: {type(e).__name__}: {str(e)[:200]}")
+
+    def refresh_rank_features(self) -> bool:
+        """
+        video_rank_features 재계산 (API 추천 후보 조회용, 한 트랜잭션으로 upsert + 사라진 영상 삭제)
+        테이블(마이그레이션 20251023_01 또는 감정/토픽 집계 테이블)이 아직 없으면 건너뜀
+        """
+        engine = self._get_engine()
+        missing = [name for name in RANK_FEATURES_SOURCE_TABLES if not inspect(engine).has_table(name)]
+        if missing:
+            print(f"⚠️ Skipping rank feature refresh, missing tables: {', '.join(missing)}")
+            return False
+        refreshed_at = datetime.utcnow().replace(microsecond=0)
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            upserted = conn.exec_driver_sql(RANK_FEATURES_REFRESH_SQL, (refreshed_at,)).rowcount
+            deleted = conn.exec_driver_sql(RANK_FEATURES_DELETE_STALE_SQL, (refreshed_at,)).rowcount
+        print(
+            f"✓ Refreshed video_rank_features (upserted={upserted}, deleted={deleted}) "
+            f"in {(time.perf_counter() - start) * 1000:.1f}ms"
+        )
+        return True
+
+    def load_staged(self, paths: Dict[str, str], keyword: Optional[str] = None):
+        """
+        스테이징 Parquet 파일(staging.stage_run 결과)을 MySQL에 적재
+        BigQuery 적재와 같은 파일을 사용하므로 로컬 파일로도 적재를 검증할 수 있음
+        """
+        loaders = (
+            ('channels', self.insert_channels),
+            ('videos', lambda records: self.insert_videos(records, keyword=keyword)),
+            ('comments', self.insert_comments),
+        )
+        for name, load in loaders:
+            path = paths.get(name)
+            if not path:
+                continue
+            staged = staging.read_staging(path, name)
+            print(f"Loading {staged.num_rows} {name} from {path}")
+            if name == 'channels':
+                load(staged.to_pylist())
+            else:
+                # 영상/댓글은 DataFrame 그대로 정규화 (dict 리스트로 풀지 않음)
+                load(staging.decode_dictionaries(staged).to_pandas())
 
 
 class BigQueryWriter:
@@ -440,96 +530,91 @@ class BigQueryWriter:
             self.client.create_dataset(dataset, exists_ok=True)
             print(f"Created dataset {self.dataset_id}")
     
-    def load_channels(self, channels: List[Dict], table_id: str = 'channels'):
-        """채널 데이터 로드"""
-        if not channels:
-            print("No channels to load to BigQuery")
-            return
-        
-        try:
-            table_ref = self.client.dataset(self.dataset_id).table(table_id)
-            print(f"Loading {len(channels)} channels to BigQuery table: {self.dataset_id}.{table_id}")
-            
-            df = pd.DataFrame(channels)
-            # channels에는 published_at 필드가 없음
-            
-            job_config = bigquery.LoadJobConfig(
-                write_disposition="WRITE_APPEND",  # 누적 적재 (MySQL과 카운트 정렬)
-                autodetect=True,
-            )
-            
-            job = self.client.load_table_from_dataframe(df, table_ref, job_config=job_config)
-            job.result()  # 작업 완료 대기
-            
-            if job.errors:
-                print(f"✗ Errors during load: {job.errors}")
-                raise Exception(f"BigQuery load errors: {job.errors}")
-            
-            print(f"✓ Loaded {len(channels)} channels to BigQuery table {table_id}")
-        except Exception as e:
-            print(f"✗ Failed to load channels to BigQuery: {type(e).__name__}: {e}")
-            raise
-    
-    def load_videos(self, videos: List[Dict], table_id: str = 'videos'):
-        """영상 데이터 로드"""
-        if not videos:
-            print("No videos to load to BigQuery")
-            return
-        
+    def _load_schema(self, table_ref, staged_fields: list) -> list:
+        """
+        로드용 스키마 = 기존 테이블 스키마 + 스테이징에만 있는 새 컬럼
+        - 명시 스키마에 기존 컬럼이 빠지면 append 로드가 거절되므로 (예전 autodetect 로드가 추가한 컬럼 등)
+          기존 컬럼은 테이블 정의 그대로 유지하고 REQUIRED만 NULLABLE로 완화 (스테이징에 없는 컬럼은 NULL로 적재)
+        - 테이블이 없으면 스테이징 스키마 그대로
+        """
+        from google.api_core.exceptions import NotFound
+
         try:
-            table_ref = self.client.dataset(self.dataset_id).table(table_id)
-            print(f"Loading {len(videos)} videos to BigQuery table: {self.dataset_id}.{table_id}")
-            
-            df = pd.DataFrame(videos)
-            if 'published_at' in df.columns:
-                df['published_at'] = pd.to_datetime(df['published_at'])
-            
-            job_config = bigquery.LoadJobConfig(
-                write_disposition="WRITE_APPEND",
-                autodetect=True,
-            )
-            
-            job = self.client.load_table_from_dataframe(df, table_ref, job_config=job_config)
-            job.result()  # 작업 완료 대기
-            
-            if job.errors:
-                print(f"✗ Errors during load: {job.errors}")
-                raise Exception(f"BigQuery load errors: {job.errors}")
-            
-            print(f"✓ Loaded {len(videos)} videos to BigQuery table {table_id}")
-        except Exception as e:
-            print(f"✗ Failed to load videos to BigQuery: {type(e).__name__}: {e}")
-            raise
-    
-    def load_comments(self, comments: List[Dict], table_id: str = 'comments'):
-        """댓글 데이터 로드"""
-        if not comments:
-            print("No comments to load to BigQuery")
+            existing = self.client.get_table(table_ref).schema
+        except NotFound:
+            return staged_fields
+
+        existing_names = {field.name for field in existing}
+        merged = [
+            bigquery.SchemaField(field.name, field.field_type, mode='NULLABLE', description=field.description, fields=field.fields)
+            if field.mode == 'REQUIRED' else field
+            for field in existing
+        ]
+        merged.extend(field for field in staged_fields if field.name not in existing_names)
+        staged_names = {field.name for field in staged_fields}
+        table_only = [name for name in existing_names if name not in staged_names]
+        if table_only:
+            print(f"  Keeping {len(table_only)} table-only columns (loaded as NULL): {', '.join(sorted(table_only))}")
+        return merged
+
+    def _load_parquet(self, path: str, table_name: str, table_id: str) -> int:
+        """스테이징 Parquet 파일을 명시적 스키마(기존 테이블 스키마와 병합)로 로드 (autodetect 없음)"""
+        table_ref = self.client.dataset(self.dataset_id).table(table_id)
+        staged = staging.read_staging(path, table_name)
+        print(f"Loading {staged.num_rows} {table_name} to BigQuery table: {self.dataset_id}.{table_id} from {path}")
+
+        parquet_options = bigquery.format_options.ParquetOptions()
+        parquet_options.enable_list_inference = True  # tags: list<string> → REPEATED STRING
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
+            write_disposition="WRITE_APPEND",  # 누적 적재 (MySQL과 카운트 정렬)
+            schema=self._load_schema(table_ref, staging.bigquery_schema(staged.schema)),
+            # 스키마 버전이 올라 컬럼이 추가/완화되어도 테이블을 다시 만들지 않음
+            schema_update_options=[
+                bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION,
+                bigquery.SchemaUpdateOption.ALLOW_FIELD_RELAXATION,
+            ],
+        )
+        job_config.parquet_options = parquet_options
+
+        with open(path, 'rb') as f:
+            job = self.client.load_table_from_file(f, table_ref, job_config=job_config)
+        job.result()  # 작업 완료 대기
+
+        if job.errors:
+            print(f"✗ Errors during load: {job.errors}")
+            raise Exception(f"BigQuery load errors: {job.errors}")
+        return staged.num_rows
+
+    def _load(self, table_name: str, data: Union[List[Dict], str], table_id: str):
+        """
+        data가 스테이징 파일 경로면 그대로, dict 리스트면 임시 Parquet로 스테이징 후 로드
+        """
+        if not data:
+            print(f"No {table_name} to load to BigQuery")
             return
-        
+
         try:
-            table_ref = self.client.dataset(self.dataset_id).table(table_id)
-            print(f"Loading {len(comments)} comments to BigQuery table: {self.dataset_id}.{table_id}")
-            
-            df = pd.DataFrame(comments)
-            if 'published_at' in df.columns:
-                df['published_at'] = pd.to_datetime(df['published_at'])
-            # comments에는 updated_at 필드가 없음
-            
-            job_config = bigquery.LoadJobConfig(
-                write_disposition="WRITE_APPEND",
-                autodetect=True,
-            )
-            
-            job = self.client.load_table_from_dataframe(df, table_ref, job_config=job_config)
-            job.result()  # 작업 완료 대기
-            
-            if job.errors:
-                print(f"✗ Errors during load: {job.errors}")
-                raise Exception(f"BigQuery load errors: {job.errors}")
-            
-            print(f"✓ Loaded {len(comments)} comments to BigQuery table {table_id}")
+            if isinstance(data, str):
+                loaded = self._load_parquet(data, table_name, table_id)
+            else:
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    path = os.path.join(tmp_dir, f'{table_name}.parquet')
+                    staging.write_staging(staging.to_table(table_name, data), path)
+                    loaded = self._load_parquet(path, table_name, table_id)
+            print(f"✓ Loaded {loaded} {table_name} to BigQuery table {table_id}")
         except Exception as e:
-            print(f"✗ Failed to load comments to BigQuery: {type(e).__name__}: {e}")
+            print(f"✗ Failed to load {table_name} to BigQuery: {type(e).__name__}: {e}")
             raise
 
+    def load_channels(self, channels: Union[List[Dict], str], table_id: str = 'channels'):
+        """채널 데이터 로드 (dict 리스트 또는 스테이징 Parquet 경로)"""
+        self._load('channels', channels, table_id)
+
+    def load_videos(self, videos: Union[List[Dict], str], table_id: str = 'videos'):
+        """영상 데이터 로드 (dict 리스트 또는 스테이징 Parquet 경로)"""
+        self._load('videos', videos, table_id)
+
+    def load_comments(self, comments: Union[List[Dict], str], table_id: str = 'comments'):
+        """댓글 데이터 로드 (dict 리스트 또는 스테이징 Parquet 경로)"""
+        self._load('comments', comments, table_id)
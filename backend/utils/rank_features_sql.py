@@ -0,0 +1,56 @@
+"""
+video_rank_features 갱신 SQL (단일 정의)
+- API(app/recommendation/repository.refresh_rank_features, SQLAlchemy text → :refreshed_at)와
+  Airflow(db_writer.MySQLWriter.refresh_rank_features, exec_driver_sql → %s)가 같은 문장을 사용
+- 드라이버마다 다른 것은 갱신 시각 placeholder뿐 → render()로 채워서 사용
+- Airflow에는 utils만 배포되므로 의존성 없는 모듈로 유지
+"""
+
+# 영상당 한 행: 감정 집계 + 대표 토픽(topic_score 최대, 동점이면 작은 topic_id)
+REFRESH_TEMPLATE = """
+    INSERT INTO video_rank_features (
+        video_id, title, channel_id, views, log_views,
+        pos_ratio, avg_score, topic_id, topic_score, published_at, refreshed_at
+    )
+    SELECT
+        v.video_id,
+        v.title,
+        v.channel_id,
+        COALESCE(v.views, 0),
+        LN(COALESCE(v.views, 0) + 1),
+        s.pos_ratio,
+        s.avg_score,
+        t.topic_id,
+        t.topic_score,
+        v.published_at,
+        {refreshed_at}
+    FROM videos v
+    JOIN video_sentiment_agg s ON v.video_id = s.video_id
+    LEFT JOIN (
+        SELECT video_id, topic_id, topic_score,
+               ROW_NUMBER() OVER (PARTITION BY video_id ORDER BY topic_score DESC, topic_id) AS topic_rank
+        FROM video_topics
+    ) t ON t.video_id = v.video_id AND t.topic_rank = 1
+    ON DUPLICATE KEY UPDATE
+        title = VALUES(title),
+        channel_id = VALUES(channel_id),
+        views = VALUES(views),
+        log_views = VALUES(log_views),
+        pos_ratio = VALUES(pos_ratio),
+        avg_score = VALUES(avg_score),
+        topic_id = VALUES(topic_id),
+        topic_score = VALUES(topic_score),
+        published_at = VALUES(published_at),
+        refreshed_at = VALUES(refreshed_at)
+"""
+
+# 이번 갱신에서 다시 쓰지 않은 행 = 원본에서 사라진 영상
+DELETE_STALE_TEMPLATE = "DELETE FROM video_rank_features WHERE refreshed_at < {refreshed_at}"
+
+# 갱신 SQL이 읽는 테이블 (갱신 대상 포함) - 하나라도 없으면 갱신하지 않음
+SOURCE_TABLES = ('video_rank_features', 'videos', 'video_sentiment_agg', 'video_topics')
+
+
+def render(template: str, placeholder: str) -> str:
+    """템플릿의 갱신 시각 자리에 드라이버별 placeholder(":refreshed_at" / "%s")를 채움"""
+    return template.format(refreshed_at=placeholder)
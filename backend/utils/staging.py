@@ -0,0 +1,225 @@
+"""
+수집 데이터 컬럼형(Parquet) 스테이징
+- 채널/영상/댓글을 명시적이고 버전이 있는 Arrow 스키마로 변환해 Parquet 파일로 저장
+  · channel_id / region / language 등 반복 값은 dictionary 인코딩
+  · published_at은 timestamp(UTC), tags는 list<string>
+- 같은 파일을 MySQL 적재(MySQLWriter.load_staged)와 BigQuery 적재(BigQueryWriter.load_*)에서 재사용
+- BigQuery에는 스키마를 명시해 PARQUET로 로드하므로 매 실행 autodetect/스키마 추론이 없음
+
+로컬 파일 확인:
+    python utils/staging.py <file.parquet>
+"""
+import os
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# 스키마를 바꾸면 버전을 올리고, 컬럼 추가만 허용 (BigQuery ALLOW_FIELD_ADDITION)
+SCHEMA_VERSION = 1
+
+_DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+_TIMESTAMP = pa.timestamp('us', tz='UTC')
+
+
+def _schema(table: str, fields: List[pa.Field]) -> pa.Schema:
+    return pa.schema(fields, metadata={
+        b'schema_version': str(SCHEMA_VERSION).encode(),
+        b'table': table.encode(),
+    })
+
+
+CHANNEL_SCHEMA = _schema('channels', [
+    pa.field('id', pa.string(), nullable=False),
+    pa.field('title', pa.string()),
+    pa.field('description', pa.string()),
+    pa.field('country', _DICT_STRING),
+    pa.field('subscriber_count', pa.int64()),
+    pa.field('video_count', pa.int64()),
+    pa.field('view_count', pa.int64()),
+    pa.field('thumbnail_url', pa.string()),
+])
+
+VIDEO_SCHEMA = _schema('videos', [
+    pa.field('id', pa.string(), nullable=False),
+    pa.field('channel_id', _DICT_STRING),
+    pa.field('title', pa.string()),
+    pa.field('description', pa.string()),
+    pa.field('published_at', _TIMESTAMP),
+    pa.field('duration', pa.string()),
+    pa.field('view_count', pa.int64()),
+    pa.field('like_count', pa.int64()),
+    pa.field('comment_count', pa.int64()),
+    pa.field('category_id', pa.int32()),
+    pa.field('tags', pa.list_(pa.string())),
+    pa.field('thumbnail_url', pa.string()),
+    pa.field('keyword', _DICT_STRING),
+    pa.field('region', _DICT_STRING),
+])
+
+COMMENT_SCHEMA = _schema('comments', [
+    pa.field('id', pa.string(), nullable=False),
+    pa.field('video_id', _DICT_STRING),
+    pa.field('parent_id', pa.string()),
+    pa.field('author_name', pa.string()),
+    pa.field('text', pa.string()),
+    pa.field('like_count', pa.int64()),
+    pa.field('published_at', _TIMESTAMP),
+    pa.field('language', _DICT_STRING),
+])
+
+SCHEMAS = {'channels': CHANNEL_SCHEMA, 'videos': VIDEO_SCHEMA, 'comments': COMMENT_SCHEMA}
+
+# 값이 없을 때 채울 기본값 (MySQLWriter의 기존 row.get(..., default)와 동일)
+DEFAULTS = {
+    'channels': {'description': '', 'country': 'KR', 'subscriber_count': 0, 'video_count': 0,
+                 'view_count': 0, 'thumbnail_url': ''},
+    'videos': {'description': '', 'duration': '', 'view_count': 0, 'like_count': 0, 'comment_count': 0,
+               'category_id': 0, 'thumbnail_url': '', 'region': 'KR'},
+    'comments': {'like_count': 0, 'language': 'ko'},
+}
+
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _column(records: List[Dict], name: str, default=None) -> list:
+    values = []
+    for record in records:
+        value = record.get(name)
+        values.append(default if value is None else value)
+    return values
+
+
+def to_table(table: str, records: List[Dict], overrides: Optional[Dict] = None) -> pa.Table:
+    """
+    수집 결과(dict 리스트) → 스키마가 고정된 Arrow 테이블
+
+    Args:
+        table: 'channels' | 'videos' | 'comments'
+        records: 수집 결과
+        overrides: 모든 행에 덮어쓸 값 (예: {'keyword': 'travel'})
+    """
+    schema = SCHEMAS[table]
+    defaults = DEFAULTS[table]
+    overrides = overrides or {}
+    arrays = []
+    for field in schema:
+        if field.name in overrides:
+            values = [overrides[field.name]] * len(records)
+        else:
+            values = _column(records, field.name, defaults.get(field.name))
+            if field.name == 'id' and table == 'videos':
+                # 수집기는 id / video_id를 모두 채우지만 한쪽만 있어도 처리
+                values = [v if v is not None else r.get('video_id') for v, r in zip(values, records)]
+        if pa.types.is_timestamp(field.type):
+            values = [_parse_timestamp(v) for v in values]
+        elif pa.types.is_list(field.type):
+            values = [v if isinstance(v, (list, tuple)) and v else None for v in values]
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def write_staging(table: pa.Table, path: str) -> str:
+    """Arrow 테이블을 Parquet로 저장 (zstd 압축, dictionary 유지)"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    pq.write_table(table, path, compression='zstd', use_dictionary=True)
+    return path
+
+
+def read_staging(path: str, table: Optional[str] = None) -> pa.Table:
+    """스테이징 파일 로드 + 스키마 버전/테이블 검증"""
+    loaded = pq.read_table(path)
+    metadata = loaded.schema.metadata or {}
+    version = int(metadata.get(b'schema_version', b'0'))
+    name = metadata.get(b'table', b'').decode()
+    if version != SCHEMA_VERSION:
+        raise ValueError(f"{path}: staging schema v{version}, expected v{SCHEMA_VERSION}")
+    if table and name != table:
+        raise ValueError(f"{path}: staged table '{name}', expected '{table}'")
+    return loaded
+
+
+def decode_dictionaries(table: pa.Table) -> pa.Table:
+    """dictionary 컬럼을 값 타입으로 되돌림 (to_pandas 시 Categorical 대신 일반 문자열)"""
+    schema = pa.schema(
+        [pa.field(f.name, f.type.value_type) if pa.types.is_dictionary(f.type) else f for f in table.schema],
+        metadata=table.schema.metadata,
+    )
+    return table.cast(schema)
+
+
+def stage_run(
+    staging_dir: str,
+    channels: Optional[List[Dict]] = None,
+    videos: Optional[List[Dict]] = None,
+    comments: Optional[List[Dict]] = None,
+    keyword: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    한 번의 수집 실행 결과를 staging_dir 아래 Parquet 파일로 저장
+
+    Returns:
+        {'channels': path, 'videos': path, 'comments': path} (데이터가 있는 테이블만)
+    """
+    paths = {}
+    for name, records, overrides in (
+        ('channels', channels, None),
+        ('videos', videos, {'keyword': keyword} if keyword else None),
+        ('comments', comments, None),
+    ):
+        if not records:
+            continue
+        path = os.path.join(staging_dir, f'{name}.v{SCHEMA_VERSION}.parquet')
+        write_staging(to_table(name, records, overrides), path)
+        paths[name] = path
+        print(f"Staged {len(records)} {name} → {path}")
+    return paths
+
+
+def bigquery_schema(schema: pa.Schema) -> list:
+    """Arrow 스키마 → BigQuery SchemaField 리스트 (dictionary는 값 타입 기준)"""
+    from google.cloud import bigquery
+
+    fields = []
+    for field in schema:
+        arrow_type = field.type.value_type if pa.types.is_dictionary(field.type) else field.type
+        # 기존 테이블 컬럼과 충돌하지 않도록 REQUIRED는 쓰지 않음
+        mode = 'NULLABLE'
+        if pa.types.is_list(arrow_type):
+            arrow_type = arrow_type.value_type
+            mode = 'REPEATED'
+        if pa.types.is_timestamp(arrow_type):
+            bq_type = 'TIMESTAMP'
+        elif pa.types.is_integer(arrow_type):
+            bq_type = 'INTEGER'
+        elif pa.types.is_floating(arrow_type):
+            bq_type = 'FLOAT'
+        elif pa.types.is_boolean(arrow_type):
+            bq_type = 'BOOLEAN'
+        else:
+            bq_type = 'STRING'
+        fields.append(bigquery.SchemaField(field.name, bq_type, mode=mode))
+    return fields
+
+
+if __name__ == '__main__':
+    import sys
+
+    for staged_path in sys.argv[1:]:
+        staged = read_staging(staged_path)
+        print(f"{staged_path}: {staged.num_rows} rows, {os.path.getsize(staged_path) / 1e3:.1f}KB")
+        print(staged.schema)
@@ -0,0 +1,289 @@
+"""
+YouTube 채널 백필 엔진
+- 채널 목록을 API 키 수만큼의 워커 스레드로 나눠 수집 (워커마다 자기 키로 시작하는 YouTubeCollector)
+- 수집 워커 → 큐 → 적재 스레드 파이프라인: 적재 스레드가 영상들을 모아 bulk insert
+- 적재가 끝난 페이지까지만 체크포인트(JSON 상태 파일)에 기록
+  · 완료 채널은 다음 실행에서 건너뛰고, 진행 중 채널은 마지막 page token부터 이어서 수집
+  · 모든 키 할당량 초과로 중단되어도 재실행하면 체크포인트부터 재개
+- 채널당 최대 max_videos_per_channel개까지만 수집 (기존 DAG의 max_results=500과 같은 API 할당량 상한)
+"""
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from googleapiclient.errors import HttpError
+
+from youtube_collector import YouTubeCollector
+
+STATE_VERSION = 1
+
+
+class BackfillCheckpoint:
+    """백필 진행 상태 파일 (채널별 status / page_token / 적재 건수)"""
+
+    def __init__(self, path: str, lookback_hours: int):
+        self.path = path
+        self.lookback_hours = lookback_hours
+        self._lock = threading.Lock()
+        self.state = self._load()
+
+    def _load(self) -> Dict:
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                if state.get('version') == STATE_VERSION and state.get('lookback_hours') == self.lookback_hours:
+                    return state
+                print(f"[Backfill] Checkpoint {self.path} has different settings, starting fresh")
+            except Exception as e:
+                print(f"[Backfill] Failed to read checkpoint {self.path}: {e}, starting fresh")
+        return {
+            'version': STATE_VERSION,
+            'lookback_hours': self.lookback_hours,
+            'started_at': datetime.utcnow().isoformat(),
+            'channels': {},
+        }
+
+    def _save(self) -> None:
+        # 임시 파일에 쓴 뒤 rename → 중간에 죽어도 상태 파일이 깨지지 않음
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def get(self, identifier: str) -> Dict:
+        with self._lock:
+            return dict(self.state['channels'].get(identifier, {}))
+
+    def is_done(self, identifier: str) -> bool:
+        return self.get(identifier).get('status') == 'done'
+
+    def update(self, identifier: str, **fields) -> None:
+        with self._lock:
+            entry = self.state['channels'].setdefault(identifier, {'status': 'in_progress', 'loaded': 0})
+            loaded = fields.pop('loaded_delta', 0)
+            entry['loaded'] = entry.get('loaded', 0) + loaded
+            entry.update(fields)
+            entry['updated_at'] = datetime.utcnow().isoformat()
+            self._save()
+
+    def summary(self) -> Dict:
+        with self._lock:
+            channels = self.state['channels'].values()
+            return {
+                'done': sum(1 for c in channels if c.get('status') == 'done'),
+                'in_progress': sum(1 for c in channels if c.get('status') == 'in_progress'),
+                'loaded': sum(c.get('loaded', 0) for c in channels),
+            }
+
+
+class ChannelBackfill:
+    """채널 목록 병렬 백필 (수집 워커 풀 + bulk 적재 스레드)"""
+
+    def __init__(
+        self,
+        api_keys: List[str],
+        writer,
+        checkpoint: BackfillCheckpoint,
+        lookback_hours: int = 8760,
+        max_videos_per_channel: Optional[int] = 500,
+        max_workers: Optional[int] = None,
+        load_batch_size: int = 1000,
+        queue_size: int = 64,
+        keyword: str = 'travel',
+        collector_factory: Callable[[List[str]], YouTubeCollector] = None,
+    ):
+        if not api_keys:
+            raise ValueError("api_keys must not be empty")
+        self.api_keys = api_keys
+        self.writer = writer
+        self.checkpoint = checkpoint
+        self.lookback_hours = lookback_hours
+        # None 또는 0이면 lookback 기간 전체 (페이지 수 제한 없음)
+        self.max_videos_per_channel = max_videos_per_channel or None
+        # 워커 수는 API 키 수를 넘지 않음 (키 하나를 여러 스레드가 동시에 소모하지 않도록)
+        self.max_workers = max(1, min(max_workers or len(api_keys), len(api_keys)))
+        self.load_batch_size = load_batch_size
+        self.keyword = keyword
+        self.collector_factory = collector_factory or (lambda keys: YouTubeCollector(api_keys=keys))
+
+        self._work: "queue.Queue[str]" = queue.Queue()
+        # 수집이 적재보다 너무 앞서가지 않도록 크기 제한 (backpressure)
+        self._loads: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._quota_exhausted = threading.Event()
+        self._errors: List[str] = []
+
+    # ------------------------------------------------------------------
+    # 수집 워커
+    # ------------------------------------------------------------------
+    def _worker(self, worker_index: int) -> None:
+        # 워커마다 다른 키로 시작하고, 할당량 초과 시 나머지 키로 로테이션
+        keys = self.api_keys[worker_index:] + self.api_keys[:worker_index]
+        collector = self.collector_factory(keys)
+        while not self._quota_exhausted.is_set():
+            try:
+                identifier = self._work.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                self._collect_channel(collector, identifier)
+            except HttpError as e:
+                if e.resp.status == 403 and 'quota' in str(e).lower():
+                    # 모든 키 소진 → 남은 채널은 다음 실행에서 체크포인트부터 재개
+                    print(f"[Backfill] worker-{worker_index}: all API keys exhausted, stopping")
+                    self._quota_exhausted.set()
+                    return
+                self._errors.append(f"{identifier}: {e}")
+                print(f"[Backfill] worker-{worker_index}: failed {identifier}: {e}")
+            except Exception as e:
+                self._errors.append(f"{identifier}: {e}")
+                print(f"[Backfill] worker-{worker_index}: failed {identifier}: {e}")
+
+    def _collect_channel(self, collector: YouTubeCollector, identifier: str) -> None:
+        entry = self.checkpoint.get(identifier)
+        channel_id = entry.get('channel_id') or collector.resolve_channel_id(identifier)
+        if not channel_id:
+            print(f"[Backfill] Could not resolve channel {identifier}, skipping")
+            self._loads.put(('skip', identifier, None))
+            return
+
+        if not entry.get('meta_loaded'):
+            meta = collector.get_channel_metadata(channel_id)
+            if meta:
+                self._loads.put(('meta', identifier, {'channel_id': channel_id, 'meta': meta}))
+
+        # 재개 시에는 체크포인트에 적재된 수만큼 이미 채운 것으로 봄
+        remaining = None
+        if self.max_videos_per_channel is not None:
+            remaining = self.max_videos_per_channel - entry.get('loaded', 0)
+            if remaining <= 0:
+                self._loads.put(('done', identifier, {'channel_id': channel_id}))
+                return
+
+        pages = collector.iter_channel_video_pages(
+            channel_id,
+            lookback_hours=self.lookback_hours,
+            page_token=entry.get('page_token'),
+        )
+        for videos, next_token in pages:
+            if remaining is not None:
+                videos = videos[:remaining]
+                remaining -= len(videos)
+                if remaining <= 0:
+                    # 상한 도달 → 다음 페이지는 요청하지 않음
+                    next_token = None
+            self._loads.put(('page', identifier, {
+                'channel_id': channel_id,
+                'videos': videos,
+                'page_token': next_token,
+            }))
+            if self._quota_exhausted.is_set():
+                return
+            if next_token is None:
+                break
+        self._loads.put(('done', identifier, {'channel_id': channel_id}))
+
+    # ------------------------------------------------------------------
+    # 적재 스레드
+    # ------------------------------------------------------------------
+    def _loader(self) -> int:
+        buffered: List[Dict] = []
+        # 버퍼가 적재된 뒤에 반영할 체크포인트 갱신 (순서 유지)
+        pending_updates: List[tuple] = []
+        total = 0
+
+        def flush() -> None:
+            nonlocal total
+            if buffered:
+                self.writer.insert_videos(buffered, keyword=self.keyword)
+                total += len(buffered)
+            for identifier, fields in pending_updates:
+                self.checkpoint.update(identifier, **fields)
+            if buffered:
+                print(f"[Backfill] Loaded {len(buffered)} videos (total {total})")
+            buffered.clear()
+            pending_updates.clear()
+
+        while True:
+            item = self._loads.get()
+            if item is None:
+                break
+            kind, identifier, payload = item
+            if kind == 'meta':
+                self.writer.insert_channels([payload['meta']])
+                pending_updates.append((identifier, {'channel_id': payload['channel_id'], 'meta_loaded': True}))
+            elif kind == 'page':
+                buffered.extend(payload['videos'])
+                pending_updates.append((identifier, {
+                    'channel_id': payload['channel_id'],
+                    'status': 'in_progress',
+                    'page_token': payload['page_token'],
+                    'loaded_delta': len(payload['videos']),
+                }))
+            elif kind == 'done':
+                pending_updates.append((identifier, {'status': 'done', 'page_token': None}))
+            elif kind == 'skip':
+                pending_updates.append((identifier, {'status': 'skipped'}))
+            if len(buffered) >= self.load_batch_size:
+                flush()
+        flush()
+        return total
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    def run(self, identifiers: List[str]) -> Dict:
+        remaining = [i for i in identifiers if not self.checkpoint.is_done(i)]
+        print(
+            f"[Backfill] {len(identifiers)} channels, {len(identifiers) - len(remaining)} already done, "
+            f"{len(remaining)} to collect with {self.max_workers} workers"
+        )
+        for identifier in remaining:
+            self._work.put(identifier)
+
+        start = time.time()
+        loaded = {'total': 0}
+        loader_error: List[BaseException] = []
+
+        def run_loader() -> None:
+            try:
+                loaded['total'] = self._loader()
+            except BaseException as e:  # 적재 실패 시 수집도 중단
+                loader_error.append(e)
+                self._quota_exhausted.set()
+                # 워커가 put에서 막히지 않도록 큐를 비움
+                while True:
+                    try:
+                        self._loads.get_nowait()
+                    except queue.Empty:
+                        break
+
+        loader = threading.Thread(target=run_loader, name='backfill-loader')
+        loader.start()
+        workers = [
+            threading.Thread(target=self._worker, args=(i,), name=f'backfill-worker-{i}')
+            for i in range(min(self.max_workers, max(1, len(remaining))))
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        if not loader_error:
+            self._loads.put(None)
+        loader.join()
+        if loader_error:
+            raise loader_error[0]
+
+        result = {
+            'loaded_this_run': loaded['total'],
+            'elapsed_sec': round(time.time() - start, 1),
+            'quota_exhausted': self._quota_exhausted.is_set(),
+            'errors': len(self._errors),
+            **self.checkpoint.summary(),
+        }
+        print(f"[Backfill] Finished: {result}")
+        return result
@@ -72,6 +72,30 @@ class YouTubeCollector:
             return self._rotate_api_key()
         return False
     
+    @staticmethod
+    def _is_quota_error(error: HttpError) -> bool:
+        return error.resp.status == 403 and 'quota' in str(error).lower()
+
+    def _lookup_channel_id_by_handle(self, channel_handle: str) -> Optional[str]:
+        """forHandle 조회 → 실패 시 검색 fallback (_execute_with_rotation 사용, HttpError는 전파)"""
+        # @ 기호 제거 (API에는 @ 없이 전달)
+        handle_without_at = channel_handle[1:] if channel_handle.startswith('@') else channel_handle
+
+        # YouTube Data API v3의 forHandle 파라미터 사용 (더 정확함)
+        channels_response = self._execute_with_rotation(
+            lambda youtube: youtube.channels().list(part='id', forHandle=handle_without_at)
+        )
+        if channels_response.get('items'):
+            return channels_response['items'][0]['id']
+
+        # forHandle이 작동하지 않으면 검색으로 fallback
+        search_response = self._execute_with_rotation(
+            lambda youtube: youtube.search().list(q=handle_without_at, part='snippet', type='channel', maxResults=1)
+        )
+        if search_response.get('items'):
+            return search_response['items'][0]['snippet']['channelId']
+        return None
+
     def get_channel_id_by_handle(self, channel_handle: str) -> Optional[str]:
         """
         채널 핸들로 채널 ID 가져오기 (YouTube Data API v3 forHandle 사용)
@@ -90,44 +114,11 @@ class YouTubeCollector:
         if not channel_handle.startswith('@'):
             channel_handle = '@' + channel_handle
         
-        max_retries = len(self.api_keys) if self.rotation_enabled else 1
-        
-        for attempt in range(max_retries):
-            try:
-                # YouTube Data API v3의 forHandle 파라미터 사용 (더 정확함)
-                # @ 기호 제거 (API에는 @ 없이 전달)
-                handle_without_at = channel_handle[1:] if channel_handle.startswith('@') else channel_handle
-                
-                channels_response = self.youtube.channels().list(
-                    part='id',
-                    forHandle=handle_without_at
-                ).execute()
-                
-                if channels_response.get('items') and len(channels_response['items']) > 0:
-                    return channels_response['items'][0]['id']
-                
-                # forHandle이 작동하지 않으면 검색으로 fallback
-                search_response = self.youtube.search().list(
-                    q=handle_without_at,
-                    part='snippet',
-                    type='channel',
-                    maxResults=1
-                ).execute()
-                
-                if search_response.get('items'):
-                    return search_response['items'][0]['snippet']['channelId']
-                return None
-            except HttpError as e:
-                if e.resp.status == 403 and 'quota' in str(e).lower():
-                    if attempt < max_retries - 1:
-                        if self._handle_quota_error(e):
-                            continue  # 다음 키로 재시도
-                    print(f"Error getting channel ID for handle {channel_handle}: {e}")
-                    return None
-                print(f"Error getting channel ID for handle {channel_handle}: {e}")
-                return None
-        
-        return None
+        try:
+            return self._lookup_channel_id_by_handle(channel_handle)
+        except HttpError as e:
+            print(f"Error getting channel ID for handle {channel_handle}: {e}")
+            return None
     
     def get_channel_id_by_name(self, channel_name: str) -> Optional[str]:
         """
@@ -139,30 +130,15 @@ class YouTubeCollector:
         Returns:
             채널 ID 또는 None
         """
-        max_retries = len(self.api_keys) if self.rotation_enabled else 1
-        
-        for attempt in range(max_retries):
-            try:
-                search_response = self.youtube.search().list(
-                    q=channel_name,
-                    part='snippet',
-                    type='channel',
-                    maxResults=1
-                ).execute()
-                
-                if search_response.get('items'):
-                    return search_response['items'][0]['snippet']['channelId']
-                return None
-            except HttpError as e:
-                if e.resp.status == 403 and 'quota' in str(e).lower():
-                    if attempt < max_retries - 1:
-                        if self._handle_quota_error(e):
-                            continue  # 다음 키로 재시도
-                    print(f"Error getting channel ID for name {channel_name}: {e}")
-                    return None
-                print(f"Error getting channel ID for name {channel_name}: {e}")
-                return None
-        
+        try:
+            search_response = self._execute_with_rotation(
+                lambda youtube: youtube.search().list(q=channel_name, part='snippet', type='channel', maxResults=1)
+            )
+        except HttpError as e:
+            print(f"Error getting channel ID for name {channel_name}: {e}")
+            return None
+        if search_response.get('items'):
+            return search_response['items'][0]['snippet']['channelId']
         return None
     
     def search_channels(self, keywords: List[str], max_results: int = 50) -> List[Dict]:
@@ -210,6 +186,28 @@ class YouTubeCollector:
         
         return channels[:max_results]
     
+    def _fetch_channel_details(self, channel_id: str) -> Optional[Dict]:
+        """channels().list(snippet,statistics) (_execute_with_rotation 사용, HttpError는 전파)"""
+        response = self._execute_with_rotation(
+            lambda youtube: youtube.channels().list(part='snippet,statistics', id=channel_id)
+        )
+        if not response.get('items'):
+            return None
+
+        item = response['items'][0]
+        # country는 기본값 'KR' 설정 (채널 정보에서 직접 가져올 수 없음)
+        return {
+            'id': channel_id,  # DB 테이블의 PK
+            'channel_id': channel_id,  # 공통 필드명
+            'title': item['snippet']['title'],
+            'description': item['snippet'].get('description', ''),
+            'country': 'KR',  # 기본값, 필요시 별도 처리
+            'subscriber_count': int(item['statistics'].get('subscriberCount', 0)),
+            'video_count': int(item['statistics'].get('videoCount', 0)),
+            'view_count': int(item['statistics'].get('viewCount', 0)),
+            'thumbnail_url': item['snippet']['thumbnails'].get('default', {}).get('url', '')
+        }
+
     def get_channel_details(self, channel_id: str) -> Optional[Dict]:
         """
         채널 상세 정보 가져오기
@@ -221,42 +219,11 @@ class YouTubeCollector:
         Returns:
             채널 정보 딕셔너리
         """
-        max_retries = len(self.api_keys) if self.rotation_enabled else 1
-        
-        for attempt in range(max_retries):
-            try:
-                response = self.youtube.channels().list(
-                    part='snippet,statistics',
-                    id=channel_id
-                ).execute()
-                
-                if not response.get('items'):
-                    return None
-                
-                item = response['items'][0]
-                # country는 기본값 'KR' 설정 (채널 정보에서 직접 가져올 수 없음)
-                return {
-                    'id': channel_id,  # DB 테이블의 PK
-                    'channel_id': channel_id,  # 공통 필드명
-                    'title': item['snippet']['title'],
-                    'description': item['snippet'].get('description', ''),
-                    'country': 'KR',  # 기본값, 필요시 별도 처리
-                    'subscriber_count': int(item['statistics'].get('subscriberCount', 0)),
-                    'video_count': int(item['statistics'].get('videoCount', 0)),
-                    'view_count': int(item['statistics'].get('viewCount', 0)),
-                    'thumbnail_url': item['snippet']['thumbnails'].get('default', {}).get('url', '')
-                }
-            except HttpError as e:
-                if e.resp.status == 403 and 'quota' in str(e).lower():
-                    if attempt < max_retries - 1:
-                        if self._handle_quota_error(e):
-                            continue  # 다음 키로 재시도
-                    print(f"Error getting channel details for {channel_id}: {e}")
-                    return None
-                print(f"Error getting channel details for {channel_id}: {e}")
-                return None
-        
-        return None
+        try:
+            return self._fetch_channel_details(channel_id)
+        except HttpError as e:
+            print(f"Error getting channel details for {channel_id}: {e}")
+            return None
     
     def _duration_to_seconds(self, iso_duration: str) -> int:
         """Convert ISO8601 duration (e.g., PT10M30S) to seconds."""
@@ -266,6 +233,140 @@ class YouTubeCollector:
         except Exception:
             return 0
 
+    def _parse_video_item(self, item: Dict, channel_id: str, cutoff=None, min_duration_sec: int = 240) -> Optional[Dict]:
+        """
+        videos().list 응답 항목 → 적재용 딕셔너리
+        lookback cutoff 이전 영상이나 Shorts면 None
+        """
+        import datetime
+
+        published_at = item['snippet']['publishedAt']
+        try:
+            published_dt = datetime.datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+        except Exception:
+            published_dt = datetime.datetime.utcnow()
+
+        # lookback cutoff
+        if cutoff is not None and published_dt.replace(tzinfo=None) < cutoff:
+            return None
+
+        # Shorts 필터: duration < min_duration_sec 또는 제목/설명 해시태그 포함 시 제외
+        iso_dur = item['contentDetails'].get('duration', '')
+        dur_sec = self._duration_to_seconds(iso_dur)
+        title = item['snippet']['title']
+        desc = item['snippet'].get('description', '')
+        if dur_sec and dur_sec < min_duration_sec:
+            return None
+        lowered = f"{title} {desc}".lower()
+        if '#shorts' in lowered or 'shorts/' in lowered:
+            return None
+
+        tags = item['snippet'].get('tags', [])
+        tags_json = None if not tags else tags
+
+        return {
+            'id': item['id'],
+            'video_id': item['id'],
+            'channel_id': channel_id,
+            'title': title,
+            'description': desc,
+            'published_at': published_at,
+            'duration': iso_dur,
+            'view_count': int(item['statistics'].get('viewCount', 0)),
+            'like_count': int(item['statistics'].get('likeCount', 0)),
+            'comment_count': int(item['statistics'].get('commentCount', 0)),
+            'category_id': int(item['snippet'].get('categoryId', 0)),
+            'tags': tags_json,
+            'thumbnail_url': item['snippet']['thumbnails'].get('default', {}).get('url', ''),
+            'keyword': None,
+            'region': 'KR'
+        }
+
+    def _execute_with_rotation(self, build_request):
+        """
+        요청 실행 (할당량 초과 시 다음 키로 로테이션 후 재시도)
+        모든 키가 할당량 초과면 HttpError를 그대로 전파
+        """
+        max_retries = len(self.api_keys) if self.rotation_enabled else 1
+        for attempt in range(max_retries):
+            try:
+                return build_request(self.youtube).execute()
+            except HttpError as e:
+                if e.resp.status == 403 and 'quota' in str(e).lower():
+                    if attempt < max_retries - 1 and self._handle_quota_error(e):
+                        continue  # 다음 키로 재시도
+                raise
+
+    def iter_channel_video_pages(
+        self,
+        channel_id: str,
+        lookback_hours: int = 24,
+        min_duration_sec: int = 240,
+        page_token: Optional[str] = None,
+        max_pages: Optional[int] = None,
+    ):
+        """
+        업로드 재생목록을 페이지 단위로 순회 (백필 체크포인트용)
+        업로드 재생목록은 최신순이므로 한 페이지가 모두 cutoff 이전이면 중단
+
+        Args:
+            channel_id: 채널 ID
+            lookback_hours: 최근 몇 시간 이내 영상만 (0이면 제한 없음)
+            page_token: 이어서 시작할 페이지 토큰 (체크포인트)
+            max_pages: 최대 페이지 수
+
+        Yields:
+            (videos, next_page_token) - 마지막 페이지의 next_page_token은 None
+        """
+        import datetime
+
+        channel_response = self._execute_with_rotation(
+            lambda yt: yt.channels().list(part='contentDetails', id=channel_id)
+        )
+        if not channel_response.get('items'):
+            return
+        uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+        cutoff = datetime.datetime.utcnow() - datetime.timedelta(hours=lookback_hours) if lookback_hours else None
+
+        pages = 0
+        while True:
+            playlist_items = self._execute_with_rotation(
+                lambda yt: yt.playlistItems().list(
+                    part='snippet,contentDetails',
+                    playlistId=uploads_playlist_id,
+                    maxResults=50,
+                    pageToken=page_token
+                )
+            )
+            items = playlist_items.get('items', [])
+            video_ids = [item['contentDetails']['videoId'] for item in items]
+            if not video_ids:
+                return
+
+            videos_response = self._execute_with_rotation(
+                lambda yt: yt.videos().list(part='snippet,statistics,contentDetails', id=','.join(video_ids))
+            )
+            videos = []
+            for item in videos_response.get('items', []):
+                video = self._parse_video_item(item, channel_id, cutoff, min_duration_sec)
+                if video is not None:
+                    videos.append(video)
+
+            page_token = playlist_items.get('nextPageToken')
+            pages += 1
+            reached_cutoff = cutoff is not None and all(
+                datetime.datetime.fromisoformat(
+                    item['contentDetails'].get('videoPublishedAt', item['snippet']['publishedAt']).replace('Z', '+00:00')
+                ).replace(tzinfo=None) < cutoff
+                for item in items
+            )
+            if reached_cutoff or (max_pages is not None and pages >= max_pages):
+                page_token = None
+            yield videos, page_token
+            if not page_token:
+                return
+            time.sleep(0.1)
+
     def get_channel_videos(self, channel_id: str, max_results: int = 10, lookback_hours: int = 24, min_duration_sec: int = 240) -> List[Dict]:
         """
         채널의 인기 영상 목록 가져오기
@@ -317,47 +418,10 @@ class YouTubeCollector:
                     ).execute()
 
                     for item in videos_response.get('items', []):
-                        published_at = item['snippet']['publishedAt']
-                        try:
-                            published_dt = datetime.datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                        except Exception:
-                            published_dt = datetime.datetime.utcnow()
-
-                        # lookback cutoff
-                        if lookback_hours and published_dt < cutoff:
-                            continue
-
-                        # Shorts 필터: duration < min_duration_sec 또는 제목/설명 해시태그 포함 시 제외
-                        iso_dur = item['contentDetails'].get('duration', '')
-                        dur_sec = self._duration_to_seconds(iso_dur)
-                        title = item['snippet']['title']
-                        desc = item['snippet'].get('description', '')
-                        if dur_sec and dur_sec < min_duration_sec:
-                            continue
-                        lowered = f"{title} {desc}".lower()
-                        if '#shorts' in lowered or 'shorts/' in lowered:
+                        video = self._parse_video_item(item, channel_id, cutoff if lookback_hours else None, min_duration_sec)
+                        if video is None:
                             continue
-
-                        tags = item['snippet'].get('tags', [])
-                        tags_json = None if not tags else tags
-
-                        videos.append({
-                            'id': item['id'],
-                            'video_id': item['id'],
-                            'channel_id': channel_id,
-                            'title': title,
-                            'description': desc,
-                            'published_at': published_at,
-                            'duration': iso_dur,
-                            'view_count': int(item['statistics'].get('viewCount', 0)),
-                            'like_count': int(item['statistics'].get('likeCount', 0)),
-                            'comment_count': int(item['statistics'].get('commentCount', 0)),
-                            'category_id': int(item['snippet'].get('categoryId', 0)),
-                            'tags': tags_json,
-                            'thumbnail_url': item['snippet']['thumbnails'].get('default', {}).get('url', ''),
-                            'keyword': None,
-                            'region': 'KR'
-                        })
+                        videos.append(video)
                         collected += 1
                         if collected >= max_results:
                             break
@@ -387,6 +451,8 @@ class YouTubeCollector:
     def resolve_channel_id(self, handle_or_id: str) -> Optional[str]:
         """
         채널 핸들 또는 ID를 실제 채널 ID로 변환
+        할당량 초과 시 자동 키 로테이션, 모든 키가 할당량 초과면 HttpError 전파
+        (호출자가 "채널 없음"과 구분해 중단/재개할 수 있도록)
         
         Args:
             handle_or_id: 채널 핸들(@ 포함) 또는 채널 ID
@@ -401,12 +467,15 @@ class YouTubeCollector:
         if handle_or_id.startswith('UC') and len(handle_or_id) == 24:
             return handle_or_id
         
-        # 핸들인 경우
-        if handle_or_id.startswith('@'):
-            return self.get_channel_id_by_handle(handle_or_id)
-        
-        # @ 없이 핸들만 있는 경우
-        return self.get_channel_id_by_handle(f"@{handle_or_id}")
+        # @ 없이 핸들만 있는 경우 @ 추가
+        channel_handle = handle_or_id if handle_or_id.startswith('@') else f"@{handle_or_id}"
+        try:
+            return self._lookup_channel_id_by_handle(channel_handle)
+        except HttpError as e:
+            if self._is_quota_error(e):
+                raise
+            print(f"Error getting channel ID for handle {channel_handle}: {e}")
+            return None
     
     def get_channel_id_by_handle_with_retry(self, channel_handle: str, max_retries: int = 3) -> Optional[str]:
         """할당량 초과 시 자동 키 로테이션하여 재시도"""
@@ -424,7 +493,8 @@ class YouTubeCollector:
     
     def get_channel_metadata(self, channel_id: str) -> Optional[Dict]:
         """
-        채널 메타데이터 가져오기 (기존 get_channel_details의 alias)
+        채널 메타데이터 가져오기 (get_channel_details와 같은 조회)
+        할당량 초과 시 자동 키 로테이션, 모든 키가 할당량 초과면 HttpError 전파
         
         Args:
             channel_id: 채널 ID
@@ -432,7 +502,13 @@ class YouTubeCollector:
         Returns:
             채널 메타데이터 딕셔너리
         """
-        return self.get_channel_details(channel_id)
+        try:
+            return self._fetch_channel_details(channel_id)
+        except HttpError as e:
+            if self._is_quota_error(e):
+                raise
+            print(f"Error getting channel details for {channel_id}: {e}")
+            return None
     
     def collect_channel_videos(self, channel_id_or_handle: str, lookback_hours: int = 24, max_results: int = 50) -> Dict:
         """
@@ -0,0 +1,38 @@
+#!/bin/bash
+# 서비스 간 공유 모듈 사본 확인 스크립트
+# 서비스마다 Docker/Bento 이미지를 따로 빌드하므로 공유 모듈은 각 서비스에 사본으로 둠
+# → 원본과 사본이 바이트 단위로 같은지 확인하고, 다르면 실패 (--sync: 원본을 사본에 복사)
+#
+# 사용법:
+#   ./check-shared-copies.sh          # 확인만 (다르면 exit 1)
+#   ./check-shared-copies.sh --sync   # 원본 → 사본 복사
+
+cd "$(dirname "$0")" || exit 1
+
+# "원본 사본" 쌍
+PAIRS=(
+  "backend/app/clients/http.py web-api/app/utils/http_client.py"
+  "model_server_bento/wire_format.py backend/app/clients/wire_format.py"
+  "ml-api/app/inference_profile.py model_server_bento/inference_profile.py"
+)
+
+status=0
+for pair in "${PAIRS[@]}"; do
+  read -r source copy <<< "$pair"
+  if cmp -s "$source" "$copy"; then
+    echo "✓ $copy"
+  elif [ "$1" == "--sync" ]; then
+    cp "$source" "$copy"
+    echo "↻ $copy ← $source"
+  else
+    echo "✗ $copy 가 $source 와 다름"
+    diff -u "$source" "$copy" | head -20
+    status=1
+  fi
+done
+
+if [ $status -ne 0 ]; then
+  echo ""
+  echo "원본을 수정한 뒤 ./check-shared-copies.sh --sync 로 사본을 맞추세요"
+fi
+exit $status
@@ -0,0 +1,224 @@
+"""
+메모리 매핑 임베딩 저장소 (embeddings.json / word_embeddings.json 대체)
+
+파일 구성 (prefix 기준):
+- {prefix}.vectors.npy : float32 [N, dim] 행렬, 행은 키 해시 오름차순
+- {prefix}.keys.npy    : uint64 [N] 키 해시 (blake2b 8바이트, 오름차순) → np.searchsorted로 행 번호 조회
+- {prefix}.meta.json   : count / dim / hash / source
+
+두 .npy 파일은 np.load(mmap_mode="r")로 열기 때문에 시작 시 파싱이 없고,
+여러 워커 프로세스가 같은 파일을 열면 OS 페이지 캐시를 공유함 (프로세스별 dict/list 복사본 없음)
+
+변환은 임시 파일에 쓴 뒤 os.replace로 바꿔 넣고 meta.json을 마지막에 놓음 → 쓰는 중인 파일을 열지 않음.
+여러 워커가 동시에 시작하면 {prefix}.lock 파일 잠금으로 한 프로세스만 변환하고 나머지는 기다렸다가 결과를 엶.
+
+변환 (1회):
+    python -m app.embedding_store convert ./model/embeddings.json ./model/embeddings
+    python -m app.embedding_store auto     # 기본 경로의 JSON 중 아직 변환되지 않은 것만 변환
+"""
+import hashlib
+import json
+import os
+import sys
+from contextlib import contextmanager
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows 로컬 개발: 잠금 없이 임시 파일 + os.replace만 사용
+    fcntl = None
+
+HASH_NAME = "blake2b-64"
+
+
+def key_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def key_hashes(keys: Iterable[str]) -> np.ndarray:
+    return np.fromiter((key_hash(k) for k in keys), dtype=np.uint64)
+
+
+def store_paths(prefix: str) -> Tuple[str, str, str]:
+    return f"{prefix}.vectors.npy", f"{prefix}.keys.npy", f"{prefix}.meta.json"
+
+
+def store_exists(prefix: str) -> bool:
+    return all(os.path.exists(path) for path in store_paths(prefix))
+
+
+def _tmp_path(path: str) -> str:
+    """같은 디렉터리의 프로세스별 임시 경로 (np.save가 .npy를 덧붙이지 않도록 확장자 유지)"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.tmp{os.getpid()}{ext}"
+
+
+@contextmanager
+def conversion_lock(prefix: str):
+    """{prefix}.lock 배타 잠금 (프로세스 간 변환 직렬화)"""
+    if fcntl is None:
+        yield
+        return
+    with open(f"{prefix}.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def convert_json(json_path: str, prefix: str) -> dict:
+    """
+    {key: [float, ...]} JSON → 메모리 매핑 저장소
+    차원이 다른 벡터는 건너뛰고, 해시 충돌이 있으면 ValueError
+    """
+    with open(json_path, "r", encoding="utf-8") as f:
+        mapping = json.load(f)
+
+    dim = next((len(v) for v in mapping.values() if isinstance(v, list) and v), 0)
+    keys = [k for k, v in mapping.items() if isinstance(v, list) and len(v) == dim]
+    if not keys:
+        raise ValueError(f"{json_path}: no vectors to convert")
+
+    hashes = key_hashes(keys)
+    order = np.argsort(hashes, kind="stable")
+    hashes = hashes[order]
+    if len(hashes) > 1 and np.any(hashes[1:] == hashes[:-1]):
+        raise ValueError(f"{json_path}: 64-bit key hash collision, cannot build store")
+
+    os.makedirs(os.path.dirname(os.path.abspath(prefix)), exist_ok=True)
+    paths = store_paths(prefix)
+    tmp_paths = [_tmp_path(path) for path in paths]
+    vectors_tmp, keys_tmp, meta_tmp = tmp_paths
+    try:
+        vectors = np.lib.format.open_memmap(vectors_tmp, mode="w+", dtype=np.float32, shape=(len(keys), dim))
+        for row, idx in enumerate(order):
+            vectors[row] = mapping[keys[idx]]
+        vectors.flush()
+        del vectors
+        np.save(keys_tmp, hashes)
+        meta = {"count": len(keys), "dim": dim, "hash": HASH_NAME, "source": os.path.basename(json_path)}
+        with open(meta_tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        # meta.json을 마지막에 바꿔 넣음 (store_exists는 세 파일이 모두 있어야 True)
+        for tmp_path, path in zip(tmp_paths, paths):
+            os.replace(tmp_path, path)
+    finally:
+        for tmp_path in tmp_paths:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return meta
+
+
+class EmbeddingStore:
+    """읽기 전용 메모리 매핑 임베딩 조회 (행 조회는 복사 없는 view)"""
+
+    def __init__(self, prefix: str):
+        vectors_path, keys_path, meta_path = store_paths(prefix)
+        with open(meta_path, "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("hash") != HASH_NAME:
+            raise ValueError(f"{prefix}: unsupported key hash {self.meta.get('hash')}")
+        self.prefix = prefix
+        self.vectors = np.load(vectors_path, mmap_mode="r")
+        self.hashes = np.load(keys_path, mmap_mode="r")
+        if self.vectors.shape[0] != self.hashes.shape[0]:
+            raise ValueError(f"{prefix}: vectors/keys row count mismatch")
+
+    @property
+    def dim(self) -> int:
+        return int(self.vectors.shape[1])
+
+    def __len__(self) -> int:
+        return int(self.vectors.shape[0])
+
+    def rows_for(self, keys: Sequence[str]) -> np.ndarray:
+        """키 목록 → 행 번호 (없으면 -1)"""
+        if len(keys) == 0 or len(self) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+        wanted = key_hashes(keys)
+        pos = np.searchsorted(self.hashes, wanted)
+        pos = np.minimum(pos, len(self) - 1)
+        return np.where(self.hashes[pos] == wanted, pos, -1).astype(np.int64)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """단일 키 벡터 (memmap view, 복사 없음)"""
+        row = self.rows_for([key])[0]
+        return None if row < 0 else self.vectors[row]
+
+    def get_many(self, keys: Sequence[str]) -> Optional[np.ndarray]:
+        """모든 키가 있으면 [len(keys), dim] 행렬, 하나라도 없으면 None"""
+        rows = self.rows_for(keys)
+        if np.any(rows < 0):
+            return None
+        return np.asarray(self.vectors[rows], dtype=np.float32)
+
+    def mean_pool(self, token_lists: Sequence[Sequence[str]]) -> np.ndarray:
+        """
+        문장별 토큰 벡터 평균 [len(token_lists), dim] (없는 토큰은 제외, 토큰이 하나도 없으면 0 벡터)
+        모든 토큰 행을 한 번에 모아 np.add.reduceat으로 문장 단위 합산
+        """
+        out = np.zeros((len(token_lists), self.dim), dtype=np.float32)
+        lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=len(token_lists))
+        if lengths.sum() == 0:
+            return out
+        rows = self.rows_for([token for tokens in token_lists for token in tokens])
+        found = rows >= 0
+        # 문장 경계를 유지한 채 찾은 토큰만 남김
+        segment = np.repeat(np.arange(len(token_lists)), lengths)[found]
+        counts = np.bincount(segment, minlength=len(token_lists))
+        if counts.sum() == 0:
+            return out
+        gathered = np.asarray(self.vectors[rows[found]], dtype=np.float32)
+        nonempty = np.flatnonzero(counts)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[nonempty]
+        out[nonempty] = np.add.reduceat(gathered, starts, axis=0) / counts[nonempty, None]
+        return out
+
+
+def open_store(prefix: str, json_path: Optional[str] = None) -> Optional[EmbeddingStore]:
+    """
+    저장소 열기. 없고 json_path가 있으면 1회 변환 후 열기 (실패 시 None)
+    """
+    if not store_exists(prefix):
+        if not json_path or not os.path.exists(json_path):
+            return None
+        with conversion_lock(prefix):
+            # 잠금을 기다리는 동안 다른 워커가 변환을 끝냈으면 그대로 사용
+            if not store_exists(prefix):
+                print(f"ℹ️ Converting {json_path} → {prefix}.*.npy (one-time)")
+                meta = convert_json(json_path, prefix)
+                print(f"✓ Converted {meta['count']} vectors (dim={meta['dim']})")
+    return EmbeddingStore(prefix)
+
+
+DEFAULT_SOURCES = (
+    ("EMBEDDINGS_JSON", "./model/embeddings.json", "EMBEDDINGS_STORE", "./model/embeddings"),
+    ("WORD_EMBED_JSON", "./model/tokenizer/word_embeddings.json", "WORD_EMBED_STORE", "./model/tokenizer/word_embeddings"),
+)
+
+
+def _main(argv: List[str]) -> int:
+    if len(argv) == 3 and argv[0] == "convert":
+        meta = convert_json(argv[1], argv[2])
+        print(f"✓ {argv[1]} → {argv[2]}: {meta['count']} vectors, dim={meta['dim']}")
+        return 0
+    if len(argv) == 1 and argv[0] == "auto":
+        for json_env, json_default, store_env, store_default in DEFAULT_SOURCES:
+            json_path = os.getenv(json_env, json_default)
+            prefix = os.getenv(store_env, store_default)
+            if not os.path.exists(json_path) or store_exists(prefix):
+                continue
+            with conversion_lock(prefix):
+                if not store_exists(prefix):
+                    meta = convert_json(json_path, prefix)
+                    print(f"✓ {json_path} → {prefix}: {meta['count']} vectors, dim={meta['dim']}")
+        return 0
+    print(__doc__)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
@@ -1,12 +1,17 @@
-from typing import Any, Dict, List
-from fastapi import FastAPI
+from typing import Any, Dict, List, Tuple
+from collections import OrderedDict
+from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 import numpy as np
 import onnxruntime as ort
 import os
-import json
+import hashlib
+import threading
 from typing import Optional, Dict
 
+from app.embedding_store import EmbeddingStore, open_store
+from app.inference_profile import InferenceProfile, SessionRunner, run_batched
+
 # 토크나이저 로드를 위한 import (선택적)
 try:
     from transformers import AutoTokenizer
@@ -39,12 +44,14 @@ class SentimentOut(BaseModel):
 
 class RerankCandidate(BaseModel):
     id: str
-    text: str
+    text: Optional[str] = None
+    vector: Optional[List[float]] = None  # 호출 측이 캐시한 임베딩 (있으면 인코딩 생략)
 
 
 class RerankIn(BaseModel):
     query: str
     candidates: List[RerankCandidate]
+    top_k: Optional[int] = None
 
 
 class RerankOutItem(BaseModel):
@@ -55,24 +62,27 @@ class RerankOutItem(BaseModel):
 app = FastAPI(title="ML API", version="0.1.0")
 
 _ort_sess: Optional[ort.InferenceSession] = None
+_ort_runner: Optional[SessionRunner] = None
+# SessionOptions / 길이순 배칭 / I/O binding / int8 설정 (app/inference_profile.py)
+_profile = InferenceProfile.from_env(max_length=int(os.getenv("MAX_SEQ_LENGTH", "512")))
 _tokenizer: Optional[Any] = None
 _dim: int = int(os.getenv("EMBEDDING_DIM", "768"))
-_embeddings_map: Optional[Dict[str, List[float]]] = None
-_word_map: Optional[Dict[str, List[float]]] = None
+_embeddings_store: Optional[EmbeddingStore] = None  # 문장 전체 매핑 (메모리 매핑)
+_word_store: Optional[EmbeddingStore] = None  # 단어 임베딩 (메모리 매핑)
 
 
 @app.on_event("startup")
 def startup_load_model() -> None:
-    global _ort_sess, _tokenizer
-    global _embeddings_map, _word_map, _dim
+    global _ort_sess, _ort_runner, _tokenizer
+    global _embeddings_store, _word_store, _dim
     
     # ONNX 모델 로드 (optional, 없어도 됨)
     model_path = os.getenv("MODEL_PATH", "./model/finetuned_video_sts.onnx")
     if model_path and os.path.exists(model_path):
         try:
-            providers = ["CPUExecutionProvider"]
-            _ort_sess = ort.InferenceSession(model_path, providers=providers)
-            print(f"✓ ONNX model loaded from {model_path}")
+            _ort_sess = _profile.create_session(model_path)
+            _ort_runner = SessionRunner(_ort_sess, io_binding=_profile.io_binding)
+            print(f"✓ ONNX model loaded from {_profile.resolve_model_path(model_path)} ({_profile.describe()})")
             
             # 토크나이저 로드 (ONNX 모델이 있으면 토크나이저도 필요)
             if _has_transformers:
@@ -86,45 +96,38 @@ def startup_load_model() -> None:
         except Exception as e:
             print(f"⚠️ ONNX model load failed: {e}")
             _ort_sess = None
+            _ort_runner = None
     else:
         _ort_sess = None
-        print(f"ℹ️ ONNX model not found at {model_path}, using JSON embeddings only")
+        print(f"ℹ️ ONNX model not found at {model_path}, using mapped embeddings only")
 
-    # JSON embeddings (문장 전체 매핑)
+    # 문장/단어 임베딩: 메모리 매핑 저장소 (app/embedding_store.py)
+    # 저장소가 없고 JSON만 있으면 1회 변환 (이미지 빌드 시 `python -m app.embedding_store auto`로 미리 변환)
     emb_json = os.getenv("EMBEDDINGS_JSON", "./model/embeddings.json")
-    if os.path.exists(emb_json):
-        try:
-            with open(emb_json, "r", encoding="utf-8") as f:
-                _embeddings_map = json.load(f)
-            # adjust dim if provided vectors indicate a size
-            for _k, v in _embeddings_map.items():
-                if isinstance(v, list) and len(v) > 0:
-                    _dim = len(v)
-                    break
-            print(f"✓ Loaded {len(_embeddings_map)} embeddings from {emb_json}")
-        except Exception as e:
-            print(f"⚠️ Failed to load embeddings.json: {e}")
-            _embeddings_map = None
-    else:
-        print(f"ℹ️ embeddings.json not found at {emb_json}")
+    emb_store = os.getenv("EMBEDDINGS_STORE", "./model/embeddings")
+    try:
+        _embeddings_store = open_store(emb_store, emb_json)
+        if _embeddings_store is not None:
+            _dim = _embeddings_store.dim
+            print(f"✓ Mapped {len(_embeddings_store)} embeddings from {emb_store}")
+        else:
+            print(f"ℹ️ embeddings store not found at {emb_store} (json: {emb_json})")
+    except Exception as e:
+        print(f"⚠️ Failed to open embeddings store: {e}")
+        _embeddings_store = None
 
-    # 단어 임베딩 (토크나이저 방식)
     word_json = os.getenv("WORD_EMBED_JSON", "./model/tokenizer/word_embeddings.json")
-    if os.path.exists(word_json):
-        try:
-            with open(word_json, "r", encoding="utf-8") as f:
-                _word_map = json.load(f)
-            # adjust dim from first
-            for _k, v in _word_map.items():
-                if isinstance(v, list) and len(v) > 0:
-                    _dim = len(v)
-                    break
-            print(f"✓ Loaded {len(_word_map)} word embeddings from {word_json}")
-        except Exception as e:
-            print(f"⚠️ Failed to load word_embeddings.json: {e}")
-            _word_map = None
-    else:
-        print(f"ℹ️ word_embeddings.json not found at {word_json}")
+    word_store = os.getenv("WORD_EMBED_STORE", "./model/tokenizer/word_embeddings")
+    try:
+        _word_store = open_store(word_store, word_json)
+        if _word_store is not None:
+            _dim = _word_store.dim
+            print(f"✓ Mapped {len(_word_store)} word embeddings from {word_store}")
+        else:
+            print(f"ℹ️ word embeddings store not found at {word_store} (json: {word_json})")
+    except Exception as e:
+        print(f"⚠️ Failed to open word embeddings store: {e}")
+        _word_store = None
     
     print(f"📊 Embedding dimension: {_dim}")
 
@@ -134,69 +137,63 @@ def ping() -> Dict[str, str]:
     return {"status": "ok"}
 
 
-def _simple_encode(texts: List[str]) -> np.ndarray:
+def _onnx_encode_batch(inputs: Dict[str, np.ndarray]) -> np.ndarray:
+    # ONNX 추론 (입력 이름은 SessionRunner가 모델 입력에 맞게 거름)
+    outputs = _ort_runner.run(inputs)
+    attention_mask = inputs["attention_mask"]
+
+    # last_hidden_state에서 평균 pooling (간단한 방법)
+    # outputs[0] = last_hidden_state [batch, seq_len, hidden_dim]
+    # outputs[1] = pooler_output [batch, hidden_dim] (있으면 사용)
+    if len(outputs) > 1 and outputs[1] is not None:
+        # pooler_output 사용
+        embeddings = outputs[1].astype(np.float32)
+    else:
+        # last_hidden_state에서 attention_mask로 평균 pooling
+        last_hidden = outputs[0].astype(np.float32)  # [batch, seq, hidden]
+        mask = attention_mask.astype(np.float32)[:, :, np.newaxis]  # [batch, seq, 1]
+        masked_sum = (last_hidden * mask).sum(axis=1)  # [batch, hidden]
+        mask_sum = mask.sum(axis=1)  # [batch, 1]
+        embeddings = masked_sum / (mask_sum + 1e-9)  # [batch, hidden]
+
+    # L2 정규화 (선택적, 일반적으로 cosine similarity를 위해)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    embeddings = embeddings / (norms + 1e-9)
+
+    return embeddings.astype(np.float32)
+
+
+ENCODER_ONNX = "onnx"
+
+
+def _encode_with_source(texts: List[str]) -> Tuple[np.ndarray, str]:
+    """(임베딩 행렬, 사용한 인코더 이름) - fallback 벡터는 ONNX 벡터와 공간/차원이 다를 수 있음"""
     # Priority 1: ONNX model inference
-    if _ort_sess is not None and _tokenizer is not None:
+    if _ort_runner is not None and _tokenizer is not None:
         try:
-            # 토크나이저로 텍스트 인코딩
-            encoded = _tokenizer(texts, return_tensors="np", padding=True, truncation=True, max_length=512)
-            input_ids = encoded["input_ids"].astype(np.int64)
-            attention_mask = encoded["attention_mask"].astype(np.int64)
-            
-            # ONNX 추론
-            outputs = _ort_sess.run(
-                None,
-                {
-                    "input_ids": input_ids,
-                    "attention_mask": attention_mask
-                }
-            )
-            
-            # last_hidden_state에서 평균 pooling (간단한 방법)
-            # outputs[0] = last_hidden_state [batch, seq_len, hidden_dim]
-            # outputs[1] = pooler_output [batch, hidden_dim] (있으면 사용)
-            if len(outputs) > 1 and outputs[1] is not None:
-                # pooler_output 사용
-                embeddings = outputs[1].astype(np.float32)
-            else:
-                # last_hidden_state에서 attention_mask로 평균 pooling
-                last_hidden = outputs[0].astype(np.float32)  # [batch, seq, hidden]
-                mask = attention_mask.astype(np.float32)[:, :, np.newaxis]  # [batch, seq, 1]
-                masked_sum = (last_hidden * mask).sum(axis=1)  # [batch, hidden]
-                mask_sum = mask.sum(axis=1)  # [batch, 1]
-                embeddings = masked_sum / (mask_sum + 1e-9)  # [batch, hidden]
-            
-            # L2 정규화 (선택적, 일반적으로 cosine similarity를 위해)
-            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-            embeddings = embeddings / (norms + 1e-9)
-            
-            return embeddings.astype(np.float32)
+            # 길이순 배치로 나눠 배치별 최장 길이까지만 패딩
+            return run_batched(_tokenizer, texts, _profile, _onnx_encode_batch), ENCODER_ONNX
         except Exception as e:
             print(f"⚠️ ONNX 추론 실패: {e}")
             # fallback으로 계속 진행
     
-    # Priority 2: exact match from embeddings.json
-    if _embeddings_map is not None and len(texts) == 1:
-        vec = _embeddings_map.get(texts[0])
-        if isinstance(vec, list) and len(vec) > 0:
-            return np.array([vec], dtype=np.float32)
-
-    # Priority 3: average word vectors from tokenizer/word_embeddings.json
-    if _word_map is not None:
-        vecs = []
-        for t in texts:
-            tokens = t.split()
-            token_vecs = [np.array(_word_map[w], dtype=np.float32) for w in tokens if isinstance(_word_map.get(w), list)]
-            if token_vecs:
-                v = np.mean(token_vecs, axis=0)
-            else:
-                v = np.zeros((_dim,), dtype=np.float32)
-            vecs.append(v)
-        return np.stack(vecs, axis=0)
+    # Priority 2: exact match from embeddings store (모든 문장이 있을 때)
+    if _embeddings_store is not None:
+        mat = _embeddings_store.get_many(texts)
+        if mat is not None:
+            return mat, "embeddings_store"
+
+    # Priority 3: average word vectors from word embeddings store
+    if _word_store is not None:
+        return _word_store.mean_pool([t.split() for t in texts]), "word_store"
 
     # Priority 4: deterministic pseudo-embedding
     rng = np.random.default_rng(abs(hash("|".join(texts))) % (2**32))
-    return rng.normal(size=(len(texts), _dim)).astype(np.float32)
+    return rng.normal(size=(len(texts), _dim)).astype(np.float32), "pseudo"
+
+
+def _simple_encode(texts: List[str]) -> np.ndarray:
+    return _encode_with_source(texts)[0]
 
 
 @app.post("/embed", response_model=EmbedOut)
@@ -218,19 +215,99 @@ def sentiment(in_obj: SentimentIn) -> SentimentOut:
     return SentimentOut(score=score)
 
 
-@app.post("/rerank", response_model=List[RerankOutItem])
-def rerank(in_obj: RerankIn) -> List[RerankOutItem]:
-    q_vec = _simple_encode([in_obj.query])[0]
-    c_texts = [c.text for c in in_obj.candidates]
-    mat = _simple_encode(c_texts)
-    # cosine similarity
-    def cos(a: np.ndarray, b: np.ndarray) -> float:
-        na = np.linalg.norm(a) + 1e-6
-        nb = np.linalg.norm(b) + 1e-6
-        return float(np.dot(a, b) / (na * nb))
+class VectorLRU:
+    """텍스트 해시 → 정규화된 임베딩 LRU (스레드 안전, def 라우트는 스레드풀에서 실행)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
 
-    scored = [RerankOutItem(id=c.id, score=cos(q_vec, v)) for c, v in zip(in_obj.candidates, mat)]
-    scored.sort(key=lambda x: x.score, reverse=True)
-    return scored
+    @staticmethod
+    def key(text: str, encoder: str, dim: int) -> str:
+        """인코더/차원이 다르면 다른 키 (ONNX 복구 전후 벡터가 섞이지 않도록)"""
+        return f"{encoder}:{dim}:" + hashlib.sha1(text.encode("utf-8")).hexdigest()
 
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vec = self._entries.get(key)
+            if vec is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vec
 
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        with self._lock:
+            for key, vec in items.items():
+                self._entries[key] = vec
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+_candidate_cache = VectorLRU(int(os.getenv("RERANK_CACHE_SIZE", "50000")))
+
+
+def _normalize_rows(mat: np.ndarray) -> np.ndarray:
+    mat = np.asarray(mat, dtype=np.float32)
+    return mat / (np.linalg.norm(mat, axis=-1, keepdims=True) + 1e-6)
+
+
+@app.post("/rerank", response_model=List[RerankOutItem])
+def rerank(in_obj: RerankIn) -> List[RerankOutItem]:
+    """
+    후보 재랭킹 (cosine)
+    - 후보 벡터: 요청의 vector → 텍스트 해시 LRU → 나머지만 한 번에 배치 인코딩
+      (LRU는 ONNX 벡터만 저장/사용, fallback 인코더 결과는 캐시하지 않음)
+    - 점수: 정규화 행렬 × 정규화 쿼리 벡터 한 번, top_k면 argpartition 후 그 안에서만 정렬
+    """
+    candidates = in_obj.candidates
+    if not candidates:
+        return []
+    q_mat, q_encoder = _encode_with_source([in_obj.query])
+    q_vec = _normalize_rows(q_mat[0])
+    dim = q_vec.shape[0]
+    use_cache = q_encoder == ENCODER_ONNX
+
+    mat = np.empty((len(candidates), q_vec.shape[0]), dtype=np.float32)
+    missing: Dict[str, List[int]] = {}
+    miss_texts: Dict[str, str] = {}
+    for i, c in enumerate(candidates):
+        if c.vector is not None and len(c.vector) == q_vec.shape[0]:
+            mat[i] = _normalize_rows(c.vector)
+            continue
+        if c.text is None:
+            raise HTTPException(status_code=422, detail=f"candidate {c.id}: text or vector of dim {q_vec.shape[0]} required")
+        key = VectorLRU.key(c.text, q_encoder, dim)
+        cached = _candidate_cache.get(key) if use_cache and key not in missing else None
+        if cached is not None and cached.shape[0] == dim:
+            mat[i] = cached
+        else:
+            missing.setdefault(key, []).append(i)
+            miss_texts[key] = c.text
+
+    if missing:
+        keys = list(missing)
+        encoded, encoder = _encode_with_source([miss_texts[k] for k in keys])
+        if (encoder == ENCODER_ONNX) != (q_encoder == ENCODER_ONNX) or encoded.shape[1] != dim:
+            # ONNX 벡터와 fallback 벡터가 섞임 (ONNX가 그 사이 실패/복구) → 같은 공간이 아니므로 503
+            # (fallback끼리는 embeddings_store 정확 일치 → word_store처럼 갈려도 기존처럼 점수 계산)
+            raise HTTPException(status_code=503, detail=f"encoder changed during request ({q_encoder} → {encoder})")
+        encoded = _normalize_rows(encoded)
+        for key, vec in zip(keys, encoded):
+            mat[missing[key]] = vec
+        if encoder == ENCODER_ONNX:
+            _candidate_cache.put_many(dict(zip(keys, encoded)))
+
+    scores = mat @ q_vec
+    top_k = in_obj.top_k
+    if top_k is not None and 0 < top_k < len(candidates):
+        order = np.argpartition(-scores, top_k - 1)[:top_k]
+        order = order[np.argsort(-scores[order], kind="stable")]
+    else:
+        order = np.argsort(-scores, kind="stable")
+    return [RerankOutItem(id=candidates[i].id, score=float(scores[i])) for i in order]
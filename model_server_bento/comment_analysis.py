@@ -0,0 +1,341 @@
+"""
+영상 댓글 분석 후처리 (감성 라벨/비율, 대표 댓글, 키워드) — NumPy 벡터화 버전
+
+- 감성: 라벨 인덱스(LabelIndex)는 시작 시 한 번만 계산하고, 확률 행렬 전체에 마스킹/argmax
+  (기존 _binary_sentiment_from_probs 와 같은 규칙: pos/neg 라벨이 있으면 둘 중 큰 쪽, NaN이면 pos 0.5,
+  없으면 argmax 라벨이 pos/neg인지로 판단, 그 외 pos 0.5)
+- 대표 댓글: (like_count, score) 내림차순 안정 정렬(np.lexsort), 상위 N개만 dict 생성
+- 키워드: 컴파일된 정규식 한 번으로 전체 댓글 토큰화 → 한국어/영어 불용어 제거 →
+  영상 내 빈도(tf) × 코퍼스 문서 빈도 기반 idf (log((1+N)/(1+df)) + 1)
+  DF 테이블(KEYWORD_DF_PATH, 기본 models/keyword_df.json)이 없으면 idf=1 → 기존 빈도 순위와 같음
+
+DF 테이블 형식: {"num_docs": N, "df": {"단어": 문서 수, ...}}
+
+CLI:
+  python comment_analysis.py build-df <docs.txt> <keyword_df.json> [--min-df 2]   # 한 줄 = 한 문서
+  python comment_analysis.py bench [--comments 150,1000] [--repeat 200] [--df keyword_df.json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+KEYWORD_DF_PATH = os.getenv("KEYWORD_DF_PATH", "models/keyword_df.json")
+TOP_COMMENTS = 20
+TOP_KEYWORDS = 12
+
+# 한글 음절 또는 영문 연속 (소문자 변환 후 적용)
+WORD_PATTERN = re.compile(r"[가-힣]+|[a-z]+")
+
+# 댓글에서 자주 나오지만 영상 내용을 설명하지 않는 단어 (조사/대명사/부사/용언 활용형/감탄사)
+KOREAN_STOPWORDS = frozenset(
+    """
+    이 가 을 를 의 에 와 과 도 로 으로 는 은 에서 에게 한테 까지 부터 보다 처럼 만 이나 나 랑 이랑 하고
+    그리고 그런데 그래서 그러나 그러면 하지만 근데 그럼 그냥 그게 이게 저게 그거 이거 저거 그건 이건 저건
+    여기 거기 저기 이런 그런 저런 이렇게 그렇게 저렇게 어떻게 왜 뭐 뭔가 무슨 어디 언제 누가 누구
+    진짜 정말 너무 완전 아주 매우 되게 엄청 조금 좀 많이 제일 가장 항상 계속 다시 또 또한 이제 지금 오늘 벌써 아직
+    저 제 저는 제가 저도 저희 나 내 나는 내가 나도 우리 우리가 너 너무너무 당신 님 분 분들 사람 사람들
+    것 거 게 수 때 중 등 및 더 덜 안 못 잘 한 두 몇 모두 다 전부 같이 함께
+    있는 없는 하는 했던 하던 되는 된 될 같은 같아요 같네요 있어요 없어요 있네요 없네요 해요 했어요 하네요
+    합니다 했습니다 입니다 있습니다 없습니다 됩니다 했네요 이네요 네요 예요 이에요 거예요 건가요 인가요
+    그래요 그렇죠 아니 아니요 네 예 응 아 오 와우 헐 음 흠
+    """.split()
+)
+ENGLISH_STOPWORDS = frozenset(
+    """
+    the a an and or but if so of to in on at by for with from as is are was were be been being
+    it its this that these those i me my we our you your he she they them his her their
+    do does did have has had not no yes just very really too can will would should could
+    """.split()
+)
+DEFAULT_STOPWORDS = KOREAN_STOPWORDS | ENGLISH_STOPWORDS
+
+
+# ---------------------------------------------------------------------------
+# Sentiment
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True)
+class LabelIndex:
+    """모델 라벨 순서에서 pos/neg 위치를 미리 계산 (요청마다 라벨 목록을 다시 훑지 않음)"""
+
+    labels: Tuple[str, ...]
+    pos_idx: int
+    neg_idx: int
+    is_pos_label: np.ndarray
+    is_neg_label: np.ndarray
+
+    @classmethod
+    def from_labels(cls, labels: Sequence[Any]) -> "LabelIndex":
+        lowered = tuple(str(label).lower() for label in labels)
+        is_pos = np.array([label.startswith("pos") for label in lowered], dtype=bool)
+        is_neg = np.array([label.startswith("neg") for label in lowered], dtype=bool)
+        return cls(
+            labels=lowered,
+            pos_idx=int(np.argmax(is_pos)) if is_pos.any() else -1,
+            neg_idx=int(np.argmax(is_neg)) if is_neg.any() else -1,
+            is_pos_label=is_pos,
+            is_neg_label=is_neg,
+        )
+
+
+def binary_sentiment(probs: np.ndarray, index: LabelIndex) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    확률 행렬 [N, num_labels] → (is_pos bool[N], score[N])
+    neutral은 예측하지 않음 (항상 pos 또는 neg)
+    """
+    probs = np.asarray(probs)
+    n, width = probs.shape
+    if 0 <= index.pos_idx < width and 0 <= index.neg_idx < width:
+        pos_p = probs[:, index.pos_idx]
+        neg_p = probs[:, index.neg_idx]
+        undefined = np.isnan(pos_p) | np.isnan(neg_p)
+        is_pos = (pos_p >= neg_p) | undefined
+        scores = np.where(is_pos, pos_p, neg_p)
+        scores[undefined] = 0.5
+        return is_pos, scores
+
+    # pos/neg 라벨 중 하나가 없으면 argmax 라벨로 판단
+    top = probs.argmax(axis=1) if n else np.zeros(0, dtype=np.int64)
+    pos_hit = _pad(index.is_pos_label, width)[top]
+    neg_hit = _pad(index.is_neg_label, width)[top]
+    scores = np.where(pos_hit | neg_hit, probs[np.arange(n), top], 0.5)
+    return ~neg_hit, scores
+
+
+def _pad(mask: np.ndarray, width: int) -> np.ndarray:
+    if len(mask) >= width:
+        return mask[:width]
+    return np.concatenate([mask, np.zeros(width - len(mask), dtype=bool)])
+
+
+def sentiment_ratio(is_pos: np.ndarray) -> Dict[str, float]:
+    total = int(is_pos.size)
+    pos_count = int(np.count_nonzero(is_pos))
+    return {
+        "pos": pos_count / total if total else 0.0,
+        "neu": 0.0,
+        "neg": (total - pos_count) / total if total else 0.0,
+    }
+
+
+def top_comment_indices(like_counts: np.ndarray, scores: np.ndarray, top_n: int = TOP_COMMENTS) -> np.ndarray:
+    """(like_count, score) 내림차순, 같으면 원래 순서 (sorted(..., reverse=True)와 같은 결과)"""
+    return np.lexsort((-np.asarray(scores, dtype=np.float64), -np.asarray(like_counts, dtype=np.int64)))[:top_n]
+
+
+# ---------------------------------------------------------------------------
+# Keywords
+# ---------------------------------------------------------------------------
+def tokenize(texts: Iterable[str]) -> List[str]:
+    """전체 댓글을 한 번에 소문자 변환 + 정규식 토큰화 (줄바꿈으로 이어 붙여도 단어 경계는 같음)"""
+    return WORD_PATTERN.findall("\n".join(texts).lower())
+
+
+class KeywordScorer:
+    """영상 댓글 단어 빈도 × 코퍼스 idf 로 상위 키워드 계산"""
+
+    def __init__(self, df: Optional[Dict[str, int]] = None, num_docs: int = 0,
+                 stopwords: frozenset = DEFAULT_STOPWORDS, min_length: int = 2):
+        self.df = df or {}
+        self.num_docs = int(num_docs)
+        self.stopwords = stopwords
+        self.min_length = min_length
+
+    @classmethod
+    def load(cls, path: Optional[str] = KEYWORD_DF_PATH) -> "KeywordScorer":
+        """DF 테이블 로드 (없거나 읽을 수 없으면 idf=1 → 단순 빈도 순위)"""
+        if not path or not Path(path).exists():
+            return cls()
+        with open(path, "r", encoding="utf-8") as f:
+            table = json.load(f)
+        return cls(df=table.get("df", {}), num_docs=table.get("num_docs", 0))
+
+    def describe(self) -> Dict[str, Any]:
+        return {"df_terms": len(self.df), "num_docs": self.num_docs, "stopwords": len(self.stopwords)}
+
+    def idf(self, words: Sequence[str]) -> np.ndarray:
+        if not self.df:
+            return np.ones(len(words), dtype=np.float64)
+        df = np.fromiter((self.df.get(w, 0) for w in words), dtype=np.float64, count=len(words))
+        return np.log((1.0 + self.num_docs) / (1.0 + df)) + 1.0
+
+    def top_keywords(self, texts: Iterable[str], top_k: int = TOP_KEYWORDS) -> List[Dict[str, Any]]:
+        # 전체 토큰을 C 레벨 Counter로 먼저 세고, 불용어/짧은 단어는 고유 단어에서만 제거
+        counts = Counter(tokenize(texts))
+        for word in [w for w in counts if len(w) < self.min_length or w in self.stopwords]:
+            del counts[word]
+        if not counts:
+            return []
+        words = list(counts)
+        tf = np.fromiter(counts.values(), dtype=np.float64, count=len(words))
+        weights = tf * self.idf(words)
+        # 점수 내림차순, 같으면 처음 나온 순서 (Counter.most_common과 같은 tie-break)
+        order = np.argsort(-weights, kind="stable")[:top_k]
+        return [{"keyword": words[i], "weight": round(float(weights[i]), 4)} for i in order]
+
+
+def build_df_table(documents: Iterable[str], min_df: int = 1,
+                   stopwords: frozenset = DEFAULT_STOPWORDS, min_length: int = 2) -> Dict[str, Any]:
+    """문서 목록 → {"num_docs", "df"} (문서마다 단어 집합으로 한 번씩만 셈)"""
+    df: Counter = Counter()
+    num_docs = 0
+    for doc in documents:
+        num_docs += 1
+        df.update({w for w in tokenize([doc]) if len(w) >= min_length and w not in stopwords})
+    return {"num_docs": num_docs, "df": {w: c for w, c in df.items() if c >= min_df}}
+
+
+# ---------------------------------------------------------------------------
+# video-detail 후처리
+# ---------------------------------------------------------------------------
+def analyze(
+    comment_ids: Sequence[str],
+    texts: Sequence[str],
+    like_counts: Sequence[int],
+    probs: np.ndarray,
+    label_index: LabelIndex,
+    scorer: KeywordScorer,
+    top_n: int = TOP_COMMENTS,
+    top_k: int = TOP_KEYWORDS,
+) -> Dict[str, Any]:
+    """감성 확률 + 댓글 → sentiment_ratio / top_comments / top_keywords (video-detail 응답 필드)"""
+    is_pos, scores = binary_sentiment(probs, label_index)
+    likes = np.asarray(like_counts, dtype=np.int64)
+    top = top_comment_indices(likes, scores, top_n)
+    top_comments = [
+        {
+            "comment_id": comment_ids[i],
+            "text": texts[i],
+            "like_count": int(likes[i]),
+            "label": "pos" if is_pos[i] else "neg",
+            "score": float(scores[i]),
+        }
+        for i in top.tolist()
+    ]
+    return {
+        "sentiment_ratio": sentiment_ratio(is_pos),
+        "top_comments": top_comments,
+        "top_keywords": scorer.top_keywords(texts, top_k),
+        "labels": is_pos,
+        "scores": scores,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Benchmark (기존 Python 루프 구현과 비교)
+# ---------------------------------------------------------------------------
+def _legacy_binary(prob_row: np.ndarray, labels: Sequence[str]) -> Tuple[str, float]:
+    pos_idx = next((i for i, l in enumerate(labels) if str(l).lower().startswith("pos")), -1)
+    neg_idx = next((i for i, l in enumerate(labels) if str(l).lower().startswith("neg")), -1)
+    if pos_idx != -1 and neg_idx != -1 and pos_idx < len(prob_row) and neg_idx < len(prob_row):
+        pos_prob = float(prob_row[pos_idx])
+        neg_prob = float(prob_row[neg_idx])
+        if np.isnan(pos_prob) or np.isnan(neg_prob):
+            return "pos", 0.5
+        if pos_prob >= neg_prob:
+            return "pos", pos_prob
+        return "neg", neg_prob
+    idx = int(np.argmax(prob_row))
+    label = str(labels[idx]).lower()
+    if label.startswith("pos"):
+        return "pos", float(prob_row[idx])
+    if label.startswith("neg"):
+        return "neg", float(prob_row[idx])
+    return "pos", 0.5
+
+
+def _legacy_analyze(comment_ids, texts, like_counts, probs, labels) -> Dict[str, Any]:
+    """기존 SimCSEService.video_detail 후처리 (행별 루프 + 댓글별 re.findall + Counter)"""
+    results = []
+    for cid, text, likes, row in zip(comment_ids, texts, like_counts, probs):
+        label, score = _legacy_binary(row, labels)
+        results.append({"comment_id": cid, "text": text, "like_count": likes, "label": label, "score": score})
+    pos_count = sum(1 for c in results if c["label"] == "pos")
+    neg_count = sum(1 for c in results if c["label"] == "neg")
+    total = pos_count + neg_count
+    ratio = {"pos": pos_count / total if total else 0.0, "neu": 0.0, "neg": neg_count / total if total else 0.0}
+    top_comments = sorted(results, key=lambda x: (x["like_count"], x["score"]), reverse=True)[:TOP_COMMENTS]
+    words = []
+    for text in texts:
+        words.extend(re.findall(r"[가-힣]+|[a-zA-Z]+", text.lower()))
+    stop_words = {"이", "가", "을", "를", "의", "에", "와", "과", "도", "로", "으로", "는", "은", "the", "a", "an", "and", "or", "but"}
+    counts = Counter(w for w in words if len(w) > 1 and w not in stop_words)
+    keywords = [{"keyword": w, "weight": float(c)} for w, c in counts.most_common(TOP_KEYWORDS)]
+    return {"sentiment_ratio": ratio, "top_comments": top_comments, "top_keywords": keywords}
+
+
+_BENCH_WORDS = (
+    "여행 브이로그 풍경 숙소 맛집 최고 추천 다음에 꼭 가보고 싶어요 영상 감사합니다 일본 제주도 오사카 "
+    "편집 음악 분위기 카페 바다 야경 호텔 가격 정보 진짜 너무 정말 좋아요 별로 아쉬워요 travel vlog nice the"
+).split()
+
+
+def _synthetic(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    comment_ids = [f"c{i}" for i in range(n)]
+    texts = [" ".join(rng.choice(_BENCH_WORDS) for _ in range(rng.randint(5, 40))) for _ in range(n)]
+    like_counts = [rng.choice([0, 0, 0, 1, 2, 5, rng.randrange(1000)]) for _ in range(n)]
+    logits = np.random.default_rng(seed).normal(size=(n, 3)).astype(np.float32)
+    probs = np.exp(logits) / np.exp(logits).sum(axis=1, keepdims=True)
+    return comment_ids, texts, like_counts, probs
+
+
+def benchmark(sizes: Sequence[int], repeat: int, scorer: KeywordScorer,
+              labels: Sequence[str] = ("negative", "neutral", "positive")) -> None:
+    label_index = LabelIndex.from_labels(labels)
+    print(f"{'comments':>9} {'legacy ms':>10} {'vector ms':>10} {'speedup':>8}  same sentiment/top_comments  keyword overlap")
+    for n in sizes:
+        data = _synthetic(n)
+        legacy = new = None
+        start = time.perf_counter()
+        for _ in range(repeat):
+            legacy = _legacy_analyze(*data, labels)
+        legacy_ms = (time.perf_counter() - start) * 1000 / repeat
+        start = time.perf_counter()
+        for _ in range(repeat):
+            new = analyze(*data, label_index, scorer)
+        new_ms = (time.perf_counter() - start) * 1000 / repeat
+        same = legacy["sentiment_ratio"] == new["sentiment_ratio"] and legacy["top_comments"] == new["top_comments"]
+        overlap = len({k["keyword"] for k in legacy["top_keywords"]} & {k["keyword"] for k in new["top_keywords"]})
+        print(f"{n:>9} {legacy_ms:>10.3f} {new_ms:>10.3f} {legacy_ms / new_ms:>7.1f}x  {str(same):<28} "
+              f"{overlap}/{len(legacy['top_keywords'])}")
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    d = sub.add_parser("build-df", help="document frequency table from one-document-per-line text")
+    d.add_argument("docs")
+    d.add_argument("output")
+    d.add_argument("--min-df", type=int, default=2)
+
+    b = sub.add_parser("bench", help="legacy loop vs vectorized post-processing")
+    b.add_argument("--comments", default="150,1000")
+    b.add_argument("--repeat", type=int, default=200)
+    b.add_argument("--df", default=None, help="DF table (default: none → idf=1)")
+
+    args = parser.parse_args()
+    if args.command == "build-df":
+        with open(args.docs, "r", encoding="utf-8") as f:
+            table = build_df_table((line for line in f if line.strip()), min_df=args.min_df)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(table, f, ensure_ascii=False)
+        print(f"✓ {args.output}: {len(table['df'])} terms over {table['num_docs']} documents")
+        return
+    scorer = KeywordScorer.load(args.df) if args.df else KeywordScorer()
+    benchmark([int(v) for v in args.comments.split(",")], args.repeat, scorer)
+
+
+if __name__ == "__main__":
+    _main()
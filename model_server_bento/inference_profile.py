@@ -0,0 +1,400 @@
+"""
+ONNX Runtime inference profile (SessionOptions / 토크나이저 배칭 / I/O binding / int8 / 벤치마크)
+
+원본: ml-api/app/inference_profile.py. model_server_bento/inference_profile.py는 바이트 단위로 같은 사본 (./check-shared-copies.sh로 확인)
+
+환경 변수 (기본값은 기존 동작과 같은 결과를 내는 값):
+  ORT_GRAPH_OPT_LEVEL      disable | basic | extended | all (기본 all)
+  ORT_INTRA_OP_THREADS     연산 내부 스레드 수 (0 = onnxruntime 기본값, Cloud Run에서는 vCPU 수 권장)
+  ORT_INTER_OP_THREADS     연산 간 스레드 수 (기본 1, sequential 모드에서는 영향 없음)
+  ORT_EXECUTION_MODE       sequential | parallel (기본 sequential)
+  ORT_ENABLE_MEM_PATTERN   true/false (기본 true)
+  ORT_ENABLE_CPU_MEM_ARENA true/false (기본 true)
+  ORT_IO_BINDING           true이면 입력 shape별 출력 버퍼를 스레드마다 재사용 (기본 false)
+  ORT_QUANTIZE             int8이면 {model}.int8.onnx 가 있을 때 그 파일을 사용 (quantize 명령으로 미리 생성)
+  ORT_SHARED_WEIGHTS       true이면 {model}.shared.onnx(가중치를 페이지 정렬 외부 파일로 분리, share 명령으로 생성)가
+                           있을 때 그 파일을 쓰고 prepacking을 끔 → 가중치가 파일 mmap 그대로 사용되어
+                           같은 파일을 여는 여러 워커 프로세스가 물리 메모리를 공유 (기본 false)
+  TOKENIZER_PAD_MULTIPLE   배치 길이를 이 배수로 패딩 (기본 8, 0이면 배치 내 최장 길이)
+  INFER_BATCH_SIZE         한 번에 추론할 최대 문장 수 (기본 32)
+
+배칭: 전체를 한 번 토크나이즈한 뒤 길이순으로 정렬해 INFER_BATCH_SIZE씩 묶고,
+각 묶음은 그 안의 최장 길이(의 배수)까지만 패딩 → 짧은 문장이 긴 문장 길이로 패딩되지 않음
+
+CLI (ml-api에서는 python -m app.inference_profile, model_server_bento에서는 python inference_profile.py):
+  python -m app.inference_profile quantize <model.onnx> [--per-channel]       # → model.int8.onnx (onnx 패키지 필요)
+  python -m app.inference_profile share <model.onnx>                          # → model.shared.onnx + .data (onnx 패키지 필요)
+  python -m app.inference_profile bench --model <model.onnx> --tokenizer <dir> \\
+      [--corpus file.txt] [--threads 1,2,4] [--opt-levels basic,all] [--batch-sizes 8,32] \\
+      [--io-binding off,on] [--int8] [--max-length 256] [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import mmap
+import os
+import statistics
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from itertools import product
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import onnxruntime as ort
+
+GRAPH_OPT_LEVELS = {
+    "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+EXECUTION_MODES = {
+    "sequential": ort.ExecutionMode.ORT_SEQUENTIAL,
+    "parallel": ort.ExecutionMode.ORT_PARALLEL,
+}
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).strip().lower() in {"1", "true", "yes", "on"}
+
+
+@dataclass(frozen=True)
+class InferenceProfile:
+    graph_opt_level: str = "all"
+    intra_op_threads: int = 0
+    inter_op_threads: int = 1
+    execution_mode: str = "sequential"
+    enable_mem_pattern: bool = True
+    enable_cpu_mem_arena: bool = True
+    io_binding: bool = False
+    quantize: str = "none"
+    shared_weights: bool = False
+    max_length: int = 256
+    pad_to_multiple_of: int = 8
+    batch_size: int = 32
+
+    @classmethod
+    def from_env(cls, max_length: int = 256) -> "InferenceProfile":
+        return cls(
+            graph_opt_level=os.getenv("ORT_GRAPH_OPT_LEVEL", "all").strip().lower(),
+            intra_op_threads=int(os.getenv("ORT_INTRA_OP_THREADS", "0")),
+            inter_op_threads=int(os.getenv("ORT_INTER_OP_THREADS", "1")),
+            execution_mode=os.getenv("ORT_EXECUTION_MODE", "sequential").strip().lower(),
+            enable_mem_pattern=_env_bool("ORT_ENABLE_MEM_PATTERN", True),
+            enable_cpu_mem_arena=_env_bool("ORT_ENABLE_CPU_MEM_ARENA", True),
+            io_binding=_env_bool("ORT_IO_BINDING", False),
+            quantize=os.getenv("ORT_QUANTIZE", "none").strip().lower(),
+            shared_weights=_env_bool("ORT_SHARED_WEIGHTS", False),
+            max_length=max_length,
+            pad_to_multiple_of=int(os.getenv("TOKENIZER_PAD_MULTIPLE", "8")),
+            batch_size=max(1, int(os.getenv("INFER_BATCH_SIZE", "32"))),
+        )
+
+    def describe(self) -> str:
+        return (
+            f"opt={self.graph_opt_level} intra={self.intra_op_threads} inter={self.inter_op_threads} "
+            f"mode={self.execution_mode} mem_pattern={self.enable_mem_pattern} arena={self.enable_cpu_mem_arena} "
+            f"io_binding={self.io_binding} quantize={self.quantize} shared_weights={self.shared_weights} "
+            f"batch={self.batch_size} "
+            f"pad_multiple={self.pad_to_multiple_of} max_length={self.max_length}"
+        )
+
+    def session_options(self) -> ort.SessionOptions:
+        options = ort.SessionOptions()
+        options.graph_optimization_level = GRAPH_OPT_LEVELS[self.graph_opt_level]
+        options.execution_mode = EXECUTION_MODES[self.execution_mode]
+        if self.intra_op_threads > 0:
+            options.intra_op_num_threads = self.intra_op_threads
+        if self.inter_op_threads > 0:
+            options.inter_op_num_threads = self.inter_op_threads
+        options.enable_mem_pattern = self.enable_mem_pattern
+        options.enable_cpu_mem_arena = self.enable_cpu_mem_arena
+        if self.shared_weights:
+            # prepacking은 가중치를 프로세스 전용 메모리로 복사하므로 끔 (mmap 페이지를 직접 사용)
+            options.add_session_config_entry("session.disable_prepacking", "1")
+        return options
+
+    def resolve_model_path(self, model_path: Union[str, Path]) -> Path:
+        """ORT_QUANTIZE=int8이면 양자화 파일, ORT_SHARED_WEIGHTS=true면 그 파일의 .shared 변환본 (없으면 앞 단계 경로)"""
+        model_path = Path(model_path)
+        if self.quantize == "int8":
+            candidate = quantized_path(model_path)
+            if candidate.exists():
+                model_path = candidate
+            else:
+                print(f"⚠️ ORT_QUANTIZE=int8 but {candidate} not found, using {model_path}")
+        if self.shared_weights:
+            candidate = shared_weights_path(model_path)
+            if candidate.exists():
+                return candidate
+            print(f"⚠️ ORT_SHARED_WEIGHTS=true but {candidate} not found, using {model_path}")
+        return model_path
+
+    def create_session(self, model_path: Union[str, Path]) -> ort.InferenceSession:
+        return ort.InferenceSession(
+            str(self.resolve_model_path(model_path)),
+            sess_options=self.session_options(),
+            providers=["CPUExecutionProvider"],
+        )
+
+
+def quantized_path(model_path: Union[str, Path]) -> Path:
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.stem}.int8{model_path.suffix}")
+
+
+def quantize_model(model_path: Union[str, Path], output_path: Optional[Union[str, Path]] = None,
+                   per_channel: bool = False) -> Path:
+    """동적 int8 양자화 (가중치만 int8, 활성값은 실행 시 양자화)"""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    output_path = Path(output_path) if output_path else quantized_path(model_path)
+    quantize_dynamic(str(model_path), str(output_path), weight_type=QuantType.QInt8, per_channel=per_channel)
+    return output_path
+
+
+def shared_weights_path(model_path: Union[str, Path]) -> Path:
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.stem}.shared{model_path.suffix}")
+
+
+def export_shared_weights(model_path: Union[str, Path], output_path: Optional[Union[str, Path]] = None,
+                          size_threshold: int = 1024) -> Path:
+    """
+    가중치를 {output}.data 로 분리하고 각 텐서 오프셋을 페이지(할당 단위) 경계에 맞춤
+    onnxruntime은 정렬된 외부 데이터만 복사 없이 mmap으로 사용함 (onnx 기본 저장은 정렬하지 않음)
+    """
+    import onnx
+    from onnx.external_data_helper import set_external_data
+
+    output_path = Path(output_path) if output_path else shared_weights_path(model_path)
+    data_name = f"{output_path.name}.data"
+    model = onnx.load(str(model_path))
+    with open(output_path.with_name(data_name), "wb") as data_file:
+        for tensor in model.graph.initializer:
+            if not tensor.HasField("raw_data") or len(tensor.raw_data) < size_threshold:
+                continue
+            offset = data_file.tell()
+            padding = -offset % mmap.ALLOCATIONGRANULARITY
+            data_file.write(b"\0" * padding)
+            data_file.write(tensor.raw_data)
+            set_external_data(tensor, data_name, offset + padding, len(tensor.raw_data))
+            tensor.ClearField("raw_data")
+            tensor.data_location = onnx.TensorProto.EXTERNAL
+    onnx.save_model(model, str(output_path))
+    return output_path
+
+
+class SessionRunner:
+    """
+    session.run 래퍼
+    io_binding=True이면 (입력 이름, shape) 조합별 출력 버퍼를 스레드마다 만들어 재사용
+    (반환된 배열은 같은 스레드에서 같은 shape로 다시 호출하면 덮어써지므로 필요하면 복사해서 보관)
+    """
+
+    MAX_CACHED_SHAPES = 32
+
+    def __init__(self, session: ort.InferenceSession, io_binding: bool = False):
+        self.session = session
+        self.io_binding = io_binding
+        self.input_names = {inp.name for inp in session.get_inputs()}
+        self.output_names = [out.name for out in session.get_outputs()]
+        self._local = threading.local()
+
+    def _buffers(self) -> "OrderedDict[tuple, List[np.ndarray]]":
+        buffers = getattr(self._local, "buffers", None)
+        if buffers is None:
+            buffers = self._local.buffers = OrderedDict()
+        return buffers
+
+    def run(self, inputs: Dict[str, np.ndarray]) -> List[np.ndarray]:
+        inputs = {name: value for name, value in inputs.items() if name in self.input_names}
+        if not self.io_binding:
+            return self.session.run(None, inputs)
+
+        key = tuple(sorted((name, value.shape) for name, value in inputs.items()))
+        buffers = self._buffers()
+        outputs = buffers.get(key)
+        if outputs is None:
+            # 처음 보는 shape: 일반 실행으로 출력 shape를 알아내고 그 배열을 버퍼로 사용
+            outputs = [np.ascontiguousarray(out) for out in self.session.run(None, inputs)]
+            buffers[key] = outputs
+            while len(buffers) > self.MAX_CACHED_SHAPES:
+                buffers.popitem(last=False)
+            return outputs
+
+        buffers.move_to_end(key)
+        binding = self.session.io_binding()
+        for name, value in inputs.items():
+            binding.bind_cpu_input(name, np.ascontiguousarray(value))
+        for name, buf in zip(self.output_names, outputs):
+            binding.bind_output(name, "cpu", 0, buf.dtype, list(buf.shape), buf.ctypes.data)
+        self.session.run_with_iobinding(binding)
+        return outputs
+
+
+def iter_length_batches(tokenizer, texts: Sequence[str], profile: InferenceProfile
+                        ) -> Iterator[Tuple[np.ndarray, Dict[str, np.ndarray]]]:
+    """
+    길이순 정렬 배치 (원래 순서 인덱스, int64 numpy 입력) 생성
+    토크나이즈는 한 번만 하고, 패딩은 배치마다 그 안의 최장 길이까지만
+    """
+    encoded = tokenizer(list(texts), truncation=True, max_length=profile.max_length)
+    lengths = np.fromiter((len(ids) for ids in encoded["input_ids"]), dtype=np.int64, count=len(texts))
+    order = np.argsort(lengths, kind="stable")
+    keys = [key for key in ("input_ids", "attention_mask", "token_type_ids") if key in encoded]
+    pad_multiple = profile.pad_to_multiple_of or None
+    for start in range(0, len(order), profile.batch_size):
+        idx = order[start:start + profile.batch_size]
+        features = {key: [encoded[key][i] for i in idx] for key in keys}
+        padded = tokenizer.pad(features, padding=True, pad_to_multiple_of=pad_multiple, return_tensors="np")
+        yield idx, {key: np.asarray(value, dtype=np.int64) for key, value in padded.items()}
+
+
+def run_batched(tokenizer, texts: Sequence[str], profile: InferenceProfile,
+                infer: Callable[[Dict[str, np.ndarray]], np.ndarray]) -> np.ndarray:
+    """iter_length_batches로 나눠 infer(inputs) → [batch, ...] 결과를 원래 순서로 합침"""
+    result: Optional[np.ndarray] = None
+    for idx, inputs in iter_length_batches(tokenizer, texts, profile):
+        rows = infer(inputs)
+        if result is None:
+            result = np.empty((len(texts),) + rows.shape[1:], dtype=rows.dtype)
+        result[idx] = rows
+    if result is None:
+        raise ValueError("no texts to encode")
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+_BENCH_PHRASES = [
+    "제주도 여행 브이로그 너무 잘 봤어요",
+    "숙소 정보랑 맛집 정리해주셔서 감사합니다",
+    "영상 편집이 깔끔하고 음악도 좋네요",
+    "다음에는 부산 해운대 쪽도 소개해주세요",
+    "비행기 표 예약 팁이 정말 유용했습니다",
+    "현지 분위기가 그대로 느껴져서 좋았어요",
+    "great travel video, thanks for sharing",
+    "음성이 조금 작아서 아쉬웠어요",
+]
+
+
+def builtin_corpus(size: int = 512, seed: int = 7) -> List[str]:
+    """고정 코퍼스: 댓글처럼 짧은 문장부터 긴 문장까지 섞인 결정적 샘플"""
+    rng = np.random.default_rng(seed)
+    corpus = []
+    for _ in range(size):
+        n = int(rng.choice([1, 1, 2, 3, 6, 12]))
+        corpus.append(" ".join(rng.choice(_BENCH_PHRASES, size=n)))
+    return corpus
+
+
+def benchmark(model_path: str, tokenizer, corpus: Sequence[str], profile: InferenceProfile,
+              repeat: int = 3) -> Dict[str, float]:
+    session = profile.create_session(model_path)
+    runner = SessionRunner(session, io_binding=profile.io_binding)
+    batches = list(iter_length_batches(tokenizer, corpus, profile))
+    real_tokens = sum(int(inputs["attention_mask"].sum()) for _, inputs in batches)
+    padded_tokens = sum(int(inputs["input_ids"].size) for _, inputs in batches)
+
+    for _, inputs in batches[:2]:
+        runner.run(inputs)  # warmup
+    latencies: List[float] = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _, inputs in batches:
+            t0 = time.perf_counter()
+            runner.run(inputs)
+            latencies.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - start
+
+    threads = profile.intra_op_threads or os.cpu_count() or 1
+    tokens_per_sec = real_tokens * repeat / elapsed
+    latencies.sort()
+    return {
+        "tokens_per_sec": tokens_per_sec,
+        "tokens_per_sec_per_thread": tokens_per_sec / threads,
+        "texts_per_sec": len(corpus) * repeat / elapsed,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "pad_ratio": padded_tokens / max(real_tokens, 1),
+    }
+
+
+def _csv(value: str, cast=str) -> List:
+    return [cast(item.strip()) for item in value.split(",") if item.strip()]
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    q = sub.add_parser("quantize", help="dynamic int8 quantization → <model>.int8.onnx")
+    q.add_argument("model")
+    q.add_argument("--output", default=None)
+    q.add_argument("--per-channel", action="store_true")
+
+    sh = sub.add_parser("share", help="page-aligned external weights → <model>.shared.onnx (+ .data)")
+    sh.add_argument("model")
+    sh.add_argument("--output", default=None)
+
+    b = sub.add_parser("bench", help="sweep session settings on a fixed corpus")
+    b.add_argument("--model", required=True)
+    b.add_argument("--tokenizer", required=True)
+    b.add_argument("--corpus", default=None, help="한 줄에 한 문장 (기본: 내장 고정 코퍼스 512문장)")
+    b.add_argument("--threads", default="1,2,4", help="intra-op 스레드 수 목록")
+    b.add_argument("--opt-levels", default="basic,all")
+    b.add_argument("--batch-sizes", default="8,32")
+    b.add_argument("--io-binding", default="off,on")
+    b.add_argument("--int8", action="store_true", help="양자화 모델도 함께 측정 (없으면 생성)")
+    b.add_argument("--max-length", type=int, default=256)
+    b.add_argument("--pad-multiple", type=int, default=8)
+    b.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.command == "quantize":
+        print(f"✓ Quantized model written to {quantize_model(args.model, args.output, args.per_channel)}")
+        return
+    if args.command == "share":
+        print(f"✓ Shared-weights model written to {export_shared_weights(args.model, args.output)}")
+        return
+
+    from transformers import AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(args.tokenizer, use_fast=True, trust_remote_code=True)
+    if args.corpus:
+        with open(args.corpus, "r", encoding="utf-8") as f:
+            corpus = [line.strip() for line in f if line.strip()]
+    else:
+        corpus = builtin_corpus()
+    quantize_modes = ["none"]
+    if args.int8:
+        if not quantized_path(args.model).exists():
+            quantize_model(args.model)
+        quantize_modes.append("int8")
+
+    base = InferenceProfile(max_length=args.max_length, pad_to_multiple_of=args.pad_multiple)
+    print(f"corpus={len(corpus)} texts, cpus={os.cpu_count()}, repeat={args.repeat}")
+    header = f"{'quant':<6}{'opt':<9}{'thr':>4}{'batch':>6}{'iob':>5}{'tok/s':>10}{'tok/s/thr':>11}{'p50 ms':>9}{'p95 ms':>9}{'pad':>6}"
+    print(header)
+    results = []
+    for quant, opt, threads, batch_size, iob in product(
+        quantize_modes, _csv(args.opt_levels), _csv(args.threads, int), _csv(args.batch_sizes, int), _csv(args.io_binding)
+    ):
+        profile = replace(base, quantize=quant, graph_opt_level=opt, intra_op_threads=threads,
+                          batch_size=batch_size, io_binding=iob in {"on", "true", "1"})
+        stats = benchmark(args.model, tokenizer, corpus, profile, repeat=args.repeat)
+        results.append((profile, stats))
+        print(f"{quant:<6}{opt:<9}{threads:>4}{batch_size:>6}{'on' if profile.io_binding else 'off':>5}"
+              f"{stats['tokens_per_sec']:>10.0f}{stats['tokens_per_sec_per_thread']:>11.0f}"
+              f"{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}{stats['pad_ratio']:>6.2f}")
+    best_profile, best = max(results, key=lambda item: item[1]["tokens_per_sec_per_thread"])
+    print(f"\nbest tokens/sec per thread: {best['tokens_per_sec_per_thread']:.0f} → {best_profile.describe()}")
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,176 @@
+"""
+Bento 부하 테스트: /predict/batch, /v1/video-detail 처리량(req/s)과 지연 측정
+
+- 이미 떠 있는 서버에 대해 동시 요청 수별로 측정:
+    python load_test.py --url http://localhost:3000 --concurrency 1,2,4,8
+- 워커 수별 확장성 측정 (BENTO_WORKERS=1,2,4... 로 bentoml serve를 차례로 띄우고 동시성 = 워커 수 × 2):
+    python load_test.py --spawn-workers 1,2,4 --duration 20
+  ORT_SHARED_WEIGHTS / BENTO_CPU_PINNING 등 나머지 환경 변수는 그대로 서버에 전달됨
+
+닫힌 루프(closed-loop) 방식: 각 클라이언트가 응답을 받으면 바로 다음 요청을 보냄
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+
+SENTENCES = [
+    "제주도 바다 보면서 힐링하는 여행 브이로그",
+    "오사카 맛집 투어 가격이랑 위치 정리해 주셔서 감사합니다",
+    "다음 달에 가는데 숙소 정보 너무 유용해요",
+    "편집이랑 음악이 분위기랑 잘 어울려요",
+    "사람이 너무 많아서 생각보다 별로였어요",
+    "야경 명소 추천 부탁드려요",
+    "travel vlog with great city views",
+    "영상 보고 바로 비행기표 예약했습니다",
+]
+
+
+def _batch_payload(batch_size: int, rng: random.Random) -> Dict[str, Any]:
+    return {"request": {"texts": [rng.choice(SENTENCES) for _ in range(batch_size)]}}
+
+
+def _video_detail_payload(comments: int, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "request": {
+            "video_id": "load-test",
+            "title": "여행 브이로그",
+            "description": "",
+            "comments": [
+                {"comment_id": f"c{i}", "text": " ".join(rng.sample(SENTENCES, 2)), "like_count": rng.randrange(100)}
+                for i in range(comments)
+            ],
+        }
+    }
+
+
+async def run_level(url: str, path: str, payload: Dict[str, Any], concurrency: int, duration: float) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=url, timeout=120.0, limits=limits) as client:
+        async def worker() -> None:
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    response = await client.post(path, json=payload)
+                    response.raise_for_status()
+                    latencies.append((time.perf_counter() - start) * 1000)
+                except httpx.HTTPError:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": len(ordered) / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(ordered) if ordered else 0.0,
+        "p95_ms": ordered[max(0, int(len(ordered) * 0.95) - 1)] if ordered else 0.0,
+    }
+
+
+async def run_suite(url: str, concurrency_levels: List[int], args) -> Dict[str, List[Dict[str, Any]]]:
+    rng = random.Random(7)
+    scenarios = {
+        "/predict/batch": _batch_payload(args.batch_size, rng),
+        "/v1/video-detail": _video_detail_payload(args.comments, rng),
+    }
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    for path in args.endpoints.split(","):
+        payload = scenarios[path]
+        # 워밍업 (세션/스레드 풀 초기화 비용 제외)
+        await run_level(url, path, payload, 1, min(3.0, args.duration))
+        results[path] = []
+        for concurrency in concurrency_levels:
+            stats = await run_level(url, path, payload, concurrency, args.duration)
+            stats["concurrency"] = concurrency
+            results[path].append(stats)
+            print(f"  {path:<18} conc={concurrency:<3} {stats['rps']:>8.1f} req/s  "
+                  f"p50={stats['p50_ms']:>7.1f}ms  p95={stats['p95_ms']:>7.1f}ms  errors={stats['errors']}")
+    return results
+
+
+def _wait_healthy(url: str, timeout: float) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{url}/health", timeout=5.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(2)
+    raise TimeoutError(f"server at {url} did not become healthy in {timeout}s")
+
+
+def spawn_and_measure(worker_counts: List[int], args) -> None:
+    service_dir = Path(__file__).resolve().parent
+    url = f"http://127.0.0.1:{args.port}"
+    summary = []
+    for workers in worker_counts:
+        env = dict(os.environ, BENTO_WORKERS=str(workers))
+        print(f"[LoadTest] starting bentoml serve with BENTO_WORKERS={workers}")
+        server = subprocess.Popen(
+            [sys.executable, "-m", "bentoml", "serve", "service:SimCSEService", "--port", str(args.port)],
+            cwd=service_dir,
+            env=env,
+        )
+        try:
+            _wait_healthy(url, args.startup_timeout)
+            concurrency = [int(v) for v in args.concurrency.split(",")] if args.concurrency else [workers * 2]
+            results = asyncio.run(run_suite(url, concurrency, args))
+            for path, rows in results.items():
+                best = max(rows, key=lambda row: row["rps"])
+                summary.append((workers, path, best))
+        finally:
+            server.terminate()
+            try:
+                server.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                server.kill()
+
+    print("\n[LoadTest] scaling summary (best req/s per worker count)")
+    baseline: Dict[str, float] = {}
+    for workers, path, best in summary:
+        baseline.setdefault(path, best["rps"])
+        speedup = best["rps"] / baseline[path] if baseline[path] else 0.0
+        print(f"  workers={workers:<3} {path:<18} {best['rps']:>8.1f} req/s  x{speedup:.2f}  p95={best['p95_ms']:.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:3000")
+    parser.add_argument("--concurrency", default="", help="동시 요청 수 목록 (기본: --url 모드 1,2,4,8 / spawn 모드 워커 수 × 2)")
+    parser.add_argument("--duration", type=float, default=15.0, help="동시성 단계별 측정 시간(초)")
+    parser.add_argument("--endpoints", default="/predict/batch,/v1/video-detail")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--comments", type=int, default=150)
+    parser.add_argument("--spawn-workers", default="", help="예: 1,2,4 → 워커 수별로 서버를 띄워 측정")
+    parser.add_argument("--port", type=int, default=3900)
+    parser.add_argument("--startup-timeout", type=float, default=300.0)
+    args = parser.parse_args()
+
+    if args.spawn_workers:
+        spawn_and_measure([int(v) for v in args.spawn_workers.split(",")], args)
+    else:
+        asyncio.run(run_suite(args.url.rstrip("/"), [int(v) for v in (args.concurrency or "1,2,4,8").split(",")], args))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,11 @@ Public endpoints (kept identical):
   - POST /predict/batch   -> batch sentence embeddings
   - POST /similarity      -> cosine similarity between two texts
 
+Video detail analysis (backend detail page):
+  - POST /v1/video-detail -> comment sentiment / top comments / keywords (JSON)
+  - POST /v2/video-detail -> same analysis over the compact wire format
+                             (msgpack or JSON, top comments by id; see wire_format.py)
+
 Request/response schemas are aligned with the old kimdododo/simcse-serve image so
 that the backend (FastAPI) and frontend clients do not need any changes.
 """
@@ -14,19 +19,26 @@ from __future__ import annotations
 
 import logging
 import os
-import re
 import traceback
-from collections import Counter
 from pathlib import Path
 import threading
 from typing import Any, Dict, List, Union
 
 import bentoml
 import numpy as np
-import onnxruntime as ort
 from pydantic import BaseModel, Field, validator
 from transformers import AutoTokenizer, AutoConfig
 from google.cloud import storage
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+import comment_analysis
+import wire_format
+from inference_profile import InferenceProfile, SessionRunner, run_batched
+from worker_scaling import configured_workers, plan_worker
 
 # ---------------------------------------------------------------------------
 # Logging setup
@@ -62,6 +74,13 @@ MAX_SEQ_LENGTH = int(os.getenv("MAX_SEQ_LENGTH", "256"))
 NORMALIZE = os.getenv("NORMALIZE_EMBEDDINGS", "true").lower() in {"1", "true", "yes"}
 ENABLE_STARTUP_WARMUP = os.getenv("SIMCSE_ENABLE_WARMUP", "true").lower() in {"1", "true", "yes"}
 WARMUP_SAMPLE_TEXT = os.getenv("SIMCSE_WARMUP_TEXT", "warm up request")
+# SessionOptions / 배칭 / I/O binding / int8 설정 (inference_profile.py 참고)
+# 멀티 프로세스 모드: 워커별 CPU 고정 + intra-op 스레드 배분 (worker_scaling.py 참고)
+# 모델 세션을 만들기 전에 고정해야 ORT 스레드 풀이 배정된 CPU 수에 맞춰짐
+WORKER_COUNT = configured_workers()
+WORKER_PLAN = plan_worker(bentoml.server_context.worker_index, WORKER_COUNT)
+WORKER_PLAN.apply()
+INFERENCE_PROFILE = WORKER_PLAN.profile(InferenceProfile.from_env(max_length=MAX_SEQ_LENGTH))
 
 
 _storage_client = None
@@ -166,32 +185,21 @@ SENTIMENT_TOKENIZER_PATH = _resolve_path(
 # ---------------------------------------------------------------------------
 class ModelBundle:
     def __init__(self, model_path: Path, tokenizer_path: Path):
-        providers = ["CPUExecutionProvider"]
-        self.session = ort.InferenceSession(str(model_path), providers=providers)
+        self.session = INFERENCE_PROFILE.create_session(model_path)
+        self.runner = SessionRunner(self.session, io_binding=INFERENCE_PROFILE.io_binding)
         self.tokenizer = AutoTokenizer.from_pretrained(
             tokenizer_path, use_fast=True, trust_remote_code=True
         )
         self.hidden_dim = self.session.get_outputs()[0].shape[-1]
         # Cache input names for dynamic input handling
-        self.input_names = {inp.name for inp in self.session.get_inputs()}
+        self.input_names = self.runner.input_names
 
     def encode(self, texts: List[str]) -> np.ndarray:
-        encoded = self.tokenizer(
-            texts,
-            return_tensors="np",
-            padding=True,
-            truncation=True,
-            max_length=MAX_SEQ_LENGTH,
-        )
-        # Build inputs dynamically based on model requirements
-        inputs: Dict[str, np.ndarray] = {}
-        if "input_ids" in self.input_names:
-            inputs["input_ids"] = encoded["input_ids"].astype(np.int64)
-        if "attention_mask" in self.input_names and "attention_mask" in encoded:
-            inputs["attention_mask"] = encoded["attention_mask"].astype(np.int64)
-        if "token_type_ids" in self.input_names and "token_type_ids" in encoded:
-            inputs["token_type_ids"] = encoded["token_type_ids"].astype(np.int64)
-        outputs = self.session.run(None, inputs)
+        # 길이순 배치로 나눠 배치별 최장 길이까지만 패딩 (inference_profile.run_batched)
+        return run_batched(self.tokenizer, texts, INFERENCE_PROFILE, self._encode_batch)
+
+    def _encode_batch(self, inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        outputs = self.runner.run(inputs)
 
         if len(outputs) > 1 and outputs[1] is not None:
             embeddings = outputs[1].astype(np.float32)
@@ -211,40 +219,25 @@ class ModelBundle:
 
 class ClassificationBundle:
     def __init__(self, model_path: Path, tokenizer_path: Path):
-        providers = ["CPUExecutionProvider"]
-        self.session = ort.InferenceSession(str(model_path), providers=providers)
+        self.session = INFERENCE_PROFILE.create_session(model_path)
+        self.runner = SessionRunner(self.session, io_binding=INFERENCE_PROFILE.io_binding)
         self.tokenizer = AutoTokenizer.from_pretrained(
             tokenizer_path, use_fast=True, trust_remote_code=True
         )
         # ONNX 입력 이름 미리 캐싱 (token_type_ids 필요 여부 확인용)
-        self.input_names = {inp.name for inp in self.session.get_inputs()}
+        self.input_names = self.runner.input_names
 
     def logits(self, texts: List[str]) -> np.ndarray:
-        # 토크나이저 호출
-        encoded = self.tokenizer(
-            texts,
-            return_tensors="np",
-            padding=True,
-            truncation=True,
-            max_length=MAX_SEQ_LENGTH,
-        )
+        # 길이순 배치로 나눠 배치별 최장 길이까지만 패딩 (inference_profile.run_batched)
+        return run_batched(self.tokenizer, texts, INFERENCE_PROFILE, self._logits_batch)
 
+    def _logits_batch(self, inputs: Dict[str, np.ndarray]) -> np.ndarray:
         # 일부 토크나이저는 token_type_ids를 안 돌려줄 수 있으므로 직접 생성
-        if "token_type_ids" not in encoded:
-            encoded["token_type_ids"] = np.zeros_like(encoded["input_ids"])
+        if "token_type_ids" in self.input_names and "token_type_ids" not in inputs:
+            inputs["token_type_ids"] = np.zeros_like(inputs["input_ids"])
 
-        # ONNX에 맞게 int64로 변환
-        inputs: Dict[str, np.ndarray] = {}
-
-        if "input_ids" in self.input_names:
-            inputs["input_ids"] = encoded["input_ids"].astype(np.int64)
-        if "attention_mask" in self.input_names:
-            inputs["attention_mask"] = encoded["attention_mask"].astype(np.int64)
-        if "token_type_ids" in self.input_names:
-            inputs["token_type_ids"] = encoded["token_type_ids"].astype(np.int64)
-
-        # 실제 추론
-        outputs = self.session.run(None, inputs)
+        # 실제 추론 (I/O binding 버퍼를 재사용할 수 있으므로 복사본 반환)
+        outputs = self.runner.run(inputs)
         return outputs[0].astype(np.float32)
 
 
@@ -300,42 +293,9 @@ def _load_sentiment_labels() -> List[str]:
 
 
 SENTIMENT_LABELS = _load_sentiment_labels()
-POS_LABEL_INDEX = next(
-    (idx for idx, label in enumerate(SENTIMENT_LABELS) if str(label).lower().startswith("pos")), None
-)
-NEG_LABEL_INDEX = next(
-    (idx for idx, label in enumerate(SENTIMENT_LABELS) if str(label).lower().startswith("neg")), None
-)
-
-
-def _binary_sentiment_from_probs(prob_row: np.ndarray, labels: List[str]) -> tuple[str, float]:
-    """
-    Extract binary sentiment (pos/neg) from probability row.
-    Always returns pos or neg, never neutral.
-    """
-    # Find pos/neg indices
-    pos_idx = next((i for i, l in enumerate(labels) if str(l).lower().startswith("pos")), -1)
-    neg_idx = next((i for i, l in enumerate(labels) if str(l).lower().startswith("neg")), -1)
-    
-    if pos_idx != -1 and neg_idx != -1 and pos_idx < len(prob_row) and neg_idx < len(prob_row):
-        pos_prob = float(prob_row[pos_idx])
-        neg_prob = float(prob_row[neg_idx])
-        if np.isnan(pos_prob) or np.isnan(neg_prob):
-            return "pos", 0.5
-        if pos_prob >= neg_prob:
-            return "pos", pos_prob
-        return "neg", neg_prob
-    
-    # Fallback: use argmax and map to pos/neg
-    idx = int(np.argmax(prob_row))
-    label = str(labels[idx]).lower()
-    if label.startswith("pos"):
-        return "pos", float(prob_row[idx])
-    if label.startswith("neg"):
-        return "neg", float(prob_row[idx])
-    
-    # Default to positive if cannot determine
-    return "pos", 0.5
+LABEL_INDEX = comment_analysis.LabelIndex.from_labels(SENTIMENT_LABELS)
+KEYWORD_SCORER = comment_analysis.KeywordScorer.load(comment_analysis.KEYWORD_DF_PATH)
+logger.info("[BentoService] Keyword DF table: %s", KEYWORD_SCORER.describe())
 
 
 EMBED_BUNDLE = ModelBundle(MODEL_PATH, TOKENIZER_PATH)
@@ -404,10 +364,135 @@ class VideoDetailRequest(BaseModel):
     comments: List[Union[Dict[str, Any], CommentItem]] = Field(default_factory=list)
 
 
+# ---------------------------------------------------------------------------
+# Video detail analysis
+# ---------------------------------------------------------------------------
+def analyze_comment_items(
+    sentiment_bundle: ClassificationBundle, video_id: str, comment_items: List[CommentItem]
+) -> Dict[str, Any]:
+    """
+    Sentiment ratio, top comments (full dicts) and keywords for one video.
+    Shared by the JSON /v1/video-detail API and the compact /v2/video-detail route.
+    """
+    if not comment_items:
+        logger.warning("[BentoService] No comments provided for video %s", video_id)
+        return {
+            "video_id": video_id,
+            "sentiment_ratio": {"pos": 0.0, "neu": 0.0, "neg": 0.0},
+            "top_comments": [],
+            "top_keywords": [],
+            "model": {"sentiment_model": "sentiment_onnx", "version": "v1"},
+        }
+
+    # Extract comment texts and keep track of valid comment indices
+    valid_comments = []
+    comment_texts = []
+    for i, c in enumerate(comment_items):
+        text = c.text
+        if text and text.strip():
+            valid_comments.append((i, c))
+            comment_texts.append(text)
+
+    logger.info("[BentoService] Valid comments: %d/%d (with non-empty text)", 
+               len(comment_texts), len(comment_items))
+
+    if not comment_texts:
+        logger.warning("[BentoService] No valid comment texts found for video %s (all empty or whitespace)", video_id)
+        return {
+            "video_id": video_id,
+            "sentiment_ratio": {"pos": 0.0, "neu": 0.0, "neg": 0.0},
+            "top_comments": [],
+            "top_keywords": [],
+            "model": {"sentiment_model": "sentiment_onnx", "version": "v1"},
+        }
+
+    # Perform sentiment analysis
+    logger.info("[BentoService] Performing sentiment analysis on %d comments", len(comment_texts))
+    logits = sentiment_bundle.logits(comment_texts)
+    probs = softmax(logits, axis=1)
+    logger.info("[BentoService] Sentiment analysis completed, processing results...")
+
+    # Vectorized post-processing (comment_analysis.py): binary labels, ratio, top comments, TF-IDF keywords
+    analysis = comment_analysis.analyze(
+        [c.comment_id for _, c in valid_comments],
+        comment_texts,
+        [c.like_count for _, c in valid_comments],
+        probs,
+        LABEL_INDEX,
+        KEYWORD_SCORER,
+    )
+    sentiment_ratio = analysis["sentiment_ratio"]
+    top_comments = analysis["top_comments"]
+    top_keywords = analysis["top_keywords"]
+
+    # Log for debugging (first few comments only)
+    for pos, (orig_idx, comment) in enumerate(valid_comments[:3]):
+        if orig_idx < 3:
+            logger.info(
+                "[BentoService] Comment %d: label=%s, score=%.4f, text_preview=%.50s",
+                orig_idx, "pos" if analysis["labels"][pos] else "neg", analysis["scores"][pos], comment.text[:50]
+            )
+
+    logger.info("[BentoService] Results: sentiment_ratio=%s, top_comments=%d, top_keywords=%d",
+               sentiment_ratio, len(top_comments), len(top_keywords))
+
+    return {
+        "video_id": video_id,
+        "sentiment_ratio": sentiment_ratio,
+        "top_comments": top_comments,
+        "top_keywords": top_keywords,
+        "model": {"sentiment_model": "sentiment_onnx", "version": "v1"},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Compact video-detail route (/v2, see wire_format.py)
+# ---------------------------------------------------------------------------
+async def compact_video_detail(request: Request) -> Response:
+    """
+    POST /v2/video-detail
+
+    Body: columnar comments as msgpack or JSON (``Content-Type``).
+    Response: same fields as /v1/video-detail, encoded per ``Accept``, with
+    ``top_comments`` reduced to id references (``comment_refs: true``).
+    """
+    content_type = request.headers.get("content-type")
+    if wire_format.is_msgpack(content_type) and not wire_format.msgpack_available():
+        return JSONResponse({"error": "msgpack is not installed on this server"}, status_code=415)
+    try:
+        video_id, rows = wire_format.parse_request(wire_format.decode(await request.body(), content_type))
+    except Exception as e:
+        return JSONResponse({"error": f"invalid request body: {e}"}, status_code=400)
+
+    logger.info("[BentoService] compact video_detail called: video_id=%s, comments_count=%d", video_id, len(rows))
+    comment_items = [CommentItem(comment_id=cid, text=text, like_count=likes) for cid, text, likes in rows]
+    try:
+        result = await run_in_threadpool(analyze_comment_items, SENTIMENT_BUNDLE, video_id, comment_items)
+    except Exception as e:
+        logger.error("[BentoService] Error in compact video_detail for %s: %s\n%s", video_id, e, traceback.format_exc())
+        result = {
+            "video_id": video_id,
+            "sentiment_ratio": {"pos": 0.0, "neu": 0.0, "neg": 0.0},
+            "top_comments": [],
+            "top_keywords": [],
+            "model": {"sentiment_model": "sentiment_onnx", "version": "v1"},
+            "error": str(e),
+        }
+    result["top_comments"] = wire_format.compact_top_comments(result["top_comments"])
+    result["comment_refs"] = True
+
+    media_type = wire_format.negotiate(request.headers.get("accept"))
+    return Response(wire_format.encode(result, media_type), media_type=media_type)
+
+
+COMPACT_APP = Starlette(routes=[Route("/video-detail", compact_video_detail, methods=["POST"])])
+
+
 # ---------------------------------------------------------------------------
 # Bento Service
 # ---------------------------------------------------------------------------
-@bentoml.service(name="simcse_onnx_service")
+@bentoml.asgi_app(COMPACT_APP, path="/v2")
+@bentoml.service(name="simcse_onnx_service", workers=WORKER_COUNT)
 class SimCSEService:
     def __init__(self):
         self.embed_bundle = EMBED_BUNDLE
@@ -446,6 +531,9 @@ class SimCSEService:
             "sentiment_tokenizer_path": str(SENTIMENT_TOKENIZER_PATH),
             "dimension": self.embed_bundle.hidden_dim,
             "warmed_up": self._warmed_up,
+            "inference_profile": INFERENCE_PROFILE.describe(),
+            "worker": WORKER_PLAN.describe(),
+            "keyword_df": KEYWORD_SCORER.describe(),
         }
 
     @bentoml.api(route="/predict")
@@ -555,139 +643,7 @@ class SimCSEService:
                     logger.error("[BentoService] Failed to parse comment: %s, error: %s", c, e)
                     continue
             
-            if not comment_items:
-                logger.warning("[BentoService] No comments provided for video %s", parsed_request.video_id)
-                return {
-                    "video_id": parsed_request.video_id,
-                    "sentiment_ratio": {"pos": 0.0, "neu": 0.0, "neg": 0.0},
-                    "top_comments": [],
-                    "top_keywords": [],
-                    "model": {"sentiment_model": "sentiment_onnx", "version": "v1"},
-                }
-            
-            # Extract comment texts and keep track of valid comment indices
-            valid_comments = []
-            comment_texts = []
-            for i, c in enumerate(comment_items):
-                text = c.text
-                if text and text.strip():
-                    valid_comments.append((i, c))
-                    comment_texts.append(text)
-            
-            logger.info("[BentoService] Valid comments: %d/%d (with non-empty text)", 
-                       len(comment_texts), len(comment_items))
-            
-            if not comment_texts:
-                logger.warning("[BentoService] No valid comment texts found for video %s (all empty or whitespace)", parsed_request.video_id)
-                return {
-                    "video_id": parsed_request.video_id,
-                    "sentiment_ratio": {"pos": 0.0, "neu": 0.0, "neg": 0.0},
-                    "top_comments": [],
-                    "top_keywords": [],
-                    "model": {"sentiment_model": "sentiment_onnx", "version": "v1"},
-                }
-            
-            # Perform sentiment analysis
-            logger.info("[BentoService] Performing sentiment analysis on %d comments", len(comment_texts))
-            logits = self.sentiment_bundle.logits(comment_texts)
-            probs = softmax(logits, axis=1)
-            logger.info("[BentoService] Sentiment analysis completed, processing results...")
-            
-            # Calculate sentiment ratio (binary: positive / negative only, no neutral)
-            sentiment_counts = {"pos": 0, "neg": 0}
-            comment_results = []
-            
-            # Map SENTIMENT_LABELS to short labels (only pos/neg, no neutral)
-            label_map = {"positive": "pos", "negative": "neg"}
-            
-            # Find indices for positive and negative only (no neutral)
-            pos_idx = -1
-            neg_idx = -1
-            
-            for i, label in enumerate(SENTIMENT_LABELS):
-                label_lower = str(label).lower()
-                if label_lower.startswith("pos"):
-                    pos_idx = i
-                elif label_lower.startswith("neg"):
-                    neg_idx = i
-                # Skip neutral - we don't predict it
-            
-            for (orig_idx, comment), prob_row in zip(valid_comments, probs):
-                # Use helper function for binary sentiment classification
-                label_short, score = _binary_sentiment_from_probs(prob_row, SENTIMENT_LABELS)
-                
-                # Log for debugging (first few comments only)
-                if orig_idx < 3:
-                    logger.info(
-                        "[BentoService] Comment %d: label=%s, score=%.4f, text_preview=%.50s",
-                        orig_idx, label_short, score, comment.text[:50] if comment.text else ""
-                    )
-                
-                sentiment_counts[label_short] += 1
-                
-                comment_results.append({
-                    "comment_id": comment.comment_id,
-                    "text": comment.text,
-                    "like_count": comment.like_count,
-                    "label": label_short,
-                    "score": score,
-                })
-            
-            binary_comments = [c for c in comment_results if c["label"] in {"pos", "neg"}]
-            binary_total = len(binary_comments)
-            if binary_total == 0:
-                binary_total = len(comment_results)
-                binary_comments = comment_results[:]
-            
-            pos_count = sum(1 for c in binary_comments if c["label"] == "pos")
-            neg_count = sum(1 for c in binary_comments if c["label"] == "neg")
-            total_binary = pos_count + neg_count
-            sentiment_ratio = {
-                "pos": pos_count / total_binary if total_binary > 0 else 0.0,
-                "neu": 0.0,
-                "neg": neg_count / total_binary if total_binary > 0 else 0.0,
-            }
-            
-            # Get top comments (binary first, fallback to all)
-            top_source = binary_comments if binary_comments else comment_results
-            top_comments = sorted(
-                top_source,
-                key=lambda x: (x["like_count"], x["score"]),
-                reverse=True
-            )[:20]
-            
-            # Extract keywords from comment texts (simple frequency-based)
-            # For now, we'll use a simple approach: extract common words
-            # In production, you might want to use more sophisticated keyword extraction
-            
-            # Extract Korean and English words
-            words = []
-            for text in comment_texts:
-                # Simple word extraction (Korean + English)
-                word_pattern = r'[\uac00-\ud7a3]+|[a-zA-Z]+'
-                words.extend(re.findall(word_pattern, text.lower()))
-            
-            # Filter out common stop words (simple list)
-            stop_words = {"이", "가", "을", "를", "의", "에", "와", "과", "도", "로", "으로", "는", "은", "the", "a", "an", "and", "or", "but"}
-            filtered_words = [w for w in words if len(w) > 1 and w not in stop_words]
-            
-            # Count word frequencies
-            word_counts = Counter(filtered_words)
-            top_keywords = [
-                {"keyword": word, "weight": float(count)}
-                for word, count in word_counts.most_common(12)
-            ]
-            
-            logger.info("[BentoService] Results: sentiment_ratio=%s, top_comments=%d, top_keywords=%d",
-                       sentiment_ratio, len(top_comments), len(top_keywords))
-            
-            return {
-                "video_id": parsed_request.video_id,
-                "sentiment_ratio": sentiment_ratio,
-                "top_comments": top_comments,
-                "top_keywords": top_keywords,
-                "model": {"sentiment_model": "sentiment_onnx", "version": "v1"},
-            }
+            return analyze_comment_items(self.sentiment_bundle, parsed_request.video_id, comment_items)
         except Exception as e:
             error_trace = traceback.format_exc()
             try:
@@ -0,0 +1,136 @@
+"""
+Compact wire format for the backend <-> Bento video-detail call.
+
+The legacy contract (``POST /v1/video-detail``) sends a JSON list of comment
+dicts and echoes every top comment's full text back. The compact contract
+(``POST /v2/video-detail``) differs in three ways:
+
+- request comments are columnar: ``comment_ids`` / ``texts`` / ``like_counts``
+- the body is msgpack (``application/x-msgpack``) or JSON, chosen by the
+  ``Content-Type`` header, and the response encoding follows ``Accept``
+- ``top_comments`` carry only ``comment_id`` / ``label`` / ``score``; the caller
+  already has text and like_count, and restores them with ``expand_top_comments``
+
+Source of truth: model_server_bento/wire_format.py. backend/app/clients/wire_format.py
+is a byte-identical copy; ./check-shared-copies.sh fails when they differ.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+try:
+    import msgpack
+except ImportError:  # optional: without it only the JSON encoding is available
+    msgpack = None
+
+MEDIA_MSGPACK = "application/x-msgpack"
+MEDIA_JSON = "application/json"
+_MSGPACK_ALIASES = {MEDIA_MSGPACK, "application/msgpack", "application/vnd.msgpack"}
+
+
+def msgpack_available() -> bool:
+    return msgpack is not None
+
+
+def is_msgpack(media_type: Optional[str]) -> bool:
+    if not media_type:
+        return False
+    return any(part.split(";")[0].strip().lower() in _MSGPACK_ALIASES for part in media_type.split(","))
+
+
+def encode(payload: Any, media_type: str) -> bytes:
+    if is_msgpack(media_type):
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed")
+        return msgpack.packb(payload, use_bin_type=True)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode(body: bytes, media_type: Optional[str]) -> Any:
+    if is_msgpack(media_type):
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed")
+        return msgpack.unpackb(body, raw=False)
+    return json.loads(body)
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """Response media type for an ``Accept`` header (msgpack only if asked for and available)."""
+    if msgpack is not None and is_msgpack(accept):
+        return MEDIA_MSGPACK
+    return MEDIA_JSON
+
+
+def build_request(video_id: str, title: str, description: str, comments: Iterable[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Comment dicts (comment_id, text, like_count) -> columnar compact request."""
+    comment_ids: List[str] = []
+    texts: List[str] = []
+    like_counts: List[int] = []
+    for c in comments:
+        comment_ids.append(str(c.get("comment_id", "")))
+        texts.append(str(c.get("text", "") or ""))
+        like_counts.append(int(c.get("like_count", 0) or 0))
+    return {
+        "video_id": video_id,
+        "title": title or "",
+        "description": description or "",
+        "comment_ids": comment_ids,
+        "texts": texts,
+        "like_counts": like_counts,
+    }
+
+
+def parse_request(payload: Mapping[str, Any]) -> Tuple[str, List[Tuple[str, str, int]]]:
+    """
+    Compact request -> (video_id, [(comment_id, text, like_count), ...]).
+
+    Also accepts the legacy ``{"request": {"comments": [...]}}`` shape so the
+    same handler can serve either body.
+    """
+    body = payload.get("request", payload)
+    video_id = str(body.get("video_id", ""))
+    if "texts" in body:
+        texts = body.get("texts") or []
+        ids = body.get("comment_ids") or [""] * len(texts)
+        likes = body.get("like_counts") or [0] * len(texts)
+        if not (len(ids) == len(texts) == len(likes)):
+            raise ValueError("comment_ids, texts and like_counts must have the same length")
+        rows = [(str(i), str(t or ""), int(l or 0)) for i, t, l in zip(ids, texts, likes)]
+    else:
+        rows = [
+            (str(c.get("comment_id", "")), str(c.get("text", "") or ""), int(c.get("like_count", 0) or 0))
+            for c in body.get("comments") or []
+            if isinstance(c, Mapping)
+        ]
+    return video_id, rows
+
+
+def compact_top_comments(top_comments: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """Full top comment dicts -> id references (drops text / like_count)."""
+    return [{"comment_id": c["comment_id"], "label": c.get("label"), "score": c.get("score")} for c in top_comments]
+
+
+def expand_top_comments(
+    refs: Iterable[Mapping[str, Any]], comments: Iterable[Mapping[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Id references -> full top comment dicts using the comments the caller sent.
+    References to unknown ids are dropped.
+    """
+    by_id = {str(c.get("comment_id", "")): c for c in comments}
+    expanded: List[Dict[str, Any]] = []
+    for ref in refs:
+        source = by_id.get(str(ref.get("comment_id", "")))
+        if source is None:
+            continue
+        expanded.append(
+            {
+                "comment_id": str(ref["comment_id"]),
+                "text": str(source.get("text", "") or ""),
+                "like_count": int(source.get("like_count", 0) or 0),
+                "label": ref.get("label"),
+                "score": ref.get("score"),
+            }
+        )
+    return expanded
@@ -0,0 +1,94 @@
+"""
+멀티 프로세스 워커 모드 (BentoML workers + CPU 고정 + intra-op 스레드 자동 배분)
+
+하나의 서비스 프로세스에서 ONNX intra-op 스레드만으로 병렬화하는 대신,
+N개의 워커 프로세스가 각자 CPU 부분집합에 고정되어 요청을 나눠 처리함
+
+환경 변수:
+  BENTO_WORKERS         워커 프로세스 수 (정수 또는 cpu_count, 기본 1 = 기존 단일 프로세스)
+  BENTO_CPU_PINNING     true이면 워커마다 사용 가능한 CPU를 균등 분할해 os.sched_setaffinity로 고정 (기본 true, Linux만)
+  BENTO_CPUS_PER_WORKER 워커당 CPU 수 (기본 사용 가능 CPU 수 // 워커 수, 최소 1)
+
+ORT_INTRA_OP_THREADS를 따로 지정하지 않으면 워커가 고정된 CPU 수로 맞춤 (스레드 과다 경쟁 방지)
+가중치 메모리 공유는 ORT_SHARED_WEIGHTS=true + inference_profile.py share 로 만든 .shared.onnx 사용
+(워커 N개가 같은 가중치 파일을 mmap → 물리 메모리에는 한 벌만 올라감)
+
+부하 테스트: python load_test.py --url http://localhost:3000 --concurrency 1,2,4,8
+"""
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Sequence
+
+from inference_profile import InferenceProfile
+
+logger = logging.getLogger(__name__)
+
+
+def available_cpus() -> List[int]:
+    """현재 프로세스가 쓸 수 있는 CPU 번호 (cgroup/affinity 반영)"""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def configured_workers(cpus: Optional[Sequence[int]] = None) -> int:
+    raw = os.getenv("BENTO_WORKERS", "1").strip().lower()
+    if raw == "cpu_count":
+        return max(1, len(cpus if cpus is not None else available_cpus()))
+    return max(1, int(raw))
+
+
+@dataclass(frozen=True)
+class WorkerPlan:
+    worker_index: Optional[int]  # BentoML 워커 번호 (1부터), 워커 밖(bentoml build 등)이면 None
+    workers: int
+    cpus: tuple
+    pinned: bool
+
+    @property
+    def intra_op_threads(self) -> int:
+        return max(1, len(self.cpus))
+
+    def apply(self) -> None:
+        """이 프로세스를 계획된 CPU에 고정"""
+        if not self.pinned:
+            return
+        try:
+            os.sched_setaffinity(0, self.cpus)
+            logger.info("[WorkerScaling] worker %s/%s pinned to CPUs %s", self.worker_index, self.workers, list(self.cpus))
+        except (AttributeError, OSError) as exc:
+            logger.warning("[WorkerScaling] CPU pinning failed for worker %s: %s", self.worker_index, exc)
+
+    def profile(self, base: InferenceProfile) -> InferenceProfile:
+        """ORT_INTRA_OP_THREADS가 명시되지 않았으면 워커 CPU 수로 intra-op 스레드 지정"""
+        if self.workers <= 1 or os.getenv("ORT_INTRA_OP_THREADS"):
+            return base
+        return replace(base, intra_op_threads=self.intra_op_threads)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "worker_index": self.worker_index,
+            "workers": self.workers,
+            "cpus": list(self.cpus),
+            "pinned": self.pinned,
+        }
+
+
+def plan_worker(worker_index: Optional[int], workers: int, cpus: Optional[Sequence[int]] = None) -> WorkerPlan:
+    """
+    사용 가능한 CPU를 워커 수로 나눠 worker_index 번째 구간을 배정
+    워커가 CPU보다 많으면 CPU를 돌려가며 배정 (CPU 하나에 여러 워커)
+    """
+    cpus = list(cpus if cpus is not None else available_cpus())
+    pin_enabled = os.getenv("BENTO_CPU_PINNING", "true").strip().lower() in {"1", "true", "yes", "on"}
+    if worker_index is None or workers <= 1 or not cpus:
+        return WorkerPlan(worker_index=worker_index, workers=workers, cpus=tuple(cpus), pinned=False)
+
+    per_worker = int(os.getenv("BENTO_CPUS_PER_WORKER", "0")) or max(1, len(cpus) // workers)
+    slot = (worker_index - 1) % workers
+    start = (slot * per_worker) % len(cpus)
+    assigned = tuple(cpus[(start + i) % len(cpus)] for i in range(min(per_worker, len(cpus))))
+    return WorkerPlan(worker_index=worker_index, workers=workers, cpus=assigned, pinned=pin_enabled)
@@ -2,6 +2,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.settings import get_settings
 from app.core.redis_client import get_redis
+from app.utils.http_client import clients_stats, close_clients
 from app.routers import channels, trends, videos, ml_test
 
 app = FastAPI(title="Web API", version="0.1.0")
@@ -22,11 +23,22 @@ async def on_startup() -> None:
     await get_redis(settings)
 
 
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    # Close pooled outbound HTTP clients (ml-api)
+    await close_clients()
+
+
 @app.get("/ping")
 async def ping():
     return {"status": "ok"}
 
 
+@app.get("/clients/metrics")
+async def client_metrics():
+    return clients_stats()
+
+
 app.include_router(channels.router)
 app.include_router(trends.router)
 app.include_router(videos.router)
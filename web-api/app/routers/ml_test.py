@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 import httpx
 from app.core.settings import get_settings, Settings
-from app.utils.ml_client import call_ml_api
+from app.utils.ml_client import call_ml_api, get_ml_client
 
 router = APIRouter(prefix="/ml-test", tags=["ml-test"])
 
@@ -61,15 +61,11 @@ async def test_embed(
 async def test_ping(settings: Settings = Depends(get_settings)):
     """ml-api의 /ping 엔드포인트를 호출하는 테스트"""
     try:
-        import httpx
         if not settings.ML_API_BASE_URL:
             raise HTTPException(status_code=503, detail="ML_API_BASE_URL이 설정되지 않았습니다")
         
-        url = f"{settings.ML_API_BASE_URL.rstrip('/')}/ping"
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            return resp.json()
+        resp = await get_ml_client(settings).get("/ping", timeout=5.0)
+        return resp.json()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"ML API 호출 실패: {str(e)}")
 
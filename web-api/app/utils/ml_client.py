@@ -1,17 +1,34 @@
 from typing import Any, Dict, List, Optional
 import httpx
 from app.core.settings import Settings
+from app.utils.http_client import CircuitOpenError, ManagedClient, get_client
+
+ML_API_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+
+def get_ml_client(settings: Settings) -> ManagedClient:
+    """ml-api 공유 클라이언트 (연결 풀 재사용, 종료 시 close_clients로 정리)"""
+    return get_client(
+        "ml-api",
+        lambda: ManagedClient(
+            name="ml-api",
+            base_url=settings.ML_API_BASE_URL,
+            env_prefix="ML_API",
+            default_timeout=ML_API_TIMEOUT,
+        ),
+    )
 
 
 async def call_ml_api(settings: Settings, path: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     if not settings.ML_API_BASE_URL:
         return None
-    url = f"{settings.ML_API_BASE_URL.rstrip('/')}{path}"
+    client = get_ml_client(settings)
+    url = f"{client.base_url}{path}"
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(url, json=payload)
-            resp.raise_for_status()
-            return resp.json()
+        resp = await client.post(path, json=payload)
+        return resp.json()
+    except CircuitOpenError:
+        raise Exception(f"ML API 일시 차단 (연속 실패로 서킷 오픈): {url}")
     except httpx.TimeoutException:
         raise Exception(f"ML API 호출 시간 초과: {url}")
     except httpx.ConnectError: